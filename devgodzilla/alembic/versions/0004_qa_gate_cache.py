@@ -0,0 +1,40 @@
+"""Add QA gate result cache
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2024-01-01 00:00:03.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    is_sqlite = bind.dialect.name == "sqlite"
+
+    json_type = sa.Text() if is_sqlite else sa.dialects.postgresql.JSONB()
+    timestamp_type = sa.DateTime() if is_sqlite else sa.TIMESTAMP()
+
+    op.create_table(
+        "qa_gate_cache",
+        sa.Column("cache_key", sa.Text(), primary_key=True),
+        sa.Column("gate_id", sa.Text(), nullable=False),
+        sa.Column("tree_hash", sa.Text(), nullable=False),
+        sa.Column("project_id", sa.Integer(), nullable=True),
+        sa.Column("result", json_type, nullable=False),
+        sa.Column("created_at", timestamp_type, server_default=sa.func.now()),
+    )
+    op.create_index("idx_qa_gate_cache_project", "qa_gate_cache", ["project_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_qa_gate_cache_project", table_name="qa_gate_cache")
+    op.drop_table("qa_gate_cache")
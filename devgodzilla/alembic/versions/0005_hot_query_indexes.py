@@ -0,0 +1,42 @@
+"""Add indexes for hot step/protocol/event queries and backfill events.project_id
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2024-01-01 00:00:04.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_INDEXES = [
+    ("idx_protocol_runs_project", "protocol_runs", ["project_id", "created_at"]),
+    ("idx_protocol_runs_status", "protocol_runs", ["status", "created_at"]),
+    ("idx_protocol_runs_created", "protocol_runs", ["created_at"]),
+    ("idx_step_runs_protocol", "step_runs", ["protocol_run_id", "step_index"]),
+    ("idx_events_project_id", "events", ["project_id", "id"]),
+    ("idx_events_protocol_id", "events", ["protocol_run_id", "id"]),
+]
+
+
+def upgrade() -> None:
+    # Backfill first so the new project index is built over final values.
+    op.execute(
+        """
+        UPDATE events
+        SET project_id = (SELECT pr.project_id FROM protocol_runs pr WHERE pr.id = events.protocol_run_id)
+        WHERE project_id IS NULL AND protocol_run_id IS NOT NULL
+        """
+    )
+    for name, table, columns in _INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(_INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,23 @@
+"""Index job_runs by status for the Windmill job reconciler
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2024-01-01 00:00:05.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("idx_job_runs_status", "job_runs", ["status", "created_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_job_runs_status", table_name="job_runs")
@@ -0,0 +1,50 @@
+"""Add projects.repo_key and index webhook routing lookups
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2024-01-01 00:00:06.000000
+"""
+from typing import Optional, Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _repo_key(value: Optional[str]) -> Optional[str]:
+    # Mirrors devgodzilla.db.database.normalize_repo_url at the time of writing.
+    if not value:
+        return None
+    text = value.strip().lower()
+    if text.endswith(".git"):
+        text = text[:-4]
+    if text.startswith("git@"):
+        text = text.replace("git@", "", 1).replace(":", "/", 1)
+    if text.startswith("https://"):
+        text = text[len("https://"):]
+    elif text.startswith("http://"):
+        text = text[len("http://"):]
+    return text.strip("/") or None
+
+
+def upgrade() -> None:
+    op.add_column("projects", sa.Column("repo_key", sa.Text(), nullable=True))
+    conn = op.get_bind()
+    for project_id, git_url in conn.execute(sa.text("SELECT id, git_url FROM projects")).fetchall():
+        conn.execute(
+            sa.text("UPDATE projects SET repo_key = :key WHERE id = :id"),
+            {"key": _repo_key(git_url), "id": project_id},
+        )
+    op.create_index("idx_projects_repo_key", "projects", ["repo_key"])
+    op.create_index("idx_protocol_runs_windmill_flow", "protocol_runs", ["windmill_flow_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_protocol_runs_windmill_flow", table_name="protocol_runs")
+    op.drop_index("idx_projects_repo_key", table_name="projects")
+    op.drop_column("projects", "repo_key")
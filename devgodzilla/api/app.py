@@ -1,4 +1,5 @@
 from fastapi import Depends, FastAPI, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 
 try:
@@ -18,12 +19,19 @@ from devgodzilla.api.routes import project_speckit as project_speckit_routes
 from devgodzilla.api.routes import cli_executions
 from devgodzilla.api.routes import queues
 from devgodzilla.api.dependencies import get_db, get_service_context, require_api_token, require_webhook_token
-from devgodzilla.config import get_config
+from devgodzilla.config import get_config, install_reload_signal_handler, reload_config
 from devgodzilla.engines.bootstrap import bootstrap_default_engines
 from devgodzilla.db.database import Database
 from devgodzilla.logging import get_logger, get_log_buffer
+from devgodzilla.services.event_persistence import get_event_writer
+from devgodzilla.services.job_reconciler import WindmillJobReconciler
 from devgodzilla.services.orchestrator import OrchestratorMode, OrchestratorService
-from devgodzilla.windmill.client import WindmillClient, WindmillConfig
+from devgodzilla.windmill.client import (
+    aclose_shared_windmill_clients,
+    close_shared_windmill_clients,
+    get_shared_windmill_client,
+    windmill_config_from_settings,
+)
 
 logger = get_logger(__name__)
 
@@ -55,6 +63,25 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.middleware("http")
+async def flush_event_sink_before_response(request: Request, call_next):
+    """
+    In `barrier` persistence mode, flush queued events around each request.
+
+    Flushing before the handler lets reads observe events published earlier
+    (e.g. by background steps); flushing after it persists the request's own
+    events before the client sees the response.
+    """
+    writer = get_event_writer()
+    if writer is None or writer.mode != "barrier":
+        return await call_next(request)
+    if writer.pending:
+        await run_in_threadpool(writer.flush)
+    response = await call_next(request)
+    if writer.pending:
+        await run_in_threadpool(writer.flush)
+    return response
+
 # Routes
 auth_deps = [Depends(require_api_token)]
 app.include_router(projects.router, tags=["Projects"], dependencies=auth_deps)
@@ -80,6 +107,13 @@ app.include_router(profile.router, dependencies=auth_deps)  # /profile
 app.include_router(cli_executions.router, tags=["CLI Executions"], dependencies=auth_deps)  # /cli-executions
 
 
+@app.on_event("startup")
+def install_config_reload() -> None:
+    """Reload the config snapshot on SIGHUP (when running in the main thread)."""
+    if install_reload_signal_handler():
+        logger.info("config_reload_signal_installed", extra={"signal": "SIGHUP"})
+
+
 @app.on_event("startup")
 def bootstrap_engines() -> None:
     """
@@ -102,14 +136,22 @@ def bootstrap_database() -> None:
     from devgodzilla.cli.main import get_db as cli_get_db
     from devgodzilla.cli.main import get_service_context as cli_get_service_context
 
-    db = cli_get_db()
-    db.init_schema()
+    # Install the sink before the CLI's get_db does, with the API default
+    # (`barrier`: flushed around each request by the middleware above).
     try:
         from devgodzilla.services.event_persistence import install_db_event_sink
 
-        install_db_event_sink(db_provider=cli_get_db)
+        config = get_config()
+        install_db_event_sink(
+            db_provider=cli_get_db,
+            mode=config.event_persistence_mode or "barrier",
+            batch_size=config.event_batch_size,
+            flush_interval_seconds=config.event_flush_interval_ms / 1000.0,
+        )
     except Exception:
         pass
+    db = cli_get_db()
+    db.init_schema()
     try:
         from devgodzilla.services.agent_config import AgentConfigService
 
@@ -135,13 +177,7 @@ def recover_protocol_runs() -> None:
         windmill_client = None
         mode = OrchestratorMode.LOCAL
         if getattr(ctx.config, "windmill_enabled", False):
-            windmill_client = WindmillClient(
-                WindmillConfig(
-                    base_url=ctx.config.windmill_url or "http://localhost:8000",
-                    token=ctx.config.windmill_token or "",
-                    workspace=getattr(ctx.config, "windmill_workspace", "devgodzilla"),
-                )
-            )
+            windmill_client = get_shared_windmill_client(windmill_config_from_settings(ctx.config))
             mode = OrchestratorMode.WINDMILL
 
         orchestrator = OrchestratorService(
@@ -163,6 +199,32 @@ def recover_protocol_runs() -> None:
         )
 
 
+_job_reconciler: WindmillJobReconciler | None = None
+
+
+@app.on_event("startup")
+def start_job_reconciler() -> None:
+    """Periodically bulk-sync non-terminal job runs from Windmill."""
+    global _job_reconciler
+    try:
+        from devgodzilla.cli.main import get_db as cli_get_db
+        from devgodzilla.cli.main import get_service_context as cli_get_service_context
+
+        ctx = cli_get_service_context()
+        interval = getattr(ctx.config, "windmill_reconcile_interval_seconds", 0) or 0
+        if not getattr(ctx.config, "windmill_enabled", False) or interval <= 0:
+            return
+        _job_reconciler = WindmillJobReconciler(
+            ctx,
+            cli_get_db(),
+            get_shared_windmill_client(windmill_config_from_settings(ctx.config)),
+            client_factory=lambda: get_shared_windmill_client(windmill_config_from_settings(get_config())),
+        )
+        _job_reconciler.start(interval_seconds=interval)
+    except Exception as exc:
+        logger.error("job_reconciler_start_failed", extra={"error": str(exc)})
+
+
 @app.on_event("startup")
 def bootstrap_sprint_integration() -> None:
     """Register sprint event handlers."""
@@ -173,6 +235,17 @@ def bootstrap_sprint_integration() -> None:
         logger.error(f"Failed to register sprint event handlers: {e}")
 
 
+@app.on_event("shutdown")
+async def close_windmill_clients() -> None:
+    """Stop the job reconciler and close the pooled Windmill connections."""
+    global _job_reconciler
+    if _job_reconciler is not None:
+        _job_reconciler.stop()
+        _job_reconciler = None
+    close_shared_windmill_clients()
+    await aclose_shared_windmill_clients()
+
+
 @app.get("/health", response_model=schemas.Health)
 def health_check():
     """Health check endpoint."""
@@ -200,13 +273,7 @@ def health_ready(
     try:
         config = ctx.config
         if getattr(config, "windmill_enabled", False):
-            wm = WindmillClient(
-                WindmillConfig(
-                    base_url=config.windmill_url or "http://localhost:8000",
-                    token=config.windmill_token or "",
-                    workspace=getattr(config, "windmill_workspace", "devgodzilla"),
-                )
-            )
+            wm = get_shared_windmill_client(windmill_config_from_settings(config))
             components["windmill"] = "ok" if wm.health_check() else "error"
         else:
             components["windmill"] = "disabled"
@@ -216,6 +283,18 @@ def health_ready(
     status = "ok" if all(v in ("ok", "disabled", "skipped") for v in components.values()) else "error"
     return {"status": status, "components": components, "version": app.version}
 
+
+@app.post("/admin/config/reload", dependencies=auth_deps)
+def admin_reload_config():
+    """Re-read environment and env files into the process-wide config snapshot."""
+    config = reload_config()
+    logger.info("config_reloaded", extra={"environment": config.environment})
+    return {
+        "status": "reloaded",
+        "environment": config.environment,
+        "windmill_enabled": config.windmill_enabled,
+    }
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
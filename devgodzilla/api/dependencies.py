@@ -5,9 +5,16 @@ from fastapi import Depends, Header, HTTPException, Request, Query
 from devgodzilla.cli.main import get_db as cli_get_db, get_service_context as cli_get_service_context
 from devgodzilla.services.base import ServiceContext
 
+from devgodzilla.db.async_database import AsyncDatabase, get_async_database
 from devgodzilla.db.database import Database
-from devgodzilla.windmill.client import WindmillClient, WindmillConfig
-from devgodzilla.config import load_config
+from devgodzilla.windmill.client import (
+    AsyncWindmillClient,
+    WindmillClient,
+    get_shared_async_windmill_client,
+    get_shared_windmill_client,
+    windmill_config_from_settings,
+)
+from devgodzilla.config import get_config
 
 def get_db():
     """Get database instance."""
@@ -18,6 +25,11 @@ def get_db():
         pass
 
 
+def get_async_db(db: Database = Depends(get_db)) -> AsyncDatabase:
+    """Get the non-blocking facade for async routes and streaming generators."""
+    return get_async_database(db)
+
+
 def require_api_token(
     authorization: Optional[str] = Header(None, alias="Authorization"),
     x_devgodzilla_token: Optional[str] = Header(None, alias="X-DevGodzilla-Token"),
@@ -31,7 +43,7 @@ def require_api_token(
     - Header `X-DevGodzilla-Token: <token>`
     - Query parameter `token=<token>` (for SSE/WebSockets)
     """
-    config = load_config()
+    config = get_config()
     expected = config.api_token
     if not expected:
         return
@@ -64,7 +76,7 @@ def require_webhook_token(
     - expose inbound webhooks to Windmill/CI, while
     - still securing the public API surface.
     """
-    config = load_config()
+    config = get_config()
     expected = config.webhook_token
     if not expected:
         return
@@ -90,14 +102,18 @@ def get_service_context(
 def get_windmill_client(
     ctx: ServiceContext = Depends(get_service_context),
 ) -> WindmillClient:
-    """Get a Windmill client from config (requires DEVGODZILLA_WINDMILL_*)."""
+    """Get the shared pooled Windmill client (requires DEVGODZILLA_WINDMILL_*)."""
     config = ctx.config
     if not getattr(config, "windmill_enabled", False):
         raise HTTPException(status_code=503, detail="Windmill integration not configured")
+    return get_shared_windmill_client(windmill_config_from_settings(config))
 
-    wm_config = WindmillConfig(
-        base_url=config.windmill_url or "http://localhost:8000",
-        token=config.windmill_token or "",
-        workspace=getattr(config, "windmill_workspace", "devgodzilla"),
-    )
-    return WindmillClient(wm_config)
+
+async def get_async_windmill_client(
+    ctx: ServiceContext = Depends(get_service_context),
+) -> AsyncWindmillClient:
+    """Get the shared non-blocking Windmill client for async routes."""
+    config = ctx.config
+    if not getattr(config, "windmill_enabled", False):
+        raise HTTPException(status_code=503, detail="Windmill integration not configured")
+    return get_shared_async_windmill_client(windmill_config_from_settings(config))
@@ -0,0 +1,209 @@
+"""
+Seek-based reads of log and artifact files for the API.
+
+Content endpoints return a window of a file (head, tail, explicit offset or an
+HTTP `Range`) without reading the rest of it; follow endpoints stream bytes
+appended to a growing file as SSE, resumable by byte offset.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncGenerator, Optional, Tuple
+
+from fastapi import HTTPException, Response
+
+from devgodzilla.api import schemas
+
+MAX_CONTENT_BYTES = 2_000_000
+
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+}
+
+
+@dataclass
+class FileWindow:
+    data: bytes
+    offset: int
+    size: int
+
+    @property
+    def end(self) -> int:
+        return self.offset + len(self.data)
+
+    @property
+    def truncated(self) -> bool:
+        return self.offset > 0 or self.end < self.size
+
+
+def parse_range_header(value: str, size: int) -> Tuple[int, int]:
+    """Resolve a single `bytes=` range to (start, end_exclusive); 416 if unsatisfiable."""
+    unit, _, spec = value.partition("=")
+    first, _, last = spec.strip().partition("-")
+    try:
+        if unit.strip().lower() != "bytes" or "," in spec:
+            raise ValueError(value)
+        if not first:
+            suffix = int(last)
+            if suffix <= 0:
+                raise ValueError(value)
+            start, end = max(0, size - suffix), size
+        else:
+            start = int(first)
+            end = int(last) + 1 if last else size
+    except ValueError:
+        start, end = size, size
+    if start >= size or end <= start:
+        raise HTTPException(
+            status_code=416,
+            detail="Requested range not satisfiable",
+            headers={"Content-Range": f"bytes */{size}"},
+        )
+    return start, min(end, size)
+
+
+def read_file_window(
+    path: Path,
+    *,
+    max_bytes: int,
+    offset: Optional[int] = None,
+    tail: bool = False,
+    range_header: Optional[str] = None,
+) -> FileWindow:
+    """
+    Read at most `max_bytes` from `path`: a `Range`, the tail, or from `offset`.
+
+    `.gz` files (size-capped patches) are read decompressed; offsets and
+    sizes then refer to the uncompressed content.
+    """
+    max_bytes = max(1, min(int(max_bytes), MAX_CONTENT_BYTES))
+    with path.open("rb") as raw:
+        handle = raw
+        size = os.fstat(raw.fileno()).st_size
+        if path.suffix == ".gz" and size >= 4:
+            # gzip trailer: uncompressed size mod 2**32.
+            raw.seek(-4, os.SEEK_END)
+            size = int.from_bytes(raw.read(4), "little")
+            raw.seek(0)
+            handle = gzip.GzipFile(fileobj=raw)
+        if range_header:
+            start, end = parse_range_header(range_header, size)
+        elif tail:
+            start, end = max(0, size - max_bytes), size
+        else:
+            start, end = min(max(0, int(offset or 0)), size), size
+        end = min(end, start + max_bytes)
+        handle.seek(start)
+        data = handle.read(end - start)
+    return FileWindow(data=data, offset=start, size=size)
+
+
+def file_content(
+    path: Path,
+    response: Response,
+    *,
+    artifact_id: str,
+    name: str,
+    type: str,
+    max_bytes: int,
+    offset: Optional[int] = None,
+    tail: bool = False,
+    range_header: Optional[str] = None,
+) -> schemas.ArtifactContentOut:
+    """Build an ArtifactContentOut for a window of `path`; a `Range` request gets a 206."""
+    window = read_file_window(path, max_bytes=max_bytes, offset=offset, tail=tail, range_header=range_header)
+    response.headers["Accept-Ranges"] = "bytes"
+    if range_header:
+        response.status_code = 206
+        response.headers["Content-Range"] = f"bytes {window.offset}-{window.end - 1}/{window.size}"
+    return schemas.ArtifactContentOut(
+        id=artifact_id,
+        name=name,
+        type=type,
+        content=window.data.decode("utf-8", errors="replace"),
+        truncated=window.truncated,
+        offset=window.offset,
+        size=window.size,
+    )
+
+
+def resume_offset(since_bytes: int, last_event_id: Optional[str]) -> int:
+    """Start offset for a follow stream; SSE `Last-Event-ID` carries the last offset sent."""
+    if last_event_id and last_event_id.isdigit():
+        return max(since_bytes, int(last_event_id))
+    return since_bytes
+
+
+def _log_chunk_to_sse(payload: dict, event_id: Optional[int] = None) -> str:
+    prefix = f"id: {event_id}\n" if event_id is not None else ""
+    return f"{prefix}event: log\ndata: {json.dumps(payload)}\n\n"
+
+
+async def follow_file(
+    path: Optional[Path],
+    *,
+    since_bytes: int = 0,
+    tail_bytes: Optional[int] = None,
+    poll_interval_seconds: float = 0.5,
+    max_chunk_bytes: int = 65536,
+) -> AsyncGenerator[str, None]:
+    """
+    Stream bytes appended to `path` as SSE `log` events.
+
+    Each event carries the byte `offset` after its chunk (also the SSE id),
+    so clients resume with `since_bytes` or `Last-Event-ID`. `tail_bytes`
+    starts that many bytes before the current end instead. The file handle
+    stays open between polls and is reopened when the file is truncated or
+    replaced.
+    """
+    offset = max(0, int(since_bytes))
+    yield "event: connected\ndata: {}\n\n"
+
+    handle = None
+    inode = None
+    idle_ticks = 0
+    try:
+        while True:
+            sent = False
+            try:
+                if path is not None and path.is_file():
+                    stat = path.stat()
+                    if handle is None or stat.st_ino != inode or stat.st_size < offset:
+                        if handle is not None:
+                            handle.close()
+                            offset = 0
+                        handle = path.open("rb")
+                        inode = stat.st_ino
+                        if tail_bytes is not None and offset == 0:
+                            offset = max(0, stat.st_size - int(tail_bytes))
+                        tail_bytes = None
+                    if stat.st_size > offset:
+                        handle.seek(offset)
+                        chunk = handle.read(max_chunk_bytes)
+                        if chunk:
+                            offset += len(chunk)
+                            sent = True
+                            payload = {"offset": offset, "chunk": chunk.decode("utf-8", errors="replace")}
+                            yield _log_chunk_to_sse(payload, event_id=offset)
+            except OSError:
+                pass
+
+            if sent:
+                idle_ticks = 0
+                continue
+            idle_ticks += 1
+            if idle_ticks >= int(30 / max(poll_interval_seconds, 0.1)):
+                idle_ticks = 0
+                yield ": heartbeat\n\n"
+
+            await asyncio.sleep(poll_interval_seconds)
+    finally:
+        if handle is not None:
+            handle.close()
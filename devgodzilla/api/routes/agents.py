@@ -3,6 +3,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 
 from devgodzilla.api import schemas
 from devgodzilla.api.dependencies import get_db, get_service_context
+from devgodzilla.api.snapshots import cached_snapshot
 from devgodzilla.db.database import Database
 from devgodzilla.engines.registry import get_registry
 from devgodzilla.services.agent_config import AgentConfigService
@@ -59,12 +60,18 @@ def list_agents(
 
 @router.get("/agents/health", response_model=List[schemas.AgentHealthOut])
 def check_all_agents_health(
+    refresh: bool = Query(default=False, description="Probe every agent now instead of using cached results"),
     ctx: ServiceContext = Depends(get_service_context),
     db: Database = Depends(get_db),
 ):
-    """Check health for all enabled agents."""
+    """
+    Check health for all enabled agents.
+
+    Results are cached per agent; `stale` marks entries past their TTL that
+    are being re-probed in the background.
+    """
     cfg = AgentConfigService(ctx, db=db)
-    results = cfg.check_all_health()
+    results = cfg.check_all_health(refresh=refresh)
     return [
         schemas.AgentHealthOut(
             agent_id=r.agent_id,
@@ -72,6 +79,8 @@ def check_all_agents_health(
             version=r.version,
             error=r.error,
             response_time_ms=r.response_time_ms,
+            checked_at=r.checked_at,
+            stale=r.stale,
         )
         for r in results
     ]
@@ -83,29 +92,24 @@ def list_agent_metrics(
     db: Database = Depends(get_db),
 ):
     """Return step execution metrics grouped by agent."""
-    metrics: Dict[str, schemas.AgentMetricsOut] = {}
-    if project_id is None:
-        runs = db.list_all_protocol_runs(limit=500)
-    else:
-        runs = db.list_protocol_runs(project_id)
-
-    for run in runs:
-        for step in db.list_step_runs(run.id):
-            agent_id = step.engine_id or step.assigned_agent
-            if not agent_id:
-                continue
+    def _compute() -> List[schemas.AgentMetricsOut]:
+        metrics: Dict[str, schemas.AgentMetricsOut] = {}
+        for row in db.step_run_stats_by_engine(project_id=project_id):
+            agent_id = row["engine_id"]
             entry = metrics.setdefault(agent_id, schemas.AgentMetricsOut(agent_id=agent_id))
-            entry.total_steps += 1
-            if step.status == "running":
-                entry.active_steps += 1
-            elif step.status == "completed":
-                entry.completed_steps += 1
-            elif step.status == "failed":
-                entry.failed_steps += 1
-            if step.updated_at and (entry.last_activity_at is None or step.updated_at > entry.last_activity_at):
-                entry.last_activity_at = step.updated_at
+            entry.total_steps += row["count"]
+            if row["status"] == "running":
+                entry.active_steps += row["count"]
+            elif row["status"] == "completed":
+                entry.completed_steps += row["count"]
+            elif row["status"] == "failed":
+                entry.failed_steps += row["count"]
+            last = row["last_activity_at"]
+            if last and (entry.last_activity_at is None or last > entry.last_activity_at):
+                entry.last_activity_at = last
+        return list(metrics.values())
 
-    return list(metrics.values())
+    return cached_snapshot(db, ("agent_metrics", project_id), _compute)
 
 
 @router.put("/agents/{agent_id}/config", response_model=schemas.AgentInfo)
@@ -432,12 +436,17 @@ def get_agent(
 @router.get("/agents/{agent_id}/health")
 def check_agent_health(
     agent_id: str,
+    refresh: bool = Query(default=False),
     ctx: ServiceContext = Depends(get_service_context),
     db: Database = Depends(get_db),
 ):
     """Check agent health (availability)."""
     cfg = AgentConfigService(ctx, db=db)
-    res = cfg.check_health(agent_id)
+    res = cfg.check_health(agent_id, refresh=refresh)
     if res.error == "Agent not found":
         raise HTTPException(status_code=404, detail="Agent not found")
-    return {"status": "available" if res.available else "unavailable"}
+    return {
+        "status": "available" if res.available else "unavailable",
+        "checked_at": res.checked_at,
+        "stale": res.stale,
+    }
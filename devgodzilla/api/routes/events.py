@@ -2,20 +2,27 @@
 DevGodzilla Events Endpoint
 
 DB-backed Server-Sent Events (SSE) and WebSocket endpoints for real-time updates.
+
+Streams are served by the shared `EventBroker`, which tails the events table
+once per process and fans new events out to every connected client. All DB
+reads go through `AsyncDatabase` so they never block the event loop.
 """
 
 import asyncio
 import json
+from contextlib import aclosing
 from typing import Any, AsyncGenerator, Dict, List, Optional, Set
 
 from fastapi import APIRouter, Depends, Header, Query, WebSocket, WebSocketDisconnect
 from fastapi.responses import StreamingResponse
 
 from devgodzilla.api import schemas
-from devgodzilla.api.dependencies import get_db
+from devgodzilla.api.dependencies import get_async_db, get_db
+from devgodzilla.db.async_database import AsyncDatabase
 from devgodzilla.db.database import Database
 from devgodzilla.events_catalog import normalize_event_type
 from devgodzilla.logging import get_logger
+from devgodzilla.services.event_broker import get_event_broker
 
 logger = get_logger(__name__)
 
@@ -93,30 +100,28 @@ async def event_generator(
         yield "data: {}\n\n"
 
     category_set = {normalize_event_type(c) for c in categories or [] if c}
+    heartbeat_ticks = int(30 / max(poll_interval_seconds, 0.1))
     idle_ticks = 0
-    while True:
-        batch = db.list_events_since_id(
-            since_id=last_id,
-            limit=200,
-            protocol_run_id=protocol_id,
-            project_id=project_id,
-            event_types=event_types,
-        )
-        if batch:
+    stream = get_event_broker(db).stream(
+        since_id=last_id,
+        protocol_run_id=protocol_id,
+        project_id=project_id,
+        event_types=event_types,
+        idle_timeout_seconds=poll_interval_seconds,
+    )
+    async with aclosing(stream):
+        async for e in stream:
+            if e is None:
+                idle_ticks += 1
+                if idle_ticks >= heartbeat_ticks:
+                    idle_ticks = 0
+                    yield ": heartbeat\n\n"
+                continue
             idle_ticks = 0
-            for e in batch:
-                out = schemas.EventOut.model_validate(e)
-                last_id = max(last_id, out.id)
-                if category_set and (out.event_category or "other") not in category_set:
-                    continue
-                yield _event_to_sse(out) if named_events else _event_to_sse_message(out)
-        else:
-            idle_ticks += 1
-            if idle_ticks >= int(30 / max(poll_interval_seconds, 0.1)):
-                idle_ticks = 0
-                yield ": heartbeat\n\n"
-
-        await asyncio.sleep(poll_interval_seconds)
+            out = schemas.EventOut.model_validate(e)
+            if category_set and (out.event_category or "other") not in category_set:
+                continue
+            yield _event_to_sse(out) if named_events else _event_to_sse_message(out)
 
 
 @router.get("/events")
@@ -208,7 +213,7 @@ async def recent_events(
     event_type: Optional[str] = Query(None, description="Filter by event type"),
     kind: Optional[str] = Query(None, description="Deprecated: use event_type"),
     category: Optional[List[str]] = Query(None, description="Filter by event category"),
-    db: Database = Depends(get_db),
+    adb: AsyncDatabase = Depends(get_async_db),
 ):
     """
     Get recent events (non-streaming).
@@ -216,7 +221,7 @@ async def recent_events(
     Returns the last N events from the DB-backed event store.
     """
     effective_event_types = [event_type or kind] if (event_type or kind) else None
-    items = db.list_recent_events(
+    items = await adb.list_recent_events(
         limit=limit,
         protocol_run_id=protocol_id,
         project_id=project_id,
@@ -230,6 +235,23 @@ async def recent_events(
 
 # ==================== WebSocket Endpoint ====================
 
+def _ws_filters(subscriptions: Set[str]) -> tuple[Optional[int], Optional[int]]:
+    protocol_id = None
+    project_id = None
+    for sub in subscriptions:
+        if sub.startswith("protocol:"):
+            try:
+                protocol_id = int(sub.split(":")[1])
+            except (ValueError, IndexError):
+                pass
+        elif sub.startswith("project:"):
+            try:
+                project_id = int(sub.split(":")[1])
+            except (ValueError, IndexError):
+                pass
+    return protocol_id, project_id
+
+
 async def _ws_event_pusher(
     websocket: WebSocket,
     db: Database,
@@ -238,60 +260,50 @@ async def _ws_event_pusher(
     """Background task to push events to WebSocket client based on subscriptions."""
     last_id = 0
     idle_ticks = 0
+    heartbeat_ticks = int(30 / max(poll_interval, 0.1))
+    broker = get_event_broker(db)
 
     while True:
         try:
-            subscriptions = ws_manager.get_subscriptions(websocket)
+            subscriptions = set(ws_manager.get_subscriptions(websocket))
             if not subscriptions:
                 await asyncio.sleep(poll_interval)
                 continue
 
-            protocol_id = None
-            project_id = None
-            for sub in subscriptions:
-                if sub.startswith("protocol:"):
-                    try:
-                        protocol_id = int(sub.split(":")[1])
-                    except (ValueError, IndexError):
-                        pass
-                elif sub.startswith("project:"):
-                    try:
-                        project_id = int(sub.split(":")[1])
-                    except (ValueError, IndexError):
-                        pass
-
-            batch = db.list_events_since_id(
+            protocol_id, project_id = _ws_filters(subscriptions)
+            stream = broker.stream(
                 since_id=last_id,
-                limit=200,
                 protocol_run_id=protocol_id,
                 project_id=project_id,
+                idle_timeout_seconds=poll_interval,
             )
-
-            if batch:
-                idle_ticks = 0
-                for e in batch:
-                    out = schemas.EventOut.model_validate(e)
-                    last_id = max(last_id, out.id)
-
-                    channel = "events"
-                    if out.protocol_run_id:
-                        channel = f"protocol:{out.protocol_run_id}"
-
-                    message = {
-                        "type": "event",
-                        "channel": channel,
-                        "payload": out.model_dump(),
-                        "id": str(out.id),
-                        "ts": out.created_at.isoformat() if out.created_at else None,
-                    }
-                    await websocket.send_json(message)
-            else:
-                idle_ticks += 1
-                if idle_ticks >= int(30 / max(poll_interval, 0.1)):
-                    idle_ticks = 0
-                    await websocket.send_json({"type": "ping"})
-
-            await asyncio.sleep(poll_interval)
+            async with aclosing(stream):
+                async for e in stream:
+                    if e is None:
+                        idle_ticks += 1
+                        if idle_ticks >= heartbeat_ticks:
+                            idle_ticks = 0
+                            await websocket.send_json({"type": "ping"})
+                    else:
+                        idle_ticks = 0
+                        out = schemas.EventOut.model_validate(e)
+                        last_id = max(last_id, out.id)
+
+                        channel = "events"
+                        if out.protocol_run_id:
+                            channel = f"protocol:{out.protocol_run_id}"
+
+                        message = {
+                            "type": "event",
+                            "channel": channel,
+                            "payload": out.model_dump(),
+                            "id": str(out.id),
+                            "ts": out.created_at.isoformat() if out.created_at else None,
+                        }
+                        await websocket.send_json(message)
+                    # Re-subscribe to the broker with new filters when channels change.
+                    if ws_manager.get_subscriptions(websocket) != subscriptions:
+                        break
         except WebSocketDisconnect:
             break
         except Exception as exc:
@@ -28,27 +28,23 @@ async def log_stream_generator(
     since_id: int = 0,
     level: Optional[str] = None,
     source: Optional[str] = None,
-    poll_interval_seconds: float = 0.5,
+    heartbeat_seconds: float = 30.0,
 ) -> AsyncGenerator[str, None]:
     buffer = get_log_buffer()
     last_id = max(0, since_id)
-    yield "event: connected\ndata: {}\n\n"
-
-    idle_ticks = 0
-    while True:
-        logs = buffer.get_logs_since(last_id, level=level, source=source)
-        if logs:
-            idle_ticks = 0
-            for log in logs:
+    # Subscribe before the first read so no entry falls between read and wait.
+    subscription = buffer.subscribe(level=level, source=source)
+    try:
+        yield "event: connected\ndata: {}\n\n"
+
+        while True:
+            for log in buffer.get_logs_since(last_id, level=level, source=source):
                 last_id = max(last_id, log["id"])
                 yield _log_to_sse(log)
-        else:
-            idle_ticks += 1
-            if idle_ticks >= int(30 / max(poll_interval_seconds, 0.1)):
-                idle_ticks = 0
+            if not await subscription.wait(timeout=heartbeat_seconds):
                 yield ": heartbeat\n\n"
-
-        await asyncio.sleep(poll_interval_seconds)
+    finally:
+        buffer.unsubscribe(subscription)
 
 
 @router.get("/logs/stream")
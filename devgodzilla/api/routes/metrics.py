@@ -8,9 +8,11 @@ from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 from fastapi import APIRouter, Depends, Response
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from devgodzilla.api.dependencies import get_db
+from devgodzilla.api.snapshots import cached_snapshot
+from devgodzilla.db.async_database import all_async_database_stats
 from devgodzilla.db.database import Database
 
 # Try to import prometheus_client, provide stub if not available
@@ -42,7 +44,6 @@ except ImportError:
 
 router = APIRouter(tags=["Metrics"])
 
-
 # ==================== JSON Summary Models ====================
 
 class JobTypeMetric(BaseModel):
@@ -58,111 +59,70 @@ class EndpointMetric(BaseModel):
 
 
 class MetricsSummary(BaseModel):
-    total_events: int
-    total_protocol_runs: int
-    total_step_runs: int
-    total_job_runs: int
+    # total_* are all-time; job_type_metrics and recent_* cover the requested window.
+    total_events: int = Field(description="All-time event count")
+    total_protocol_runs: int = Field(description="All-time protocol run count")
+    total_step_runs: int = Field(description="All-time step run count")
+    total_job_runs: int = Field(description="All-time job run count")
     active_projects: int
     success_rate: float
     job_type_metrics: list[JobTypeMetric]
     recent_events_count: int
+    recent_job_runs_count: int = Field(description="Job runs created in the window (sum of job_type_metrics)")
 
 
-@router.get("/metrics/summary", response_model=MetricsSummary)
-def metrics_summary(
-    hours: int = 24,
-    db: Database = Depends(get_db),
-):
-    """
-    JSON metrics summary for the frontend dashboard.
-    
-    Returns aggregated stats from the database.
-    """
-    # Get basic counts
+def _summary(db: Database, hours: int) -> MetricsSummary:
     projects = db.list_projects()
     active_projects = len([p for p in projects if p.status != "archived"])
-    
-    # Get protocol runs across all projects
-    all_protocol_runs = []
-    for project in projects:
-        try:
-            runs = db.list_protocol_runs(project.id)
-            all_protocol_runs.extend(runs)
-        except Exception:
-            pass
-    total_protocol_runs = len(all_protocol_runs)
-    
-    # Calculate success rate
-    completed = [r for r in all_protocol_runs if r.status in ("completed", "passed")]
-    failed = [r for r in all_protocol_runs if r.status in ("failed", "error")]
-    total_finished = len(completed) + len(failed)
-    success_rate = (len(completed) / total_finished * 100) if total_finished > 0 else 100.0
-    
-    # Get step runs across all protocol runs
-    total_step_runs = 0
-    for pr in all_protocol_runs:
-        try:
-            steps = db.list_step_runs(pr.id)
-            total_step_runs += len(steps)
-        except Exception:
-            pass
-    
-    # Get job runs (this method supports limit directly)
-    job_runs = db.list_job_runs(limit=1000)
-    total_job_runs = len(job_runs)
-    
-    # Aggregate job runs by type
-    job_type_counts: dict[str, list] = {}
-    def _parse_ts(value: Optional[str]) -> Optional[datetime]:
-        if not value:
-            return None
-        try:
-            return datetime.fromisoformat(str(value).replace("Z", "+00:00"))
-        except Exception:
-            return None
-
-    for jr in job_runs:
-        jt = jr.job_type or "unknown"
-        if jt not in job_type_counts:
-            job_type_counts[jt] = []
-        # Calculate duration if we have start/end times
-        duration = None
-        started_at = _parse_ts(jr.started_at)
-        finished_at = _parse_ts(jr.finished_at)
-        if started_at and finished_at:
-            duration = (finished_at - started_at).total_seconds()
-        job_type_counts[jt].append(duration)
-    
-    job_type_metrics = []
-    for jt, durations in job_type_counts.items():
-        valid_durations = [d for d in durations if d is not None]
-        avg_dur = sum(valid_durations) / len(valid_durations) if valid_durations else None
-        job_type_metrics.append(JobTypeMetric(
-            job_type=jt,
-            count=len(durations),
-            avg_duration_seconds=avg_dur,
-        ))
-    
-    # Sort by count descending
-    job_type_metrics.sort(key=lambda x: x.count, reverse=True)
-    
-    # Get recent events count
-    recent_events = db.list_recent_events(limit=500)
-    recent_events_count = len(recent_events)
-    total_events = recent_events_count  # This is approximate
-    
+
+    protocol_counts = db.count_protocol_runs_by_status()
+    total_protocol_runs = sum(protocol_counts.values())
+    completed = sum(protocol_counts.get(s, 0) for s in ("completed", "passed"))
+    failed = sum(protocol_counts.get(s, 0) for s in ("failed", "error"))
+    total_finished = completed + failed
+    success_rate = (completed / total_finished * 100) if total_finished > 0 else 100.0
+
+    total_step_runs = sum(db.count_step_runs_by_status().values())
+
+    since = datetime.now(timezone.utc) - timedelta(hours=max(1, int(hours)))
+    total_job_runs = sum(row["count"] for row in db.job_run_stats_by_type())
+    job_type_metrics = [
+        JobTypeMetric(
+            job_type=row["job_type"],
+            count=row["count"],
+            avg_duration_seconds=row["avg_duration_seconds"],
+        )
+        for row in db.job_run_stats_by_type(since=since)
+    ]
+
     return MetricsSummary(
-        total_events=total_events,
+        total_events=db.count_events(),
         total_protocol_runs=total_protocol_runs,
         total_step_runs=total_step_runs,
         total_job_runs=total_job_runs,
         active_projects=active_projects,
         success_rate=round(success_rate, 1),
         job_type_metrics=job_type_metrics,
-        recent_events_count=recent_events_count,
+        recent_events_count=db.count_events(since=since),
+        recent_job_runs_count=sum(m.count for m in job_type_metrics),
     )
 
 
+@router.get("/metrics/summary", response_model=MetricsSummary)
+def metrics_summary(
+    hours: int = 24,
+    db: Database = Depends(get_db),
+):
+    """
+    JSON metrics summary for the frontend dashboard.
+    
+    Returns aggregated stats from the database. Job type metrics,
+    `recent_events_count` and `recent_job_runs_count` cover the last `hours`;
+    the `total_*` fields are all-time.
+    """
+    return cached_snapshot(db, ("metrics_summary", hours), lambda: _summary(db, hours))
+
+
 
 # ==================== Metrics Definitions ====================
 
@@ -251,6 +211,17 @@ async def metrics():
     )
 
 
+@router.get("/metrics/db")
+def db_call_metrics():
+    """
+    Latency of database calls made through the async DB executor.
+
+    Reports per-method call counts, errors, and average/max execution and
+    queue-wait times in milliseconds.
+    """
+    return {"databases": all_async_database_stats()}
+
+
 # ==================== Helper Functions ====================
 
 def record_protocol_started():
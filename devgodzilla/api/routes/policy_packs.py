@@ -8,6 +8,7 @@ from fastapi import APIRouter, Depends, HTTPException
 
 from devgodzilla.api import schemas
 from devgodzilla.api.dependencies import get_db, Database
+from devgodzilla.services.policy import invalidate_policy_cache
 
 router = APIRouter(tags=["policy_packs"])
 
@@ -53,7 +54,7 @@ def create_or_update_policy_pack(
     db: Database = Depends(get_db),
 ):
     """Create or update a policy pack."""
-    return db.upsert_policy_pack(
+    pack = db.upsert_policy_pack(
         key=data.key,
         version=data.version,
         name=data.name,
@@ -61,3 +62,5 @@ def create_or_update_policy_pack(
         status=data.status,
         pack=data.pack,
     )
+    invalidate_policy_cache(db, pack_key=data.key)
+    return pack
@@ -2,18 +2,22 @@ from __future__ import annotations
 
 import os
 import time
+from datetime import datetime, timezone
 from typing import Any, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from devgodzilla.api import schemas
-from devgodzilla.api.dependencies import get_db, get_service_context
+from devgodzilla.api.dependencies import get_async_db, get_db, get_service_context
+from devgodzilla.api.file_reads import SSE_HEADERS, file_content, follow_file, resume_offset
+from devgodzilla.db.async_database import AsyncDatabase
 from devgodzilla.db.database import Database, _UNSET
 from devgodzilla.events_catalog import normalize_event_type
 from devgodzilla.logging import get_logger, log_extra
 from devgodzilla.services.base import ServiceContext
-from devgodzilla.services.policy import PolicyService
+from devgodzilla.services.policy import PolicyService, invalidate_policy_cache
 from devgodzilla.services.clarifier import ClarifierService
 from devgodzilla.services.specification import SpecificationService
 from pathlib import Path
@@ -69,6 +73,25 @@ def _normalize_policy_enforcement_mode(mode: Optional[str]) -> Optional[str]:
     return mapping.get(value, value)
 
 
+def _policy_clone_strategy(ctx: ServiceContext, db: Database, project_id: int) -> Optional[str]:
+    """`defaults.git.clone` from the project's policy (repo-local policy is not cloned yet)."""
+    try:
+        effective = PolicyService(ctx, db).resolve_effective_policy(project_id, include_repo_local=False)
+    except Exception:
+        return None
+    defaults = effective.policy.get("defaults", {}) if isinstance(effective.policy, dict) else {}
+    git_defaults = defaults.get("git", {}) if isinstance(defaults, dict) else {}
+    value = git_defaults.get("clone") if isinstance(git_defaults, dict) else None
+    return str(value) if value else None
+
+
+def _set_refs_headers(response: Response, *entries: Any) -> None:
+    """Staleness metadata for responses served from the repo ref cache."""
+    oldest = min(entry.fetched_at for entry in entries)
+    response.headers["X-DevGodzilla-Refs-Fetched-At"] = datetime.fromtimestamp(oldest, timezone.utc).isoformat()
+    response.headers["X-DevGodzilla-Refs-Stale"] = "true" if any(entry.stale for entry in entries) else "false"
+
+
 class ProjectOnboardRequest(BaseModel):
     branch: Optional[str] = Field(default=None, description="Branch to checkout after clone (defaults to project.base_branch)")
     clone_if_missing: bool = Field(default=True, description="Clone repo if local_path is missing")
@@ -422,6 +445,8 @@ def onboard_project(
         raise HTTPException(status_code=400, detail="Project has no git_url")
 
     from devgodzilla.services.git import GitService, run_process
+    from devgodzilla.services.repo_refs import invalidate_repo_refs
+    from devgodzilla.services.worktree_pool import refresh_worktree_pools
     from devgodzilla.services.specification import SpecificationService
 
     logger.debug(
@@ -456,6 +481,7 @@ def onboard_project(
             project.local_path,
             project_id=project.id,
             clone_if_missing=bool(request.clone_if_missing),
+            clone_strategy=_policy_clone_strategy(ctx, db, project.id),
         )
     except FileNotFoundError as exc:
         raise HTTPException(status_code=400, detail=str(exc))
@@ -474,7 +500,9 @@ def onboard_project(
     branch = (request.branch or project.base_branch or "main").strip()
     if branch:
         try:
-            run_process(["git", "fetch", "--prune", "origin", branch], cwd=repo_path, check=False)
+            fetched = run_process(["git", "fetch", "--prune", "origin", branch], cwd=repo_path, check=False)
+            if fetched.returncode == 0:
+                refresh_worktree_pools(repo_path)
             # Prefer tracking branch when available.
             res = run_process(["git", "checkout", branch], cwd=repo_path, check=False)
             if res.returncode != 0:
@@ -482,6 +510,7 @@ def onboard_project(
         except Exception:
             # Best-effort: branch checkout isn't strictly required for SpecKit init.
             pass
+        invalidate_repo_refs(repo_path)
 
     # Persist local_path (ensure DevGodzilla API can later find the repo).
     if not project.local_path or project.local_path != str(repo_path):
@@ -752,22 +781,33 @@ def retry_project_discovery(
     )
 
 
-@router.get("/projects/{project_id}/discovery/logs", response_model=schemas.ArtifactContentOut)
-def get_project_discovery_logs(
-    project_id: int,
-    max_bytes: int = 200_000,
-    db: Database = Depends(get_db),
-):
+def _discovery_log_path(db: Database, project_id: int) -> Path:
     try:
         project = db.get_project(project_id)
     except KeyError:
         raise HTTPException(status_code=404, detail="Project not found")
+    return _project_discovery_log_path(project)
+
 
+def _project_discovery_log_path(project) -> Path:
     if not project.local_path:
         raise HTTPException(status_code=400, detail="Project has no local repository path")
 
     repo_root = Path(project.local_path).expanduser().resolve()
-    log_path = repo_root / "specs" / "discovery" / "_runtime" / "opencode-discovery.log"
+    return repo_root / "specs" / "discovery" / "_runtime" / "opencode-discovery.log"
+
+
+@router.get("/projects/{project_id}/discovery/logs", response_model=schemas.ArtifactContentOut)
+def get_project_discovery_logs(
+    project_id: int,
+    response: Response,
+    max_bytes: int = 200_000,
+    offset: Optional[int] = Query(None, ge=0, description="Read from this byte offset"),
+    tail: bool = Query(False, description="Return the last max_bytes instead of the first"),
+    range_header: Optional[str] = Header(None, alias="Range"),
+    db: Database = Depends(get_db),
+):
+    log_path = _discovery_log_path(db, project_id)
     if not log_path.exists() or not log_path.is_file():
         return schemas.ArtifactContentOut(
             id="discovery-log",
@@ -777,22 +817,46 @@ def get_project_discovery_logs(
             truncated=False,
         )
 
-    max_bytes = max(1, min(int(max_bytes), 2_000_000))
-    raw = log_path.read_bytes()
-    truncated = len(raw) > max_bytes
-    if truncated:
-        raw = raw[:max_bytes]
-    try:
-        content = raw.decode("utf-8")
-    except Exception:
-        content = raw.decode("utf-8", errors="replace")
-
-    return schemas.ArtifactContentOut(
-        id="discovery-log",
+    return file_content(
+        log_path,
+        response,
+        artifact_id="discovery-log",
         name=log_path.name,
         type="log",
-        content=content,
-        truncated=truncated,
+        max_bytes=max_bytes,
+        offset=offset,
+        tail=tail,
+        range_header=range_header,
+    )
+
+
+@router.get("/projects/{project_id}/discovery/logs/stream")
+async def stream_project_discovery_logs(
+    project_id: int,
+    since_bytes: int = Query(0, ge=0, description="Only stream bytes after this offset"),
+    tail_bytes: Optional[int] = Query(None, ge=0, description="Start this many bytes before the current end"),
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
+    poll_interval_seconds: float = Query(0.5, ge=0.1, le=5),
+    max_chunk_bytes: int = Query(65536, ge=1024, le=200000),
+    adb: AsyncDatabase = Depends(get_async_db),
+):
+    """Follow the discovery log as SSE while discovery runs."""
+    try:
+        project = await adb.get_project(project_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Project not found")
+    log_path = _project_discovery_log_path(project)
+    since = resume_offset(since_bytes, last_event_id)
+    return StreamingResponse(
+        follow_file(
+            log_path,
+            since_bytes=since,
+            tail_bytes=tail_bytes if not since else None,
+            poll_interval_seconds=poll_interval_seconds,
+            max_chunk_bytes=max_chunk_bytes,
+        ),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
     )
 
 @router.get("/projects/{project_id}/sprints", response_model=List[schemas.SprintOut])
@@ -868,6 +932,7 @@ def update_project_policy(
         kwargs["policy_enforcement_mode"] = _normalize_policy_enforcement_mode(policy.policy_enforcement_mode)
 
     updated = db.update_project_policy(project_id, **kwargs)
+    invalidate_policy_cache(db, project_id=project_id)
     try:
         if updated.local_path:
             constitution_path = Path(updated.local_path).expanduser() / ".specify" / "memory" / "constitution.md"
@@ -957,10 +1022,17 @@ def get_policy_findings(
 @router.get("/projects/{project_id}/branches", response_model=List[schemas.BranchOut])
 def list_project_branches(
     project_id: int,
+    response: Response,
+    refresh: bool = False,
     db: Database = Depends(get_db),
     ctx: ServiceContext = Depends(get_service_context),
 ):
-    """List git branches for a project repository."""
+    """
+    List git branches for a project repository.
+
+    Served from the repo ref cache; `X-DevGodzilla-Refs-Stale: true` means a
+    background reload is under way. `?refresh=true` reloads first.
+    """
     try:
         project = db.get_project(project_id)
     except KeyError:
@@ -969,8 +1041,7 @@ def list_project_branches(
     if not project.local_path:
         raise HTTPException(status_code=400, detail="Project has no local repository path")
     
-    from pathlib import Path
-    from devgodzilla.services.git import GitService, run_process
+    from devgodzilla.services.repo_refs import get_repo_ref_cache, load_local_heads, load_remote_heads
     
     repo_path = Path(project.local_path).expanduser()
     if not repo_path.exists():
@@ -979,48 +1050,19 @@ def list_project_branches(
     if not (repo_path / ".git").exists():
         raise HTTPException(status_code=400, detail="Project path is not a git repository")
     
-    git_service = GitService(ctx)
-    branches = []
-    
-    # Get local branches with their SHAs
-    try:
-        result = run_process(
-            ["git", "for-each-ref", "--format=%(refname:short) %(objectname)", "refs/heads/"],
-            cwd=repo_path,
-        )
-        for line in result.stdout.strip().splitlines():
-            if line:
-                parts = line.split()
-                if len(parts) >= 2:
-                    branches.append(schemas.BranchOut(
-                        name=parts[0],
-                        sha=parts[1],
-                        is_remote=False,
-                    ))
-    except Exception:
-        pass
-    
-    # Get remote branches with their SHAs
-    try:
-        result = run_process(
-            ["git", "ls-remote", "--heads", "origin"],
-            cwd=repo_path,
-        )
-        for line in result.stdout.strip().splitlines():
-            if line:
-                parts = line.split()
-                if len(parts) >= 2 and parts[1].startswith("refs/heads/"):
-                    branch_name = parts[1].replace("refs/heads/", "")
-                    # Only add if not already in local branches
-                    if not any(b.name == branch_name and not b.is_remote for b in branches):
-                        branches.append(schemas.BranchOut(
-                            name=branch_name,
-                            sha=parts[0],
-                            is_remote=True,
-                        ))
-    except Exception:
-        pass
-    
+    cache = get_repo_ref_cache()
+    local = cache.get(repo_path, "local_heads", load_local_heads, refresh=refresh)
+    remote = cache.get(repo_path, "remote_heads", load_remote_heads, refresh=refresh)
+    _set_refs_headers(response, local, remote)
+
+    branches = [schemas.BranchOut(name=h["name"], sha=h["sha"], is_remote=False) for h in local.value]
+    local_names = {b.name for b in branches}
+    # Remote branches only when there is no local branch of the same name.
+    branches.extend(
+        schemas.BranchOut(name=h["name"], sha=h["sha"], is_remote=True)
+        for h in remote.value
+        if h["name"] not in local_names
+    )
     return branches
 
 
@@ -1040,6 +1082,7 @@ def create_project_branch(
         raise HTTPException(status_code=400, detail="Project has no local repository path")
 
     from devgodzilla.services.git import run_process
+    from devgodzilla.services.repo_refs import invalidate_repo_refs
 
     repo_path = Path(project.local_path).expanduser()
     if not repo_path.exists():
@@ -1074,6 +1117,7 @@ def create_project_branch(
         run_process(["git", "checkout", branch_name], cwd=repo_path, check=True)
     if request.push:
         run_process(["git", "push", "-u", "origin", branch_name], cwd=repo_path, check=True)
+    invalidate_repo_refs(repo_path)
 
     _append_project_event(
         db,
@@ -1102,6 +1146,7 @@ def delete_project_branch(
         raise HTTPException(status_code=400, detail="Project has no local repository path")
 
     from devgodzilla.services.git import run_process
+    from devgodzilla.services.repo_refs import invalidate_repo_refs
 
     repo_path = Path(project.local_path).expanduser()
     if not repo_path.exists():
@@ -1127,6 +1172,7 @@ def delete_project_branch(
     if delete_remote:
         remote_res = run_process(["git", "push", "origin", "--delete", branch_name], cwd=repo_path, check=False)
         deleted_remote_branch = remote_res.returncode == 0
+    invalidate_repo_refs(repo_path)
 
     _append_project_event(
         db,
@@ -1191,11 +1237,13 @@ def answer_project_clarification(
 @router.get("/projects/{project_id}/commits", response_model=List[schemas.CommitOut])
 def list_project_commits(
     project_id: int,
+    response: Response,
     limit: int = 20,
+    refresh: bool = False,
     db: Database = Depends(get_db),
     ctx: ServiceContext = Depends(get_service_context),
 ):
-    """List recent git commits for a project repository."""
+    """List recent git commits for a project repository (repo ref cache)."""
     try:
         project = db.get_project(project_id)
     except KeyError:
@@ -1204,8 +1252,7 @@ def list_project_commits(
     if not project.local_path:
         raise HTTPException(status_code=400, detail="Project has no local repository path")
     
-    from pathlib import Path
-    from devgodzilla.services.git import run_process
+    from devgodzilla.services.repo_refs import get_repo_ref_cache, load_commits
     
     repo_path = Path(project.local_path).expanduser()
     if not repo_path.exists():
@@ -1214,35 +1261,21 @@ def list_project_commits(
     if not (repo_path / ".git").exists():
         raise HTTPException(status_code=400, detail="Project path is not a git repository")
     
-    commits = []
-    try:
-        # Use git log to get recent commits with format: sha|subject|author name|relative date
-        result = run_process(
-            ["git", "log", f"-{limit}", "--format=%H|%s|%an|%ar"],
-            cwd=repo_path,
-        )
-        for line in result.stdout.strip().splitlines():
-            if line:
-                parts = line.split("|", 3)
-                if len(parts) >= 4:
-                    commits.append(schemas.CommitOut(
-                        sha=parts[0],
-                        message=parts[1],
-                        author=parts[2],
-                        date=parts[3],
-                    ))
-    except Exception:
-        pass
-    
-    return commits
+    entry = get_repo_ref_cache().get(
+        repo_path, "commits", lambda path: load_commits(path, limit), arg=limit, refresh=refresh
+    )
+    _set_refs_headers(response, entry)
+    return [schemas.CommitOut(**commit) for commit in entry.value]
 
 @router.get("/projects/{project_id}/pulls", response_model=List[schemas.PullRequestOut])
 def list_project_pulls(
     project_id: int,
+    response: Response,
+    refresh: bool = False,
     db: Database = Depends(get_db),
     ctx: ServiceContext = Depends(get_service_context),
 ):
-    """List open pull requests for a project repository (GitHub only)."""
+    """List open pull requests for a project repository (GitHub only, repo ref cache)."""
     try:
         project = db.get_project(project_id)
     except KeyError:
@@ -1251,48 +1284,42 @@ def list_project_pulls(
     if not project.local_path:
         return []  # No repo path, return empty list
     
-    from pathlib import Path
-    from devgodzilla.services.git import run_process
-    import json
+    from devgodzilla.services.repo_refs import get_repo_ref_cache, load_pulls
     
     repo_path = Path(project.local_path).expanduser()
     if not repo_path.exists() or not (repo_path / ".git").exists():
         return []
     
-    pulls = []
     try:
-        # Use GitHub CLI to list PRs (requires gh to be installed and authenticated)
-        result = run_process(
-            ["gh", "pr", "list", "--json", "number,title,headRefName,state,author,url,createdAt,statusCheckRollup"],
-            cwd=repo_path,
-            check=False,
-        )
-        if result.returncode == 0 and result.stdout.strip():
-            pr_data = json.loads(result.stdout)
-            for pr in pr_data:
-                # Determine check status
-                checks = "unknown"
-                if pr.get("statusCheckRollup"):
-                    check_statuses = [c.get("conclusion") or c.get("state") for c in pr["statusCheckRollup"]]
-                    if all(s in ("SUCCESS", "success", "COMPLETED") for s in check_statuses if s):
-                        checks = "passing"
-                    elif any(s in ("FAILURE", "failure", "FAILED") for s in check_statuses if s):
-                        checks = "failing"
-                    elif any(s in ("PENDING", "pending", "IN_PROGRESS", "QUEUED") for s in check_statuses if s):
-                        checks = "pending"
-                
-                pulls.append(schemas.PullRequestOut(
-                    id=str(pr.get("number", "")),
-                    title=pr.get("title", ""),
-                    branch=pr.get("headRefName", ""),
-                    status=pr.get("state", "open").lower(),
-                    checks=checks,
-                    url=pr.get("url", ""),
-                    author=pr.get("author", {}).get("login", "") if isinstance(pr.get("author"), dict) else "",
-                    created_at=pr.get("createdAt", ""),
-                ))
+        # Requires the GitHub CLI to be installed and authenticated.
+        entry = get_repo_ref_cache().get(repo_path, "pulls", load_pulls, refresh=refresh)
     except Exception:
-        pass  # gh CLI not available or not authenticated
+        return []
+    _set_refs_headers(response, entry)
+
+    pulls = []
+    for pr in entry.value:
+        # Determine check status
+        checks = "unknown"
+        if pr.get("statusCheckRollup"):
+            check_statuses = [c.get("conclusion") or c.get("state") for c in pr["statusCheckRollup"]]
+            if all(s in ("SUCCESS", "success", "COMPLETED") for s in check_statuses if s):
+                checks = "passing"
+            elif any(s in ("FAILURE", "failure", "FAILED") for s in check_statuses if s):
+                checks = "failing"
+            elif any(s in ("PENDING", "pending", "IN_PROGRESS", "QUEUED") for s in check_statuses if s):
+                checks = "pending"
+        
+        pulls.append(schemas.PullRequestOut(
+            id=str(pr.get("number", "")),
+            title=pr.get("title", ""),
+            branch=pr.get("headRefName", ""),
+            status=pr.get("state", "open").lower(),
+            checks=checks,
+            url=pr.get("url", ""),
+            author=pr.get("author", {}).get("login", "") if isinstance(pr.get("author"), dict) else "",
+            created_at=pr.get("createdAt", ""),
+        ))
     
     return pulls
 
@@ -1300,10 +1327,12 @@ def list_project_pulls(
 @router.get("/projects/{project_id}/worktrees", response_model=List[schemas.WorktreeOut])
 def list_project_worktrees(
     project_id: int,
+    response: Response,
+    refresh: bool = False,
     db: Database = Depends(get_db),
     ctx: ServiceContext = Depends(get_service_context),
 ):
-    """List worktrees associated with protocols and spec runs for a project."""
+    """List worktrees associated with protocols and spec runs for a project (repo ref cache)."""
     try:
         project = db.get_project(project_id)
     except KeyError:
@@ -1312,14 +1341,12 @@ def list_project_worktrees(
     if not project.local_path:
         return []
     
-    from devgodzilla.services.git import run_process
+    from devgodzilla.services.repo_refs import get_repo_ref_cache, load_local_heads, load_pr_urls, load_worktrees
     
     repo_path = Path(project.local_path).expanduser()
     if not repo_path.exists() or not (repo_path / ".git").exists():
         return []
     
-    worktrees = []
-    
     # Get all protocol runs for this project to find associated branches
     try:
         protocols = db.list_protocol_runs(project_id=project_id)
@@ -1333,77 +1360,38 @@ def list_project_worktrees(
         branch_name = p.protocol_name
         if branch_name:
             branch_protocols[branch_name] = p
-    
-    # Get git worktrees if any
-    worktree_paths = {}
+    if not branch_protocols:
+        return []
+
+    # One cached lookup each instead of `git log -1` / `gh pr view` per branch.
+    cache = get_repo_ref_cache()
+    worktree_entry = cache.get(repo_path, "worktrees", load_worktrees, refresh=refresh)
+    heads_entry = cache.get(repo_path, "local_heads", load_local_heads, refresh=refresh)
+    entries = [worktree_entry, heads_entry]
+    pr_urls = {}
     try:
-        result = run_process(
-            ["git", "worktree", "list", "--porcelain"],
-            cwd=repo_path,
-            check=False,
-        )
-        if result.returncode == 0:
-            current_worktree = None
-            current_branch = None
-            for line in result.stdout.strip().splitlines():
-                if line.startswith("worktree "):
-                    current_worktree = line.split(" ", 1)[1]
-                elif line.startswith("branch refs/heads/"):
-                    current_branch = line.replace("branch refs/heads/", "")
-                    if current_worktree and current_branch:
-                        worktree_paths[current_branch] = current_worktree
-                    current_worktree = None
-                    current_branch = None
+        pr_entry = cache.get(repo_path, "pr_urls", load_pr_urls, refresh=refresh)
+        pr_urls = pr_entry.value
+        entries.append(pr_entry)
     except Exception:
-        pass
-    
-    # Build worktree list from protocols
+        pass  # gh CLI not available or not authenticated
+    _set_refs_headers(response, *entries)
+    heads = {h["name"]: h for h in heads_entry.value}
+
+    worktrees = []
     for branch_name, protocol in branch_protocols.items():
-        # Get last commit for this branch
-        last_sha = None
-        last_message = None
-        last_date = None
-        try:
-            result = run_process(
-                ["git", "log", "-1", "--format=%H|%s|%ar", branch_name],
-                cwd=repo_path,
-                check=False,
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                parts = result.stdout.strip().split("|", 2)
-                if len(parts) >= 3:
-                    last_sha = parts[0]
-                    last_message = parts[1]
-                    last_date = parts[2]
-        except Exception:
-            pass
-        
-        # Check if there's a PR for this branch
-        pr_url = None
-        try:
-            result = run_process(
-                ["gh", "pr", "view", branch_name, "--json", "url"],
-                cwd=repo_path,
-                check=False,
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                import json
-                pr_data = json.loads(result.stdout)
-                pr_url = pr_data.get("url")
-        except Exception:
-            pass
-        
+        head = heads.get(branch_name) or {}
         worktrees.append(schemas.WorktreeOut(
             branch_name=branch_name,
-            worktree_path=worktree_paths.get(branch_name) or protocol.worktree_path,
+            worktree_path=worktree_entry.value.get(branch_name) or protocol.worktree_path,
             protocol_run_id=protocol.id,
             protocol_name=protocol.protocol_name,
             protocol_status=protocol.status,
             spec_run_id=None,  # Could be populated if we track spec runs per protocol
-            last_commit_sha=last_sha,
-            last_commit_message=last_message,
-            last_commit_date=last_date,
-            pr_url=pr_url,
+            last_commit_sha=head.get("sha"),
+            last_commit_message=head.get("subject"),
+            last_commit_date=head.get("date"),
+            pr_url=pr_urls.get(branch_name),
         ))
     
     return worktrees
@@ -8,6 +8,7 @@ from devgodzilla.api import schemas
 from devgodzilla.api.dependencies import get_db, get_service_context, get_windmill_client
 from devgodzilla.services.base import ServiceContext
 from devgodzilla.db.database import Database
+from devgodzilla.services.execution import ExecutionService
 from devgodzilla.services.orchestrator import OrchestratorMode, OrchestratorService
 from devgodzilla.services.planning import PlanningService
 from devgodzilla.services.policy import PolicyService
@@ -69,6 +70,8 @@ def _protocol_root(run, workspace_root: Path) -> Path:
 
 def _artifact_type_from_name(name: str) -> str:
     lower = name.lower()
+    if lower.endswith(".gz"):
+        lower = lower[:-3]
     if lower.endswith(".log") or "log" in lower:
         return "log"
     if lower.endswith(".diff") or lower.endswith(".patch"):
@@ -224,7 +227,7 @@ def list_protocols(
     """List protocol runs."""
     limit = max(1, min(int(limit), 500))
     if project_id is None:
-        runs = db.list_all_protocol_runs(limit=limit)
+        runs = db.list_all_protocol_runs(limit=limit, status=status or None)
     else:
         runs = db.list_protocol_runs(project_id=project_id)[:limit]
 
@@ -342,6 +345,44 @@ def start_protocol(
     
     return db.get_protocol_run(protocol_id)
 
+@router.post("/protocols/{protocol_id}/actions/run", response_model=schemas.ProtocolOut)
+def run_protocol(
+    protocol_id: int,
+    background_tasks: BackgroundTasks,
+    ctx: ServiceContext = Depends(get_service_context),
+    db: Database = Depends(get_db),
+):
+    """
+    Run a planned protocol in-process (local mode, no Windmill).
+
+    Ready steps are executed by the local DAG scheduler in a background task;
+    poll the protocol and its steps for progress.
+    """
+    try:
+        run = db.get_protocol_run(protocol_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Protocol not found")
+
+    if getattr(ctx.config, "windmill_enabled", False):
+        raise HTTPException(status_code=409, detail="Windmill is configured; run the protocol flow instead")
+    if run.status not in ["planned", "running"]:
+        raise HTTPException(status_code=400, detail=f"Cannot run protocol in {run.status} state")
+
+    db.update_protocol_status(protocol_id, "running")
+
+    def run_locally():
+        orchestrator = OrchestratorService(
+            context=ctx,
+            db=db,
+            mode=OrchestratorMode.LOCAL,
+            execution_service=ExecutionService(ctx, db),
+        )
+        orchestrator.enqueue_next_step(protocol_id)
+
+    background_tasks.add_task(run_locally)
+
+    return db.get_protocol_run(protocol_id)
+
 @router.post("/protocols/{protocol_id}/actions/run_next_step", response_model=schemas.NextStepOut)
 def run_next_step(
     protocol_id: int,
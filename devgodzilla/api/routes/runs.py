@@ -1,51 +1,36 @@
 from __future__ import annotations
 
-import asyncio
-import json
 from pathlib import Path
-from typing import AsyncGenerator, List, Optional
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
 from fastapi.responses import StreamingResponse
 
 from devgodzilla.api import schemas
-from devgodzilla.api.dependencies import get_db
-from devgodzilla.config import load_config
+from devgodzilla.api.dependencies import get_async_db, get_db
+from devgodzilla.api.file_reads import SSE_HEADERS, file_content, follow_file, resume_offset
+from devgodzilla.config import get_config
+from devgodzilla.db.async_database import AsyncDatabase
 from devgodzilla.db.database import Database
 from devgodzilla.logging import get_logger
-from devgodzilla.windmill.client import JobStatus, WindmillClient, WindmillConfig
+from devgodzilla.services.job_reconciler import job_run_updates
+from devgodzilla.windmill.client import WindmillClient, get_shared_windmill_client, windmill_config_from_settings
 
 router = APIRouter(tags=["Runs"])
 logger = get_logger(__name__)
 
 
 def _build_windmill_client() -> WindmillClient | None:
-    config = load_config()
+    config = get_config()
     if not getattr(config, "windmill_enabled", False):
         return None
     try:
-        wm_config = WindmillConfig(
-            base_url=config.windmill_url or "http://localhost:8000",
-            token=config.windmill_token or "",
-            workspace=getattr(config, "windmill_workspace", "devgodzilla"),
-        )
-        return WindmillClient(wm_config)
+        return get_shared_windmill_client(windmill_config_from_settings(config))
     except Exception as exc:
         logger.warning("windmill_client_unavailable", extra={"error": str(exc)})
         return None
 
 
-def _map_windmill_status(status: JobStatus) -> str:
-    mapping = {
-        JobStatus.QUEUED: "queued",
-        JobStatus.RUNNING: "running",
-        JobStatus.COMPLETED: "succeeded",
-        JobStatus.FAILED: "failed",
-        JobStatus.CANCELED: "cancelled",
-    }
-    return mapping.get(status, status.value)
-
-
 def _sync_run_from_windmill(
     db: Database,
     run,
@@ -65,18 +50,7 @@ def _sync_run_from_windmill(
         )
         return run
 
-    updates: dict[str, object] = {}
-    mapped_status = _map_windmill_status(job.status)
-    if mapped_status != run.status:
-        updates["status"] = mapped_status
-    if job.started_at:
-        updates["started_at"] = job.started_at
-    if job.completed_at:
-        updates["finished_at"] = job.completed_at
-    if job.result is not None:
-        updates["result"] = job.result
-    if job.error:
-        updates["error"] = job.error
+    updates = job_run_updates(run, job)
 
     if updates:
         try:
@@ -91,6 +65,8 @@ def _sync_run_from_windmill(
 
 def _artifact_type_from_name(name: str) -> str:
     lower = name.lower()
+    if lower.endswith(".gz"):
+        lower = lower[:-3]
     if lower.endswith(".log") or "log" in lower:
         return "log"
     if lower.endswith(".diff") or lower.endswith(".patch"):
@@ -104,52 +80,6 @@ def _artifact_type_from_name(name: str) -> str:
     return "file"
 
 
-def _log_chunk_to_sse(payload: dict, event_id: Optional[int] = None) -> str:
-    prefix = f"id: {event_id}\n" if event_id is not None else ""
-    return f"{prefix}event: log\ndata: {json.dumps(payload)}\n\n"
-
-
-async def _log_stream(
-    path: Optional[Path],
-    *,
-    since_bytes: int = 0,
-    poll_interval_seconds: float = 0.5,
-    max_chunk_bytes: int = 65536,
-) -> AsyncGenerator[str, None]:
-    offset = max(0, int(since_bytes))
-    yield "event: connected\ndata: {}\n\n"
-
-    idle_ticks = 0
-    while True:
-        if not path or not path.exists() or not path.is_file():
-            idle_ticks += 1
-        else:
-            try:
-                size = path.stat().st_size
-                if size < offset:
-                    offset = 0
-                if size > offset:
-                    idle_ticks = 0
-                    with path.open("rb") as handle:
-                        handle.seek(offset)
-                        chunk = handle.read(max_chunk_bytes)
-                    offset += len(chunk)
-                    if chunk:
-                        text = chunk.decode("utf-8", errors="replace")
-                        payload = {"offset": offset, "chunk": text}
-                        yield _log_chunk_to_sse(payload, event_id=offset)
-                else:
-                    idle_ticks += 1
-            except Exception:
-                idle_ticks += 1
-
-        if idle_ticks >= int(30 / max(poll_interval_seconds, 0.1)):
-            idle_ticks = 0
-            yield ": heartbeat\n\n"
-
-        await asyncio.sleep(poll_interval_seconds)
-
-
 @router.get("/runs", response_model=List[schemas.JobRunOut])
 def list_runs(
     project_id: Optional[int] = None,
@@ -170,14 +100,11 @@ def list_runs(
     )
     windmill = _build_windmill_client()
     if windmill:
-        try:
-            synced = [_sync_run_from_windmill(db, run, windmill) for run in runs]
-            if status:
-                runs = [run for run in synced if run.status == status]
-            else:
-                runs = synced
-        finally:
-            windmill.close()
+        synced = [_sync_run_from_windmill(db, run, windmill) for run in runs]
+        if status:
+            runs = [run for run in synced if run.status == status]
+        else:
+            runs = synced
     return [schemas.JobRunOut.model_validate(r) for r in runs]
 
 
@@ -192,17 +119,18 @@ def get_run(
         raise HTTPException(status_code=404, detail="Run not found")
     windmill = _build_windmill_client()
     if windmill:
-        try:
-            run = _sync_run_from_windmill(db, run, windmill)
-        finally:
-            windmill.close()
+        run = _sync_run_from_windmill(db, run, windmill)
     return schemas.JobRunOut.model_validate(run)
 
 
 @router.get("/runs/{run_id}/logs", response_model=schemas.ArtifactContentOut)
 def get_run_logs(
     run_id: str,
+    response: Response,
     max_bytes: int = 200_000,
+    offset: Optional[int] = Query(None, ge=0, description="Read from this byte offset"),
+    tail: bool = Query(False, description="Return the last max_bytes instead of the first"),
+    range_header: Optional[str] = Header(None, alias="Range"),
     db: Database = Depends(get_db),
 ):
     try:
@@ -225,23 +153,16 @@ def get_run_logs(
     if not path.exists() or not path.is_file():
         raise HTTPException(status_code=404, detail="Run logs not found")
 
-    max_bytes = max(1, min(int(max_bytes), 2_000_000))
-    raw = path.read_bytes()
-    truncated = len(raw) > max_bytes
-    if truncated:
-        raw = raw[:max_bytes]
-
-    try:
-        content = raw.decode("utf-8")
-    except Exception:
-        content = raw.decode("utf-8", errors="replace")
-
-    return schemas.ArtifactContentOut(
-        id="logs",
+    return file_content(
+        path,
+        response,
+        artifact_id="logs",
         name=path.name,
         type="log",
-        content=content,
-        truncated=truncated,
+        max_bytes=max_bytes,
+        offset=offset,
+        tail=tail,
+        range_header=range_header,
     )
 
 
@@ -249,13 +170,14 @@ def get_run_logs(
 async def stream_run_logs(
     run_id: str,
     since_bytes: int = Query(0, ge=0, description="Only stream bytes after this offset"),
+    tail_bytes: Optional[int] = Query(None, ge=0, description="Start this many bytes before the current end"),
     last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
     poll_interval_seconds: float = Query(0.5, ge=0.1, le=5),
     max_chunk_bytes: int = Query(65536, ge=1024, le=200000),
-    db: Database = Depends(get_db),
+    adb: AsyncDatabase = Depends(get_async_db),
 ):
     try:
-        run = db.get_job_run(run_id)
+        run = await adb.get_job_run(run_id)
     except KeyError:
         raise HTTPException(status_code=404, detail="Run not found")
 
@@ -263,22 +185,17 @@ async def stream_run_logs(
     if path and not path.is_absolute():
         path = (Path.cwd() / path).resolve()
 
-    effective_since = since_bytes
-    if last_event_id and last_event_id.isdigit():
-        effective_since = max(effective_since, int(last_event_id))
-
+    since = resume_offset(since_bytes, last_event_id)
     return StreamingResponse(
-        _log_stream(
+        follow_file(
             path,
-            since_bytes=effective_since,
+            since_bytes=since,
+            tail_bytes=tail_bytes if not since else None,
             poll_interval_seconds=poll_interval_seconds,
             max_chunk_bytes=max_chunk_bytes,
         ),
         media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-        },
+        headers=SSE_HEADERS,
     )
 
 
@@ -319,7 +236,11 @@ def list_run_artifacts(
 def get_run_artifact_content(
     run_id: str,
     artifact_id: str,
+    response: Response,
     max_bytes: int = 200_000,
+    offset: Optional[int] = Query(None, ge=0),
+    tail: bool = Query(False),
+    range_header: Optional[str] = Header(None, alias="Range"),
     db: Database = Depends(get_db),
 ):
     try:
@@ -333,21 +254,14 @@ def get_run_artifact_content(
     if not path.exists() or not path.is_file():
         raise HTTPException(status_code=404, detail="Artifact not found")
 
-    max_bytes = max(1, min(int(max_bytes), 2_000_000))
-    raw = path.read_bytes()
-    truncated = len(raw) > max_bytes
-    if truncated:
-        raw = raw[:max_bytes]
-
-    try:
-        content = raw.decode("utf-8")
-    except Exception:
-        content = raw.decode("utf-8", errors="replace")
-
-    return schemas.ArtifactContentOut(
-        id=artifact_id,
+    return file_content(
+        path,
+        response,
+        artifact_id=artifact_id,
         name=artifact_id,
         type=_artifact_type_from_name(artifact_id),
-        content=content,
-        truncated=truncated,
+        max_bytes=max_bytes,
+        offset=offset,
+        tail=tail,
+        range_header=range_header,
     )
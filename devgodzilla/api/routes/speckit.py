@@ -15,7 +15,7 @@ from devgodzilla.api.dependencies import get_db, get_service_context
 from devgodzilla.db.database import Database
 from devgodzilla.services.base import ServiceContext
 from devgodzilla.services.specification import SpecificationService
-from devgodzilla.services.policy import PolicyService
+from devgodzilla.services.policy import PolicyService, invalidate_policy_cache
 
 router = APIRouter(prefix="/speckit", tags=["SpecKit"])
 
@@ -285,6 +285,7 @@ def save_constitution(
         updates["policy_overrides"] = override
     if updates:
         db.update_project_policy(project_id, **updates)
+        invalidate_policy_cache(db, project_id=project_id)
 
     return SpecKitResponse(
         success=result.success,
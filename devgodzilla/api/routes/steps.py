@@ -1,9 +1,8 @@
 from typing import List, Optional
 from pathlib import Path
-import subprocess
 
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from fastapi.responses import FileResponse, StreamingResponse
 from pydantic import BaseModel
 
 from devgodzilla.api.dependencies import get_service_context
@@ -13,9 +12,12 @@ from devgodzilla.services.execution import ExecutionService
 from devgodzilla.services.policy import PolicyService
 from devgodzilla.services.quality import QualityService
 from devgodzilla.qa.gates import LintGate, TypeGate, TestGate
+from devgodzilla.qa.changeset import write_patch
 
 from devgodzilla.api import schemas
-from devgodzilla.api.dependencies import get_db
+from devgodzilla.api.dependencies import get_async_db, get_db
+from devgodzilla.api.file_reads import SSE_HEADERS, file_content, follow_file, resume_offset
+from devgodzilla.db.async_database import AsyncDatabase
 from devgodzilla.db.database import Database
 
 router = APIRouter()
@@ -23,6 +25,7 @@ router = APIRouter()
 
 class StepQARequest(BaseModel):
     gates: Optional[List[str]] = None
+    use_cache: bool = True
 
 
 class StepAssignAgentRequest(BaseModel):
@@ -49,18 +52,25 @@ def _protocol_root(run, workspace_root: Path) -> Path:
     return specs
 
 
-def _step_artifacts_dir(db: Database, step_id: int) -> Path:
+def _step_artifacts_dir(db: Database, step_id: int, *, create: bool = False) -> Path:
     step = db.get_step_run(step_id)
     run = db.get_protocol_run(step.protocol_run_id)
-    project = db.get_project(run.project_id)
+    return _artifacts_dir_for(step_id, run, db.get_project(run.project_id), create=create)
+
+
+def _artifacts_dir_for(step_id: int, run, project, *, create: bool = False) -> Path:
+    """A step's artifact directory; only writers create it (reads must not touch a released worktree)."""
     root = _protocol_root(run, _workspace_root(run, project))
     artifacts_dir = root / ".devgodzilla" / "steps" / str(step_id) / "artifacts"
-    artifacts_dir.mkdir(parents=True, exist_ok=True)
+    if create:
+        artifacts_dir.mkdir(parents=True, exist_ok=True)
     return artifacts_dir
 
 
 def _artifact_type_from_name(name: str) -> str:
     lower = name.lower()
+    if lower.endswith(".gz"):
+        lower = lower[:-3]
     if lower.endswith(".log") or "log" in lower:
         return "log"
     if lower.endswith(".diff") or lower.endswith(".patch"):
@@ -279,9 +289,13 @@ def execute_step(
     try:
         import json
 
-        artifacts_dir = _step_artifacts_dir(db, step_id)
-        (artifacts_dir / "execution.log").write_text(result.stdout or "", encoding="utf-8")
-        (artifacts_dir / "execution.stderr.log").write_text(result.stderr or "", encoding="utf-8")
+        artifacts_dir = _step_artifacts_dir(db, step_id, create=True)
+        # Full engine output is already in stdout.log/stderr.log when it was
+        # streamed; result.stdout is only its tail then.
+        if "stdout" not in result.outputs_written:
+            (artifacts_dir / "execution.log").write_text(result.stdout or "", encoding="utf-8")
+        if "stderr" not in result.outputs_written:
+            (artifacts_dir / "execution.stderr.log").write_text(result.stderr or "", encoding="utf-8")
         (artifacts_dir / "execution.meta.json").write_text(
             json.dumps(
                 {
@@ -298,21 +312,12 @@ def execute_step(
             encoding="utf-8",
         )
 
-        run = db.get_protocol_run(step.protocol_run_id)
-        project = db.get_project(run.project_id)
-        cwd = _workspace_root(run, project)
-        try:
-            proc = subprocess.run(
-                ["git", "diff"],
-                cwd=cwd,
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            if proc.returncode == 0 and proc.stdout.strip():
-                (artifacts_dir / "changes.diff").write_text(proc.stdout, encoding="utf-8")
-        except Exception:
-            pass
+        # ExecutionService normally captures the diffs (changes.diff.gz);
+        # only fall back to writing the patch here when it could not.
+        if not result.outputs_written.get("git_diff"):
+            run = db.get_protocol_run(step.protocol_run_id)
+            project = db.get_project(run.project_id)
+            write_patch(_workspace_root(run, project), artifacts_dir / "changes.diff.gz")
     except Exception:
         # Artifacts should never break execution endpoint
         pass
@@ -350,7 +355,7 @@ def qa_step(
                 raise HTTPException(status_code=400, detail=f"Unknown gates: {', '.join(unknown)}")
             gates_to_run = [gate_map[g] for g in request.gates]
 
-    qa = quality.run_qa(step_id, gates=gates_to_run)
+    qa = quality.run_qa(step_id, gates=gates_to_run, use_cache=None if request.use_cache else False)
 
     # Best-effort: if all steps are terminal, update protocol status to completed/failed.
     try:
@@ -364,7 +369,7 @@ def qa_step(
     # Generate human-readable report as an artifact (best-effort)
     report_path = None
     try:
-        artifacts_dir = _step_artifacts_dir(db, step_id)
+        artifacts_dir = _step_artifacts_dir(db, step_id, create=True)
         report_path = quality.generate_quality_report(
             qa,
             artifacts_dir,
@@ -447,10 +452,14 @@ def list_step_artifacts(
 def get_step_artifact_content(
     step_id: int,
     artifact_id: str,
+    response: Response,
     max_bytes: int = 200_000,
+    offset: Optional[int] = Query(None, ge=0, description="Read from this byte offset"),
+    tail: bool = Query(False, description="Return the last max_bytes instead of the first"),
+    range_header: Optional[str] = Header(None, alias="Range"),
     db: Database = Depends(get_db),
 ):
-    """Fetch artifact content for preview (truncates large files)."""
+    """Fetch artifact content for preview (at most max_bytes, read by seeking)."""
     try:
         db.get_step_run(step_id)
     except KeyError:
@@ -461,23 +470,50 @@ def get_step_artifact_content(
     if not path.exists() or not path.is_file():
         raise HTTPException(status_code=404, detail="Artifact not found")
 
-    max_bytes = max(1, min(int(max_bytes), 2_000_000))
-    raw = path.read_bytes()
-    truncated = len(raw) > max_bytes
-    if truncated:
-        raw = raw[:max_bytes]
+    return file_content(
+        path,
+        response,
+        artifact_id=artifact_id,
+        name=artifact_id,
+        type=_artifact_type_from_name(artifact_id),
+        max_bytes=max_bytes,
+        offset=offset,
+        tail=tail,
+        range_header=range_header,
+    )
+
 
+@router.get("/steps/{step_id}/artifacts/{artifact_id}/stream")
+async def stream_step_artifact(
+    step_id: int,
+    artifact_id: str,
+    since_bytes: int = Query(0, ge=0, description="Only stream bytes after this offset"),
+    tail_bytes: Optional[int] = Query(None, ge=0, description="Start this many bytes before the current end"),
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
+    poll_interval_seconds: float = Query(0.5, ge=0.1, le=5),
+    max_chunk_bytes: int = Query(65536, ge=1024, le=200000),
+    adb: AsyncDatabase = Depends(get_async_db),
+):
+    """Follow a growing step artifact (e.g. stdout.log) as SSE."""
     try:
-        content = raw.decode("utf-8")
-    except Exception:
-        content = raw.decode("utf-8", errors="replace")
+        step = await adb.get_step_run(step_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Step not found")
 
-    return schemas.ArtifactContentOut(
-        id=artifact_id,
-        name=artifact_id,
-        type=_artifact_type_from_name(artifact_id),
-        content=content,
-        truncated=truncated,
+    run = await adb.get_protocol_run(step.protocol_run_id)
+    project = await adb.get_project(run.project_id)
+    path = _safe_child(_artifacts_dir_for(step_id, run, project), artifact_id)
+    since = resume_offset(since_bytes, last_event_id)
+    return StreamingResponse(
+        follow_file(
+            path,
+            since_bytes=since,
+            tail_bytes=tail_bytes if not since else None,
+            poll_interval_seconds=poll_interval_seconds,
+            max_chunk_bytes=max_chunk_bytes,
+        ),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
     )
 
 
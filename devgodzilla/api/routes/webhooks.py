@@ -11,16 +11,17 @@ from datetime import datetime
 from typing import Any, Dict, Optional
 
 from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 
 from devgodzilla.api.dependencies import get_db
-from devgodzilla.config import load_config
+from devgodzilla.config import get_config
 from devgodzilla.db.database import Database
 from devgodzilla.logging import get_logger
 from devgodzilla.models.domain import ProtocolStatus, StepStatus
 from devgodzilla.services.base import ServiceContext
 from devgodzilla.services.orchestrator import OrchestratorMode, OrchestratorResult, OrchestratorService
-from devgodzilla.windmill.client import WindmillClient, WindmillConfig
+from devgodzilla.windmill.client import get_shared_windmill_client, windmill_config_from_settings
 
 router = APIRouter(prefix="/webhooks", tags=["Webhooks"])
 logger = get_logger(__name__)
@@ -60,32 +61,9 @@ class GitLabWebhook(BaseModel):
     object_attributes: Optional[Dict[str, Any]] = None
 
 
-def _normalize_repo_url(value: Optional[str]) -> Optional[str]:
-    if not value:
-        return None
-    text = value.strip().lower()
-    if text.endswith(".git"):
-        text = text[:-4]
-    if text.startswith("git@"):
-        text = text.replace("git@", "", 1)
-        text = text.replace(":", "/", 1)
-    if text.startswith("https://"):
-        text = text[len("https://") :]
-    elif text.startswith("http://"):
-        text = text[len("http://") :]
-    return text.strip("/")
-
-
 def _resolve_project_id(db: Database, candidates: list[str]) -> Optional[int]:
-    normalized = {_normalize_repo_url(value) for value in candidates if value}
-    normalized.discard(None)
-    if not normalized:
-        return None
-    for project in db.list_projects():
-        project_url = _normalize_repo_url(project.git_url)
-        if project_url and project_url in normalized:
-            return project.id
-    return None
+    project = db.get_project_by_repo_urls([value for value in candidates if value])
+    return project.id if project else None
 
 
 def _emit_ci_event(
@@ -115,18 +93,12 @@ def _emit_ci_event(
 
 
 def _build_orchestrator(db: Database) -> OrchestratorService:
-    config = load_config()
+    config = get_config()
     ctx = ServiceContext(config=config)
     windmill_client = None
     mode = OrchestratorMode.LOCAL
     if getattr(config, "windmill_enabled", False):
-        windmill_client = WindmillClient(
-            WindmillConfig(
-                base_url=config.windmill_url or "http://localhost:8000",
-                token=config.windmill_token or "",
-                workspace=getattr(config, "windmill_workspace", "devgodzilla"),
-            )
-        )
+        windmill_client = get_shared_windmill_client(windmill_config_from_settings(config))
         mode = OrchestratorMode.WINDMILL
     return OrchestratorService(context=ctx, db=db, windmill_client=windmill_client, mode=mode)
 
@@ -314,10 +286,9 @@ async def windmill_flow_webhook(
     flow_path = _extract_flow_path(payload)
 
     if protocol_run_id is None and flow_path:
-        for run in db.list_all_protocol_runs(limit=200):
-            if run.windmill_flow_id == flow_path:
-                protocol_run_id = run.id
-                break
+        run = db.get_protocol_run_by_windmill_flow_id(flow_path)
+        if run is not None:
+            protocol_run_id = run.id
 
     if protocol_run_id is not None:
         if _is_success_status(status):
@@ -355,7 +326,7 @@ async def github_webhook(
     except json.JSONDecodeError:
         raise HTTPException(status_code=400, detail="Invalid JSON payload")
 
-    config = load_config()
+    config = get_config()
     if config.webhook_token:
         signature = x_hub_signature_256 or x_hub_signature
         if not _verify_github_signature(config.webhook_token, body, signature):
@@ -442,8 +413,9 @@ async def _handle_workflow_run(
             protocol_run_id=protocol_run_id,
             metadata={"workflow": workflow_run.get("name"), "id": workflow_run.get("id")},
         )
-        if load_config().auto_qa_on_ci:
-            _maybe_advance_protocol_on_ci(db, protocol_run_id=protocol_run_id)
+        if get_config().auto_qa_on_ci:
+            # Enqueueing runs the blocking Windmill client; keep it off the event loop.
+            await run_in_threadpool(_maybe_advance_protocol_on_ci, db, protocol_run_id=protocol_run_id)
     elif conclusion in ("failure", "cancelled"):
         _emit_ci_event(
             db,
@@ -548,7 +520,7 @@ async def gitlab_webhook(
     except json.JSONDecodeError:
         raise HTTPException(status_code=400, detail="Invalid JSON payload")
 
-    config = load_config()
+    config = get_config()
     if config.webhook_token:
         if not _verify_gitlab_token(config.webhook_token, x_gitlab_token):
             raise HTTPException(status_code=401, detail="Invalid GitLab token")
@@ -627,8 +599,9 @@ async def _handle_gitlab_pipeline(
             protocol_run_id=protocol_run_id,
             metadata={"pipeline_id": attrs.get("id")},
         )
-        if load_config().auto_qa_on_ci:
-            _maybe_advance_protocol_on_ci(db, protocol_run_id=protocol_run_id)
+        if get_config().auto_qa_on_ci:
+            # Enqueueing runs the blocking Windmill client; keep it off the event loop.
+            await run_in_threadpool(_maybe_advance_protocol_on_ci, db, protocol_run_id=protocol_run_id)
     elif status in ("failed", "canceled", "cancelled"):
         _emit_ci_event(
             db,
@@ -286,6 +286,8 @@ class AgentHealthOut(BaseModel):
     version: Optional[str] = None
     error: Optional[str] = None
     response_time_ms: Optional[float] = None
+    checked_at: Optional[datetime] = None
+    stale: bool = False
 
 class AgentMetricsOut(BaseModel):
     agent_id: str
@@ -394,6 +396,8 @@ class ArtifactContentOut(BaseModel):
     type: str
     content: str
     truncated: bool = False
+    offset: int = 0  # byte offset of `content` within the file
+    size: Optional[int] = None  # total file size in bytes
 
 
 class ProtocolArtifactOut(ArtifactOut):
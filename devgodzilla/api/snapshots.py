@@ -0,0 +1,47 @@
+"""
+Short-lived snapshots of dashboard queries shared by the API routes.
+
+Polling dashboards (`/metrics/summary`, `/agents/metrics`) hit the same
+aggregate queries every few seconds; a snapshot is computed once per database
+and key and reused for `metrics_snapshot_ttl_seconds`.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable, Dict, TypeVar
+
+from devgodzilla.config import get_config
+from devgodzilla.db.database import Database
+
+T = TypeVar("T")
+
+_snapshots: Dict[tuple, tuple[float, Any]] = {}
+_snapshot_lock = threading.Lock()
+
+
+def cached_snapshot(db: Database, key: tuple, compute: Callable[[], T]) -> T:
+    """
+    Return a recently computed dashboard snapshot, or compute and store it.
+
+    Snapshots are kept per database for `metrics_snapshot_ttl_seconds`
+    (0 disables caching), so polling dashboards share one set of queries.
+    """
+    ttl = getattr(get_config(), "metrics_snapshot_ttl_seconds", 0) or 0
+    if ttl <= 0:
+        return compute()
+    db_key = getattr(db, "db_path", None) or getattr(db, "db_url", None) or id(db)
+    cache_key = (str(db_key), *key)
+    now = time.monotonic()
+    with _snapshot_lock:
+        hit = _snapshots.get(cache_key)
+        if hit is not None and now - hit[0] < ttl:
+            return hit[1]
+    value = compute()
+    with _snapshot_lock:
+        _snapshots[cache_key] = (now, value)
+        # Drop expired snapshots so the cache stays bounded by live keys.
+        for stale in [k for k, (ts, _) in _snapshots.items() if now - ts >= ttl]:
+            _snapshots.pop(stale, None)
+    return value
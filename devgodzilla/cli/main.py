@@ -32,17 +32,18 @@ def get_service_context(project_id: Optional[int] = None):
     Args:
         project_id: Optional project ID for request-scoped context.
     """
-    from devgodzilla.config import load_config
+    from devgodzilla.config import get_config
     from devgodzilla.services.base import ServiceContext
     
-    config = load_config()
+    config = get_config()
     return ServiceContext(config=config, project_id=project_id)
 
 
 def get_db():
     """Get database connection."""
     from devgodzilla.db import get_database
-    from devgodzilla.config import load_config
+    from devgodzilla.db.async_database import get_async_database
+    from devgodzilla.config import get_config
     from devgodzilla.services.event_persistence import install_db_event_sink
     
     global _DB, _DB_KEY
@@ -52,11 +53,14 @@ def get_db():
         _DB = None  # type: ignore[assignment]
         _DB_KEY = None  # type: ignore[assignment]
 
-    config = load_config()
+    config = get_config()
     current_key = (
         config.db_url,
         str(config.db_path) if getattr(config, "db_path", None) else None,
         getattr(config, "db_pool_size", 20),
+        getattr(config, "sqlite_busy_timeout_ms", 5000),
+        getattr(config, "sqlite_synchronous", "NORMAL"),
+        getattr(config, "sqlite_mmap_size", 256 * 1024 * 1024),
     )
 
     if _DB is None or _DB_KEY != current_key:
@@ -64,11 +68,20 @@ def get_db():
             db_url=config.db_url,
             db_path=Path(config.db_path) if getattr(config, "db_path", None) else None,
             pool_size=getattr(config, "db_pool_size", 20),
+            sqlite_busy_timeout_ms=getattr(config, "sqlite_busy_timeout_ms", 5000),
+            sqlite_synchronous=getattr(config, "sqlite_synchronous", "NORMAL"),
+            sqlite_mmap_size=getattr(config, "sqlite_mmap_size", 256 * 1024 * 1024),
         )
         _DB.init_schema()
         _DB_KEY = current_key  # type: ignore[assignment]
+        get_async_database(_DB, max_workers=getattr(config, "db_async_workers", 8))
 
-    install_db_event_sink(db_provider=lambda: _DB)  # type: ignore[arg-type]
+    install_db_event_sink(
+        db_provider=lambda: _DB,  # type: ignore[arg-type]
+        mode=getattr(config, "event_persistence_mode", None) or "sync",
+        batch_size=getattr(config, "event_batch_size", 200),
+        flush_interval_seconds=getattr(config, "event_flush_interval_ms", 50) / 1000.0,
+    )
     return _DB  # type: ignore[return-value]
 
 
@@ -661,8 +674,9 @@ def step_execute(ctx, step_id: int, engine_id: Optional[str], model: Optional[st
 @step.command('qa')
 @click.argument('step_id', type=int)
 @click.option('--gates', '-g', multiple=True, help='Specific gates to run')
+@click.option('--no-cache', is_flag=True, help='Re-run every gate instead of reusing cached results')
 @click.pass_context
-def step_qa(ctx, step_id, gates):
+def step_qa(ctx, step_id, gates, no_cache):
     """Run QA on a step."""
     try:
         context = get_service_context()
@@ -671,7 +685,7 @@ def step_qa(ctx, step_id, gates):
         from devgodzilla.services.quality import QualityService
         
         quality = QualityService(context=context, db=db)
-        result = quality.run_qa(step_run_id=step_id)
+        result = quality.run_qa(step_run_id=step_id, use_cache=False if no_cache else None)
         
         if ctx.obj and ctx.obj.get("JSON"):
             click.echo(json.dumps({
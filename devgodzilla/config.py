@@ -7,20 +7,26 @@ Supports .env file loading via python-dotenv.
 """
 
 import os
+import signal
 import threading
+import time
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from pydantic import BaseModel, ConfigDict, Field
 
 try:
-    from dotenv import load_dotenv
+    from dotenv import dotenv_values
     _HAS_DOTENV = True
 except ImportError:
     _HAS_DOTENV = False
 
 _DOTENV_LOADED = False
 
+# Values copied into os.environ from .env / Windmill env files, so a reload can
+# drop them and pick up edits to those files instead of keeping stale values.
+_INJECTED_ENV: Dict[str, str] = {}
+
 
 class Config(BaseModel):
     """
@@ -28,18 +34,47 @@ class Config(BaseModel):
 
     Key env vars:
     - DEVGODZILLA_DB_URL (preferred) or DEVGODZILLA_DB_PATH for SQLite fallback.
+    - DEVGODZILLA_DB_ASYNC_WORKERS (thread pool size for async DB access)
+    - DEVGODZILLA_SQLITE_BUSY_TIMEOUT_MS / SQLITE_SYNCHRONOUS / SQLITE_MMAP_SIZE (SQLite pragmas)
+    - DEVGODZILLA_EVENT_PERSISTENCE_MODE (sync | async | barrier, default: barrier in the API, sync in CLI/worker)
     - DEVGODZILLA_ENV (default: local)
     - DEVGODZILLA_API_TOKEN (optional bearer token)
     - DEVGODZILLA_LOG_LEVEL (default: INFO)
     - DEVGODZILLA_WEBHOOK_TOKEN (optional shared secret)
     - DEVGODZILLA_DEFAULT_ENGINE_ID (default: opencode)
     - DEVGODZILLA_DISCOVERY_ENGINE_ID / PLANNING_ENGINE_ID / EXEC_ENGINE_ID / QA_ENGINE_ID
+    - DEVGODZILLA_QA_MAX_PARALLEL_GATES / QA_DEADLINE_SECONDS / QA_SHORT_CIRCUIT (concurrent QA gates)
+    - DEVGODZILLA_QA_GATE_CACHE / QA_GATE_CACHE_TTL_SECONDS (reuse gate results for unchanged trees)
+    - DEVGODZILLA_QA_SCAN_MODE (incremental|full; lint/type/format/security scope)
+    - DEVGODZILLA_METRICS_SNAPSHOT_TTL_SECONDS (cache /metrics/summary and /agents/metrics; 0 disables)
+    - DEVGODZILLA_AGENT_HEALTH_TTL_SECONDS / AGENT_HEALTH_NEGATIVE_TTL_SECONDS (cached agent health and engine availability)
+    - DEVGODZILLA_AGENT_HEALTH_MAX_PARALLEL (concurrent agent health probes, default: 8)
+    - DEVGODZILLA_LOCAL_MAX_PARALLEL_STEPS (local-mode step worker pool, default: 4)
+    - DEVGODZILLA_LOCAL_ENGINE_CONCURRENCY (per-engine caps, e.g. "codex=2,opencode=1")
+    - DEVGODZILLA_WINDMILL_MAX_CONNECTIONS / WINDMILL_MAX_KEEPALIVE / WINDMILL_HTTP2 (shared Windmill client pool)
+    - DEVGODZILLA_WINDMILL_RECONCILE_INTERVAL_SECONDS (bulk job_runs status sweep, default: 30; 0 disables)
+    - DEVGODZILLA_WORKTREE_POOL_SIZE (pre-created worktrees per repo/base branch, default: 0 = disabled)
+    - DEVGODZILLA_GIT_MIRROR_ROOT (shared bare mirror cache for project clones; unset disables)
+    - DEVGODZILLA_GIT_CLONE_STRATEGY (full | reference | partial | shallow, default: full)
+    - DEVGODZILLA_REPO_REFS_TTL_SECONDS / REPO_REMOTE_REFS_TTL_SECONDS (cached branches/commits/worktrees and remote heads/PRs)
+    - DEVGODZILLA_REPO_MAP_TOKEN_BUDGET (size of the repository map in planning prompts, default: 2000)
+    - DEVGODZILLA_PROMPT_CACHE_SIZE (rendered exec/QA prompts kept per process, default: 128; 0 disables reuse)
+    - DEVGODZILLA_POLICY_CACHE_TTL_SECONDS (memoized effective policies and step findings, default: 60; 0 disables)
     """
 
     # Database
     db_url: Optional[str] = Field(default=None)
     db_path: Path = Field(default=Path(".devgodzilla.sqlite"))
     db_pool_size: int = Field(default=20)
+    db_async_workers: int = Field(default=8)
+    sqlite_busy_timeout_ms: int = Field(default=5000)
+    sqlite_synchronous: str = Field(default="NORMAL")
+    sqlite_mmap_size: int = Field(default=256 * 1024 * 1024)
+
+    # Event persistence (sync | async | barrier; None: per-process default)
+    event_persistence_mode: Optional[str] = Field(default=None)
+    event_batch_size: int = Field(default=200)
+    event_flush_interval_ms: int = Field(default=50)
     
     # Environment
     environment: str = Field(default="local")
@@ -78,6 +113,13 @@ class Config(BaseModel):
     exec_engine_id: Optional[str] = Field(default=None)
     qa_engine_id: Optional[str] = Field(default=None)
     agent_config_path: Optional[Path] = Field(default=None)
+    agent_health_ttl_seconds: float = Field(default=60.0)
+    agent_health_negative_ttl_seconds: float = Field(default=10.0)
+    agent_health_max_parallel: int = Field(default=8)
+
+    # Local-mode step scheduling
+    local_max_parallel_steps: int = Field(default=4)
+    local_engine_concurrency: Dict[str, int] = Field(default_factory=dict)
 
     # Token budgets
     max_tokens_per_step: Optional[int] = Field(default=None)
@@ -89,10 +131,25 @@ class Config(BaseModel):
     auto_qa_after_exec: bool = Field(default=False)
     qa_auto_fix_enabled: bool = Field(default=True)
     qa_max_auto_fix_attempts: int = Field(default=3)
+    qa_max_parallel_gates: int = Field(default=4)
+    qa_deadline_seconds: Optional[float] = Field(default=None)
+    qa_short_circuit: bool = Field(default=True)
+    qa_gate_cache_enabled: bool = Field(default=True)
+    qa_gate_cache_ttl_seconds: int = Field(default=24 * 60 * 60)
+    qa_scan_mode: str = Field(default="incremental")
+    metrics_snapshot_ttl_seconds: float = Field(default=5.0)
     
     # Git settings
     git_lock_max_retries: int = Field(default=5)
     git_lock_retry_delay: float = Field(default=1.0)
+    worktree_pool_size: int = Field(default=0)
+    git_mirror_root: Optional[Path] = Field(default=None)
+    git_clone_strategy: str = Field(default="full")
+    repo_refs_ttl_seconds: float = Field(default=10.0)
+    repo_remote_refs_ttl_seconds: float = Field(default=60.0)
+    repo_map_token_budget: int = Field(default=2000)
+    prompt_cache_size: int = Field(default=128)
+    policy_cache_ttl_seconds: float = Field(default=60.0)
 
     # Projects
     projects_root: Path = Field(default=Path("projects"))
@@ -108,8 +165,12 @@ class Config(BaseModel):
     windmill_url: Optional[str] = Field(default=None)
     windmill_token: Optional[str] = Field(default=None)
     windmill_workspace: str = Field(default="devgodzilla")
+    windmill_max_connections: int = Field(default=20)
+    windmill_max_keepalive_connections: int = Field(default=10)
+    windmill_http2: bool = Field(default=True)
+    windmill_reconcile_interval_seconds: float = Field(default=30.0)
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    model_config = ConfigDict(arbitrary_types_allowed=True, frozen=True)
 
     @property
     def default_models(self) -> Dict[str, str]:
@@ -172,6 +233,20 @@ def _parse_csv(value: Optional[str]) -> List[str]:
     return [v.strip() for v in value.split(",") if v.strip()]
 
 
+def _parse_int_map(value: Optional[str]) -> Dict[str, int]:
+    """Parse `key=N,key2=M` into a dict, skipping malformed entries."""
+    result: Dict[str, int] = {}
+    for item in _parse_csv(value):
+        key, sep, raw = item.partition("=")
+        if not sep or not key.strip():
+            continue
+        try:
+            result[key.strip()] = int(raw.strip())
+        except ValueError:
+            continue
+    return result
+
+
 def _read_simple_env_file(path: Path) -> Dict[str, str]:
     """
     Read a simple KEY=VALUE env file.
@@ -206,14 +281,13 @@ def _read_simple_env_file(path: Path) -> Dict[str, str]:
     return data
 
 
-def _maybe_load_windmill_env_defaults() -> None:
-    """
-    Populate DEVGODZILLA_WINDMILL_* from a local env file.
+def _inject_env(key: str, value: str) -> None:
+    os.environ[key] = value
+    _INJECTED_ENV[key] = value
 
-    This is a convenience for local/dev setups where Windmill is already running and
-    tokens live in a Windmill app env file.
-    """
-    candidates: list[Path] = []
+
+def _windmill_env_candidates() -> List[Path]:
+    candidates: List[Path] = []
     explicit = os.environ.get("DEVGODZILLA_WINDMILL_ENV_FILE")
     if explicit:
         candidates.append(Path(explicit).expanduser())
@@ -223,7 +297,21 @@ def _maybe_load_windmill_env_defaults() -> None:
             Path(".env.development"),
         ]
     )
+    return candidates
+
+
+def _dotenv_candidates() -> List[Path]:
+    return [Path(".env"), Path(".env.local")]
+
+
+def _maybe_load_windmill_env_defaults() -> None:
+    """
+    Populate DEVGODZILLA_WINDMILL_* from a local env file.
 
+    This is a convenience for local/dev setups where Windmill is already running and
+    tokens live in a Windmill app env file.
+    """
+    candidates = _windmill_env_candidates()
     env: Dict[str, str] = {}
     for candidate in candidates:
         if candidate.exists():
@@ -237,12 +325,12 @@ def _maybe_load_windmill_env_defaults() -> None:
     if not os.environ.get("DEVGODZILLA_WINDMILL_TOKEN"):
         token = env.get("DEVGODZILLA_WINDMILL_TOKEN") or env.get("WINDMILL_TOKEN") or env.get("VITE_TOKEN")
         if token:
-            os.environ["DEVGODZILLA_WINDMILL_TOKEN"] = token
+            _inject_env("DEVGODZILLA_WINDMILL_TOKEN", token)
 
     if not os.environ.get("DEVGODZILLA_WINDMILL_WORKSPACE"):
         workspace = env.get("DEVGODZILLA_WINDMILL_WORKSPACE") or env.get("VITE_WORKSPACE")
         if workspace:
-            os.environ["DEVGODZILLA_WINDMILL_WORKSPACE"] = workspace
+            _inject_env("DEVGODZILLA_WINDMILL_WORKSPACE", workspace)
 
     if not os.environ.get("DEVGODZILLA_WINDMILL_URL"):
         url = env.get("DEVGODZILLA_WINDMILL_URL") or env.get("WINDMILL_URL") or env.get("VITE_API_URL")
@@ -250,7 +338,7 @@ def _maybe_load_windmill_env_defaults() -> None:
             normalized = url.strip().rstrip("/")
             if normalized.endswith("/api"):
                 normalized = normalized[: -len("/api")]
-            os.environ["DEVGODZILLA_WINDMILL_URL"] = normalized
+            _inject_env("DEVGODZILLA_WINDMILL_URL", normalized)
 
 
 def _maybe_load_dotenv() -> None:
@@ -259,9 +347,11 @@ def _maybe_load_dotenv() -> None:
     if _DOTENV_LOADED or not _HAS_DOTENV:
         return
     _DOTENV_LOADED = True
-    for env_path in [Path(".env"), Path(".env.local")]:
+    for env_path in _dotenv_candidates():
         if env_path.exists():
-            load_dotenv(env_path, override=False)
+            for key, value in dotenv_values(env_path).items():
+                if value is not None and key not in os.environ:
+                    _inject_env(key, value)
             break
 
 
@@ -283,6 +373,15 @@ def load_config() -> Config:
         db_url=os.environ.get("DEVGODZILLA_DB_URL"),
         db_path=Path(os.environ.get("DEVGODZILLA_DB_PATH", ".devgodzilla.sqlite")).expanduser(),
         db_pool_size=int(os.environ.get("DEVGODZILLA_DB_POOL_SIZE", "20")),
+        db_async_workers=int(os.environ.get("DEVGODZILLA_DB_ASYNC_WORKERS", "8")),
+        sqlite_busy_timeout_ms=int(os.environ.get("DEVGODZILLA_SQLITE_BUSY_TIMEOUT_MS", "5000")),
+        sqlite_synchronous=os.environ.get("DEVGODZILLA_SQLITE_SYNCHRONOUS", "NORMAL"),
+        sqlite_mmap_size=int(os.environ.get("DEVGODZILLA_SQLITE_MMAP_SIZE", str(256 * 1024 * 1024))),
+
+        # Event persistence
+        event_persistence_mode=(os.environ.get("DEVGODZILLA_EVENT_PERSISTENCE_MODE") or "").strip().lower() or None,
+        event_batch_size=int(os.environ.get("DEVGODZILLA_EVENT_BATCH_SIZE", "200")),
+        event_flush_interval_ms=int(os.environ.get("DEVGODZILLA_EVENT_FLUSH_INTERVAL_MS", "50")),
         
         # Environment
         environment=env,
@@ -321,6 +420,13 @@ def load_config() -> Config:
         exec_engine_id=os.environ.get("DEVGODZILLA_EXEC_ENGINE_ID") or None,
         qa_engine_id=os.environ.get("DEVGODZILLA_QA_ENGINE_ID") or None,
         agent_config_path=Path(os.environ.get("DEVGODZILLA_AGENT_CONFIG_PATH")) if os.environ.get("DEVGODZILLA_AGENT_CONFIG_PATH") else Path("config/agents.yaml"),
+        agent_health_ttl_seconds=float(os.environ.get("DEVGODZILLA_AGENT_HEALTH_TTL_SECONDS", "60")),
+        agent_health_negative_ttl_seconds=float(os.environ.get("DEVGODZILLA_AGENT_HEALTH_NEGATIVE_TTL_SECONDS", "10")),
+        agent_health_max_parallel=int(os.environ.get("DEVGODZILLA_AGENT_HEALTH_MAX_PARALLEL", "8")),
+
+        # Local-mode step scheduling
+        local_max_parallel_steps=int(os.environ.get("DEVGODZILLA_LOCAL_MAX_PARALLEL_STEPS", "4")),
+        local_engine_concurrency=_parse_int_map(os.environ.get("DEVGODZILLA_LOCAL_ENGINE_CONCURRENCY")),
         
         # Token budgets
         max_tokens_per_step=int(v) if (v := os.environ.get("DEVGODZILLA_MAX_TOKENS_PER_STEP")) else None,
@@ -332,10 +438,25 @@ def load_config() -> Config:
         auto_qa_after_exec=_parse_bool(os.environ.get("DEVGODZILLA_AUTO_QA_AFTER_EXEC")),
         qa_auto_fix_enabled=_parse_bool(os.environ.get("DEVGODZILLA_QA_AUTO_FIX_ENABLED"), default=True),
         qa_max_auto_fix_attempts=int(os.environ.get("DEVGODZILLA_QA_MAX_AUTO_FIX_ATTEMPTS", "3")),
+        qa_max_parallel_gates=int(os.environ.get("DEVGODZILLA_QA_MAX_PARALLEL_GATES", "4")),
+        qa_deadline_seconds=float(v) if (v := os.environ.get("DEVGODZILLA_QA_DEADLINE_SECONDS")) else None,
+        qa_short_circuit=_parse_bool(os.environ.get("DEVGODZILLA_QA_SHORT_CIRCUIT"), default=True),
+        qa_gate_cache_enabled=_parse_bool(os.environ.get("DEVGODZILLA_QA_GATE_CACHE"), default=True),
+        qa_gate_cache_ttl_seconds=int(os.environ.get("DEVGODZILLA_QA_GATE_CACHE_TTL_SECONDS", str(24 * 60 * 60))),
+        qa_scan_mode=(os.environ.get("DEVGODZILLA_QA_SCAN_MODE") or "incremental").strip().lower(),
+        metrics_snapshot_ttl_seconds=float(os.environ.get("DEVGODZILLA_METRICS_SNAPSHOT_TTL_SECONDS", "5")),
         
         # Git
         git_lock_max_retries=int(os.environ.get("DEVGODZILLA_GIT_LOCK_MAX_RETRIES", "5")),
         git_lock_retry_delay=float(os.environ.get("DEVGODZILLA_GIT_LOCK_RETRY_DELAY", "1.0")),
+        worktree_pool_size=int(os.environ.get("DEVGODZILLA_WORKTREE_POOL_SIZE", "0")),
+        git_mirror_root=Path(v).expanduser() if (v := os.environ.get("DEVGODZILLA_GIT_MIRROR_ROOT")) else None,
+        git_clone_strategy=(os.environ.get("DEVGODZILLA_GIT_CLONE_STRATEGY") or "full").strip().lower(),
+        repo_refs_ttl_seconds=float(os.environ.get("DEVGODZILLA_REPO_REFS_TTL_SECONDS", "10")),
+        repo_remote_refs_ttl_seconds=float(os.environ.get("DEVGODZILLA_REPO_REMOTE_REFS_TTL_SECONDS", "60")),
+        repo_map_token_budget=int(os.environ.get("DEVGODZILLA_REPO_MAP_TOKEN_BUDGET", "2000")),
+        prompt_cache_size=int(os.environ.get("DEVGODZILLA_PROMPT_CACHE_SIZE", "128")),
+        policy_cache_ttl_seconds=float(os.environ.get("DEVGODZILLA_POLICY_CACHE_TTL_SECONDS", "60")),
 
         # Projects
         projects_root=Path(os.environ.get("DEVGODZILLA_PROJECTS_ROOT", "projects")).expanduser(),
@@ -351,26 +472,118 @@ def load_config() -> Config:
         windmill_url=os.environ.get("DEVGODZILLA_WINDMILL_URL"),
         windmill_token=os.environ.get("DEVGODZILLA_WINDMILL_TOKEN"),
         windmill_workspace=os.environ.get("DEVGODZILLA_WINDMILL_WORKSPACE", "devgodzilla"),
+        windmill_max_connections=int(os.environ.get("DEVGODZILLA_WINDMILL_MAX_CONNECTIONS", "20")),
+        windmill_max_keepalive_connections=int(os.environ.get("DEVGODZILLA_WINDMILL_MAX_KEEPALIVE", "10")),
+        windmill_http2=_parse_bool(os.environ.get("DEVGODZILLA_WINDMILL_HTTP2"), default=True),
+        windmill_reconcile_interval_seconds=float(os.environ.get("DEVGODZILLA_WINDMILL_RECONCILE_INTERVAL_SECONDS", "30")),
     )
 
 
-# Singleton config instance (lazy loaded)
+# Process-wide config snapshot (lazy loaded, immutable). Request paths read it
+# through `get_config()`; it is rebuilt only on `reload_config()` (SIGHUP, admin
+# endpoint) or when the env files it came from change on disk.
 _config: Optional[Config] = None
 _config_lock = threading.Lock()
+_config_file_stamp: Optional[Tuple[Tuple[str, Optional[int]], ...]] = None
+_config_checked_at = 0.0
+_reload_requested = False
 
+# How often `get_config()` may stat the env files for changes.
+ENV_FILE_CHECK_INTERVAL_SECONDS = 2.0
 
-def get_config() -> Config:
-    """Get or create the singleton config instance."""
-    global _config
-    if _config is None:
-        with _config_lock:
-            if _config is None:
-                _config = load_config()
+
+def _env_file_stamp() -> Tuple[Tuple[str, Optional[int]], ...]:
+    stamp: List[Tuple[str, Optional[int]]] = []
+    for path in [*_dotenv_candidates(), *_windmill_env_candidates()]:
+        try:
+            stamp.append((str(path), path.stat().st_mtime_ns))
+        except OSError:
+            stamp.append((str(path), None))
+    return tuple(stamp)
+
+
+def _forget_injected_env() -> None:
+    """Drop values previously copied from env files (unless overridden since)."""
+    global _DOTENV_LOADED
+    for key, value in _INJECTED_ENV.items():
+        if os.environ.get(key) == value:
+            os.environ.pop(key, None)
+    _INJECTED_ENV.clear()
+    _DOTENV_LOADED = False
+
+
+def _build_snapshot() -> Config:
+    """Load a fresh snapshot and record what it was derived from (lock held)."""
+    global _config, _config_file_stamp, _config_checked_at, _reload_requested
+    _reload_requested = False
+    _config = load_config()
+    _config_file_stamp = _env_file_stamp()
+    _config_checked_at = time.monotonic()
     return _config
 
 
+def _snapshot_is_stale() -> bool:
+    global _config_checked_at
+    if _reload_requested:
+        return True
+    now = time.monotonic()
+    if now - _config_checked_at < ENV_FILE_CHECK_INTERVAL_SECONDS:
+        return False
+    _config_checked_at = now
+    return _env_file_stamp() != _config_file_stamp
+
+
+def get_config() -> Config:
+    """
+    Return the process-wide config snapshot.
+
+    The snapshot is shared and frozen. It is rebuilt by `reload_config()` (or
+    SIGHUP) and when a watched env file's mtime changes (checked at most every
+    ENV_FILE_CHECK_INTERVAL_SECONDS); DEVGODZILLA_* variables changed
+    in-process are only picked up by a reload.
+    """
+    config = _config
+    if config is not None and not _snapshot_is_stale():
+        return config
+    with _config_lock:
+        if _config is not None and not _snapshot_is_stale():
+            return _config
+        if _config is not None:
+            _forget_injected_env()
+        return _build_snapshot()
+
+
+def reload_config() -> Config:
+    """Re-read the environment and env files and replace the snapshot."""
+    with _config_lock:
+        _forget_injected_env()
+        return _build_snapshot()
+
+
+def install_reload_signal_handler() -> bool:
+    """
+    Reload the config snapshot on SIGHUP.
+
+    The handler only flags the snapshot as stale (taking the lock from a signal
+    handler could deadlock); the next `get_config()` call rebuilds it. Returns
+    False where signals cannot be installed (no SIGHUP on this platform, or
+    not called from the main thread).
+    """
+    sighup = getattr(signal, "SIGHUP", None)
+    if sighup is None or threading.current_thread() is not threading.main_thread():
+        return False
+
+    def _request_reload(signum, frame) -> None:
+        global _reload_requested
+        _reload_requested = True
+
+    signal.signal(sighup, _request_reload)
+    return True
+
+
 def _reset_config_for_tests() -> None:
     """Reset the global config cache (tests only)."""
-    global _config
+    global _config, _config_file_stamp
     with _config_lock:
         _config = None
+        _config_file_stamp = None
@@ -11,6 +11,7 @@ from devgodzilla.db.database import (
     PostgresDatabase,
     get_database,
 )
+from devgodzilla.db.async_database import AsyncDatabase, get_async_database
 from devgodzilla.db.schema import SCHEMA_SQLITE, SCHEMA_POSTGRES
 
 __all__ = [
@@ -19,6 +20,8 @@ __all__ = [
     "SQLiteDatabase",
     "PostgresDatabase",
     "get_database",
+    "AsyncDatabase",
+    "get_async_database",
     "SCHEMA_SQLITE",
     "SCHEMA_POSTGRES",
 ]
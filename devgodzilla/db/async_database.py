@@ -0,0 +1,185 @@
+"""
+DevGodzilla Async Database Facade
+
+Runs synchronous `Database` calls on a bounded thread pool so async code
+(SSE/WebSocket generators, async routes) never blocks the event loop on a
+query. Each call records queue-wait and execution latency per method.
+"""
+
+import asyncio
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+from devgodzilla.logging import get_logger
+from devgodzilla.models.domain import Event, JobRun, Project, ProtocolRun, StepRun
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class CallStats:
+    """Latency counters for a single database method."""
+
+    calls: int = 0
+    errors: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        calls = max(self.calls, 1)
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "avg_ms": round(self.total_seconds * 1000 / calls, 3),
+            "max_ms": round(self.max_seconds * 1000, 3),
+            "avg_wait_ms": round(self.total_wait_seconds * 1000 / calls, 3),
+            "max_wait_ms": round(self.max_wait_seconds * 1000, 3),
+        }
+
+
+class AsyncDatabase:
+    """
+    Awaitable wrapper around a synchronous `Database`.
+
+    The executor is bounded (`max_workers`) so a burst of streaming clients
+    cannot exhaust DB connections; excess calls queue and their wait time is
+    reported separately from execution time.
+
+    Usage:
+        adb = get_async_database(db)
+        events = await adb.list_events_since_id(since_id=0, limit=200)
+        stats = adb.stats()
+    """
+
+    def __init__(
+        self,
+        db: Any,
+        *,
+        max_workers: int = 8,
+        slow_call_ms: float = 500.0,
+    ) -> None:
+        self._db_ref = weakref.ref(db)
+        self.max_workers = max(1, int(max_workers))
+        self.slow_call_ms = slow_call_ms
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="devgodzilla-db",
+        )
+        self._stats: Dict[str, CallStats] = {}
+        self._stats_lock = threading.Lock()
+        # Hold the Database weakly so the shared registry never keeps it alive.
+        weakref.finalize(db, self._executor.shutdown, wait=False)
+
+    @property
+    def db(self) -> Any:
+        db = self._db_ref()
+        if db is None:
+            raise RuntimeError("Database has been garbage collected")
+        return db
+
+    def _record(self, name: str, wait: float, elapsed: float, failed: bool) -> None:
+        with self._stats_lock:
+            stats = self._stats.setdefault(name, CallStats())
+            stats.calls += 1
+            stats.errors += int(failed)
+            stats.total_seconds += elapsed
+            stats.max_seconds = max(stats.max_seconds, elapsed)
+            stats.total_wait_seconds += wait
+            stats.max_wait_seconds = max(stats.max_wait_seconds, wait)
+        if elapsed * 1000 >= self.slow_call_ms:
+            logger.warning(
+                "db_call_slow",
+                extra={"method": name, "elapsed_ms": round(elapsed * 1000, 1), "wait_ms": round(wait * 1000, 1)},
+            )
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run `fn(*args, **kwargs)` on the DB executor and record its latency."""
+        name = getattr(fn, "__name__", "call")
+        submitted = time.perf_counter()
+
+        def _call() -> T:
+            started = time.perf_counter()
+            failed = True
+            try:
+                result = fn(*args, **kwargs)
+                failed = False
+                return result
+            finally:
+                self._record(name, started - submitted, time.perf_counter() - started, failed)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, _call)
+
+    async def call(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        """Run an arbitrary `Database` method by name on the DB executor."""
+        return await self.run(getattr(self.db, method), *args, **kwargs)
+
+    # Hot read paths
+
+    async def list_events_since_id(self, **kwargs: Any) -> List[Event]:
+        return await self.run(self.db.list_events_since_id, **kwargs)
+
+    async def list_recent_events(self, **kwargs: Any) -> List[Event]:
+        return await self.run(self.db.list_recent_events, **kwargs)
+
+    async def get_project(self, project_id: int) -> Project:
+        return await self.run(self.db.get_project, project_id)
+
+    async def get_protocol_run(self, run_id: int) -> ProtocolRun:
+        return await self.run(self.db.get_protocol_run, run_id)
+
+    async def list_step_runs(self, protocol_run_id: int) -> List[StepRun]:
+        return await self.run(self.db.list_step_runs, protocol_run_id)
+
+    async def get_step_run(self, step_run_id: int) -> StepRun:
+        return await self.run(self.db.get_step_run, step_run_id)
+
+    async def get_job_run(self, run_id: str) -> JobRun:
+        return await self.run(self.db.get_job_run, run_id)
+
+    # Metrics
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-method latency snapshot (`calls`, `errors`, avg/max execution and wait ms)."""
+        with self._stats_lock:
+            return {name: stats.to_dict() for name, stats in sorted(self._stats.items())}
+
+    def reset_stats(self) -> None:
+        with self._stats_lock:
+            self._stats.clear()
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+# One facade per Database instance; entries disappear with their Database.
+_async_databases: "weakref.WeakKeyDictionary[Any, AsyncDatabase]" = weakref.WeakKeyDictionary()
+_async_databases_lock = threading.Lock()
+
+
+def get_async_database(db: Any, *, max_workers: Optional[int] = None) -> AsyncDatabase:
+    """Get or create the shared `AsyncDatabase` for `db`."""
+    with _async_databases_lock:
+        adb = _async_databases.get(db)
+        if adb is None:
+            adb = AsyncDatabase(db, max_workers=max_workers or 8)
+            _async_databases[db] = adb
+        return adb
+
+
+def all_async_database_stats() -> List[Dict[str, Any]]:
+    """Latency stats for every live `AsyncDatabase` (one entry per backend)."""
+    with _async_databases_lock:
+        items = list(_async_databases.items())
+    return [
+        {"backend": type(db).__name__, "max_workers": adb.max_workers, "methods": adb.stats()}
+        for db, adb in items
+    ]
@@ -6,12 +6,18 @@ Uses the Protocol pattern to define the database contract.
 """
 
 import json
+import os
+import queue
+import re
 import sqlite3
+import threading
 from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Protocol, Union
+from typing import Any, Dict, Iterable, List, Optional, Protocol, Tuple, Union
+from urllib.parse import urlsplit
 
+from devgodzilla.db.schema import EVENTS_PROJECT_BACKFILL, SQLITE_REPO_KEY_INDEX
 from devgodzilla.events_catalog import event_type_variants, infer_event_category, normalize_event_type
 from devgodzilla.logging import get_logger
 from devgodzilla.models.domain import (
@@ -23,6 +29,7 @@ from devgodzilla.models.domain import (
     PolicyPack,
     Project,
     ProtocolRun,
+    QAGateCacheEntry,
     QAResultRecord,
     RunArtifact,
     SpeckitSpec,
@@ -48,6 +55,113 @@ except ImportError:
 _UNSET = object()
 
 
+def _event_insert_rows(events: Iterable[Dict[str, Any]]) -> List[tuple]:
+    """Normalize `append_events` payloads into INSERT parameter tuples."""
+    rows: List[tuple] = []
+    for event in events:
+        protocol_run_id = event.get("protocol_run_id")
+        project_id = event.get("project_id")
+        if protocol_run_id is None and project_id is None:
+            raise ValueError("append_events requires protocol_run_id or project_id for every event")
+        metadata = event.get("metadata")
+        rows.append(
+            (
+                protocol_run_id,
+                project_id,
+                event.get("step_run_id"),
+                normalize_event_type(event["event_type"]),
+                event.get("message") or "",
+                json.dumps(metadata) if metadata else None,
+            )
+        )
+    return rows
+
+
+_JOB_RUN_UPDATE_FIELDS = frozenset({
+    "status",
+    "run_kind",
+    "project_id",
+    "protocol_run_id",
+    "step_run_id",
+    "queue",
+    "attempt",
+    "worker_id",
+    "started_at",
+    "finished_at",
+    "prompt_version",
+    "params",
+    "result",
+    "error",
+    "log_path",
+    "cost_tokens",
+    "cost_cents",
+    "windmill_job_id",
+})
+
+
+def _job_run_assignments(fields: Dict[str, Any], placeholder: str) -> Tuple[List[str], List[Any]]:
+    """Build the SET clause for a job_runs update, ignoring unknown columns."""
+    updates: List[str] = []
+    params: List[Any] = []
+    for key, value in fields.items():
+        if key not in _JOB_RUN_UPDATE_FIELDS:
+            continue
+        updates.append(f"{key} = {placeholder}")
+        params.append(json.dumps(value) if key in ("params", "result") and value is not None else value)
+    updates.append("updated_at = CURRENT_TIMESTAMP")
+    return updates, params
+
+
+_SCP_URL_RE = re.compile(r"^(?:[^@/]+@)?([^:/]{2,}):(?!//)(.+)$")
+
+
+def normalize_repo_url(value: Optional[str]) -> Optional[str]:
+    """
+    Reduce a git remote URL to a comparable `host/owner/repo` key.
+
+    `https://github.com/Org/Repo.git`, `http://github.com/org/repo`,
+    `git@github.com:org/repo.git` and `ssh://git@github.com:22/org/repo` all
+    map to `github.com/org/repo`: scheme, credentials, port and `.git` are
+    dropped and the key is lowercased. Local paths keep their path.
+    This is the repository key used for webhook routing (projects.repo_key).
+    """
+    if not value:
+        return None
+    text = value.strip()
+    if "://" in text:
+        parts = urlsplit(text)
+        text = f"{parts.hostname or ''}/{parts.path.strip('/')}"
+    else:
+        match = _SCP_URL_RE.match(text)
+        if match and "/" not in match.group(1):
+            text = f"{match.group(1)}/{match.group(2)}"
+    text = text.lower().strip("/")
+    if text.endswith(".git"):
+        text = text[:-4].rstrip("/")
+    return text or None
+
+
+def _stale_repo_keys(rows: Iterable[Tuple[int, Optional[str], Optional[str]]]) -> List[Tuple[Optional[str], int]]:
+    """(repo_key, id) updates for rows whose stored key is missing or outdated."""
+    updates = []
+    for project_id, git_url, repo_key in rows:
+        key = normalize_repo_url(git_url)
+        if key != repo_key:
+            updates.append((key, project_id))
+    return updates
+
+
+def _sqlite_ts(value: datetime) -> str:
+    """Format a datetime like SQLite's CURRENT_TIMESTAMP (UTC) for range comparisons."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return value.strftime("%Y-%m-%d %H:%M:%S")
+
+
+# Rows per multi-row INSERT (6 params each; well under SQLite's variable limit).
+_EVENT_INSERT_CHUNK = 500
+
+
 class DatabaseProtocol(Protocol):
     """Protocol defining the database interface."""
     
@@ -69,6 +183,7 @@ class DatabaseProtocol(Protocol):
     ) -> Project: ...
     
     def get_project(self, project_id: int) -> Project: ...
+    def get_project_by_repo_urls(self, urls: List[str]) -> Optional[Project]: ...
     def list_projects(self) -> List[Project]: ...
     def update_project_local_path(self, project_id: int, local_path: str) -> Project: ...
     def delete_project(self, project_id: int) -> None: ...
@@ -87,8 +202,16 @@ class DatabaseProtocol(Protocol):
     
     def get_protocol_run(self, run_id: int) -> ProtocolRun: ...
     def list_protocol_runs(self, project_id: int) -> List[ProtocolRun]: ...
-    def list_all_protocol_runs(self, *, limit: int = 200) -> List[ProtocolRun]: ...
+    def list_all_protocol_runs(self, *, limit: int = 200, status: Optional[str] = None) -> List[ProtocolRun]: ...
+    def get_protocol_run_by_windmill_flow_id(self, windmill_flow_id: str) -> Optional[ProtocolRun]: ...
     def update_protocol_status(self, run_id: int, status: str) -> ProtocolRun: ...
+    def update_protocol_paths(
+        self,
+        run_id: int,
+        *,
+        worktree_path: Optional[str] = _UNSET,
+        protocol_root: Optional[str] = None,
+    ) -> ProtocolRun: ...
 
     # SpecKit specs
     def upsert_speckit_spec(
@@ -180,6 +303,8 @@ class DatabaseProtocol(Protocol):
         project_id: Optional[int] = None,
     ) -> Event: ...
 
+    def append_events(self, events: List[Dict[str, Any]]) -> int: ...
+
     # QA results
     def create_qa_result(
         self,
@@ -214,6 +339,25 @@ class DatabaseProtocol(Protocol):
         *,
         step_run_id: int,
     ) -> Optional[QAResultRecord]: ...
+
+    def get_qa_gate_cache(self, cache_key: str) -> Optional[QAGateCacheEntry]: ...
+
+    def upsert_qa_gate_cache(
+        self,
+        *,
+        cache_key: str,
+        gate_id: str,
+        tree_hash: str,
+        result: Dict[str, Any],
+        project_id: Optional[int] = None,
+    ) -> None: ...
+
+    def delete_qa_gate_cache(
+        self,
+        *,
+        project_id: Optional[int] = None,
+        older_than: Optional[datetime] = None,
+    ) -> int: ...
     
     def list_events(
         self,
@@ -281,6 +425,15 @@ class DatabaseProtocol(Protocol):
 
     def update_job_run(self, run_id: str, **kwargs: Any) -> JobRun: ...
 
+    def list_active_windmill_job_runs(self, *, limit: int = 1000) -> List[JobRun]: ...
+
+    def update_job_runs(
+        self,
+        updates: Dict[str, Dict[str, Any]],
+        *,
+        events: Optional[List[Dict[str, Any]]] = None,
+    ) -> int: ...
+
     def update_job_run_by_windmill_id(self, windmill_job_id: str, **kwargs: Any) -> JobRun: ...
 
     def create_run_artifact(
@@ -302,6 +455,13 @@ class DatabaseProtocol(Protocol):
     def get_queue_stats(self) -> List[Dict[str, Any]]: ...
     def list_queue_jobs(self, status: Optional[str] = None, limit: int = 100) -> List[Dict[str, Any]]: ...
 
+    # Aggregate statistics
+    def count_protocol_runs_by_status(self, *, project_id: Optional[int] = None) -> Dict[str, int]: ...
+    def count_step_runs_by_status(self, *, project_id: Optional[int] = None) -> Dict[str, int]: ...
+    def step_run_stats_by_engine(self, *, project_id: Optional[int] = None) -> List[Dict[str, Any]]: ...
+    def job_run_stats_by_type(self, *, since: Optional[datetime] = None) -> List[Dict[str, Any]]: ...
+    def count_events(self, *, since: Optional[datetime] = None) -> int: ...
+
     # Agile: Sprints
     def create_sprint(
         self,
@@ -355,42 +515,190 @@ class DatabaseProtocol(Protocol):
 
 
 
+class SQLiteConnectionPool:
+    """
+    Thread-aware pool of long-lived SQLite connections.
+
+    The database is switched to WAL mode so readers never block the writer.
+    All writes go through a single writer connection serialized by a lock;
+    reads borrow a connection from a bounded pool of read-only connections.
+    Connections are reopened transparently after ``os.fork``.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        *,
+        max_readers: int = 8,
+        busy_timeout_ms: int = 5000,
+        synchronous: str = "NORMAL",
+        mmap_size: int = 256 * 1024 * 1024,
+    ) -> None:
+        self.db_path = Path(db_path)
+        self.max_readers = max(1, int(max_readers))
+        self.busy_timeout_ms = max(0, int(busy_timeout_ms))
+        self.synchronous = synchronous.upper()
+        if self.synchronous not in ("OFF", "NORMAL", "FULL", "EXTRA"):
+            raise ValueError(f"Invalid SQLite synchronous mode: {synchronous}")
+        self.mmap_size = max(0, int(mmap_size))
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._pid = os.getpid()
+        self._writer: Optional[sqlite3.Connection] = None
+        self._writer_lock = threading.RLock()
+        self._writer_depth = 0
+        self._idle_readers: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._reader_slots = threading.BoundedSemaphore(self.max_readers)
+        self._all_readers: List[sqlite3.Connection] = []
+
+    def _check_pid(self) -> None:
+        # Connections must never be shared with a forked child process.
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    self._reset()
+
+    def _open(self, *, readonly: bool) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            timeout=self.busy_timeout_ms / 1000.0,
+            isolation_level="DEFERRED" if readonly else "IMMEDIATE",
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute(f"PRAGMA busy_timeout = {self.busy_timeout_ms}")
+        conn.execute(f"PRAGMA synchronous = {self.synchronous}")
+        conn.execute(f"PRAGMA mmap_size = {self.mmap_size}")
+        if readonly:
+            conn.execute("PRAGMA query_only = 1")
+        else:
+            conn.execute("PRAGMA journal_mode = WAL")
+        return conn
+
+    def _get_writer(self) -> sqlite3.Connection:
+        if self._writer is None:
+            self._writer = self._open(readonly=False)
+        return self._writer
+
+    @contextmanager
+    def writer(self):
+        """
+        Yield the writer connection inside a transaction.
+
+        Re-entrant within a thread: only the outermost block commits or rolls back.
+        """
+        self._check_pid()
+        with self._writer_lock:
+            conn = self._get_writer()
+            self._writer_depth += 1
+            try:
+                yield conn
+                if self._writer_depth == 1:
+                    conn.commit()
+            except Exception:
+                if self._writer_depth == 1:
+                    conn.rollback()
+                raise
+            finally:
+                self._writer_depth -= 1
+
+    @contextmanager
+    def reader(self):
+        """Borrow a read-only connection, opening one if the pool is not full."""
+        self._check_pid()
+        # Make sure the database exists and is in WAL mode before the first read.
+        if self._writer is None:
+            with self._writer_lock:
+                self._get_writer()
+        self._reader_slots.acquire()
+        try:
+            try:
+                conn = self._idle_readers.get_nowait()
+            except queue.Empty:
+                conn = self._open(readonly=True)
+                with self._lock:
+                    self._all_readers.append(conn)
+            try:
+                yield conn
+            finally:
+                if conn.in_transaction:
+                    conn.rollback()
+                self._idle_readers.put(conn)
+        finally:
+            self._reader_slots.release()
+
+    def close(self) -> None:
+        """Close every pooled connection (idle readers and the writer)."""
+        with self._lock:
+            readers, self._all_readers = self._all_readers, []
+        for conn in readers:
+            try:
+                conn.close()
+            except Exception:
+                pass
+        self._idle_readers = queue.LifoQueue()
+        with self._writer_lock:
+            if self._writer is not None:
+                try:
+                    self._writer.close()
+                finally:
+                    self._writer = None
+
+
 class SQLiteDatabase:
     """
     SQLite-backed persistence for DevGodzilla state.
+
+    Connections are pooled and kept open (see `SQLiteConnectionPool`); the
+    database runs in WAL mode with a single writer and concurrent readers.
     """
 
-    def __init__(self, db_path: Path) -> None:
+    def __init__(
+        self,
+        db_path: Path,
+        *,
+        pool_size: int = 8,
+        busy_timeout_ms: int = 5000,
+        synchronous: str = "NORMAL",
+        mmap_size: int = 256 * 1024 * 1024,
+    ) -> None:
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.pool = SQLiteConnectionPool(
+            self.db_path,
+            max_readers=pool_size,
+            busy_timeout_ms=busy_timeout_ms,
+            synchronous=synchronous,
+            mmap_size=mmap_size,
+        )
 
-    def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path, check_same_thread=False)
-        conn.row_factory = sqlite3.Row
-        return conn
+    def close(self) -> None:
+        """Close pooled connections."""
+        self.pool.close()
 
     @contextmanager
     def _transaction(self):
-        """Context manager for database transactions."""
-        conn = self._connect()
-        try:
+        """Context manager for database transactions (on the writer connection)."""
+        with self.pool.writer() as conn:
             yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
-        finally:
-            conn.close()
 
     def _fetchone(self, query: str, params: Iterable[Any] = ()) -> Optional[sqlite3.Row]:
-        with self._connect() as conn:
+        with self.pool.reader() as conn:
             cur = conn.execute(query, tuple(params))
-            return cur.fetchone()
+            try:
+                return cur.fetchone()
+            finally:
+                cur.close()
 
     def _fetchall(self, query: str, params: Iterable[Any] = ()) -> List[sqlite3.Row]:
-        with self._connect() as conn:
+        with self.pool.reader() as conn:
             cur = conn.execute(query, tuple(params))
-            return cur.fetchall()
+            try:
+                return cur.fetchall()
+            finally:
+                cur.close()
 
     def init_schema(self) -> None:
         """Initialize database schema."""
@@ -398,6 +706,16 @@ class SQLiteDatabase:
         
         with self._transaction() as conn:
             conn.executescript(SCHEMA_SQLITE)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(projects)")}
+            if "repo_key" not in columns:
+                conn.execute("ALTER TABLE projects ADD COLUMN repo_key TEXT")
+            conn.execute(SQLITE_REPO_KEY_INDEX)
+            conn.execute(EVENTS_PROJECT_BACKFILL)
+            rows = conn.execute("SELECT id, git_url, repo_key FROM projects").fetchall()
+            conn.executemany(
+                "UPDATE projects SET repo_key = ? WHERE id = ?",
+                _stale_repo_keys((row[0], row[1], row[2]) for row in rows),
+            )
             conn.commit()
 
     # Helper methods for JSON and timestamp parsing
@@ -580,6 +898,16 @@ class SQLiteDatabase:
             updated_at=self._coerce_ts(row["updated_at"] if "updated_at" in keys else None),
         )
 
+    def _row_to_qa_gate_cache(self, row: sqlite3.Row) -> QAGateCacheEntry:
+        return QAGateCacheEntry(
+            cache_key=row["cache_key"],
+            gate_id=row["gate_id"],
+            tree_hash=row["tree_hash"],
+            result=self._parse_json(row["result"]) or {},
+            project_id=row["project_id"],
+            created_at=self._coerce_ts(row["created_at"]),
+        )
+
     def _row_to_event(self, row: sqlite3.Row) -> Event:
         keys = set(row.keys())
         event_type = normalize_event_type(row["event_type"])
@@ -702,15 +1030,15 @@ class SQLiteDatabase:
             cur = conn.execute(
                 """
                 INSERT INTO projects (
-                    name, git_url, base_branch, ci_provider,
+                    name, git_url, repo_key, base_branch, ci_provider,
                     default_models, secrets, local_path,
                     project_classification, policy_pack_key, policy_pack_version,
                     policy_enforcement_mode
                 )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 'warn')
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 'warn')
                 """,
                 (
-                    name, git_url, base_branch, ci_provider,
+                    name, git_url, normalize_repo_url(git_url), base_branch, ci_provider,
                     json.dumps(default_models) if default_models else None,
                     json.dumps(secrets) if secrets else None,
                     local_path, project_classification,
@@ -727,6 +1055,18 @@ class SQLiteDatabase:
             raise KeyError(f"Project {project_id} not found")
         return self._row_to_project(row)
 
+    def get_project_by_repo_urls(self, urls: List[str]) -> Optional[Project]:
+        """Newest project whose git_url matches any of `urls` (after normalization)."""
+        keys = sorted({key for key in (normalize_repo_url(url) for url in urls) if key})
+        if not keys:
+            return None
+        row = self._fetchone(
+            f"SELECT * FROM projects WHERE repo_key IN ({', '.join(['?'] * len(keys))}) "
+            "ORDER BY created_at DESC, id DESC LIMIT 1",
+            tuple(keys),
+        )
+        return self._row_to_project(row) if row else None
+
     def list_projects(self) -> List[Project]:
         rows = self._fetchall("SELECT * FROM projects ORDER BY created_at DESC")
         return [self._row_to_project(row) for row in rows]
@@ -767,6 +1107,8 @@ class SQLiteDatabase:
         if git_url is not None:
             updates.append("git_url = ?")
             params.append(git_url)
+            updates.append("repo_key = ?")
+            params.append(normalize_repo_url(git_url))
         if base_branch is not None:
             updates.append("base_branch = ?")
             params.append(base_branch)
@@ -816,6 +1158,7 @@ class SQLiteDatabase:
                 (project_id, project_id),
             )
             conn.execute("DELETE FROM qa_results WHERE project_id = ?", (project_id,))
+            conn.execute("DELETE FROM qa_gate_cache WHERE project_id = ?", (project_id,))
             conn.execute("DELETE FROM agent_overrides WHERE project_id = ?", (project_id,))
             conn.execute("DELETE FROM agent_assignments WHERE project_id = ?", (project_id,))
             conn.execute("DELETE FROM agent_assignment_settings WHERE project_id = ?", (project_id,))
@@ -879,14 +1222,27 @@ class SQLiteDatabase:
         )
         return [self._row_to_protocol_run(row) for row in rows]
 
-    def list_all_protocol_runs(self, *, limit: int = 200) -> List[ProtocolRun]:
+    def list_all_protocol_runs(self, *, limit: int = 200, status: Optional[str] = None) -> List[ProtocolRun]:
         limit = max(1, min(int(limit), 500))
-        rows = self._fetchall(
-            "SELECT * FROM protocol_runs ORDER BY created_at DESC LIMIT ?",
-            (limit,),
-        )
+        if status is not None:
+            rows = self._fetchall(
+                "SELECT * FROM protocol_runs WHERE status = ? ORDER BY created_at DESC LIMIT ?",
+                (status, limit),
+            )
+        else:
+            rows = self._fetchall(
+                "SELECT * FROM protocol_runs ORDER BY created_at DESC LIMIT ?",
+                (limit,),
+            )
         return [self._row_to_protocol_run(row) for row in rows]
 
+    def get_protocol_run_by_windmill_flow_id(self, windmill_flow_id: str) -> Optional[ProtocolRun]:
+        row = self._fetchone(
+            "SELECT * FROM protocol_runs WHERE windmill_flow_id = ? ORDER BY created_at DESC, id DESC LIMIT 1",
+            (windmill_flow_id,),
+        )
+        return self._row_to_protocol_run(row) if row else None
+
     def update_protocol_status(self, run_id: int, status: str) -> ProtocolRun:
         with self._transaction() as conn:
             conn.execute(
@@ -923,21 +1279,21 @@ class SQLiteDatabase:
         self,
         run_id: int,
         *,
-        worktree_path: Optional[str] = None,
+        worktree_path: Optional[str] = _UNSET,
         protocol_root: Optional[str] = None,
     ) -> ProtocolRun:
-        """Update worktree/protocol root paths on a protocol run."""
+        """Update worktree/protocol root paths on a protocol run (worktree_path=None clears it)."""
         updates = ["updated_at = CURRENT_TIMESTAMP"]
         params: List[Any] = []
 
-        if worktree_path is not None:
+        if worktree_path is not _UNSET:
             updates.append("worktree_path = ?")
             params.append(worktree_path)
         if protocol_root is not None:
             updates.append("protocol_root = ?")
             params.append(protocol_root)
 
-        if len(params) == 0:
+        if len(updates) == 1:
             return self.get_protocol_run(run_id)
 
         params.append(run_id)
@@ -1495,6 +1851,34 @@ class SQLiteDatabase:
         row = self._fetchone("SELECT * FROM events WHERE id = ?", (event_id,))
         return self._row_to_event(row)
 
+    def append_events(self, events: List[Dict[str, Any]]) -> int:
+        """
+        Insert many events in one transaction using multi-row INSERTs.
+
+        Each item takes the `append_event` keyword arguments. `project_id` is
+        stored as given (callers resolve it); missing ones are filled from the
+        protocol run so project filters never need a join. Nothing is read back.
+        """
+        rows = _event_insert_rows(events)
+        if not rows:
+            return 0
+        with self._transaction() as conn:
+            self._insert_event_rows(conn, rows)
+        return len(rows)
+
+    @staticmethod
+    def _insert_event_rows(conn: sqlite3.Connection, rows: List[tuple]) -> None:
+        for start in range(0, len(rows), _EVENT_INSERT_CHUNK):
+            chunk = rows[start:start + _EVENT_INSERT_CHUNK]
+            placeholders = ", ".join(["(?, ?, ?, ?, ?, ?)"] * len(chunk))
+            conn.execute(
+                "INSERT INTO events (protocol_run_id, project_id, step_run_id, event_type, message, metadata) "
+                f"VALUES {placeholders}",
+                [value for row in chunk for value in row],
+            )
+        if any(row[1] is None for row in rows):
+            conn.execute(EVENTS_PROJECT_BACKFILL)
+
     def list_events(
         self,
         protocol_run_id: int,
@@ -1517,11 +1901,10 @@ class SQLiteDatabase:
             SELECT
                 e.*,
                 pr.protocol_name,
-                COALESCE(e.project_id, pr.project_id) AS project_id,
                 p.name AS project_name
             FROM events e
             LEFT JOIN protocol_runs pr ON pr.id = e.protocol_run_id
-            LEFT JOIN projects p ON p.id = COALESCE(e.project_id, pr.project_id)
+            LEFT JOIN projects p ON p.id = e.project_id
             WHERE
         """
         sql += " AND ".join(where)
@@ -1551,7 +1934,7 @@ class SQLiteDatabase:
             where.append("e.protocol_run_id = ?")
             params.append(protocol_run_id)
         if project_id is not None:
-            where.append("COALESCE(e.project_id, pr.project_id) = ?")
+            where.append("e.project_id = ?")
             params.append(project_id)
         if event_types:
             variants: list[str] = []
@@ -1566,11 +1949,10 @@ class SQLiteDatabase:
             SELECT
                 e.*,
                 pr.protocol_name,
-                COALESCE(e.project_id, pr.project_id) AS project_id,
                 p.name AS project_name
             FROM events e
             LEFT JOIN protocol_runs pr ON pr.id = e.protocol_run_id
-            LEFT JOIN projects p ON p.id = COALESCE(e.project_id, pr.project_id)
+            LEFT JOIN projects p ON p.id = e.project_id
         """
         if where:
             sql += " WHERE " + " AND ".join(where)
@@ -1602,7 +1984,7 @@ class SQLiteDatabase:
             where.append("e.protocol_run_id = ?")
             params.append(protocol_run_id)
         if project_id is not None:
-            where.append("COALESCE(e.project_id, pr.project_id) = ?")
+            where.append("e.project_id = ?")
             params.append(project_id)
         if event_types:
             variants: list[str] = []
@@ -1617,11 +1999,10 @@ class SQLiteDatabase:
             SELECT
                 e.*,
                 pr.protocol_name,
-                COALESCE(e.project_id, pr.project_id) AS project_id,
                 p.name AS project_name
             FROM events e
             LEFT JOIN protocol_runs pr ON pr.id = e.protocol_run_id
-            LEFT JOIN projects p ON p.id = COALESCE(e.project_id, pr.project_id)
+            LEFT JOIN projects p ON p.id = e.project_id
             WHERE
         """
         sql += " AND ".join(where)
@@ -1820,6 +2201,53 @@ class SQLiteDatabase:
             return None
         return self._row_to_qa_result(row)
 
+    # QA gate result cache
+    def get_qa_gate_cache(self, cache_key: str) -> Optional[QAGateCacheEntry]:
+        row = self._fetchone("SELECT * FROM qa_gate_cache WHERE cache_key = ?", (cache_key,))
+        if row is None:
+            return None
+        return self._row_to_qa_gate_cache(row)
+
+    def upsert_qa_gate_cache(
+        self,
+        *,
+        cache_key: str,
+        gate_id: str,
+        tree_hash: str,
+        result: Dict[str, Any],
+        project_id: Optional[int] = None,
+    ) -> None:
+        with self._transaction() as conn:
+            conn.execute(
+                """
+                INSERT INTO qa_gate_cache (cache_key, gate_id, tree_hash, project_id, result)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (cache_key) DO UPDATE SET
+                    result = excluded.result,
+                    project_id = excluded.project_id,
+                    created_at = CURRENT_TIMESTAMP
+                """,
+                (cache_key, gate_id, tree_hash, project_id, json.dumps(result)),
+            )
+
+    def delete_qa_gate_cache(
+        self,
+        *,
+        project_id: Optional[int] = None,
+        older_than: Optional[datetime] = None,
+    ) -> int:
+        clauses, params = [], []
+        if project_id is not None:
+            clauses.append("project_id = ?")
+            params.append(project_id)
+        if older_than is not None:
+            clauses.append("created_at < ?")
+            params.append(_sqlite_ts(older_than))
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._transaction() as conn:
+            cur = conn.execute(f"DELETE FROM qa_gate_cache{where}", tuple(params))
+            return cur.rowcount or 0
+
     # Job runs + artifacts
     def create_job_run(
         self,
@@ -1923,48 +2351,47 @@ class SQLiteDatabase:
         return [self._row_to_job_run(row) for row in rows]
 
     def update_job_run(self, run_id: str, **kwargs: Any) -> JobRun:
-        allowed = {
-            "status",
-            "run_kind",
-            "project_id",
-            "protocol_run_id",
-            "step_run_id",
-            "queue",
-            "attempt",
-            "worker_id",
-            "started_at",
-            "finished_at",
-            "prompt_version",
-            "params",
-            "result",
-            "error",
-            "log_path",
-            "cost_tokens",
-            "cost_cents",
-            "windmill_job_id",
-        }
-        updates = []
-        params: list[Any] = []
-        for key, value in kwargs.items():
-            if key not in allowed:
-                continue
-            if key in ("params", "result") and value is not None:
-                updates.append(f"{key} = ?")
-                params.append(json.dumps(value))
-                continue
-            updates.append(f"{key} = ?")
-            params.append(value)
-
-        updates.append("updated_at = CURRENT_TIMESTAMP")
-        params.append(run_id)
-
+        updates, params = _job_run_assignments(kwargs, "?")
         with self._transaction() as conn:
             conn.execute(
                 f"UPDATE job_runs SET {', '.join(updates)} WHERE run_id = ?",
-                tuple(params),
+                (*params, run_id),
             )
         return self.get_job_run(run_id)
 
+    def list_active_windmill_job_runs(self, *, limit: int = 1000) -> List[JobRun]:
+        rows = self._fetchall(
+            """
+            SELECT * FROM job_runs
+            WHERE status IN ('queued', 'running') AND windmill_job_id IS NOT NULL
+            ORDER BY created_at ASC
+            LIMIT ?
+            """,
+            (max(1, int(limit)),),
+        )
+        return [self._row_to_job_run(row) for row in rows]
+
+    def update_job_runs(
+        self,
+        updates: Dict[str, Dict[str, Any]],
+        *,
+        events: Optional[List[Dict[str, Any]]] = None,
+    ) -> int:
+        """
+        Apply `update_job_run` changes for many runs, plus the events that
+        describe them, in a single transaction. Returns the number of runs.
+        """
+        event_rows = _event_insert_rows(events or [])
+        with self._transaction() as conn:
+            for run_id, fields in updates.items():
+                assignments, params = _job_run_assignments(fields, "?")
+                conn.execute(
+                    f"UPDATE job_runs SET {', '.join(assignments)} WHERE run_id = ?",
+                    (*params, run_id),
+                )
+            self._insert_event_rows(conn, event_rows)
+        return len(updates)
+
     def update_job_run_by_windmill_id(self, windmill_job_id: str, **kwargs: Any) -> JobRun:
         row = self._fetchone("SELECT run_id FROM job_runs WHERE windmill_job_id = ? LIMIT 1", (windmill_job_id,))
         if row is None:
@@ -2079,6 +2506,103 @@ class SQLiteDatabase:
             result.append(job)
         return result
 
+    # Aggregate statistics (single GROUP BY queries for dashboards/metrics)
+    def count_protocol_runs_by_status(self, *, project_id: Optional[int] = None) -> Dict[str, int]:
+        clause, params = ("WHERE project_id = ?", (project_id,)) if project_id is not None else ("", ())
+        rows = self._fetchall(
+            f"SELECT status, COUNT(*) AS count FROM protocol_runs {clause} GROUP BY status",
+            params,
+        )
+        return {row["status"]: int(row["count"]) for row in rows}
+
+    def count_step_runs_by_status(self, *, project_id: Optional[int] = None) -> Dict[str, int]:
+        if project_id is not None:
+            rows = self._fetchall(
+                """
+                SELECT s.status, COUNT(*) AS count
+                FROM step_runs s
+                JOIN protocol_runs pr ON pr.id = s.protocol_run_id
+                WHERE pr.project_id = ?
+                GROUP BY s.status
+                """,
+                (project_id,),
+            )
+        else:
+            rows = self._fetchall("SELECT status, COUNT(*) AS count FROM step_runs GROUP BY status")
+        return {row["status"]: int(row["count"]) for row in rows}
+
+    def step_run_stats_by_engine(self, *, project_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Step counts per engine (engine_id, else assigned_agent) and status.
+
+        Each row has `engine_id`, `status`, `count` and `last_activity_at`
+        (latest step update for that engine/status).
+        """
+        engine = "COALESCE(NULLIF(s.engine_id, ''), NULLIF(s.assigned_agent, ''))"
+        join, where, params = "", "", ()
+        if project_id is not None:
+            join = "JOIN protocol_runs pr ON pr.id = s.protocol_run_id"
+            where, params = "AND pr.project_id = ?", (project_id,)
+        rows = self._fetchall(
+            f"""
+            SELECT {engine} AS engine_id, s.status, COUNT(*) AS count, MAX(s.updated_at) AS last_activity_at
+            FROM step_runs s
+            {join}
+            WHERE {engine} IS NOT NULL {where}
+            GROUP BY {engine}, s.status
+            """,
+            params,
+        )
+        return [
+            {
+                "engine_id": row["engine_id"],
+                "status": row["status"],
+                "count": int(row["count"]),
+                "last_activity_at": self._coerce_ts(row["last_activity_at"]) or None,
+            }
+            for row in rows
+        ]
+
+    def job_run_stats_by_type(self, *, since: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """
+        Job counts and average duration per job type, most frequent first.
+
+        Only jobs created at or after `since` are counted when it is given;
+        the average covers jobs with both start and finish times.
+        """
+        clause, params = ("WHERE created_at >= ?", (_sqlite_ts(since),)) if since is not None else ("", ())
+        rows = self._fetchall(
+            f"""
+            SELECT
+                COALESCE(job_type, 'unknown') AS job_type,
+                COUNT(*) AS count,
+                AVG(CASE WHEN started_at IS NOT NULL AND finished_at IS NOT NULL THEN (julianday(finished_at) - julianday(started_at)) * 86400.0 END) AS avg_duration_seconds
+            FROM job_runs
+            {clause}
+            GROUP BY COALESCE(job_type, 'unknown')
+            ORDER BY count DESC, job_type
+            """,
+            params,
+        )
+        return [
+            {
+                "job_type": row["job_type"],
+                "count": int(row["count"]),
+                "avg_duration_seconds": (
+                    float(row["avg_duration_seconds"]) if row["avg_duration_seconds"] is not None else None
+                ),
+            }
+            for row in rows
+        ]
+
+    def count_events(self, *, since: Optional[datetime] = None) -> int:
+        """Count events, optionally only those created at or after `since`."""
+        if since is not None:
+            row = self._fetchone("SELECT COUNT(*) AS count FROM events WHERE created_at >= ?", (_sqlite_ts(since),))
+        else:
+            row = self._fetchone("SELECT COUNT(*) AS count FROM events")
+        return int(row["count"]) if row else 0
+
     # Feedback event operations (new for DevGodzilla)
     def append_feedback_event(
         self,
@@ -2748,6 +3272,11 @@ class PostgresDatabase:
         with self._transaction() as conn:
             with conn.cursor() as cur:
                 cur.execute(SCHEMA_POSTGRES)
+                cur.execute(EVENTS_PROJECT_BACKFILL)
+                cur.execute("SELECT id, git_url, repo_key FROM projects")
+                updates = _stale_repo_keys((row["id"], row["git_url"], row["repo_key"]) for row in cur.fetchall())
+                if updates:
+                    cur.executemany("UPDATE projects SET repo_key = %s WHERE id = %s", updates)
 
     # Helper methods for JSON and timestamp parsing (reuse SQLite implementations)
     @staticmethod
@@ -2889,6 +3418,16 @@ class PostgresDatabase:
             project_name=row.get("project_name"),
         )
 
+    def _row_to_qa_gate_cache(self, row: Dict[str, Any]) -> QAGateCacheEntry:
+        return QAGateCacheEntry(
+            cache_key=row["cache_key"],
+            gate_id=row["gate_id"],
+            tree_hash=row["tree_hash"],
+            result=self._parse_json(row.get("result")) or {},
+            project_id=row.get("project_id"),
+            created_at=self._coerce_ts(row.get("created_at")),
+        )
+
     def _row_to_qa_result(self, row: Dict[str, Any]) -> QAResultRecord:
         return QAResultRecord(
             id=row["id"],
@@ -3484,16 +4023,16 @@ class PostgresDatabase:
                 cur.execute(
                     """
                     INSERT INTO projects (
-                        name, git_url, base_branch, ci_provider,
+                        name, git_url, repo_key, base_branch, ci_provider,
                         default_models, secrets, local_path,
                         project_classification, policy_pack_key, policy_pack_version,
                         policy_enforcement_mode
                     )
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, 'warn')
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, 'warn')
                     RETURNING id
                     """,
                     (
-                        name, git_url, base_branch, ci_provider,
+                        name, git_url, normalize_repo_url(git_url), base_branch, ci_provider,
                         json.dumps(default_models) if default_models else None,
                         json.dumps(secrets) if secrets else None,
                         local_path, project_classification,
@@ -3510,6 +4049,18 @@ class PostgresDatabase:
             raise KeyError(f"Project {project_id} not found")
         return self._row_to_project(row)
 
+    def get_project_by_repo_urls(self, urls: List[str]) -> Optional[Project]:
+        """Newest project whose git_url matches any of `urls` (after normalization)."""
+        keys = sorted({key for key in (normalize_repo_url(url) for url in urls) if key})
+        if not keys:
+            return None
+        row = self._fetchone(
+            f"SELECT * FROM projects WHERE repo_key IN ({', '.join(['%s'] * len(keys))}) "
+            "ORDER BY created_at DESC, id DESC LIMIT 1",
+            tuple(keys),
+        )
+        return self._row_to_project(row) if row else None
+
     def list_projects(self) -> List[Project]:
         rows = self._fetchall("SELECT * FROM projects ORDER BY created_at DESC")
         return [self._row_to_project(row) for row in rows]
@@ -3551,6 +4102,8 @@ class PostgresDatabase:
         if git_url is not None:
             updates.append("git_url = %s")
             params.append(git_url)
+            updates.append("repo_key = %s")
+            params.append(normalize_repo_url(git_url))
         if base_branch is not None:
             updates.append("base_branch = %s")
             params.append(base_branch)
@@ -3610,6 +4163,7 @@ class PostgresDatabase:
                     (project_id, project_id),
                 )
                 cur.execute("DELETE FROM qa_results WHERE project_id = %s", (project_id,))
+                cur.execute("DELETE FROM qa_gate_cache WHERE project_id = %s", (project_id,))
                 cur.execute("DELETE FROM agent_overrides WHERE project_id = %s", (project_id,))
                 cur.execute("DELETE FROM agent_assignments WHERE project_id = %s", (project_id,))
                 cur.execute("DELETE FROM agent_assignment_settings WHERE project_id = %s", (project_id,))
@@ -3717,14 +4271,27 @@ class PostgresDatabase:
         )
         return [self._row_to_protocol_run(row) for row in rows]
 
-    def list_all_protocol_runs(self, *, limit: int = 200) -> List[ProtocolRun]:
+    def list_all_protocol_runs(self, *, limit: int = 200, status: Optional[str] = None) -> List[ProtocolRun]:
         limit = max(1, min(int(limit), 500))
-        rows = self._fetchall(
-            "SELECT * FROM protocol_runs ORDER BY created_at DESC LIMIT %s",
-            (limit,),
-        )
+        if status is not None:
+            rows = self._fetchall(
+                "SELECT * FROM protocol_runs WHERE status = %s ORDER BY created_at DESC LIMIT %s",
+                (status, limit),
+            )
+        else:
+            rows = self._fetchall(
+                "SELECT * FROM protocol_runs ORDER BY created_at DESC LIMIT %s",
+                (limit,),
+            )
         return [self._row_to_protocol_run(row) for row in rows]
 
+    def get_protocol_run_by_windmill_flow_id(self, windmill_flow_id: str) -> Optional[ProtocolRun]:
+        row = self._fetchone(
+            "SELECT * FROM protocol_runs WHERE windmill_flow_id = %s ORDER BY created_at DESC, id DESC LIMIT 1",
+            (windmill_flow_id,),
+        )
+        return self._row_to_protocol_run(row) if row else None
+
     def update_protocol_status(self, run_id: int, status: str) -> ProtocolRun:
         with self._transaction() as conn:
             with conn.cursor() as cur:
@@ -3734,6 +4301,34 @@ class PostgresDatabase:
                 )
         return self.get_protocol_run(run_id)
 
+    def update_protocol_paths(
+        self,
+        run_id: int,
+        *,
+        worktree_path: Optional[str] = _UNSET,
+        protocol_root: Optional[str] = None,
+    ) -> ProtocolRun:
+        """Update worktree/protocol root paths on a protocol run (PostgreSQL)."""
+        updates = ["updated_at = CURRENT_TIMESTAMP"]
+        params: List[Any] = []
+        if worktree_path is not _UNSET:
+            updates.append("worktree_path = %s")
+            params.append(worktree_path)
+        if protocol_root is not None:
+            updates.append("protocol_root = %s")
+            params.append(protocol_root)
+        if len(updates) == 1:
+            return self.get_protocol_run(run_id)
+
+        params.append(run_id)
+        with self._transaction() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    f"UPDATE protocol_runs SET {', '.join(updates)} WHERE id = %s",
+                    tuple(params),
+                )
+        return self.get_protocol_run(run_id)
+
     # SpecKit spec operations
     def upsert_speckit_spec(
         self,
@@ -4292,6 +4887,29 @@ class PostgresDatabase:
         row = self._fetchone("SELECT * FROM events WHERE id = %s", (event_id,))
         return self._row_to_event(row)
 
+    def append_events(self, events: List[Dict[str, Any]]) -> int:
+        """Insert many events in one transaction using multi-row INSERTs."""
+        rows = _event_insert_rows(events)
+        if not rows:
+            return 0
+        with self._transaction() as conn:
+            with conn.cursor() as cur:
+                self._insert_event_rows(cur, rows)
+        return len(rows)
+
+    @staticmethod
+    def _insert_event_rows(cur: Any, rows: List[tuple]) -> None:
+        for start in range(0, len(rows), _EVENT_INSERT_CHUNK):
+            chunk = rows[start:start + _EVENT_INSERT_CHUNK]
+            placeholders = ", ".join(["(%s, %s, %s, %s, %s, %s)"] * len(chunk))
+            cur.execute(
+                "INSERT INTO events (protocol_run_id, project_id, step_run_id, event_type, message, metadata) "
+                f"VALUES {placeholders}",
+                [value for row in chunk for value in row],
+            )
+        if any(row[1] is None for row in rows):
+            cur.execute(EVENTS_PROJECT_BACKFILL)
+
     def list_events(
         self,
         protocol_run_id: int,
@@ -4314,11 +4932,10 @@ class PostgresDatabase:
             SELECT
                 e.*,
                 pr.protocol_name,
-                COALESCE(e.project_id, pr.project_id) AS project_id,
                 p.name AS project_name
             FROM events e
             LEFT JOIN protocol_runs pr ON pr.id = e.protocol_run_id
-            LEFT JOIN projects p ON p.id = COALESCE(e.project_id, pr.project_id)
+            LEFT JOIN projects p ON p.id = e.project_id
             WHERE
         """
         sql += " AND ".join(where)
@@ -4348,7 +4965,7 @@ class PostgresDatabase:
             where.append("e.protocol_run_id = %s")
             params.append(protocol_run_id)
         if project_id is not None:
-            where.append("COALESCE(e.project_id, pr.project_id) = %s")
+            where.append("e.project_id = %s")
             params.append(project_id)
         if event_types:
             variants: list[str] = []
@@ -4363,11 +4980,10 @@ class PostgresDatabase:
             SELECT
                 e.*,
                 pr.protocol_name,
-                COALESCE(e.project_id, pr.project_id) AS project_id,
                 p.name AS project_name
             FROM events e
             LEFT JOIN protocol_runs pr ON pr.id = e.protocol_run_id
-            LEFT JOIN projects p ON p.id = COALESCE(e.project_id, pr.project_id)
+            LEFT JOIN projects p ON p.id = e.project_id
         """
         if where:
             sql += " WHERE " + " AND ".join(where)
@@ -4399,7 +5015,7 @@ class PostgresDatabase:
             where.append("e.protocol_run_id = %s")
             params.append(protocol_run_id)
         if project_id is not None:
-            where.append("COALESCE(e.project_id, pr.project_id) = %s")
+            where.append("e.project_id = %s")
             params.append(project_id)
         if event_types:
             variants: list[str] = []
@@ -4414,11 +5030,10 @@ class PostgresDatabase:
             SELECT
                 e.*,
                 pr.protocol_name,
-                COALESCE(e.project_id, pr.project_id) AS project_id,
                 p.name AS project_name
             FROM events e
             LEFT JOIN protocol_runs pr ON pr.id = e.protocol_run_id
-            LEFT JOIN projects p ON p.id = COALESCE(e.project_id, pr.project_id)
+            LEFT JOIN projects p ON p.id = e.project_id
             WHERE
         """
         sql += " AND ".join(where)
@@ -4526,6 +5141,55 @@ class PostgresDatabase:
             return None
         return self._row_to_qa_result(row)
 
+    # QA gate result cache
+    def get_qa_gate_cache(self, cache_key: str) -> Optional[QAGateCacheEntry]:
+        row = self._fetchone("SELECT * FROM qa_gate_cache WHERE cache_key = %s", (cache_key,))
+        if row is None:
+            return None
+        return self._row_to_qa_gate_cache(row)
+
+    def upsert_qa_gate_cache(
+        self,
+        *,
+        cache_key: str,
+        gate_id: str,
+        tree_hash: str,
+        result: Dict[str, Any],
+        project_id: Optional[int] = None,
+    ) -> None:
+        with self._transaction() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    INSERT INTO qa_gate_cache (cache_key, gate_id, tree_hash, project_id, result)
+                    VALUES (%s, %s, %s, %s, %s)
+                    ON CONFLICT (cache_key) DO UPDATE SET
+                        result = excluded.result,
+                        project_id = excluded.project_id,
+                        created_at = CURRENT_TIMESTAMP
+                    """,
+                    (cache_key, gate_id, tree_hash, project_id, json.dumps(result)),
+                )
+
+    def delete_qa_gate_cache(
+        self,
+        *,
+        project_id: Optional[int] = None,
+        older_than: Optional[datetime] = None,
+    ) -> int:
+        clauses, params = [], []
+        if project_id is not None:
+            clauses.append("project_id = %s")
+            params.append(project_id)
+        if older_than is not None:
+            clauses.append("created_at < %s")
+            params.append(older_than)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._transaction() as conn:
+            with conn.cursor() as cur:
+                cur.execute(f"DELETE FROM qa_gate_cache{where}", tuple(params))
+                return cur.rowcount or 0
+
     # Job runs + artifacts
     def create_job_run(
         self,
@@ -4630,49 +5294,46 @@ class PostgresDatabase:
         return [self._row_to_job_run(row) for row in rows]
 
     def update_job_run(self, run_id: str, **kwargs: Any) -> JobRun:
-        allowed = {
-            "status",
-            "run_kind",
-            "project_id",
-            "protocol_run_id",
-            "step_run_id",
-            "queue",
-            "attempt",
-            "worker_id",
-            "started_at",
-            "finished_at",
-            "prompt_version",
-            "params",
-            "result",
-            "error",
-            "log_path",
-            "cost_tokens",
-            "cost_cents",
-            "windmill_job_id",
-        }
-        updates = []
-        params: list[Any] = []
-        for key, value in kwargs.items():
-            if key not in allowed:
-                continue
-            if key in ("params", "result") and value is not None:
-                updates.append(f"{key} = %s")
-                params.append(json.dumps(value))
-                continue
-            updates.append(f"{key} = %s")
-            params.append(value)
-
-        updates.append("updated_at = CURRENT_TIMESTAMP")
-        params.append(run_id)
-
+        updates, params = _job_run_assignments(kwargs, "%s")
         with self._transaction() as conn:
             with conn.cursor() as cur:
                 cur.execute(
                     f"UPDATE job_runs SET {', '.join(updates)} WHERE run_id = %s",
-                    tuple(params),
+                    (*params, run_id),
                 )
         return self.get_job_run(run_id)
 
+    def list_active_windmill_job_runs(self, *, limit: int = 1000) -> List[JobRun]:
+        rows = self._fetchall(
+            """
+            SELECT * FROM job_runs
+            WHERE status IN ('queued', 'running') AND windmill_job_id IS NOT NULL
+            ORDER BY created_at ASC
+            LIMIT %s
+            """,
+            (max(1, int(limit)),),
+        )
+        return [self._row_to_job_run(row) for row in rows]
+
+    def update_job_runs(
+        self,
+        updates: Dict[str, Dict[str, Any]],
+        *,
+        events: Optional[List[Dict[str, Any]]] = None,
+    ) -> int:
+        """Apply many job run updates and their events in one transaction."""
+        event_rows = _event_insert_rows(events or [])
+        with self._transaction() as conn:
+            with conn.cursor() as cur:
+                for run_id, fields in updates.items():
+                    assignments, params = _job_run_assignments(fields, "%s")
+                    cur.execute(
+                        f"UPDATE job_runs SET {', '.join(assignments)} WHERE run_id = %s",
+                        (*params, run_id),
+                    )
+                self._insert_event_rows(cur, event_rows)
+        return len(updates)
+
     def update_job_run_by_windmill_id(self, windmill_job_id: str, **kwargs: Any) -> JobRun:
         row = self._fetchone(
             "SELECT run_id FROM job_runs WHERE windmill_job_id = %s LIMIT 1",
@@ -4791,19 +5452,127 @@ class PostgresDatabase:
             result.append(job)
         return result
 
+    # Aggregate statistics (single GROUP BY queries for dashboards/metrics)
+    def count_protocol_runs_by_status(self, *, project_id: Optional[int] = None) -> Dict[str, int]:
+        clause, params = ("WHERE project_id = %s", (project_id,)) if project_id is not None else ("", ())
+        rows = self._fetchall(
+            f"SELECT status, COUNT(*) AS count FROM protocol_runs {clause} GROUP BY status",
+            params,
+        )
+        return {row["status"]: int(row["count"]) for row in rows}
+
+    def count_step_runs_by_status(self, *, project_id: Optional[int] = None) -> Dict[str, int]:
+        if project_id is not None:
+            rows = self._fetchall(
+                """
+                SELECT s.status, COUNT(*) AS count
+                FROM step_runs s
+                JOIN protocol_runs pr ON pr.id = s.protocol_run_id
+                WHERE pr.project_id = %s
+                GROUP BY s.status
+                """,
+                (project_id,),
+            )
+        else:
+            rows = self._fetchall("SELECT status, COUNT(*) AS count FROM step_runs GROUP BY status")
+        return {row["status"]: int(row["count"]) for row in rows}
+
+    def step_run_stats_by_engine(self, *, project_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Step counts per engine (engine_id, else assigned_agent) and status.
+
+        Each row has `engine_id`, `status`, `count` and `last_activity_at`
+        (latest step update for that engine/status).
+        """
+        engine = "COALESCE(NULLIF(s.engine_id, ''), NULLIF(s.assigned_agent, ''))"
+        join, where, params = "", "", ()
+        if project_id is not None:
+            join = "JOIN protocol_runs pr ON pr.id = s.protocol_run_id"
+            where, params = "AND pr.project_id = %s", (project_id,)
+        rows = self._fetchall(
+            f"""
+            SELECT {engine} AS engine_id, s.status, COUNT(*) AS count, MAX(s.updated_at) AS last_activity_at
+            FROM step_runs s
+            {join}
+            WHERE {engine} IS NOT NULL {where}
+            GROUP BY {engine}, s.status
+            """,
+            params,
+        )
+        return [
+            {
+                "engine_id": row["engine_id"],
+                "status": row["status"],
+                "count": int(row["count"]),
+                "last_activity_at": self._coerce_ts(row["last_activity_at"]) or None,
+            }
+            for row in rows
+        ]
+
+    def job_run_stats_by_type(self, *, since: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """
+        Job counts and average duration per job type, most frequent first.
+
+        Only jobs created at or after `since` are counted when it is given;
+        the average covers jobs with both start and finish times.
+        """
+        clause, params = ("WHERE created_at >= %s", (since,)) if since is not None else ("", ())
+        rows = self._fetchall(
+            f"""
+            SELECT
+                COALESCE(job_type, 'unknown') AS job_type,
+                COUNT(*) AS count,
+                AVG(EXTRACT(EPOCH FROM (finished_at - started_at))) AS avg_duration_seconds
+            FROM job_runs
+            {clause}
+            GROUP BY COALESCE(job_type, 'unknown')
+            ORDER BY count DESC, job_type
+            """,
+            params,
+        )
+        return [
+            {
+                "job_type": row["job_type"],
+                "count": int(row["count"]),
+                "avg_duration_seconds": (
+                    float(row["avg_duration_seconds"]) if row["avg_duration_seconds"] is not None else None
+                ),
+            }
+            for row in rows
+        ]
+
+    def count_events(self, *, since: Optional[datetime] = None) -> int:
+        """Count events, optionally only those created at or after `since`."""
+        if since is not None:
+            row = self._fetchone("SELECT COUNT(*) AS count FROM events WHERE created_at >= %s", (since,))
+        else:
+            row = self._fetchone("SELECT COUNT(*) AS count FROM events")
+        return int(row["count"]) if row else 0
+
 
 # Type alias for the unified database interface
 Database = Union[SQLiteDatabase, PostgresDatabase]
 
 
-def get_database(db_url: Optional[str] = None, db_path: Optional[Path] = None, pool_size: int = 20) -> Database:
+def get_database(
+    db_url: Optional[str] = None,
+    db_path: Optional[Path] = None,
+    pool_size: int = 20,
+    *,
+    sqlite_busy_timeout_ms: int = 5000,
+    sqlite_synchronous: str = "NORMAL",
+    sqlite_mmap_size: int = 256 * 1024 * 1024,
+) -> Database:
     """
     Factory function to create the appropriate database instance.
     
     Args:
         db_url: PostgreSQL connection URL (postgresql://...)
         db_path: SQLite database file path
-        pool_size: Connection pool size for PostgreSQL
+        pool_size: Connection pool size (PostgreSQL connections, SQLite readers)
+        sqlite_busy_timeout_ms: SQLite busy_timeout pragma
+        sqlite_synchronous: SQLite synchronous pragma (NORMAL is safe in WAL mode)
+        sqlite_mmap_size: SQLite mmap_size pragma in bytes
         
     Returns:
         Either SQLiteDatabase or PostgresDatabase instance
@@ -4811,8 +5580,14 @@ def get_database(db_url: Optional[str] = None, db_path: Optional[Path] = None, p
     if db_url and db_url.startswith("postgres"):
         return PostgresDatabase(db_url, pool_size=pool_size)
     
+    sqlite_options: Dict[str, Any] = {
+        "pool_size": pool_size,
+        "busy_timeout_ms": sqlite_busy_timeout_ms,
+        "synchronous": sqlite_synchronous,
+        "mmap_size": sqlite_mmap_size,
+    }
     if db_path:
-        return SQLiteDatabase(db_path)
+        return SQLiteDatabase(db_path, **sqlite_options)
     
     # Default to SQLite with default path
-    return SQLiteDatabase(Path(".devgodzilla.sqlite"))
+    return SQLiteDatabase(Path(".devgodzilla.sqlite"), **sqlite_options)
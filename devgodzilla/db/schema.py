@@ -26,6 +26,7 @@ CREATE TABLE IF NOT EXISTS projects (
     policy_enforcement_mode TEXT,
     constitution_version TEXT,
     constitution_hash TEXT,
+    repo_key TEXT,
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
     updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
 );
@@ -65,6 +66,11 @@ CREATE TABLE IF NOT EXISTS protocol_runs (
     updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
 );
 
+CREATE INDEX IF NOT EXISTS idx_protocol_runs_project ON protocol_runs(project_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_protocol_runs_status ON protocol_runs(status, created_at);
+CREATE INDEX IF NOT EXISTS idx_protocol_runs_created ON protocol_runs(created_at);
+CREATE INDEX IF NOT EXISTS idx_protocol_runs_windmill_flow ON protocol_runs(windmill_flow_id);
+
 CREATE TABLE IF NOT EXISTS speckit_specs (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     project_id INTEGER NOT NULL REFERENCES projects(id),
@@ -133,6 +139,8 @@ CREATE TABLE IF NOT EXISTS step_runs (
     updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
 );
 
+CREATE INDEX IF NOT EXISTS idx_step_runs_protocol ON step_runs(protocol_run_id, step_index);
+
 CREATE TABLE IF NOT EXISTS agent_assignments (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     project_id INTEGER REFERENCES projects(id),
@@ -179,6 +187,8 @@ CREATE TABLE IF NOT EXISTS events (
 
 CREATE INDEX IF NOT EXISTS idx_events_project ON events(project_id, created_at);
 CREATE INDEX IF NOT EXISTS idx_events_protocol ON events(protocol_run_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_events_project_id ON events(project_id, id);
+CREATE INDEX IF NOT EXISTS idx_events_protocol_id ON events(protocol_run_id, id);
 
 CREATE TABLE IF NOT EXISTS job_runs (
     run_id TEXT PRIMARY KEY,
@@ -206,6 +216,7 @@ CREATE TABLE IF NOT EXISTS job_runs (
 );
 
 CREATE INDEX IF NOT EXISTS idx_job_runs_job_status ON job_runs(job_type, status, created_at);
+CREATE INDEX IF NOT EXISTS idx_job_runs_status ON job_runs(status, created_at);
 CREATE INDEX IF NOT EXISTS idx_job_runs_project ON job_runs(project_id, created_at);
 CREATE INDEX IF NOT EXISTS idx_job_runs_protocol ON job_runs(protocol_run_id, created_at);
 CREATE INDEX IF NOT EXISTS idx_job_runs_step ON job_runs(step_run_id, created_at);
@@ -282,6 +293,16 @@ CREATE INDEX IF NOT EXISTS idx_qa_results_project ON qa_results(project_id, crea
 CREATE INDEX IF NOT EXISTS idx_qa_results_protocol ON qa_results(protocol_run_id, created_at);
 CREATE INDEX IF NOT EXISTS idx_qa_results_step ON qa_results(step_run_id, created_at);
 
+CREATE TABLE IF NOT EXISTS qa_gate_cache (
+    cache_key TEXT PRIMARY KEY,
+    gate_id TEXT NOT NULL,
+    tree_hash TEXT NOT NULL,
+    project_id INTEGER,
+    result TEXT NOT NULL,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS idx_qa_gate_cache_project ON qa_gate_cache(project_id);
+
 CREATE TABLE IF NOT EXISTS sprints (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     project_id INTEGER NOT NULL REFERENCES projects(id),
@@ -345,10 +366,14 @@ CREATE TABLE IF NOT EXISTS projects (
     policy_enforcement_mode TEXT,
     constitution_version TEXT,
     constitution_hash TEXT,
+    repo_key TEXT,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+ALTER TABLE projects ADD COLUMN IF NOT EXISTS repo_key TEXT;
+CREATE INDEX IF NOT EXISTS idx_projects_repo_key ON projects(repo_key);
+
 CREATE TABLE IF NOT EXISTS policy_packs (
     id SERIAL PRIMARY KEY,
     key TEXT NOT NULL,
@@ -384,6 +409,11 @@ CREATE TABLE IF NOT EXISTS protocol_runs (
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+CREATE INDEX IF NOT EXISTS idx_protocol_runs_project ON protocol_runs(project_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_protocol_runs_status ON protocol_runs(status, created_at);
+CREATE INDEX IF NOT EXISTS idx_protocol_runs_created ON protocol_runs(created_at);
+CREATE INDEX IF NOT EXISTS idx_protocol_runs_windmill_flow ON protocol_runs(windmill_flow_id);
+
 CREATE TABLE IF NOT EXISTS speckit_specs (
     id SERIAL PRIMARY KEY,
     project_id INTEGER NOT NULL REFERENCES projects(id),
@@ -452,6 +482,8 @@ CREATE TABLE IF NOT EXISTS step_runs (
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+CREATE INDEX IF NOT EXISTS idx_step_runs_protocol ON step_runs(protocol_run_id, step_index);
+
 CREATE TABLE IF NOT EXISTS agent_assignments (
     id SERIAL PRIMARY KEY,
     project_id INTEGER REFERENCES projects(id),
@@ -498,6 +530,8 @@ CREATE TABLE IF NOT EXISTS events (
 
 CREATE INDEX IF NOT EXISTS idx_events_project ON events(project_id, created_at);
 CREATE INDEX IF NOT EXISTS idx_events_protocol ON events(protocol_run_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_events_project_id ON events(project_id, id);
+CREATE INDEX IF NOT EXISTS idx_events_protocol_id ON events(protocol_run_id, id);
 
 CREATE TABLE IF NOT EXISTS job_runs (
     run_id TEXT PRIMARY KEY,
@@ -525,6 +559,7 @@ CREATE TABLE IF NOT EXISTS job_runs (
 );
 
 CREATE INDEX IF NOT EXISTS idx_job_runs_job_status ON job_runs(job_type, status, created_at);
+CREATE INDEX IF NOT EXISTS idx_job_runs_status ON job_runs(status, created_at);
 CREATE INDEX IF NOT EXISTS idx_job_runs_project ON job_runs(project_id, created_at);
 CREATE INDEX IF NOT EXISTS idx_job_runs_protocol ON job_runs(protocol_run_id, created_at);
 CREATE INDEX IF NOT EXISTS idx_job_runs_step ON job_runs(step_run_id, created_at);
@@ -601,6 +636,16 @@ CREATE INDEX IF NOT EXISTS idx_qa_results_project ON qa_results(project_id, crea
 CREATE INDEX IF NOT EXISTS idx_qa_results_protocol ON qa_results(protocol_run_id, created_at);
 CREATE INDEX IF NOT EXISTS idx_qa_results_step ON qa_results(step_run_id, created_at);
 
+CREATE TABLE IF NOT EXISTS qa_gate_cache (
+    cache_key TEXT PRIMARY KEY,
+    gate_id TEXT NOT NULL,
+    tree_hash TEXT NOT NULL,
+    project_id INTEGER,
+    result JSONB NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS idx_qa_gate_cache_project ON qa_gate_cache(project_id);
+
 CREATE TABLE IF NOT EXISTS sprints (
     id SERIAL PRIMARY KEY,
     project_id INTEGER NOT NULL REFERENCES projects(id),
@@ -642,3 +687,16 @@ CREATE TABLE IF NOT EXISTS tasks (
 CREATE INDEX IF NOT EXISTS idx_tasks_project ON tasks(project_id, board_status);
 CREATE INDEX IF NOT EXISTS idx_tasks_sprint ON tasks(sprint_id);
 """
+
+# SQLite has no ADD COLUMN IF NOT EXISTS; init_schema adds `projects.repo_key`
+# to databases created before it existed, then builds its index.
+SQLITE_REPO_KEY_INDEX = "CREATE INDEX IF NOT EXISTS idx_projects_repo_key ON projects(repo_key)"
+
+# Events written before project_id was always populated carry only
+# protocol_run_id; fill project_id so project filters can use the index
+# directly. Idempotent and cheap once done (NULL lookup on idx_events_project).
+EVENTS_PROJECT_BACKFILL = """
+UPDATE events
+SET project_id = (SELECT pr.project_id FROM protocol_runs pr WHERE pr.id = events.protocol_run_id)
+WHERE project_id IS NULL AND protocol_run_id IS NOT NULL
+"""
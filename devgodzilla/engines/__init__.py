@@ -20,7 +20,7 @@ from devgodzilla.engines.registry import (
     get_engine,
     get_default_engine,
 )
-from devgodzilla.engines.cli_adapter import CLIEngine, run_cli_command
+from devgodzilla.engines.cli_adapter import CLIEngine, OutputCapture, run_cli_command
 from devgodzilla.engines.codex import CodexEngine, register_codex_engine
 from devgodzilla.engines.claude_code import ClaudeCodeEngine, register_claude_code_engine
 from devgodzilla.engines.opencode import OpenCodeEngine, register_opencode_engine
@@ -53,6 +53,7 @@ __all__ = [
     # Adapters
     "CLIEngine",
     "run_cli_command",
+    "OutputCapture",
     # Engine implementations
     "CodexEngine",
     "register_codex_engine",
@@ -48,7 +48,7 @@ def _register_from_agent_config(*, replace: bool) -> None:
     if default_agent and registry.has(default_agent.id):
         try:
             engine = registry.get(default_agent.id)
-            if engine.metadata.id == "dummy" or engine.check_availability():
+            if engine.metadata.id == "dummy" or registry.is_available(engine):
                 registry.set_default(default_agent.id)
         except Exception:
             pass
@@ -62,6 +62,9 @@ def bootstrap_default_engines(*, replace: bool = True) -> None:
     where agent CLIs are not installed.
     """
     registry = get_registry()
+    config = get_config()
+    registry.availability_ttl_seconds = config.agent_health_ttl_seconds
+    registry.availability_negative_ttl_seconds = config.agent_health_negative_ttl_seconds
 
     def _register(engine, *, default: bool) -> None:
         if replace or not registry.has(engine.metadata.id):
@@ -92,7 +95,7 @@ def bootstrap_default_engines(*, replace: bool = True) -> None:
                 continue
             try:
                 engine = registry.get(engine_id)
-                if engine_id == "dummy" or engine.check_availability():
+                if engine_id == "dummy" or registry.is_available(engine):
                     registry.set_default(engine_id)
                     break
             except Exception:
@@ -5,12 +5,15 @@ Adapter for executing CLI-based AI coding agents.
 Handles process spawning, output capture, and timeout management.
 """
 
+import codecs
 import os
+import select
 import subprocess
 import threading
 import time
+from collections import deque
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, List, Optional, TextIO
 
 from devgodzilla.engines.interface import (
     Engine,
@@ -25,6 +28,81 @@ from devgodzilla.logging import get_logger
 logger = get_logger(__name__)
 
 
+DEFAULT_OUTPUT_TAIL_CHARS = 64 * 1024
+_READ_CHUNK_BYTES = 64 * 1024
+_KILLED_DRAIN_SECONDS = 5.0
+# After the process exits, descendants (daemons, `cmd &`) may keep the pipes
+# open indefinitely; output still buffered is drained for at most this long.
+_EXIT_DRAIN_SECONDS = 2.0
+_READ_POLL_SECONDS = 0.1
+
+
+class OutputCapture:
+    """
+    Collects one output stream of a CLI process.
+
+    Without a path every chunk is kept in memory. With a path, output is
+    written to the file as it arrives and only the last `tail_chars`
+    characters are retained for summaries and error messages.
+    """
+
+    def __init__(self, path: Optional[Path] = None, *, tail_chars: int = DEFAULT_OUTPUT_TAIL_CHARS) -> None:
+        self.path = Path(path) if path else None
+        self.tail_chars = tail_chars
+        self.total_chars = 0
+        self._chunks: Deque[str] = deque()
+        self._held = 0
+        self._lock = threading.Lock()
+        self._file: Optional[TextIO] = None
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "w", encoding="utf-8")
+
+    @property
+    def truncated(self) -> bool:
+        return self.path is not None and self.total_chars > self.tail_chars
+
+    def write(self, text: str) -> None:
+        with self._lock:
+            self.total_chars += len(text)
+            self._chunks.append(text)
+            self._held += len(text)
+            if self.path is None:
+                return
+            if self._file is not None:
+                self._file.write(text)
+            while len(self._chunks) > 1 and self._held - len(self._chunks[0]) >= self.tail_chars:
+                self._held -= len(self._chunks.popleft())
+
+    def text(self) -> str:
+        with self._lock:
+            value = "".join(self._chunks)
+        if self.path is not None and len(value) > self.tail_chars:
+            value = value[-self.tail_chars:]
+        return value
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def _captured_result(stdout: OutputCapture, stderr: OutputCapture, **kwargs: Any) -> EngineResult:
+    result = EngineResult(
+        stdout=stdout.text(),
+        stderr=stderr.text(),
+        stdout_path=str(stdout.path) if stdout.path else None,
+        stderr_path=str(stderr.path) if stderr.path else None,
+        **kwargs,
+    )
+    for name, capture in (("stdout", stdout), ("stderr", stderr)):
+        if capture.path is not None:
+            result.metadata[f"{name}_chars"] = capture.total_chars
+            result.metadata[f"{name}_truncated"] = capture.truncated
+    return result
+
+
 def run_cli_command(
     cmd: List[str],
     *,
@@ -34,6 +112,9 @@ def run_cli_command(
     env: Optional[Dict[str, str]] = None,
     capture_output: bool = True,
     on_output: Optional[Callable[[str, str], None]] = None,
+    stdout_path: Optional[Path] = None,
+    stderr_path: Optional[Path] = None,
+    tail_chars: int = DEFAULT_OUTPUT_TAIL_CHARS,
 ) -> EngineResult:
     """
     Run a CLI command and capture output.
@@ -45,9 +126,14 @@ def run_cli_command(
         timeout: Timeout in seconds
         env: Environment variables (merged with os.environ)
         capture_output: Whether to capture stdout/stderr
+        on_output: Callback invoked with (source, text) as output arrives
+        stdout_path: Stream stdout to this file instead of holding it in memory
+        stderr_path: Stream stderr to this file instead of holding it in memory
+        tail_chars: Characters of streamed output kept in EngineResult.stdout/stderr
         
     Returns:
-        EngineResult with success, stdout, stderr
+        EngineResult with success, stdout, stderr (only the tail when streamed
+        to a file; stdout_path/stderr_path point at the full output)
     """
     start_time = time.time()
     
@@ -62,14 +148,13 @@ def run_cli_command(
     )
 
     try:
-        if on_output:
-            capture = True
+        if on_output or stdout_path or stderr_path:
             proc = subprocess.Popen(
                 cmd,
                 cwd=cwd,
                 stdin=subprocess.PIPE if input_text is not None else None,
-                stdout=subprocess.PIPE if capture else None,
-                stderr=subprocess.PIPE if capture else None,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
                 text=True,
                 env=proc_env,
                 bufsize=1,
@@ -83,30 +168,75 @@ def run_cli_command(
                 finally:
                     proc.stdin.close()
 
-            stdout_chunks: List[str] = []
-            stderr_chunks: List[str] = []
-
-            def _read_stream(stream, sink: List[str], source: str) -> None:
-                for line in iter(stream.readline, ""):
-                    sink.append(line)
-                    try:
-                        on_output(source, line)
-                    except Exception as e:
-                        logger.warning(
-                            "cli_command_output_callback_failed",
-                            extra={"source": source, "error": str(e)},
-                        )
-                stream.close()
+            stdout_capture = OutputCapture(stdout_path, tail_chars=tail_chars)
+            stderr_capture = OutputCapture(stderr_path, tail_chars=tail_chars)
+
+            stop_reading = threading.Event()
+
+            def _emit(sink: OutputCapture, source: str, chunk: str) -> None:
+                sink.write(chunk)
+                if on_output is None:
+                    return
+                try:
+                    on_output(source, chunk)
+                except Exception as e:
+                    logger.warning(
+                        "cli_command_output_callback_failed",
+                        extra={"source": source, "error": str(e)},
+                    )
+
+            def _read_stream(stream, sink: OutputCapture, source: str) -> None:
+                # Raw bounded reads polled against `stop_reading`, so a pipe
+                # held open by a descendant cannot pin this thread (a blocked
+                # readline() would also block closing the stream).
+                fd = stream.fileno()
+                decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+                pending = ""
+                try:
+                    while True:
+                        stopping = stop_reading.is_set()
+                        ready, _, _ = select.select([fd], [], [], 0 if stopping else _READ_POLL_SECONDS)
+                        if not ready:
+                            if stopping:
+                                break
+                            continue
+                        data = os.read(fd, _READ_CHUNK_BYTES)
+                        if not data:
+                            break
+                        pending += decoder.decode(data)
+                        # Emit whole lines; keep a partial line for the next read.
+                        cut = pending.rfind("\n") + 1
+                        if cut:
+                            _emit(sink, source, pending[:cut])
+                            pending = pending[cut:]
+                        elif len(pending) >= _READ_CHUNK_BYTES:
+                            _emit(sink, source, pending)
+                            pending = ""
+                    pending += decoder.decode(b"", final=True)
+                    if pending:
+                        _emit(sink, source, pending)
+                finally:
+                    stream.close()
+
+            def _drain(seconds: float) -> None:
+                deadline = time.monotonic() + seconds
+                for t in threads:
+                    t.join(timeout=max(0.0, deadline - time.monotonic()))
+                # Whatever is still open belongs to a descendant: stop reading
+                # and let the readers close the pipes.
+                stop_reading.set()
+                for t in threads:
+                    t.join()
 
             threads: List[threading.Thread] = []
-            if proc.stdout:
-                t = threading.Thread(target=_read_stream, args=(proc.stdout, stdout_chunks, "stdout"), daemon=True)
-                t.start()
-                threads.append(t)
-            if proc.stderr:
-                t = threading.Thread(target=_read_stream, args=(proc.stderr, stderr_chunks, "stderr"), daemon=True)
-                t.start()
-                threads.append(t)
+            for stream, sink, source in (
+                (proc.stdout, stdout_capture, "stdout"),
+                (proc.stderr, stderr_capture, "stderr"),
+            ):
+                if stream:
+                    t = threading.Thread(target=_read_stream, args=(stream, sink, source), daemon=True)
+                    t.start()
+                    threads.append(t)
 
             try:
                 proc.wait(timeout=timeout)
@@ -114,25 +244,27 @@ def run_cli_command(
                 proc.kill()
                 proc.wait()
                 duration = time.time() - start_time
-                for t in threads:
-                    t.join(timeout=0.2)
-                return EngineResult(
+                _drain(_KILLED_DRAIN_SECONDS)
+                stdout_capture.close()
+                stderr_capture.close()
+                return _captured_result(
+                    stdout_capture,
+                    stderr_capture,
                     success=False,
-                    stdout="".join(stdout_chunks),
-                    stderr="".join(stderr_chunks),
                     duration_seconds=duration,
                     error=f"Command timed out after {timeout}s",
                     metadata={"cmd": cmd[0], "timeout": True},
                 )
 
             duration = time.time() - start_time
-            for t in threads:
-                t.join(timeout=0.2)
+            _drain(_EXIT_DRAIN_SECONDS)
+            stdout_capture.close()
+            stderr_capture.close()
 
-            return EngineResult(
+            return _captured_result(
+                stdout_capture,
+                stderr_capture,
                 success=proc.returncode == 0,
-                stdout="".join(stdout_chunks),
-                stderr="".join(stderr_chunks),
                 exit_code=proc.returncode,
                 duration_seconds=duration,
                 metadata={"cmd": cmd[0]},
@@ -273,6 +405,8 @@ class CLIEngine(Engine):
             timeout=timeout,
             env=req.extra.get("env"),
             on_output=log_callback,
+            stdout_path=Path(req.stdout_path) if req.stdout_path else None,
+            stderr_path=Path(req.stderr_path) if req.stderr_path else None,
         )
         
         # Add engine info to metadata
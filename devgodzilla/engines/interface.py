@@ -64,6 +64,10 @@ class EngineRequest:
     
     # Timeout in seconds
     timeout: Optional[int] = None
+
+    # Stream process output to these files (EngineResult then keeps only a tail)
+    stdout_path: Optional[str] = None
+    stderr_path: Optional[str] = None
     
     # Additional parameters
     extra: Dict[str, Any] = field(default_factory=dict)
@@ -75,6 +79,10 @@ class EngineResult:
     success: bool
     stdout: str = ""
     stderr: str = ""
+
+    # Full output on disk when it was streamed; stdout/stderr are then tails
+    stdout_path: Optional[str] = None
+    stderr_path: Optional[str] = None
     
     # Cost tracking
     tokens_used: Optional[int] = None
@@ -136,6 +136,8 @@ class OpenCodeEngine(CLIEngine):
                 timeout=timeout,
                 env=req.extra.get("env"),
                 on_output=log_callback,
+                stdout_path=Path(req.stdout_path) if req.stdout_path else None,
+                stderr_path=Path(req.stderr_path) if req.stderr_path else None,
             )
             result.metadata["engine_id"] = self.metadata.id
             result.metadata["sandbox"] = sandbox.value
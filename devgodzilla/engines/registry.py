@@ -5,8 +5,10 @@ Central registry for AI coding engines.
 Manages engine registration, lookup, and health checks.
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+import os
 import threading
+import time
 
 from devgodzilla.engines.interface import Engine, EngineMetadata, EngineKind, EngineRequest, EngineResult
 from devgodzilla.logging import get_logger
@@ -35,12 +37,23 @@ class EngineRegistry:
         registry.register(ClaudeCodeEngine())
         
         engine = registry.get("codex")
-        result = engine.execute(request)
+        if registry.is_available(engine):
+            result = engine.execute(request)
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        *,
+        availability_ttl_seconds: float = 60.0,
+        availability_negative_ttl_seconds: float = 10.0,
+    ) -> None:
         self._engines: Dict[str, Engine] = {}
         self._default_id: Optional[str] = None
+        self.availability_ttl_seconds = availability_ttl_seconds
+        self.availability_negative_ttl_seconds = availability_negative_ttl_seconds
+        # engine_id -> (expires_at monotonic, engine object id, env hash, available)
+        self._availability: Dict[str, Tuple[float, int, int, bool]] = {}
+        self._availability_lock = threading.Lock()
 
     def register(
         self,
@@ -63,6 +76,7 @@ class EngineRegistry:
             raise ValueError(f"Engine '{engine_id}' already registered")
         
         self._engines[engine_id] = engine
+        self.invalidate_availability(engine_id)
         
         if default or self._default_id is None:
             self._default_id = engine_id
@@ -81,6 +95,7 @@ class EngineRegistry:
         """Remove an engine from the registry."""
         if engine_id in self._engines:
             del self._engines[engine_id]
+            self.invalidate_availability(engine_id)
             if self._default_id == engine_id:
                 self._default_id = next(iter(self._engines), None)
 
@@ -132,11 +147,45 @@ class EngineRegistry:
         """Check if an engine is registered."""
         return engine_id in self._engines
 
+    def is_available(self, engine: Engine) -> bool:
+        """
+        Cached `engine.check_availability()`.
+
+        Positive results are reused for `availability_ttl_seconds` and negative
+        ones for `availability_negative_ttl_seconds`, so step starts do not
+        rescan PATH or respawn `--version` probes. A TTL of 0 disables caching.
+        Entries are dropped when the engine is re-registered or the process
+        environment (PATH, API keys) changes. Exceptions from the probe
+        propagate and are not cached.
+        """
+        engine_id = engine.metadata.id
+        env_hash = hash(tuple(sorted(os.environ.items())))
+        now = time.monotonic()
+        with self._availability_lock:
+            hit = self._availability.get(engine_id)
+        if hit is not None and hit[0] > now and hit[1:3] == (id(engine), env_hash):
+            return hit[3]
+
+        available = bool(engine.check_availability())
+        ttl = self.availability_ttl_seconds if available else self.availability_negative_ttl_seconds
+        if ttl > 0:
+            with self._availability_lock:
+                self._availability[engine_id] = (now + ttl, id(engine), env_hash, available)
+        return available
+
+    def invalidate_availability(self, engine_id: Optional[str] = None) -> None:
+        """Forget cached availability for one engine, or for all of them."""
+        with self._availability_lock:
+            if engine_id is None:
+                self._availability.clear()
+            else:
+                self._availability.pop(engine_id, None)
+
     def check_all_available(self) -> Dict[str, bool]:
-        """Check availability of all engines."""
+        """Check availability of all engines (cached, see `is_available`)."""
         return {
-            engine_id: engine.check_availability()
-            for engine_id, engine in self._engines.items()
+            engine_id: self.is_available(engine)
+            for engine_id, engine in list(self._engines.items())
         }
 
     def get_metadata(self, engine_id: str) -> EngineMetadata:
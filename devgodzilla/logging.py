@@ -5,11 +5,13 @@ Provides structured logging with context propagation, JSON formatting,
 and sensitive data redaction.
 """
 
+import asyncio
+import bisect
+import heapq
 import json
 import logging
 import os
 import threading
-from collections import deque
 from contextlib import contextmanager
 from contextvars import ContextVar
 from datetime import datetime, timezone
@@ -186,19 +188,76 @@ class JsonFormatter(logging.Formatter):
         return json.dumps(sanitized, default=_json_fallback)
 
 
+class LogSubscription:
+    """
+    Wake-up handle for an async log stream reader.
+
+    `RingBufferHandler.emit` (any thread) sets the subscription when a
+    matching entry arrives; the reader awaits `wait()` instead of polling.
+    """
+
+    def __init__(self, loop: "asyncio.AbstractEventLoop", level: Optional[str], source: Optional[str]) -> None:
+        self._loop = loop
+        self._event = asyncio.Event()
+        self._pending = False
+        self.level = level
+        self.source = source
+
+    def matches(self, entry: Dict[str, Any]) -> bool:
+        return (not self.level or entry["level"] == self.level) and (
+            not self.source or self.source in entry["source"]
+        )
+
+    def _claim(self) -> bool:
+        """Mark as notified; False if a wake-up is already pending (called under the buffer lock)."""
+        if self._pending:
+            return False
+        self._pending = True
+        return True
+
+    def _notify(self) -> None:
+        if self._loop.is_closed():
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._event.set)
+        except RuntimeError:
+            pass
+
+    async def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait for new matching entries; returns False on timeout."""
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        self._event.clear()
+        self._pending = False
+        return True
+
+
 class RingBufferHandler(logging.Handler):
     """
     Logging handler that stores logs in a thread-safe ring buffer.
 
     Logs are stored as structured dicts matching the AppLogEntry interface
     for streaming via SSE to the frontend.
+
+    Entry ids are consecutive, so entry `n` lives in slot `(n - 1) % capacity`
+    and `since_id` lookups are offset arithmetic. Per-level and per-source id
+    lists serve filtered reads without scanning the buffer; they are pruned
+    in batches as entries are overwritten. The lock only covers slot and index
+    updates (entries are built before taking it).
     """
 
     def __init__(self, capacity: int = 10000) -> None:
         super().__init__()
-        self._buffer: deque[Dict[str, Any]] = deque(maxlen=capacity)
+        self.capacity = max(1, int(capacity))
+        self._slots: List[Optional[Dict[str, Any]]] = [None] * self.capacity
         self._lock = threading.Lock()
         self._counter = 0
+        self._by_level: Dict[str, List[int]] = {}
+        self._by_source: Dict[str, List[int]] = {}
+        self._prune_every = max(1, self.capacity // 10)
+        self._subscribers: List[LogSubscription] = []
 
     def emit(self, record: logging.LogRecord) -> None:
         try:
@@ -226,10 +285,45 @@ class RingBufferHandler(logging.Handler):
             with self._lock:
                 self._counter += 1
                 entry["id"] = self._counter
-                self._buffer.append(entry)
+                self._slots[(self._counter - 1) % self.capacity] = entry
+                self._by_level.setdefault(entry["level"], []).append(self._counter)
+                self._by_source.setdefault(entry["source"], []).append(self._counter)
+                if self._counter % self._prune_every == 0:
+                    self._prune()
+                woken = [s for s in self._subscribers if s.matches(entry) and s._claim()] if self._subscribers else []
+            for subscription in woken:
+                subscription._notify()
         except Exception:
             self.handleError(record)
 
+    def _first_id(self) -> int:
+        return max(1, self._counter - self.capacity + 1)
+
+    def _prune(self) -> None:
+        """Drop overwritten ids from the secondary indexes (called under the lock)."""
+        first = self._first_id()
+        for index in (self._by_level, self._by_source):
+            for key in list(index):
+                ids = index[key]
+                if ids[0] >= first:
+                    continue
+                kept = ids[bisect.bisect_left(ids, first):]
+                if kept:
+                    index[key] = kept
+                else:
+                    del index[key]
+
+    def _candidate_ids(self, level: Optional[str], source: Optional[str]) -> Optional[List[List[int]]]:
+        """Sorted id lists to read for a filter, or None to read every slot."""
+        if level:
+            return [self._by_level.get(level, [])]
+        if source:
+            return [ids for name, ids in self._by_source.items() if source in name]
+        return None
+
+    def _matches(self, entry: Dict[str, Any], level: Optional[str], source: Optional[str]) -> bool:
+        return (not level or entry["level"] == level) and (not source or source in entry["source"])
+
     def get_logs_since(
         self,
         since_id: int,
@@ -238,12 +332,14 @@ class RingBufferHandler(logging.Handler):
     ) -> List[Dict[str, Any]]:
         """Return logs with id > since_id, optionally filtered by level/source."""
         with self._lock:
-            return [
-                e for e in self._buffer
-                if e["id"] > since_id
-                and (not level or e["level"] == level)
-                and (not source or source in e["source"])
-            ]
+            start = max(int(since_id) + 1, self._first_id())
+            candidates = self._candidate_ids(level, source)
+            if candidates is None:
+                ids: Any = range(start, self._counter + 1)
+            else:
+                ids = heapq.merge(*(c[bisect.bisect_left(c, start):] for c in candidates))
+            entries = (self._slots[(i - 1) % self.capacity] for i in ids)
+            return [e for e in entries if e is not None and self._matches(e, level, source)]
 
     def get_recent(
         self,
@@ -252,19 +348,46 @@ class RingBufferHandler(logging.Handler):
         source: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """Return the most recent logs, optionally filtered by level/source."""
+        if limit <= 0:
+            return []
         with self._lock:
-            filtered = [
-                e for e in self._buffer
-                if (not level or e["level"] == level)
-                and (not source or source in e["source"])
-            ]
-            return list(filtered)[-limit:]
+            first = self._first_id()
+            candidates = self._candidate_ids(level, source)
+            if candidates is None:
+                ids: Any = range(self._counter, first - 1, -1)
+            else:
+                ids = heapq.merge(*(reversed(c) for c in candidates), reverse=True)
+            result: List[Dict[str, Any]] = []
+            for i in ids:
+                if i < first:
+                    break
+                entry = self._slots[(i - 1) % self.capacity]
+                if entry is not None and self._matches(entry, level, source):
+                    result.append(entry)
+                    if len(result) >= limit:
+                        break
+        result.reverse()
+        return result
 
     def get_last_id(self) -> int:
         """Return the current counter value (last assigned ID)."""
         with self._lock:
             return self._counter
 
+    def subscribe(self, level: Optional[str] = None, source: Optional[str] = None) -> LogSubscription:
+        """Register a reader on the running event loop; pair with `unsubscribe`."""
+        subscription = LogSubscription(asyncio.get_running_loop(), level, source)
+        with self._lock:
+            self._subscribers.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: LogSubscription) -> None:
+        with self._lock:
+            try:
+                self._subscribers.remove(subscription)
+            except ValueError:
+                pass
+
 
 _ring_buffer_handler: Optional[RingBufferHandler] = None
 
@@ -221,6 +221,17 @@ class QAResultRecord:
     updated_at: Optional[str] = None
 
 
+@dataclass
+class QAGateCacheEntry:
+    """Cached QA gate result keyed by gate fingerprint and workspace tree."""
+    cache_key: str
+    gate_id: str
+    tree_hash: str
+    result: Dict[str, Any]
+    project_id: Optional[int] = None
+    created_at: Optional[str] = None
+
+
 @dataclass
 class Event:
     """An event represents a significant occurrence during protocol execution."""
@@ -0,0 +1,172 @@
+"""
+DevGodzilla Prompt Assembly Cache
+
+Rendered execution and QA prompts keyed by the content fingerprints
+(`prompt_utils.fingerprint_file`) of the files they are built from, plus any
+non-file inputs such as git status. File fingerprints are memoized by stat
+signature, so unchanged files are not re-read on retries; a file rewritten
+with identical content still maps to the same key.
+
+The hash of the rendered text (`prompt_hash`) is recorded with step runs and
+QA results and identifies identical agent invocations.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+from devgodzilla.config import get_config
+from devgodzilla.prompt_utils import fingerprint_file, fingerprint_text
+
+# Fingerprints of inputs that have no content.
+MISSING = "missing"
+NONE = "none"
+
+_FINGERPRINT_MEMO_SIZE = 1024
+
+_StatSignature = Tuple[int, int, int]
+
+
+@dataclass
+class AssembledPrompt:
+    text: str
+    prompt_hash: str
+    key: str
+    fingerprints: Dict[str, str] = field(default_factory=dict)
+    cached: bool = False
+
+
+class PromptCache:
+    """
+    LRU of rendered prompts keyed by their input fingerprints.
+
+    Example:
+        cache = get_prompt_cache()
+        prompt = cache.assemble(
+            "exec",
+            {"plan": protocol_root / "plan.md"},
+            lambda texts: texts["plan"] or "Execute step",
+        )
+        prompt.text, prompt.prompt_hash, prompt.cached
+    """
+
+    def __init__(self, *, max_entries: int = 128) -> None:
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._prompts: "OrderedDict[str, AssembledPrompt]" = OrderedDict()
+        self._fingerprints: "OrderedDict[str, Tuple[_StatSignature, str]]" = OrderedDict()
+
+    def fingerprint(self, path: Optional[Path]) -> str:
+        """Full content fingerprint of `path`; re-hashed only when its stat changes."""
+        if path is None:
+            return NONE
+        try:
+            st = path.stat()
+        except OSError:
+            return MISSING
+        if not path.is_file():
+            return MISSING
+        signature = (st.st_size, st.st_mtime_ns, st.st_ino)
+        memo_key = str(path)
+        with self._lock:
+            memo = self._fingerprints.get(memo_key)
+            if memo is not None and memo[0] == signature:
+                self._fingerprints.move_to_end(memo_key)
+                return memo[1]
+        digest = fingerprint_file(path, short=False)
+        self._remember(memo_key, signature, digest)
+        return digest
+
+    def _remember(self, memo_key: str, signature: _StatSignature, digest: str) -> None:
+        with self._lock:
+            self._fingerprints[memo_key] = (signature, digest)
+            self._fingerprints.move_to_end(memo_key)
+            while len(self._fingerprints) > _FINGERPRINT_MEMO_SIZE:
+                self._fingerprints.popitem(last=False)
+
+    def assemble(
+        self,
+        kind: str,
+        files: Mapping[str, Optional[Path]],
+        render: Callable[[Dict[str, Optional[str]]], str],
+        *,
+        values: Optional[Mapping[str, Any]] = None,
+    ) -> AssembledPrompt:
+        """
+        Return the prompt `render(texts)` for these inputs, from cache when unchanged.
+
+        `texts` maps each name in `files` to the file's text, or None when the
+        file is absent. `values` are the non-file inputs of `render`.
+        """
+        fingerprints = {name: self.fingerprint(path) for name, path in files.items()}
+        key = _prompt_key(kind, fingerprints, values)
+        if self.max_entries > 0:
+            with self._lock:
+                hit = self._prompts.get(key)
+                if hit is not None:
+                    self._prompts.move_to_end(key)
+                    return AssembledPrompt(hit.text, hit.prompt_hash, key, dict(fingerprints), cached=True)
+
+        texts: Dict[str, Optional[str]] = {}
+        consistent = True
+        for name, path in files.items():
+            if path is None or fingerprints[name] in (MISSING, NONE):
+                texts[name] = None
+                continue
+            try:
+                data = path.read_bytes()
+            except OSError:
+                texts[name] = None
+                consistent = False
+                continue
+            # The file may have changed since it was fingerprinted; never
+            # store text under a key computed from other content.
+            if hashlib.sha256(data).hexdigest() != fingerprints[name]:
+                consistent = False
+            # Like the readers this replaced, never fail a prompt on bad bytes.
+            texts[name] = data.decode("utf-8", errors="replace")
+
+        text = render(texts)
+        prompt = AssembledPrompt(text, fingerprint_text(text, short=False), key, dict(fingerprints))
+        if consistent and self.max_entries > 0:
+            with self._lock:
+                self._prompts[key] = prompt
+                self._prompts.move_to_end(key)
+                while len(self._prompts) > self.max_entries:
+                    self._prompts.popitem(last=False)
+        return prompt
+
+    def clear(self) -> None:
+        with self._lock:
+            self._prompts.clear()
+            self._fingerprints.clear()
+
+
+def _prompt_key(kind: str, fingerprints: Mapping[str, str], values: Optional[Mapping[str, Any]]) -> str:
+    material = json.dumps(
+        {"kind": kind, "files": dict(fingerprints), "values": dict(values or {})},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+_cache: Optional[PromptCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_prompt_cache() -> PromptCache:
+    """Process-wide cache; its size follows DEVGODZILLA_PROMPT_CACHE_SIZE (0 disables reuse)."""
+    global _cache
+    size = get_config().prompt_cache_size
+    with _cache_lock:
+        if _cache is None:
+            _cache = PromptCache(max_entries=size)
+        _cache.max_entries = size
+        return _cache
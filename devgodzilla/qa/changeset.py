@@ -0,0 +1,482 @@
+"""
+DevGodzilla QA Change Sets
+
+Helpers for incremental QA: the set of files a step changed relative to the
+protocol base branch, and the Python reverse-import closure of those files
+(modules whose type checks can break when a changed module's API changes).
+
+After each step `ExecutionService` calls `capture_workspace_changes`, which
+runs `git status` and the staged/unstaged `git diff --numstat -p` once each,
+concurrently, writes the patches gzip-compressed and size-capped, and returns
+a manifest of changed files. The manifest is stored in the step's
+`runtime_state["changes"]` (and the `changed-files.json` artifact);
+`QualityService` reuses it (plus any later working-tree edits) and hands the
+file set to gates through `GateContext.changed_files`.
+"""
+
+import gzip
+import json
+import os
+import re
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+CHANGED_FILES_ARTIFACT = "changed-files"
+CHANGES_MANIFEST_ARTIFACT = "changes-manifest"
+CHANGES_STATE_KEY = "changes"
+MAX_INCREMENTAL_FILES = 500
+MAX_PATCH_BYTES = 5 * 1024 * 1024
+MAX_MANIFEST_FILES = 1000
+PATCH_OVERFLOW_MARKER = "\n# devgodzilla: patch truncated after {limit} bytes\n"
+
+_NUMSTAT_RE = re.compile(rb"^(\d+|-)\t(\d+|-)\t(.*)$")
+
+_SKIP_DIRS = {".git", "node_modules", ".venv", "venv", "__pycache__", "build", "dist", ".tox", ".mypy_cache"}
+_IMPORT_RE = re.compile(
+    r"^\s*(?:from\s+(\.*[\w.]*)\s+import\s+\(?\s*([\w., ]*)|import\s+([\w., ]+))",
+    re.MULTILINE,
+)
+
+
+def _git_text(args: List[str], cwd: Path) -> Optional[str]:
+    try:
+        proc = subprocess.run(
+            ["git", *args],
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+    except Exception:
+        return None
+    if proc.returncode != 0:
+        return None
+    return proc.stdout
+
+
+def _git_lines(args: List[str], cwd: Path) -> Optional[List[str]]:
+    text = _git_text(args, cwd)
+    if text is None:
+        return None
+    return [line.strip() for line in text.splitlines() if line.strip()]
+
+
+def resolve_base_ref(workspace_root: Path, base_branch: Optional[str]) -> Optional[str]:
+    """Return the merge-base of HEAD and the protocol base branch (remote first)."""
+    if not base_branch:
+        return None
+    for ref in (f"origin/{base_branch}", base_branch):
+        lines = _git_lines(["merge-base", "HEAD", ref], workspace_root)
+        if lines:
+            return lines[0]
+    return None
+
+
+def compute_changed_files(workspace_root: Path, base_branch: Optional[str]) -> Optional[List[str]]:
+    """
+    Files changed since the merge-base with `base_branch`.
+
+    Includes committed, staged, unstaged and untracked (non-ignored) files,
+    as paths relative to `workspace_root`. Returns None when the change set
+    cannot be determined (not a git repo, unknown base), meaning "scan all".
+    """
+    base_ref = resolve_base_ref(workspace_root, base_branch)
+    if base_ref is None:
+        return None
+    changed = _git_lines(["diff", "--name-only", "--relative", base_ref], workspace_root)
+    untracked = _git_lines(["ls-files", "--others", "--exclude-standard"], workspace_root)
+    if changed is None or untracked is None:
+        return None
+    return sorted(set(changed) | set(untracked))
+
+
+@dataclass
+class WorkspaceStatus:
+    """`git status` of a workspace: HEAD commit and (XY code, path) entries."""
+    head: Optional[str]
+    entries: List[Tuple[str, str]] = field(default_factory=list)
+
+    @property
+    def paths(self) -> List[str]:
+        return sorted({path for _, path in self.entries})
+
+
+def workspace_status(workspace_root: Path) -> Optional[WorkspaceStatus]:
+    """One `git status --porcelain=v2 --branch` call; None when it fails."""
+    try:
+        proc = subprocess.run(
+            ["git", "--no-optional-locks", "status", "--porcelain=v2", "-z", "--branch", "--untracked-files=all"],
+            cwd=workspace_root,
+            capture_output=True,
+            timeout=60,
+        )
+    except Exception:
+        return None
+    if proc.returncode != 0:
+        return None
+
+    status = WorkspaceStatus(head=None)
+    tokens = iter(proc.stdout.decode("utf-8", errors="replace").split("\0"))
+    for token in tokens:
+        if token.startswith("# branch.oid "):
+            oid = token.split(" ", 2)[2]
+            status.head = None if oid == "(initial)" else oid
+        elif token[:2] in ("1 ", "2 ", "u "):
+            fields = token.split(" ", {"1": 8, "2": 9, "u": 10}[token[0]])
+            status.entries.append((fields[1].replace(".", " "), fields[-1]))
+            if token[0] == "2":
+                next(tokens, None)  # rename source path
+        elif token[:2] == "? ":
+            status.entries.append(("??", token[2:]))
+    return status
+
+
+def _capture_diff(
+    workspace_root: Path,
+    args: List[str],
+    target: Path,
+    max_bytes: int,
+) -> Optional[Tuple[Dict[str, Tuple[Optional[int], Optional[int]]], Dict[str, Any]]]:
+    """
+    Stream `git diff --numstat -p` into a gzip file.
+
+    Numstat lines precede the patch, so per-file counts are complete even
+    when the patch is cut at `max_bytes`; git is stopped at that point.
+    """
+    stats: Dict[str, Tuple[Optional[int], Optional[int]]] = {}
+    written = 0
+    truncated = False
+    try:
+        proc = subprocess.Popen(
+            ["git", "-c", "core.quotepath=off", "diff", "--no-color", "--no-ext-diff", "--no-renames", "--numstat", "-p", *args],
+            cwd=workspace_root,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+    except Exception:
+        return None
+    assert proc.stdout is not None
+    with gzip.open(target, "wb", compresslevel=6) as out:
+        in_stats = True
+        for line in proc.stdout:
+            if in_stats:
+                match = _NUMSTAT_RE.match(line.rstrip(b"\n"))
+                if match:
+                    added, deleted, path = match.groups()
+                    stats[path.decode("utf-8", errors="replace")] = (
+                        int(added) if added != b"-" else None,
+                        int(deleted) if deleted != b"-" else None,
+                    )
+                    continue
+                in_stats = False
+                if not line.strip():
+                    continue
+            if written + len(line) > max_bytes:
+                truncated = True
+                out.write(PATCH_OVERFLOW_MARKER.format(limit=max_bytes).encode("utf-8"))
+                proc.kill()
+                break
+            out.write(line)
+            written += len(line)
+    proc.stdout.close()
+    proc.wait()
+    if proc.returncode != 0 and not truncated:
+        return None
+    return stats, {"path": str(target), "bytes": written, "truncated": truncated}
+
+
+def write_patch(
+    workspace_root: Path,
+    target: Path,
+    *,
+    max_patch_bytes: int = MAX_PATCH_BYTES,
+) -> Optional[Dict[str, Any]]:
+    """
+    Write the unstaged patch of a workspace to gzip `target`, capped like
+    `capture_workspace_changes`. None (and no file) when git fails or there
+    is nothing to write.
+    """
+    target = Path(target)
+    captured = _capture_diff(workspace_root, [], target, max_patch_bytes)
+    if captured is None or not captured[1]["bytes"]:
+        target.unlink(missing_ok=True)
+        return None
+    return captured[1]
+
+
+@dataclass
+class WorkspaceChanges:
+    """Result of `capture_workspace_changes`."""
+    head: Optional[str]
+    files: List[Dict[str, Any]]
+    patches: Dict[str, Dict[str, Any]]
+    base_branch: Optional[str] = None
+    # Files changed since the merge-base with base_branch (None: unknown).
+    changed_files: Optional[List[str]] = None
+    last_commit: Optional[str] = None
+
+    def manifest(self, max_files: Optional[int] = None) -> Dict[str, Any]:
+        files = self.files if max_files is None else self.files[:max_files]
+        changed = self.changed_files
+        if max_files is not None and changed is not None and len(changed) > MAX_INCREMENTAL_FILES:
+            changed = None
+        return {
+            "head": self.head,
+            "base_branch": self.base_branch,
+            "files": files,
+            "files_total": len(self.files),
+            "files_truncated": len(files) < len(self.files),
+            "additions": sum(f["additions"] or 0 for f in self.files),
+            "deletions": sum(f["deletions"] or 0 for f in self.files),
+            "patches": self.patches,
+            "changed_files": changed,
+            "last_commit": self.last_commit,
+        }
+
+
+def capture_workspace_changes(
+    workspace_root: Path,
+    artifacts_dir: Path,
+    *,
+    base_branch: Optional[str] = None,
+    max_patch_bytes: int = MAX_PATCH_BYTES,
+) -> Optional[WorkspaceChanges]:
+    """
+    Capture status, per-file line counts and both diffs of a workspace.
+
+    `git status`, the unstaged and staged `git diff --numstat -p`, the
+    change set vs `base_branch` and the HEAD commit message run concurrently,
+    one process each. Patches
+    go to `changes.diff.gz` / `changes_cached.diff.gz` in `artifacts_dir`.
+    Returns None when the workspace is not a usable git repository.
+    """
+    artifacts_dir = Path(artifacts_dir)
+    artifacts_dir.mkdir(parents=True, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=5, thread_name_prefix="devgodzilla-changes") as pool:
+        status_f = pool.submit(workspace_status, workspace_root)
+        unstaged_f = pool.submit(_capture_diff, workspace_root, [], artifacts_dir / "changes.diff.gz", max_patch_bytes)
+        staged_f = pool.submit(
+            _capture_diff, workspace_root, ["--cached"], artifacts_dir / "changes_cached.diff.gz", max_patch_bytes
+        )
+        base_f = pool.submit(compute_changed_files, workspace_root, base_branch)
+        commit_f = pool.submit(_git_text, ["log", "-1", "--pretty=%B"], workspace_root)
+    status = status_f.result()
+    if status is None:
+        return None
+
+    files: Dict[str, Dict[str, Any]] = {
+        path: {"path": path, "status": code, "additions": None, "deletions": None, "binary": False}
+        for code, path in status.entries
+    }
+    patches: Dict[str, Dict[str, Any]] = {}
+    for name, captured in (("unstaged", unstaged_f.result()), ("staged", staged_f.result())):
+        if captured is None:
+            continue
+        stats, patches[name] = captured
+        for path, (added, deleted) in stats.items():
+            entry = files.setdefault(
+                path, {"path": path, "status": "M ", "additions": None, "deletions": None, "binary": False}
+            )
+            if added is None or deleted is None:
+                entry["binary"] = True
+                continue
+            entry["additions"] = (entry["additions"] or 0) + added
+            entry["deletions"] = (entry["deletions"] or 0) + deleted
+
+    return WorkspaceChanges(
+        head=status.head,
+        files=sorted(files.values(), key=lambda f: f["path"]),
+        patches=patches,
+        base_branch=base_branch,
+        changed_files=base_f.result(),
+        last_commit=(commit_f.result() or "").strip() or None,
+    )
+
+
+def changed_files_from_manifest(manifest: Any, workspace_root: Path) -> Optional[List[str]]:
+    """
+    Reuse a step's recorded change set when HEAD has not moved since.
+
+    Adds files the working tree changed after the capture (one `git status`)
+    instead of re-diffing against the base branch. None: not reusable.
+    """
+    if not isinstance(manifest, dict) or not isinstance(manifest.get("changed_files"), list):
+        return None
+    status = workspace_status(workspace_root)
+    if status is None or status.head is None or status.head != manifest.get("head"):
+        return None
+    return sorted(set(manifest["changed_files"]) | set(status.paths))
+
+
+def manifest_status(manifest: Any) -> Optional[str]:
+    """`git status --porcelain` text of a recorded manifest (None: no manifest)."""
+    if not isinstance(manifest, dict) or not isinstance(manifest.get("files"), list):
+        return None
+    return "\n".join(f"{f.get('status') or '  '} {f.get('path')}" for f in manifest["files"])
+
+
+def describe_changes(manifests: Iterable[Any], *, max_files: int = 50) -> Optional[str]:
+    """
+    Markdown summary of the files recorded in step change manifests.
+
+    `manifests` are in step order; a later step's line counts for a path
+    replace an earlier one's. None when no step recorded a manifest.
+    """
+    counts: Dict[str, Tuple[Optional[int], Optional[int]]] = {}
+    paths: Set[str] = set()
+    seen = False
+    for manifest in manifests:
+        if not isinstance(manifest, dict):
+            continue
+        seen = True
+        for entry in manifest.get("files") or []:
+            counts[entry["path"]] = (entry.get("additions"), entry.get("deletions"))
+        paths.update(manifest.get("changed_files") or [])
+    if not seen:
+        return None
+    paths.update(counts)
+    ordered = sorted(paths)
+    additions = sum(counts.get(p, (0, 0))[0] or 0 for p in ordered)
+    deletions = sum(counts.get(p, (0, 0))[1] or 0 for p in ordered)
+    lines = ["### Changes", f"{len(ordered)} files changed (+{additions} -{deletions})", ""]
+    for path in ordered[:max_files]:
+        added, deleted = counts.get(path, (None, None))
+        stat = f" (+{added} -{deleted})" if added is not None and deleted is not None else ""
+        lines.append(f"- `{path}`{stat}")
+    if len(ordered) > max_files:
+        lines.append(f"- ...and {len(ordered) - max_files} more")
+    return "\n".join(lines)
+
+
+def load_changes_manifest(artifacts_dir: Path) -> Optional[Dict[str, Any]]:
+    path = Path(artifacts_dir) / f"{CHANGES_MANIFEST_ARTIFACT}.json"
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def load_changed_files(artifacts_dir: Path) -> Optional[List[str]]:
+    path = Path(artifacts_dir) / f"{CHANGED_FILES_ARTIFACT}.json"
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    files = payload.get("files") if isinstance(payload, dict) else None
+    if not isinstance(files, list):
+        return None
+    return [str(f) for f in files]
+
+
+def select_paths(
+    workspace_root: Path,
+    changed_files: Optional[Iterable[str]],
+    suffixes: tuple,
+) -> Optional[List[str]]:
+    """
+    Existing changed files with one of `suffixes`.
+
+    Returns None (full scan) when the change set is unknown or too large.
+    """
+    if changed_files is None:
+        return None
+    paths = sorted({p for p in changed_files if p.endswith(suffixes) and (workspace_root / p).is_file()})
+    if len(paths) > MAX_INCREMENTAL_FILES:
+        return None
+    return paths
+
+
+def _module_names(rel_path: str) -> List[str]:
+    parts = Path(rel_path).with_suffix("").parts
+    if parts and parts[-1] == "__init__":
+        parts = parts[:-1]
+    names = []
+    # Support both flat and `src/` layouts.
+    for start in range(len(parts)):
+        if start > 0 and parts[start - 1] not in ("src", "lib"):
+            continue
+        name = ".".join(parts[start:])
+        if name:
+            names.append(name)
+    return names
+
+
+def _python_files(workspace_root: Path) -> List[str]:
+    files = []
+    for dirpath, dirnames, filenames in os.walk(workspace_root):
+        dirnames[:] = [d for d in dirnames if d not in _SKIP_DIRS and not d.startswith(".")]
+        for name in filenames:
+            if name.endswith(".py"):
+                files.append(str((Path(dirpath) / name).relative_to(workspace_root)))
+    return files
+
+
+def _imports(workspace_root: Path, rel_path: str) -> Set[str]:
+    try:
+        text = (workspace_root / rel_path).read_text(encoding="utf-8", errors="ignore")
+    except OSError:
+        return set()
+    package = ".".join(Path(rel_path).parent.parts)
+    found: Set[str] = set()
+    for match in _IMPORT_RE.finditer(text):
+        if match.group(1) is not None:
+            module = match.group(1)
+            if module.startswith("."):
+                dots = len(module) - len(module.lstrip("."))
+                base = package.split(".") if package else []
+                base = base[: len(base) - (dots - 1)] if dots > 1 else base
+                module = ".".join([*base, module.lstrip(".")]).strip(".")
+            found.add(module)
+            # `from pkg import mod` may import a submodule.
+            for item in match.group(2).split(","):
+                name = item.strip().split(" ")[0]
+                if name and name != "*":
+                    found.add(f"{module}.{name}" if module else name)
+        else:
+            for item in match.group(3).split(","):
+                name = item.strip().split(" ")[0]
+                if name:
+                    found.add(name)
+    return found
+
+
+def python_import_closure(workspace_root: Path, changed_py: List[str]) -> Optional[List[str]]:
+    """
+    Changed Python files plus every module that (transitively) imports them.
+
+    Returns None when the closure exceeds MAX_INCREMENTAL_FILES so callers
+    fall back to a full scan.
+    """
+    if not changed_py:
+        return []
+    all_files = _python_files(workspace_root)
+    by_module: Dict[str, str] = {}
+    for rel in all_files:
+        for name in _module_names(rel):
+            by_module.setdefault(name, rel)
+
+    importers: Dict[str, Set[str]] = {}
+    for rel in all_files:
+        for module in _imports(workspace_root, rel):
+            # `import a.b.c` depends on a, a.b and a.b.c.
+            parts = module.split(".")
+            for i in range(1, len(parts) + 1):
+                target = by_module.get(".".join(parts[:i]))
+                if target and target != rel:
+                    importers.setdefault(target, set()).add(rel)
+
+    closure: Set[str] = set(changed_py)
+    frontier = list(changed_py)
+    while frontier:
+        current = frontier.pop()
+        for importer in importers.get(current, ()):
+            if importer not in closure:
+                closure.add(importer)
+                frontier.append(importer)
+        if len(closure) > MAX_INCREMENTAL_FILES:
+            return None
+    return sorted(closure)
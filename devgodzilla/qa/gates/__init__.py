@@ -29,6 +29,7 @@ if TYPE_CHECKING:
     )
     from devgodzilla.qa.gates.speckit import SpecKitChecklistGate
     from devgodzilla.qa.gates.prompt import PromptQAGate
+    from devgodzilla.qa.gates.runner import GateRunner
 
 __all__ = [
     # Interface
@@ -49,6 +50,8 @@ __all__ = [
     # Constitutional gates
     "ConstitutionalGate",
     "ConstitutionalSummaryGate",
+    # Execution
+    "GateRunner",
 ]
 
 _EXPORTS = {
@@ -67,6 +70,7 @@ _EXPORTS = {
     "ConstitutionalSummaryGate": "devgodzilla.qa.gates.constitutional",
     "SpecKitChecklistGate": "devgodzilla.qa.gates.speckit",
     "PromptQAGate": "devgodzilla.qa.gates.prompt",
+    "GateRunner": "devgodzilla.qa.gates.runner",
 }
 
 
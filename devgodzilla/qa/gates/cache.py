@@ -0,0 +1,339 @@
+"""
+DevGodzilla QA Gate Result Cache
+
+Content-addressed cache of gate results. An entry is keyed by:
+
+- the gate id and class,
+- the gate's `cache_fingerprint` (command, options, tool version),
+- the workspace tree hash: the HEAD tree id plus a digest of the working-tree
+  diff against it and of untracked, non-ignored files (nothing is written to
+  the repository's object store), or a content hash for non-git dirs.
+
+Identical code therefore reuses a prior `GateResult` instead of re-running
+tests or scanners. Entries live in the `qa_gate_cache` table next to
+`qa_results` and expire after `ttl_seconds` (scanners such as `npm audit` also
+depend on advisory data outside the tree); expired rows are purged when a
+QA run first stores a result.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import threading
+from dataclasses import asdict
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from devgodzilla.logging import get_logger
+from devgodzilla.qa.gates.interface import (
+    Finding,
+    Gate,
+    GateContext,
+    GateResult,
+    GateVerdict,
+)
+
+logger = get_logger(__name__)
+
+_HASH_EXCLUDED_DIRS = {
+    ".git",
+    "node_modules",
+    ".venv",
+    "venv",
+    "__pycache__",
+    ".mypy_cache",
+    ".pytest_cache",
+    ".ruff_cache",
+}
+_HASH_MAX_FILES = 20000
+_CACHEABLE_VERDICTS = {GateVerdict.PASS, GateVerdict.WARN, GateVerdict.FAIL}
+
+
+@lru_cache(maxsize=64)
+def tool_version(executable: str) -> Optional[str]:
+    """Return the first line of `<executable> --version`, or None if unavailable."""
+    if not shutil.which(executable):
+        return None
+    try:
+        proc = subprocess.run(
+            [executable, "--version"],
+            capture_output=True,
+            text=True,
+            timeout=15,
+        )
+    except Exception:
+        return None
+    output = (proc.stdout or proc.stderr or "").strip()
+    return output.splitlines()[0] if output else None
+
+
+def _git(args: list, cwd: Path, env: Optional[Dict[str, str]] = None) -> Optional[str]:
+    try:
+        proc = subprocess.run(
+            ["git", *args],
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+            timeout=60,
+            env=env,
+        )
+    except Exception:
+        return None
+    if proc.returncode != 0:
+        return None
+    return proc.stdout.strip()
+
+
+def _git_digest(args: list, cwd: Path, digest: Any) -> bool:
+    """Feed the stdout of a git command into `digest` as it streams."""
+    try:
+        proc = subprocess.Popen(["git", *args], cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    except OSError:
+        return False
+    with proc:
+        for chunk in iter(lambda: proc.stdout.read(1 << 16), b""):
+            digest.update(chunk)
+    return proc.returncode == 0
+
+
+def _file_digest(path: Path) -> bytes:
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def git_tree_hash(workspace_root: Path) -> Optional[str]:
+    """
+    Hash the working tree (tracked and untracked, honouring .gitignore).
+
+    Read-only: the HEAD tree id, the binary diff of the working tree against
+    it (git reuses the index stat cache, so unchanged files are not read) and
+    the contents of untracked files. Neither the index nor the object store
+    is written.
+    """
+    base = _git(["rev-parse", "--verify", "-q", "HEAD^{tree}"], workspace_root)
+    if base is None:
+        # No commits yet: diff against the empty tree (hash-object without -w).
+        base = _git(["hash-object", "-t", "tree", os.devnull], workspace_root)
+        if base is None:
+            return None
+    digest = hashlib.sha256(base.encode("utf-8") + b"\0")
+    diff = ["diff", "--binary", "--no-ext-diff", "--no-textconv", "--no-renames", "--no-color", base]
+    if not _git_digest(diff, workspace_root, digest):
+        return None
+    try:
+        listing = subprocess.run(
+            ["git", "ls-files", "--others", "--exclude-standard", "-z"],
+            cwd=workspace_root,
+            capture_output=True,
+            timeout=60,
+        )
+    except Exception:
+        return None
+    if listing.returncode != 0:
+        return None
+    names = [name for name in os.fsdecode(listing.stdout).split("\0") if name]
+    if len(names) > _HASH_MAX_FILES:
+        return None
+    for name in sorted(names):
+        path = workspace_root / name
+        digest.update(os.fsencode(name) + b"\0")
+        try:
+            digest.update(_file_digest(path))
+        except OSError:
+            digest.update(b"unreadable")
+    return digest.hexdigest()
+
+
+def content_tree_hash(workspace_root: Path) -> Optional[str]:
+    """Hash relative paths and file contents of a non-git workspace."""
+    digest = hashlib.sha256()
+    count = 0
+    for dirpath, dirnames, filenames in os.walk(workspace_root):
+        dirnames[:] = sorted(d for d in dirnames if d not in _HASH_EXCLUDED_DIRS)
+        for name in sorted(filenames):
+            count += 1
+            if count > _HASH_MAX_FILES:
+                return None
+            path = Path(dirpath) / name
+            try:
+                data = path.read_bytes()
+            except OSError:
+                continue
+            digest.update(str(path.relative_to(workspace_root)).encode("utf-8"))
+            digest.update(b"\0")
+            digest.update(hashlib.sha256(data).digest())
+    return f"sha256:{digest.hexdigest()}"
+
+
+def workspace_tree_hash(workspace_root: Path) -> Optional[str]:
+    """Tree hash for a workspace: git tree id when possible, content hash otherwise."""
+    if not workspace_root.exists():
+        return None
+    tree = git_tree_hash(workspace_root)
+    if tree:
+        return f"git:{tree}"
+    return content_tree_hash(workspace_root)
+
+
+def serialize_gate_result(result: GateResult) -> Dict[str, Any]:
+    payload = asdict(result)
+    payload["verdict"] = result.verdict.value if hasattr(result.verdict, "value") else str(result.verdict)
+    return payload
+
+
+def deserialize_gate_result(payload: Dict[str, Any]) -> GateResult:
+    return GateResult(
+        gate_id=payload["gate_id"],
+        gate_name=payload.get("gate_name") or payload["gate_id"],
+        verdict=GateVerdict(payload["verdict"]),
+        findings=[Finding(**f) for f in payload.get("findings") or []],
+        duration_seconds=payload.get("duration_seconds"),
+        metadata=dict(payload.get("metadata") or {}),
+        error=payload.get("error"),
+    )
+
+
+class GateResultCache:
+    """
+    DB-backed gate result cache for one QA run.
+
+    The workspace tree hash is computed once per workspace and reused for all
+    gates of the run, so it reflects the tree the gates started from.
+
+    Example:
+        cache = GateResultCache(db, project_id=project.id)
+        runner = GateRunner(cache=cache)
+    """
+
+    def __init__(
+        self,
+        db,
+        *,
+        project_id: Optional[int] = None,
+        ttl_seconds: Optional[float] = 24 * 60 * 60,
+    ) -> None:
+        self.db = db
+        self.project_id = project_id
+        self.ttl_seconds = ttl_seconds if ttl_seconds and ttl_seconds > 0 else None
+        self._trees: Dict[str, Optional[str]] = {}
+        self._lock = threading.Lock()
+        self._purged = False
+
+    def tree_hash(self, context: GateContext) -> Optional[str]:
+        with self._lock:
+            if context.workspace_root not in self._trees:
+                self._trees[context.workspace_root] = workspace_tree_hash(Path(context.workspace_root))
+            return self._trees[context.workspace_root]
+
+    def prime(self, gates: List[Gate], context: GateContext) -> None:
+        """Hash the tree up front (before gates write to it) if any gate is cacheable."""
+        for gate in gates:
+            try:
+                fingerprint = gate.cache_fingerprint(context)
+            except Exception:
+                continue
+            if fingerprint is not None:
+                self.tree_hash(context)
+                return
+
+    def key_for(self, gate: Gate, context: GateContext) -> Optional[tuple[str, str]]:
+        """Return (cache_key, tree_hash), or None when the gate/tree cannot be cached."""
+        try:
+            fingerprint = gate.cache_fingerprint(context)
+        except Exception:
+            return None
+        if fingerprint is None:
+            return None
+        tree = self.tree_hash(context)
+        if tree is None:
+            return None
+        material = json.dumps(
+            {
+                "gate_id": gate.gate_id,
+                "gate_class": f"{type(gate).__module__}.{type(gate).__qualname__}",
+                "fingerprint": fingerprint,
+                "tree": tree,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest(), tree
+
+    def lookup(self, gate: Gate, context: GateContext) -> Optional[GateResult]:
+        key = self.key_for(gate, context)
+        if key is None:
+            return None
+        try:
+            entry = self.db.get_qa_gate_cache(key[0])
+        except Exception as exc:
+            logger.warning("qa_gate_cache_lookup_failed", extra={"gate_id": gate.gate_id, "error": str(exc)})
+            return None
+        if entry is None or self._expired(entry.created_at):
+            return None
+        try:
+            result = deserialize_gate_result(entry.result)
+        except Exception:
+            return None
+        if result.gate_id != gate.gate_id:
+            return None
+        result.metadata = {
+            **result.metadata,
+            "cache_hit": True,
+            "cache_key": key[0],
+            "cached_at": entry.created_at,
+        }
+        return result
+
+    def store(self, gate: Gate, context: GateContext, result: GateResult) -> None:
+        if result.verdict not in _CACHEABLE_VERDICTS or result.error:
+            return
+        if (result.metadata or {}).get("errors") or (result.metadata or {}).get("timed_out"):
+            return
+        key = self.key_for(gate, context)
+        if key is None:
+            return
+        payload = serialize_gate_result(result)
+        payload["metadata"] = {
+            k: v for k, v in payload["metadata"].items() if k not in ("cache_hit", "cache_key", "cached_at")
+        }
+        try:
+            self.db.upsert_qa_gate_cache(
+                cache_key=key[0],
+                gate_id=gate.gate_id,
+                tree_hash=key[1],
+                result=payload,
+                project_id=self.project_id,
+            )
+        except Exception as exc:
+            logger.warning("qa_gate_cache_store_failed", extra={"gate_id": gate.gate_id, "error": str(exc)})
+        self._purge_expired()
+
+    def _purge_expired(self) -> None:
+        """Delete expired rows, once per QA run (lookups already ignore them)."""
+        with self._lock:
+            if self._purged or self.ttl_seconds is None:
+                return
+            self._purged = True
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=self.ttl_seconds)
+        try:
+            self.db.delete_qa_gate_cache(older_than=cutoff)
+        except Exception as exc:
+            logger.warning("qa_gate_cache_purge_failed", extra={"error": str(exc)})
+
+    def _expired(self, created_at: Optional[str]) -> bool:
+        if self.ttl_seconds is None or not created_at:
+            return False
+        try:
+            created = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
+        except (AttributeError, TypeError, ValueError):
+            return True
+        if created.tzinfo is None:
+            created = created.replace(tzinfo=timezone.utc)
+        return (datetime.now(timezone.utc) - created).total_seconds() > self.ttl_seconds
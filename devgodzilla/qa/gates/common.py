@@ -10,7 +10,7 @@ import subprocess
 import time
 import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from devgodzilla.qa.gates.interface import (
     Gate,
@@ -19,11 +19,33 @@ from devgodzilla.qa.gates.interface import (
     GateVerdict,
     Finding,
 )
+from devgodzilla.qa.gates.cache import tool_version
+from devgodzilla.qa.gates.process import run_command
+from devgodzilla.qa.changeset import python_import_closure, select_paths
 from devgodzilla.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+def _command_fingerprint(cmd: Optional[List[str]], timeout: int) -> Optional[Dict[str, Any]]:
+    """Cache fingerprint for a command-running gate (None: nothing to run, do not cache)."""
+    if not cmd:
+        return None
+    return {"command": list(cmd), "timeout": timeout, "tool_version": tool_version(cmd[0])}
+
+
+_PYTHON_SUFFIXES = (".py", ".pyi")
+_ESLINT_SUFFIXES = (".js", ".jsx", ".mjs", ".cjs", ".ts", ".tsx")
+_PRETTIER_SUFFIXES = _ESLINT_SUFFIXES + (".json", ".css", ".scss", ".md", ".yaml", ".yml", ".html")
+
+
+def _scoped(base: List[str], full: List[str], paths: Optional[List[str]]) -> List[str]:
+    """`base + paths` for an incremental scan, `base + full` when paths is None, [] when empty."""
+    if paths is None:
+        return base + full
+    return base + paths if paths else []
+
+
 class TestGate(Gate):
     """
     Gate that runs tests.
@@ -49,29 +71,31 @@ class TestGate(Gate):
     def gate_name(self) -> str:
         return "Test Gate"
 
+    def resolve_command(self, workspace: Path) -> Optional[List[str]]:
+        """Detect the test command for a workspace."""
+        if self.test_command:
+            return self.test_command
+        if (workspace / "pytest.ini").exists() or (workspace / "pyproject.toml").exists():
+            return ["pytest", "--tb=short", "-q"]
+        if (workspace / "package.json").exists():
+            return ["npm", "test"]
+        return None
+
+    def cache_fingerprint(self, context: GateContext) -> Optional[Dict[str, Any]]:
+        return _command_fingerprint(self.resolve_command(Path(context.workspace_root)), self.timeout)
+
     def run(self, context: GateContext) -> GateResult:
         """Run tests."""
         start = time.time()
         workspace = Path(context.workspace_root)
         
         # Detect test command
-        cmd = self.test_command
+        cmd = self.resolve_command(workspace)
         if not cmd:
-            if (workspace / "pytest.ini").exists() or (workspace / "pyproject.toml").exists():
-                cmd = ["pytest", "--tb=short", "-q"]
-            elif (workspace / "package.json").exists():
-                cmd = ["npm", "test"]
-            else:
-                return self.skip("No test configuration found")
+            return self.skip("No test configuration found")
         
         try:
-            proc = subprocess.run(
-                cmd,
-                cwd=workspace,
-                capture_output=True,
-                text=True,
-                timeout=self.timeout,
-            )
+            proc = run_command(cmd, cwd=workspace, timeout=self.timeout)
             
             duration = time.time() - start
             
@@ -137,33 +161,53 @@ class LintGate(Gate):
     def gate_name(self) -> str:
         return "Lint Gate"
 
+    @property
+    def fast(self) -> bool:
+        return True
+
     @property
     def blocking(self) -> bool:
         return False  # Lint warnings don't block by default
 
+    def resolve_command(
+        self,
+        workspace: Path,
+        changed_files: Optional[List[str]] = None,
+    ) -> Optional[List[str]]:
+        """
+        Detect the lint command for a workspace.
+
+        With `changed_files`, only those files are linted; an empty list means
+        there is nothing to lint. Custom commands always run unchanged.
+        """
+        if self.lint_command:
+            return self.lint_command
+        if (workspace / "pyproject.toml").exists() or (workspace / "ruff.toml").exists():
+            paths = select_paths(workspace, changed_files, _PYTHON_SUFFIXES)
+            return _scoped(["ruff", "check", "--force-exclude"], ["."], paths)
+        if (workspace / ".eslintrc.js").exists() or (workspace / ".eslintrc.json").exists():
+            paths = select_paths(workspace, changed_files, _ESLINT_SUFFIXES)
+            return _scoped(["eslint", "--format", "compact"], ["."], paths)
+        return None
+
+    def cache_fingerprint(self, context: GateContext) -> Optional[Dict[str, Any]]:
+        cmd = self.resolve_command(Path(context.workspace_root), context.changed_files)
+        return _command_fingerprint(cmd, self.timeout)
+
     def run(self, context: GateContext) -> GateResult:
         """Run linter."""
         start = time.time()
         workspace = Path(context.workspace_root)
         
         # Detect linter
-        cmd = self.lint_command
+        cmd = self.resolve_command(workspace, context.changed_files)
+        if cmd is None:
+            return self.skip("No linter configuration found")
         if not cmd:
-            if (workspace / "pyproject.toml").exists() or (workspace / "ruff.toml").exists():
-                cmd = ["ruff", "check", "."]
-            elif (workspace / ".eslintrc.js").exists() or (workspace / ".eslintrc.json").exists():
-                cmd = ["eslint", ".", "--format", "compact"]
-            else:
-                return self.skip("No linter configuration found")
+            return self.skip("No changed files to lint")
         
         try:
-            proc = subprocess.run(
-                cmd,
-                cwd=workspace,
-                capture_output=True,
-                text=True,
-                timeout=self.timeout,
-            )
+            proc = run_command(cmd, cwd=workspace, timeout=self.timeout)
             
             duration = time.time() - start
             findings = self._parse_lint_output(proc.stdout + proc.stderr)
@@ -266,29 +310,47 @@ class TypeGate(Gate):
     def blocking(self) -> bool:
         return False  # Type errors usually warnings
 
+    def resolve_command(
+        self,
+        workspace: Path,
+        changed_files: Optional[List[str]] = None,
+    ) -> Optional[List[str]]:
+        """
+        Detect the type checker command for a workspace.
+
+        With `changed_files`, mypy checks the changed modules plus every module
+        that imports them. tsc has no per-file mode that honours tsconfig.json,
+        so it always checks the whole project.
+        """
+        if self.type_command:
+            return self.type_command
+        if (workspace / "mypy.ini").exists() or (workspace / "pyproject.toml").exists():
+            paths = select_paths(workspace, changed_files, _PYTHON_SUFFIXES)
+            if paths:
+                paths = python_import_closure(workspace, paths)
+            return _scoped(["mypy"], ["."], paths)
+        if (workspace / "tsconfig.json").exists():
+            return ["tsc", "--noEmit"]
+        return None
+
+    def cache_fingerprint(self, context: GateContext) -> Optional[Dict[str, Any]]:
+        cmd = self.resolve_command(Path(context.workspace_root), context.changed_files)
+        return _command_fingerprint(cmd, self.timeout)
+
     def run(self, context: GateContext) -> GateResult:
         """Run type checker."""
         start = time.time()
         workspace = Path(context.workspace_root)
         
         # Detect type checker
-        cmd = self.type_command
+        cmd = self.resolve_command(workspace, context.changed_files)
+        if cmd is None:
+            return self.skip("No type checker configuration found")
         if not cmd:
-            if (workspace / "mypy.ini").exists() or (workspace / "pyproject.toml").exists():
-                cmd = ["mypy", "."]
-            elif (workspace / "tsconfig.json").exists():
-                cmd = ["tsc", "--noEmit"]
-            else:
-                return self.skip("No type checker configuration found")
+            return self.skip("No changed files to type check")
         
         try:
-            proc = subprocess.run(
-                cmd,
-                cwd=workspace,
-                capture_output=True,
-                text=True,
-                timeout=self.timeout,
-            )
+            proc = run_command(cmd, cwd=workspace, timeout=self.timeout)
             
             duration = time.time() - start
             findings = self._parse_type_output(proc.stdout + proc.stderr)
@@ -353,6 +415,10 @@ class ChecklistGate(Gate):
     def gate_name(self) -> str:
         return "Checklist Gate"
 
+    @property
+    def fast(self) -> bool:
+        return True
+
     def run(self, context: GateContext) -> GateResult:
         """Validate checklist items."""
         start = time.time()
@@ -422,35 +488,50 @@ class FormatGate(Gate):
     def gate_name(self) -> str:
         return "Formatting Gate"
 
+    @property
+    def fast(self) -> bool:
+        return True
+
     @property
     def blocking(self) -> bool:
         return False
 
+    def resolve_command(
+        self,
+        workspace: Path,
+        changed_files: Optional[List[str]] = None,
+    ) -> Optional[List[str]]:
+        """Detect the format check command for a workspace (scoped to `changed_files` if given)."""
+        if self.format_command:
+            return self.format_command
+        if (workspace / "pyproject.toml").exists() or (workspace / "ruff.toml").exists():
+            paths = select_paths(workspace, changed_files, _PYTHON_SUFFIXES)
+            return _scoped(["ruff", "format", "--check", "--force-exclude"], ["."], paths)
+        if (workspace / "package.json").exists():
+            paths = select_paths(workspace, changed_files, _PRETTIER_SUFFIXES)
+            return _scoped(["prettier", "--check"], ["."], paths)
+        return None
+
+    def cache_fingerprint(self, context: GateContext) -> Optional[Dict[str, Any]]:
+        cmd = self.resolve_command(Path(context.workspace_root), context.changed_files)
+        return _command_fingerprint(cmd, self.timeout)
+
     def run(self, context: GateContext) -> GateResult:
         """Check formatting."""
         start = time.time()
         workspace = Path(context.workspace_root)
 
-        cmd = self.format_command
+        cmd = self.resolve_command(workspace, context.changed_files)
+        if cmd is None:
+            return self.skip("No formatter configuration found")
         if not cmd:
-            if (workspace / "pyproject.toml").exists() or (workspace / "ruff.toml").exists():
-                cmd = ["ruff", "format", "--check", "."]
-            elif (workspace / "package.json").exists():
-                cmd = ["prettier", "--check", "."]
-            else:
-                return self.skip("No formatter configuration found")
+            return self.skip("No changed files to format check")
 
         if not shutil.which(cmd[0]):
             return self.skip("Formatter not installed")
 
         try:
-            proc = subprocess.run(
-                cmd,
-                cwd=workspace,
-                capture_output=True,
-                text=True,
-                timeout=self.timeout,
-            )
+            proc = run_command(cmd, cwd=workspace, timeout=self.timeout)
             duration = time.time() - start
             if proc.returncode == 0:
                 return GateResult(
@@ -505,6 +586,14 @@ class CoverageGate(Gate):
     def gate_name(self) -> str:
         return "Coverage Gate"
 
+    @property
+    def depends_on(self) -> List[str]:
+        return ["test"]  # coverage.xml is written by the test run
+
+    @property
+    def fast(self) -> bool:
+        return True
+
     def run(self, context: GateContext) -> GateResult:
         workspace = Path(context.workspace_root)
         candidates = self.coverage_paths or [
@@ -50,6 +50,10 @@ class ConstitutionalGate(Gate):
     def gate_name(self) -> str:
         return "Constitutional Gate"
 
+    @property
+    def fast(self) -> bool:
+        return True
+
     def run(self, context: GateContext) -> GateResult:
         """Validate against constitution."""
         findings = []
@@ -70,6 +70,9 @@ class GateContext:
     # Artifacts from execution
     stdout: Optional[str] = None
     stderr: Optional[str] = None
+
+    # Files changed by the step, relative to workspace_root (None: scan everything)
+    changed_files: Optional[List[str]] = None
     
     # Additional context
     metadata: Dict[str, Any] = field(default_factory=dict)
@@ -128,6 +131,25 @@ class Gate(ABC):
         """Whether this gate is enabled."""
         return True
 
+    @property
+    def depends_on(self) -> List[str]:
+        """Gate IDs that must finish before this gate starts (when present in the run)."""
+        return []
+
+    @property
+    def fast(self) -> bool:
+        """Whether this gate is cheap enough to run first and short-circuit slower gates."""
+        return False
+
+    def cache_fingerprint(self, context: GateContext) -> Optional[Dict[str, Any]]:
+        """
+        Inputs besides the workspace tree that determine this gate's result.
+
+        Returning a dict (command, options, tool versions) makes the gate's
+        results reusable for an unchanged tree; None disables caching.
+        """
+        return None
+
     @abstractmethod
     def run(self, context: GateContext) -> GateResult:
         """
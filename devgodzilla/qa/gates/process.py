@@ -0,0 +1,151 @@
+"""
+DevGodzilla QA Gate Processes
+
+Runs gate tools (ruff, mypy, pytest, bandit, ...) so that the `GateRunner`
+can account for and stop them:
+
+- `run_command` is `subprocess.run(cmd, capture_output=True, text=True)` with
+  the tool in its own process group, reaped with `os.wait4` so its CPU time
+  (user + system, including reaped grandchildren) is known.
+- `GateProcesses` collects that CPU time for one gate run, and `kill()` ends
+  the gate's running tools when the runner gives up on the gate.
+"""
+
+import os
+import signal
+import subprocess
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterator, List, Optional, Set, Union
+
+_local = threading.local()
+
+_POLL_SECONDS = 0.02
+_MAX_POLL_SECONDS = 0.1
+# Output still buffered when the tool exits is drained for at most this long;
+# after that, descendants still holding the pipes are killed.
+_DRAIN_SECONDS = 1.0
+
+
+class GateProcesses:
+    """Tool processes started by one gate run, and the CPU time they used."""
+
+    def __init__(self) -> None:
+        self.cpu_seconds = 0.0
+        self.killed = False
+        self._running: Set[subprocess.Popen] = set()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def bind(self) -> Iterator["GateProcesses"]:
+        """Attribute `run_command` calls on this thread to this gate run."""
+        previous = getattr(_local, "processes", None)
+        _local.processes = self
+        try:
+            yield self
+        finally:
+            _local.processes = previous
+
+    def kill(self) -> None:
+        """Kill every running tool (and its process group); later tools are killed on start."""
+        with self._lock:
+            self.killed = True
+            running = list(self._running)
+        for proc in running:
+            _kill_group(proc)
+
+    def _started(self, proc: subprocess.Popen) -> None:
+        with self._lock:
+            self._running.add(proc)
+            killed = self.killed
+        if killed:
+            _kill_group(proc)
+
+    def _finished(self, proc: subprocess.Popen, cpu_seconds: float) -> None:
+        with self._lock:
+            self._running.discard(proc)
+            self.cpu_seconds += cpu_seconds
+
+
+def _kill_group(proc: subprocess.Popen) -> None:
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def run_command(
+    cmd: List[str],
+    *,
+    cwd: Optional[Union[str, Path]] = None,
+    timeout: Optional[float] = None,
+) -> subprocess.CompletedProcess:
+    """
+    Run a gate tool and capture its text output.
+
+    Raises `subprocess.TimeoutExpired` after `timeout` seconds (the tool's
+    process group is killed first) and `FileNotFoundError` when the tool is
+    not installed, like `subprocess.run`.
+    """
+    if not hasattr(os, "wait4"):
+        return subprocess.run(cmd, cwd=cwd, capture_output=True, text=True, timeout=timeout)
+
+    processes: Optional[GateProcesses] = getattr(_local, "processes", None)
+    proc = subprocess.Popen(
+        cmd,
+        cwd=cwd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        start_new_session=True,
+    )
+    output: List[str] = ["", ""]
+
+    def _read(stream: IO[str], index: int) -> None:
+        with stream:
+            output[index] = stream.read()
+
+    readers = [
+        threading.Thread(target=_read, args=(stream, index), daemon=True)
+        for index, stream in enumerate((proc.stdout, proc.stderr))
+    ]
+    for reader in readers:
+        reader.start()
+    if processes is not None:
+        processes._started(proc)
+
+    cpu_seconds = 0.0
+    timed_out = False
+    try:
+        deadline = time.monotonic() + timeout if timeout else None
+        delay = _POLL_SECONDS
+        while True:
+            pid, status, usage = os.wait4(proc.pid, os.WNOHANG)
+            if pid:
+                break
+            if deadline is not None and not timed_out and time.monotonic() >= deadline:
+                timed_out = True
+                _kill_group(proc)
+            time.sleep(delay)
+            delay = min(delay * 2, _MAX_POLL_SECONDS)
+        # Reaped here, so Popen must not wait for it again.
+        proc.returncode = os.waitstatus_to_exitcode(status)
+        cpu_seconds = usage.ru_utime + usage.ru_stime
+
+        drain_until = time.monotonic() + _DRAIN_SECONDS
+        for reader in readers:
+            reader.join(timeout=max(0.0, drain_until - time.monotonic()))
+        if any(reader.is_alive() for reader in readers):
+            _kill_group(proc)
+            for reader in readers:
+                reader.join()
+    finally:
+        if processes is not None:
+            processes._finished(proc, cpu_seconds)
+
+    if timed_out:
+        raise subprocess.TimeoutExpired(cmd, timeout, output=output[0], stderr=output[1])
+    return subprocess.CompletedProcess(cmd, proc.returncode, output[0], output[1])
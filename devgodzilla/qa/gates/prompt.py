@@ -2,18 +2,24 @@
 Prompt-driven QA Gate
 
 Runs the quality-validator prompt through the configured QA engine.
+The prompt is assembled through a `PromptCache` when one is given, so QA
+re-runs over unchanged protocol files and git state reuse it. Git status and
+the last commit come from the step's change manifest
+(`GateContext.metadata["changes"]`) when one was recorded; git is only run
+without one.
 """
 
 from __future__ import annotations
 
-import hashlib
 import re
 import subprocess
 import time
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 from devgodzilla.engines.interface import Engine, EngineRequest, EngineResult, SandboxMode
+from devgodzilla.prompt_cache import AssembledPrompt, PromptCache
+from devgodzilla.qa.changeset import manifest_status
 from devgodzilla.qa.gates.interface import Gate, GateContext, GateResult, GateVerdict, Finding
 
 
@@ -25,11 +31,13 @@ class PromptQAGate(Gate):
         prompt_path: Path,
         model: Optional[str] = None,
         timeout_seconds: Optional[int] = None,
+        prompt_cache: Optional[PromptCache] = None,
     ) -> None:
         self._engine = engine
         self._prompt_path = prompt_path
         self._model = model
         self._timeout_seconds = timeout_seconds
+        self._prompt_cache = prompt_cache or PromptCache(max_entries=0)
 
     @property
     def gate_id(self) -> str:
@@ -47,8 +55,9 @@ class PromptQAGate(Gate):
         if not self._engine.check_availability():
             return self.error(f"QA engine unavailable: {self._engine.metadata.id}")
 
-        prompt_text = self._build_prompt(context)
-        prompt_hash = hashlib.sha256(prompt_text.encode("utf-8")).hexdigest()[:16]
+        prompt = self._build_prompt(context)
+        prompt_text = prompt.text
+        prompt_hash = prompt.prompt_hash[:16]
 
         req = EngineRequest(
             project_id=context.project_id or 0,
@@ -69,6 +78,7 @@ class PromptQAGate(Gate):
             {
                 "prompt_path": str(self._prompt_path),
                 "prompt_hash": prompt_hash,
+                "prompt_cached": prompt.cached,
                 "engine_id": self._engine.metadata.id,
                 "model": req.model or self._engine.metadata.default_model,
                 "report_text": result.stdout.strip(),
@@ -76,52 +86,56 @@ class PromptQAGate(Gate):
         )
         return gate_result
 
-    def _build_prompt(self, context: GateContext) -> str:
-        prompt_header = self._prompt_path.read_text(encoding="utf-8")
+    def _build_prompt(self, context: GateContext) -> AssembledPrompt:
         protocol_root = Path(context.protocol_root) if context.protocol_root else None
         step_name = context.step_name or ""
 
-        plan_text = self._read_file(protocol_root / "plan.md") if protocol_root else ""
-        context_text = self._read_file(protocol_root / "context.md") if protocol_root else ""
-        log_text = self._read_file(protocol_root / "log.md") if protocol_root else ""
-        step_text = ""
-        if protocol_root and step_name:
-            step_text = self._read_file(protocol_root / f"{step_name}.md")
-
-        git_status = self._git_cmd(["git", "status", "--porcelain"], context.workspace_root)
-        last_commit = self._git_cmd(["git", "log", "-1", "--pretty=%B"], context.workspace_root)
-
-        sections = [
-            prompt_header,
-            "",
-            "## plan.md",
-            plan_text or "MISSING",
-            "",
-            "## context.md",
-            context_text or "MISSING",
-            "",
-            "## log.md",
-            log_text or "MISSING",
-            "",
-            f"## {step_name or 'step'}.md",
-            step_text or "MISSING",
-            "",
-            "## git status",
-            git_status or "MISSING",
-            "",
-            "## last commit",
-            last_commit or "MISSING",
-        ]
-        return "\n".join(sections).strip()
-
-    @staticmethod
-    def _read_file(path: Path) -> str:
-        try:
-            if path.exists():
-                return path.read_text(encoding="utf-8")
-        except Exception:
-            pass
-        return ""
+        files = {
+            "header": self._prompt_path,
+            "plan": protocol_root / "plan.md" if protocol_root else None,
+            "context": protocol_root / "context.md" if protocol_root else None,
+            "log": protocol_root / "log.md" if protocol_root else None,
+            "step": protocol_root / f"{step_name}.md" if protocol_root and step_name else None,
+        }
+        # Git state is prompt content, so it is part of the cache key.
+        manifest = context.metadata.get("changes")
+        git_status = manifest_status(manifest)
+        if git_status is None:
+            git_status = self._git_cmd(["git", "status", "--porcelain"], context.workspace_root)
+            last_commit = self._git_cmd(["git", "log", "-1", "--pretty=%B"], context.workspace_root)
+        else:
+            last_commit = manifest.get("last_commit") or ""
+        values = {
+            "step_name": step_name,
+            "git_status": git_status,
+            "last_commit": last_commit,
+        }
+
+        def render(texts: Dict[str, Optional[str]]) -> str:
+            sections = [
+                texts["header"] or "",
+                "",
+                "## plan.md",
+                texts["plan"] or "MISSING",
+                "",
+                "## context.md",
+                texts["context"] or "MISSING",
+                "",
+                "## log.md",
+                texts["log"] or "MISSING",
+                "",
+                f"## {step_name or 'step'}.md",
+                texts["step"] or "MISSING",
+                "",
+                "## git status",
+                values["git_status"] or "MISSING",
+                "",
+                "## last commit",
+                values["last_commit"] or "MISSING",
+            ]
+            return "\n".join(sections).strip()
+
+        return self._prompt_cache.assemble("qa", files, render, values=values)
 
     @staticmethod
     def _git_cmd(cmd: list[str], cwd: str) -> str:
@@ -0,0 +1,204 @@
+"""
+DevGodzilla QA Gate Runner
+
+Runs a set of QA gates concurrently on a thread pool.
+
+- Gates start as soon as the gates they `depends_on` have finished; a gate
+  whose dependency did not pass is skipped.
+- With `short_circuit`, `fast` gates run first and a failing fast gate skips
+  the remaining (expensive) gates, since the QA verdict is already FAIL.
+- Each gate is bounded by its own `timeout` (plus a grace period) and the
+  whole run by `deadline_seconds`; overdue gates are reported as errors and
+  their tool processes are killed.
+- Each result records `wall_seconds` and `cpu_seconds` (CPU time of the tools
+  the gate ran through `process.run_command`) in `GateResult.metadata`.
+- With a `GateResultCache`, gates whose fingerprint and workspace tree match
+  a stored entry return the cached result instead of running.
+"""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, List, Optional, Set
+
+from devgodzilla.logging import get_logger
+from devgodzilla.qa.gates.cache import GateResultCache
+from devgodzilla.qa.gates.interface import Gate, GateContext, GateResult
+from devgodzilla.qa.gates.process import GateProcesses
+
+logger = get_logger(__name__)
+
+
+class GateRunner:
+    """
+    Concurrent gate executor used by `QualityService.run_qa`.
+
+    Example:
+        runner = GateRunner(max_workers=4, deadline_seconds=900)
+        results = runner.run([LintGate(), TestGate(), CoverageGate()], context)
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: int = 4,
+        deadline_seconds: Optional[float] = None,
+        short_circuit: bool = True,
+        timeout_grace_seconds: float = 5.0,
+        cache: Optional[GateResultCache] = None,
+    ) -> None:
+        self.max_workers = max(1, int(max_workers))
+        self.deadline_seconds = deadline_seconds if deadline_seconds and deadline_seconds > 0 else None
+        self.short_circuit = short_circuit
+        self.timeout_grace_seconds = max(0.0, float(timeout_grace_seconds))
+        self.cache = cache
+
+    def run(self, gates: List[Gate], context: GateContext) -> List[GateResult]:
+        """Run gates and return their results in the order the gates were given."""
+        results: Dict[str, GateResult] = {}
+        by_id: Dict[str, Gate] = {}
+        for gate in gates:
+            if gate.gate_id in by_id:
+                continue
+            if not gate.enabled:
+                results[gate.gate_id] = gate.skip("Gate disabled")
+                continue
+            by_id[gate.gate_id] = gate
+
+        deps: Dict[str, Set[str]] = {
+            gate_id: {d for d in gate.depends_on if d in by_id and d != gate_id}
+            for gate_id, gate in by_id.items()
+        }
+        # Fast gates with no dependencies form the short-circuit wave.
+        fast_wave = {
+            gate_id for gate_id, gate in by_id.items()
+            if self.short_circuit and gate.fast and not deps[gate_id]
+        }
+
+        started_at = time.monotonic()
+        if self.cache is not None:
+            self.cache.prime(list(by_id.values()), context)
+        deadline = started_at + self.deadline_seconds if self.deadline_seconds else None
+        pending: List[str] = [g for g in by_id if g not in results]
+        running: Dict[Future, str] = {}
+        gate_deadlines: Dict[str, float] = {}
+        gate_starts: Dict[str, float] = {}
+        gate_processes: Dict[str, GateProcesses] = {}
+        halted_reason: Optional[str] = None
+
+        pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="devgodzilla-qa-gate")
+        try:
+            while pending or running:
+                if halted_reason is None and fast_wave and all(g in results for g in fast_wave):
+                    failed = [g for g in fast_wave if results[g].blocking]
+                    if failed:
+                        halted_reason = f"Short-circuited by failing {failed[0]} gate"
+                    fast_wave = set()
+
+                if halted_reason is not None:
+                    for gate_id in pending:
+                        results[gate_id] = by_id[gate_id].skip(halted_reason)
+                    pending = []
+
+                for gate_id in list(pending):
+                    if len(running) >= self.max_workers:
+                        break
+                    if fast_wave and gate_id not in fast_wave:
+                        continue
+                    if any(d not in results for d in deps[gate_id]):
+                        continue
+                    pending.remove(gate_id)
+                    failed_deps = [d for d in sorted(deps[gate_id]) if not results[d].passed]
+                    if failed_deps:
+                        results[gate_id] = by_id[gate_id].skip(f"Dependency {failed_deps[0]} did not pass")
+                        continue
+                    gate = by_id[gate_id]
+                    if self.cache is not None:
+                        cached = self.cache.lookup(gate, context)
+                        if cached is not None:
+                            results[gate_id] = cached
+                            continue
+                    now = time.monotonic()
+                    gate_starts[gate_id] = now
+                    timeout = getattr(gate, "timeout", None)
+                    if isinstance(timeout, (int, float)) and not isinstance(timeout, bool) and timeout > 0:
+                        gate_deadlines[gate_id] = now + float(timeout) + self.timeout_grace_seconds
+                    gate_processes[gate_id] = GateProcesses()
+                    running[pool.submit(self._run_gate, gate, context, gate_processes[gate_id])] = gate_id
+
+                if not running:
+                    if pending and not any(
+                        all(d in results for d in deps[g]) for g in pending
+                    ) and not fast_wave:
+                        for gate_id in pending:
+                            results[gate_id] = by_id[gate_id].error("Unresolvable gate dependencies")
+                        pending = []
+                    continue
+
+                wait_until = min(
+                    [t for t in (deadline, *(gate_deadlines.get(g) for g in running.values())) if t is not None],
+                    default=None,
+                )
+                timeout = None if wait_until is None else max(0.0, wait_until - time.monotonic())
+                done, _ = wait(list(running), timeout=timeout, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    gate_id = running.pop(future)
+                    results[gate_id] = future.result()
+                    if self.cache is not None:
+                        self.cache.store(by_id[gate_id], context, results[gate_id])
+
+                now = time.monotonic()
+                for future, gate_id in list(running.items()):
+                    gate_deadline = gate_deadlines.get(gate_id)
+                    if deadline is not None and now >= deadline:
+                        message = f"QA deadline of {self.deadline_seconds:g}s exceeded"
+                    elif gate_deadline is not None and now >= gate_deadline:
+                        message = f"Gate timed out after {getattr(by_id[gate_id], 'timeout')}s"
+                    else:
+                        continue
+                    running.pop(future)
+                    future.cancel()
+                    gate_processes[gate_id].kill()
+                    result = by_id[gate_id].error(message)
+                    result.metadata = {"wall_seconds": round(now - gate_starts[gate_id], 3), "timed_out": True}
+                    results[gate_id] = result
+                    logger.warning(
+                        "qa_gate_timed_out",
+                        extra={"gate_id": gate_id, "step_run_id": context.step_run_id, "reason": message},
+                    )
+
+                if deadline is not None and now >= deadline and pending:
+                    halted_reason = f"QA deadline of {self.deadline_seconds:g}s exceeded"
+        finally:
+            # Overdue gates were killed above; this also stops tools of gates
+            # still running if the loop was left early.
+            for future, gate_id in running.items():
+                gate_processes[gate_id].kill()
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        ordered: List[GateResult] = []
+        seen: Set[str] = set()
+        for gate in gates:
+            if gate.gate_id in results and gate.gate_id not in seen:
+                seen.add(gate.gate_id)
+                ordered.append(results[gate.gate_id])
+        return ordered
+
+    @staticmethod
+    def _run_gate(gate: Gate, context: GateContext, processes: GateProcesses) -> GateResult:
+        wall_start = time.monotonic()
+        try:
+            with processes.bind():
+                result = gate.run(context)
+        except Exception as exc:
+            result = gate.error(str(exc))
+        wall = time.monotonic() - wall_start
+        result.metadata = {
+            **(result.metadata or {}),
+            "wall_seconds": round(wall, 3),
+            "cpu_seconds": round(processes.cpu_seconds, 3),
+        }
+        if result.duration_seconds is None:
+            result.duration_seconds = wall
+        return result
+
@@ -11,6 +11,9 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from devgodzilla.qa.changeset import select_paths
+from devgodzilla.qa.gates.cache import tool_version
+from devgodzilla.qa.gates.process import run_command
 from devgodzilla.qa.gates.interface import (
     Finding,
     Gate,
@@ -64,6 +67,17 @@ class SecurityGate(Gate):
     def gate_name(self) -> str:
         return "Security Gate"
 
+    def cache_fingerprint(self, context: GateContext) -> Optional[Dict[str, Any]]:
+        return {
+            "fail_on_high": self.fail_on_high,
+            "fail_on_medium": self.fail_on_medium,
+            "exclude_dirs": sorted(self.exclude_dirs),
+            "timeout": self.timeout,
+            "bandit": tool_version("bandit"),
+            "npm": tool_version("npm"),
+            "python_paths": self._python_paths(Path(context.workspace_root), context.changed_files),
+        }
+
     def run(self, context: GateContext) -> GateResult:
         """Run security scan on workspace."""
         start = time.time()
@@ -79,8 +93,9 @@ class SecurityGate(Gate):
         errors: List[str] = []
         
         # Run bandit for Python
-        if has_python:
-            python_findings, python_error = self._run_bandit(workspace_path)
+        python_paths = self._python_paths(workspace_path, context.changed_files)
+        if has_python and python_paths != []:
+            python_findings, python_error = self._run_bandit(workspace_path, python_paths)
             findings.extend(python_findings)
             if python_error:
                 errors.append(python_error)
@@ -146,25 +161,34 @@ class SecurityGate(Gate):
         )
         return self.run(gate_context)
     
-    def _run_bandit(self, workspace: Path) -> tuple[List[SecurityFinding], Optional[str]]:
-        """Run bandit security scanner for Python."""
+    def _python_paths(self, workspace: Path, changed_files: Optional[List[str]]) -> Optional[List[str]]:
+        """Changed Python files outside excluded dirs, or None for a recursive scan."""
+        paths = select_paths(workspace, changed_files, (".py",))
+        if paths is None:
+            return None
+        excluded = set(self.exclude_dirs)
+        return [p for p in paths if not excluded.intersection(Path(p).parts)]
+
+    def _run_bandit(
+        self,
+        workspace: Path,
+        paths: Optional[List[str]] = None,
+    ) -> tuple[List[SecurityFinding], Optional[str]]:
+        """Run bandit security scanner for Python (on `paths` only, if given)."""
         try:
-            exclude = ",".join(self.exclude_dirs)
+            if paths is None:
+                exclude = ",".join(self.exclude_dirs)
+                targets = ["-r", str(workspace), "--exclude", exclude]
+            else:
+                targets = [str(workspace / p) for p in paths]
             cmd = [
                 "bandit",
-                "-r",
-                str(workspace),
+                *targets,
                 "-f", "json",
-                "--exclude", exclude,
                 "-ll",  # Only medium and high severity
             ]
             
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=self.timeout,
-            )
+            result = run_command(cmd, timeout=self.timeout)
             
             # Bandit returns 1 if issues found, 0 if clean
             if result.stdout:
@@ -200,13 +224,7 @@ class SecurityGate(Gate):
         try:
             cmd = ["npm", "audit", "--json"]
             
-            result = subprocess.run(
-                cmd,
-                cwd=workspace,
-                capture_output=True,
-                text=True,
-                timeout=self.timeout,
-            )
+            result = run_command(cmd, cwd=workspace, timeout=self.timeout)
             
             if result.stdout:
                 try:
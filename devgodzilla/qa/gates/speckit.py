@@ -24,6 +24,10 @@ class SpecKitChecklistGate(Gate):
     def gate_name(self) -> str:
         return "SpecKit Checklist"
 
+    @property
+    def fast(self) -> bool:
+        return True
+
     def has_checklist(self, context: GateContext) -> bool:
         return self._resolve_checklist_path(context).exists()
 
@@ -6,9 +6,13 @@ Provides runtime health checks and agent capability discovery.
 """
 
 import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field, replace
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 try:
     import yaml
@@ -56,6 +60,27 @@ class HealthCheckResult:
     version: Optional[str] = None
     error: Optional[str] = None
     response_time_ms: Optional[float] = None
+    checked_at: Optional[datetime] = None
+    stale: bool = False
+
+
+# Health results are shared across the per-request AgentConfigService
+# instances. Keyed by (agent_id, kind, command) so a reconfigured agent is
+# probed afresh; values are (monotonic probe time, result).
+_HealthKey = Tuple[str, str, Optional[str]]
+_health_cache: Dict[_HealthKey, Tuple[float, HealthCheckResult]] = {}
+_health_refreshing: Set[_HealthKey] = set()
+_health_lock = threading.Lock()
+
+
+def _health_key(agent: "AgentConfig") -> _HealthKey:
+    return (agent.id, agent.kind, agent.command)
+
+
+def clear_health_cache() -> None:
+    """Drop all cached agent health results."""
+    with _health_lock:
+        _health_cache.clear()
 
 
 class AgentConfigService(Service):
@@ -598,8 +623,13 @@ class AgentConfigService(Service):
             return {"id": prompt_id, "path": prompt_id}
         return None
     
-    def check_health(self, agent_id: str) -> HealthCheckResult:
-        """Check if an agent is available."""
+    def check_health(self, agent_id: str, *, refresh: bool = False) -> HealthCheckResult:
+        """
+        Check if an agent is available.
+
+        Results are cached (see `check_all_health`); pass `refresh=True` to
+        probe immediately.
+        """
         agent = self.get_agent(agent_id)
         if not agent:
             return HealthCheckResult(
@@ -614,22 +644,86 @@ class AgentConfigService(Service):
                 available=False,
                 error="Agent is disabled",
             )
-        
+
+        if not refresh:
+            cached = self._cached_health(agent)
+            if cached is not None:
+                if cached.stale:
+                    self._refresh_in_background([agent])
+                return cached
+        return self._probe_health(agent)
+
+    def _health_ttls(self) -> Tuple[float, float]:
+        config = self.config
+        return (
+            float(getattr(config, "agent_health_ttl_seconds", 60.0) or 0),
+            float(getattr(config, "agent_health_negative_ttl_seconds", 10.0) or 0),
+        )
+
+    def _cached_health(self, agent: AgentConfig) -> Optional[HealthCheckResult]:
+        """Cached result for `agent`, flagged `stale` once past its TTL."""
+        with _health_lock:
+            hit = _health_cache.get(_health_key(agent))
+        if hit is None:
+            return None
+        probed_at, result = hit
+        ttl, negative_ttl = self._health_ttls()
+        ttl = ttl if result.available else negative_ttl
+        if ttl <= 0:
+            return None
+        return replace(result, stale=time.monotonic() - probed_at >= ttl)
+
+    def _probe_health(self, agent: AgentConfig) -> HealthCheckResult:
+        """Run the real probe for `agent` and store the result."""
         if agent.is_cli:
-            return self._check_cli_health(agent)
+            result = self._check_cli_health(agent)
         elif agent.is_api:
-            return self._check_api_health(agent)
+            result = self._check_api_health(agent)
         else:
-            return HealthCheckResult(
-                agent_id=agent_id,
+            result = HealthCheckResult(
+                agent_id=agent.id,
                 available=False,
                 error=f"Health check not supported for kind: {agent.kind}",
             )
+        result.checked_at = datetime.now(timezone.utc)
+        with _health_lock:
+            _health_cache[_health_key(agent)] = (time.monotonic(), result)
+        return result
+
+    def _probe_many(self, agents: List[AgentConfig]) -> List[HealthCheckResult]:
+        if len(agents) <= 1:
+            return [self._probe_health(agent) for agent in agents]
+        max_parallel = int(getattr(self.config, "agent_health_max_parallel", 8) or 1)
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(max_parallel, len(agents))),
+            thread_name_prefix="devgodzilla-agent-health",
+        ) as pool:
+            return list(pool.map(self._probe_health, agents))
+
+    def _refresh_in_background(self, agents: List[AgentConfig]) -> None:
+        """Re-probe stale agents on a daemon thread; concurrent callers share it."""
+        with _health_lock:
+            pending = [a for a in agents if _health_key(a) not in _health_refreshing]
+            _health_refreshing.update(_health_key(a) for a in pending)
+        if not pending:
+            return
+
+        def run() -> None:
+            try:
+                self._probe_many(pending)
+            except Exception as exc:
+                self.logger.warning(
+                    "agent_health_refresh_failed",
+                    extra=self.log_extra(error=str(exc)),
+                )
+            finally:
+                with _health_lock:
+                    _health_refreshing.difference_update(_health_key(a) for a in pending)
+
+        threading.Thread(target=run, name="devgodzilla-agent-health-refresh", daemon=True).start()
     
     def _check_cli_health(self, agent: AgentConfig) -> HealthCheckResult:
         """Check health of a CLI-based agent."""
-        import time
-        
         if not agent.command:
             return HealthCheckResult(
                 agent_id=agent.id,
@@ -692,13 +786,34 @@ class AgentConfigService(Service):
             error="API health checks not yet implemented",
         )
     
-    def check_all_health(self) -> List[HealthCheckResult]:
-        """Check health of all enabled agents."""
+    def check_all_health(self, *, refresh: bool = False) -> List[HealthCheckResult]:
+        """
+        Check health of all enabled agents.
+
+        Fresh cached results are returned as-is. Agents never probed (or all
+        of them, with `refresh=True`) are probed concurrently; expired
+        results are returned with `stale=True` while a background refresh
+        runs. Failures are cached for the shorter negative TTL.
+        """
         self.load_config()
-        results = []
-        for agent in self.list_agents(enabled_only=True):
-            results.append(self.check_health(agent.id))
-        return results
+        agents = self.list_agents(enabled_only=True)
+        results: Dict[str, HealthCheckResult] = {}
+        stale: List[AgentConfig] = []
+        if not refresh:
+            for agent in agents:
+                cached = self._cached_health(agent)
+                if cached is None:
+                    continue
+                results[agent.id] = cached
+                if cached.stale:
+                    stale.append(agent)
+
+        missing = [agent for agent in agents if agent.id not in results]
+        for agent, result in zip(missing, self._probe_many(missing)):
+            results[agent.id] = result
+        if stale:
+            self._refresh_in_background(stale)
+        return [results[agent.id] for agent in agents]
 
     def update_config(
         self,
@@ -104,13 +104,13 @@ class DiscoveryAgentService(Service):
                 error=f"Engine not registered: {e}",
             )
 
-        if not engine.check_availability():
+        if not registry.is_available(engine):
             # Try to find a fallback engine
             fallback_engines = ["dummy"]  # dummy always available for dev/testing
             for fallback_id in fallback_engines:
                 try:
                     fallback = registry.get(fallback_id)
-                    if fallback.check_availability():
+                    if registry.is_available(fallback):
                         logger.warning(
                             "discovery_engine_fallback",
                             extra={
@@ -0,0 +1,378 @@
+"""
+DevGodzilla Event Broker
+
+Process-wide fan-out of persisted events to streaming clients (SSE/WebSocket).
+
+A single tail loop reads new rows from the events table and keeps a bounded
+in-memory window indexed by id, protocol and project. Subscribers receive new
+events through per-subscriber asyncio queues; a reconnecting client whose
+`Last-Event-ID` is older than the window is replayed from the database, one
+page at a time and at most `max_replay_events` ids back from the tail (older
+history is skipped, newest kept).
+
+Database reads run on the shared `AsyncDatabase` executor, never on the event
+loop. The tail loop polls on an interval (to pick up events written by other
+processes such as Windmill workers) and is woken immediately when this
+process persists an event via `install_db_event_sink`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import threading
+from contextlib import aclosing
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, List, Optional, Protocol, Set
+
+from devgodzilla.db.async_database import AsyncDatabase, get_async_database
+from devgodzilla.events_catalog import event_type_variants
+from devgodzilla.logging import get_logger
+from devgodzilla.models.domain import Event
+
+logger = get_logger(__name__)
+
+
+class _EventSource(Protocol):
+    def list_events_since_id(
+        self,
+        *,
+        since_id: int,
+        limit: int = 200,
+        protocol_run_id: Optional[int] = None,
+        project_id: Optional[int] = None,
+        event_types: Optional[List[str]] = None,
+        categories: Optional[List[str]] = None,
+    ) -> List[Event]: ...
+
+    def list_recent_events(self, *, limit: int = 50, **kwargs: Any) -> List[Event]: ...
+
+
+_PAGE_SIZE = 500
+
+
+@dataclass(eq=False)
+class _Subscription:
+    protocol_run_id: Optional[int]
+    project_id: Optional[int]
+    event_types: Optional[Set[str]]
+    queue: "asyncio.Queue[Event]"
+    lagged: bool = False
+
+    def matches(self, event: Event) -> bool:
+        if self.protocol_run_id is not None and event.protocol_run_id != self.protocol_run_id:
+            return False
+        if self.project_id is not None and event.project_id != self.project_id:
+            return False
+        if self.event_types is not None and event.event_type not in self.event_types:
+            return False
+        return True
+
+
+@dataclass
+class _Window:
+    """Bounded, id-ordered window of recent events with secondary indexes."""
+
+    max_size: int
+    floor_id: int = 0  # every event with id > floor_id is (or was) in the window
+    ids: List[int] = field(default_factory=list)
+    by_id: Dict[int, Event] = field(default_factory=dict)
+    by_protocol: Dict[int, List[int]] = field(default_factory=dict)
+    by_project: Dict[int, List[int]] = field(default_factory=dict)
+
+    def append(self, event: Event) -> None:
+        if event.id in self.by_id or event.id <= self.floor_id:
+            return
+        self.ids.append(event.id)
+        self.by_id[event.id] = event
+        if event.protocol_run_id is not None:
+            self.by_protocol.setdefault(event.protocol_run_id, []).append(event.id)
+        if event.project_id is not None:
+            self.by_project.setdefault(event.project_id, []).append(event.id)
+        # Trim in chunks so eviction stays amortized O(1) per event.
+        if len(self.ids) > self.max_size + max(1, self.max_size // 10):
+            self._evict(len(self.ids) - self.max_size)
+
+    def _evict(self, count: int) -> None:
+        evicted, self.ids = self.ids[:count], self.ids[count:]
+        for event_id in evicted:
+            self.by_id.pop(event_id, None)
+        self.floor_id = evicted[-1]
+        for index in (self.by_protocol, self.by_project):
+            for key in list(index):
+                kept = index[key][bisect.bisect_right(index[key], self.floor_id):]
+                if kept:
+                    index[key] = kept
+                else:
+                    del index[key]
+
+    def since(self, since_id: int, sub: _Subscription) -> List[Event]:
+        if sub.protocol_run_id is not None:
+            candidates = self.by_protocol.get(sub.protocol_run_id, [])
+        elif sub.project_id is not None:
+            candidates = self.by_project.get(sub.project_id, [])
+        else:
+            candidates = self.ids
+        start = bisect.bisect_right(candidates, since_id)
+        return [e for e in (self.by_id[i] for i in candidates[start:]) if sub.matches(e)]
+
+
+class EventBroker:
+    """
+    Shared event tail with in-memory fan-out to async subscribers.
+
+    Usage:
+        broker = get_event_broker(db)
+        async for event in broker.stream(since_id=last_id, project_id=1):
+            if event is None:  # idle tick
+                ...
+    """
+
+    def __init__(
+        self,
+        db: _EventSource,
+        *,
+        window_size: int = 5000,
+        poll_interval_seconds: float = 0.5,
+        subscriber_queue_size: int = 1000,
+        max_replay_events: int = 10000,
+    ) -> None:
+        self.db = db
+        self.adb: AsyncDatabase = get_async_database(db)
+        self.poll_interval_seconds = poll_interval_seconds
+        self.max_replay_events = max(1, max_replay_events)
+        self.subscriber_queue_size = subscriber_queue_size
+        self._window = _Window(max_size=max(1, window_size))
+        self._last_id: Optional[int] = None
+        self._subscribers: Set[_Subscription] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._ready: Optional[asyncio.Event] = None
+        self._closed = False
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    async def _ensure_started(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # (Re)bind to the current loop, e.g. after a test client restarts the app.
+            self._loop = loop
+            self._wakeup = asyncio.Event()
+            self._ready = asyncio.Event()
+            self._subscribers = set()
+            self._task = None
+        if self._task is None or self._task.done():
+            # Created synchronously so concurrent subscribers share one tail loop.
+            self._closed = False
+            self._task = loop.create_task(self._tail_loop())
+        assert self._ready is not None
+        await self._ready.wait()
+
+    async def _init_cursor(self) -> None:
+        if self._last_id is None:
+            try:
+                recent = await self.adb.list_recent_events(limit=1)
+                self._last_id = recent[0].id if recent else 0
+            except Exception as exc:
+                logger.debug("event_broker_init_failed", extra={"error": str(exc)})
+                self._last_id = 0
+            self._window.floor_id = self._last_id
+        assert self._ready is not None
+        self._ready.set()
+
+    def notify(self) -> None:
+        """Wake the tail loop (thread-safe); called after this process persists an event."""
+        loop, wakeup = self._loop, self._wakeup
+        if loop is None or wakeup is None or loop.is_closed():
+            return
+        try:
+            loop.call_soon_threadsafe(wakeup.set)
+        except RuntimeError:
+            pass
+
+    async def close(self) -> None:
+        self._closed = True
+        for event in (self._wakeup, self._ready):
+            if event is not None:
+                event.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+        self._task = None
+
+    # ------------------------------------------------------------------
+    # Tail + fan-out
+    # ------------------------------------------------------------------
+
+    async def _tail_loop(self) -> None:
+        assert self._wakeup is not None
+        await self._init_cursor()
+        # `wait_for` can swallow a cancellation that races with the wakeup, so
+        # the loop also checks the closed flag set by `close()`.
+        while not self._closed:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            if self._closed or not self._subscribers:
+                continue
+            try:
+                await self._poll_once()
+            except Exception as exc:
+                logger.debug("event_broker_poll_failed", extra={"error": str(exc)})
+
+    async def _poll_once(self) -> None:
+        while True:
+            batch = await self.adb.list_events_since_id(since_id=self._last_id or 0, limit=_PAGE_SIZE)
+            for event in batch:
+                self._last_id = max(self._last_id or 0, event.id)
+                self._window.append(event)
+                self._fan_out(event)
+            if len(batch) < _PAGE_SIZE:
+                return
+
+    def _fan_out(self, event: Event) -> None:
+        for sub in list(self._subscribers):
+            if sub.lagged or not sub.matches(event):
+                continue
+            try:
+                sub.queue.put_nowait(event)
+            except asyncio.QueueFull:
+                # Slow consumer: drop its queue and let it catch up from the DB.
+                sub.lagged = True
+
+    # ------------------------------------------------------------------
+    # Subscribers
+    # ------------------------------------------------------------------
+
+    async def _backlog(self, since_id: int, sub: _Subscription) -> AsyncIterator[Event]:
+        if since_id >= (self._last_id or 0):
+            return
+        if since_id >= self._window.floor_id:
+            for event in self._window.since(since_id, sub):
+                yield event
+            return
+        async for event in self._replay_from_db(since_id, sub):
+            yield event
+
+    async def _replay_from_db(self, since_id: int, sub: _Subscription) -> AsyncIterator[Event]:
+        """Page events after `since_id` up to the tail, one batch in memory at a time."""
+        target = self._last_id or 0
+        cursor = max(since_id, target - self.max_replay_events)
+        if cursor > since_id:
+            logger.info(
+                "event_replay_truncated",
+                extra={"since_id": since_id, "replay_from_id": cursor, "max_replay_events": self.max_replay_events},
+            )
+        while cursor < target:
+            batch = await self.adb.list_events_since_id(
+                since_id=cursor,
+                limit=_PAGE_SIZE,
+                protocol_run_id=sub.protocol_run_id,
+                project_id=sub.project_id,
+                event_types=sorted(sub.event_types) if sub.event_types else None,
+            )
+            for event in batch:
+                yield event
+            if len(batch) < _PAGE_SIZE:
+                break
+            cursor = batch[-1].id
+
+    async def stream(
+        self,
+        *,
+        since_id: int = 0,
+        protocol_run_id: Optional[int] = None,
+        project_id: Optional[int] = None,
+        event_types: Optional[List[str]] = None,
+        idle_timeout_seconds: float = 0.5,
+    ) -> AsyncIterator[Optional[Event]]:
+        """
+        Yield events with id > since_id matching the filters, in id order.
+
+        Yields None whenever no event arrived within `idle_timeout_seconds` so
+        callers can emit heartbeats or re-check their own state.
+        """
+        await self._ensure_started()
+        variants: Optional[Set[str]] = None
+        if event_types:
+            variants = {v for t in event_types for v in event_type_variants(t)}
+        sub = _Subscription(
+            protocol_run_id=protocol_run_id,
+            project_id=project_id,
+            event_types=variants,
+            queue=asyncio.Queue(maxsize=self.subscriber_queue_size),
+        )
+        self._subscribers.add(sub)
+        self.notify()
+        last_id = max(0, int(since_id))
+        try:
+            async with aclosing(self._backlog(last_id, sub)) as backlog:
+                async for event in backlog:
+                    if event.id > last_id:
+                        last_id = event.id
+                        yield event
+            while True:
+                if sub.lagged:
+                    while not sub.queue.empty():
+                        sub.queue.get_nowait()
+                    sub.lagged = False
+                    async with aclosing(self._replay_from_db(last_id, sub)) as replay:
+                        async for event in replay:
+                            if event.id > last_id:
+                                last_id = event.id
+                                yield event
+                    continue
+                try:
+                    event = await asyncio.wait_for(sub.queue.get(), timeout=idle_timeout_seconds)
+                except asyncio.TimeoutError:
+                    yield None
+                    continue
+                if event.id > last_id:
+                    last_id = event.id
+                    yield event
+        finally:
+            self._subscribers.discard(sub)
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+
+# Global broker instance (one per process / database)
+_event_broker: Optional[EventBroker] = None
+_event_broker_lock = threading.Lock()
+
+
+def get_event_broker(db: _EventSource) -> EventBroker:
+    """Get or create the process-wide broker for `db`."""
+    global _event_broker
+    broker = _event_broker
+    if broker is None or broker.db is not db:
+        with _event_broker_lock:
+            broker = _event_broker
+            if broker is None or broker.db is not db:
+                broker = EventBroker(db)
+                _event_broker = broker
+    return broker
+
+
+def notify_event_broker() -> None:
+    """Wake the broker tail loop if a broker exists in this process."""
+    broker = _event_broker
+    if broker is not None:
+        broker.notify()
+
+
+def _reset_event_broker_for_tests() -> None:
+    """Reset the global event broker (tests only)."""
+    global _event_broker
+    with _event_broker_lock:
+        _event_broker = None
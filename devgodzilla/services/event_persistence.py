@@ -2,17 +2,35 @@
 DevGodzilla Event Persistence
 
 Binds the in-process EventBus (`devgodzilla.services.events`) to the database
-events table (`db.append_event`).
+events table.
+
+Durability modes:
+- `sync`: each event is written inside `EventBus.publish` (`db.append_event`).
+- `async`: events are queued and flushed by a background writer in multi-row
+  batches (`db.append_events`) on a size or time trigger.
+- `barrier`: like `async`, but the API flushes pending events before each HTTP
+  response (`flush_db_event_sink`) so clients read their own writes.
+
+Unless DEVGODZILLA_EVENT_PERSISTENCE_MODE is set, the API server uses
+`barrier` and every other process (CLI, Windmill worker) uses `sync`: those
+have no request boundary to flush at, so queued events would be lost if the
+process crashed.
 """
 
+
 from __future__ import annotations
 
+import atexit
 import dataclasses
+import threading
+import time
+from collections import OrderedDict, deque
 from datetime import datetime
-from typing import Any, Callable, Dict, Optional, Protocol, cast
+from typing import Any, Callable, Dict, List, Optional, Protocol, cast
 
 from devgodzilla.events_catalog import normalize_event_type
 from devgodzilla.logging import get_logger
+from devgodzilla.services.event_broker import notify_event_broker
 from devgodzilla.services.events import Event as BusEvent
 from devgodzilla.services.events import get_event_bus
 
@@ -30,6 +48,13 @@ class _EventDB(Protocol):
         project_id: Optional[int] = None,
     ) -> Any: ...
 
+    def append_events(self, events: List[Dict[str, Any]]) -> int: ...
+
+    def get_protocol_run(self, run_id: int) -> Any: ...
+
+
+EVENT_PERSISTENCE_MODES = ("sync", "async", "barrier")
+
 
 def _json_safe(value: Any) -> Any:
     if isinstance(value, datetime):
@@ -54,20 +79,249 @@ def _default_message(event: BusEvent) -> str:
     return " - ".join(pieces)
 
 
+class _ProjectCache:
+    """Small LRU mapping protocol_run_id -> project_id (a run never changes project)."""
+
+    def __init__(self, max_size: int = 1024) -> None:
+        self.max_size = max_size
+        self._items: "OrderedDict[int, Optional[int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, protocol_run_id: int) -> Any:
+        with self._lock:
+            if protocol_run_id not in self._items:
+                return _MISSING
+            self._items.move_to_end(protocol_run_id)
+            return self._items[protocol_run_id]
+
+    def put(self, protocol_run_id: int, project_id: Optional[int]) -> None:
+        with self._lock:
+            self._items[protocol_run_id] = project_id
+            self._items.move_to_end(protocol_run_id)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+
+_MISSING = object()
+
+
+class EventWriter:
+    """
+    Background writer that persists bus events in batches.
+
+    Events are buffered in a bounded in-memory queue and flushed with one
+    multi-row INSERT when `batch_size` events are pending, when
+    `flush_interval_seconds` has elapsed since the batch started, or when a
+    caller requests a flush. When the queue is full the publisher writes
+    synchronously instead of dropping the event.
+    """
+
+    def __init__(
+        self,
+        db_provider: Callable[[], _EventDB],
+        *,
+        mode: str = "async",
+        batch_size: int = 200,
+        flush_interval_seconds: float = 0.05,
+        max_queue_size: int = 10000,
+    ) -> None:
+        self.db_provider = db_provider
+        self.mode = mode
+        self.batch_size = max(1, int(batch_size))
+        self.flush_interval_seconds = max(0.0, float(flush_interval_seconds))
+        self.max_queue_size = max(1, int(max_queue_size))
+        self._buffer: "deque[tuple[_EventDB, Dict[str, Any]]]" = deque()
+        self._projects = _ProjectCache()
+        self._cond = threading.Condition()
+        self._enqueued = 0
+        self._written = 0
+        self._flush_wanted = False
+        self._stopped = False
+        self._thread: Optional[threading.Thread] = None
+
+    # ------------------------------------------------------------------
+    # Producer side
+    # ------------------------------------------------------------------
+
+    def resolve_project_id(self, protocol_run_id: Optional[int], project_id: Optional[int]) -> Optional[int]:
+        if protocol_run_id is None:
+            return project_id
+        if project_id is not None:
+            self._projects.put(protocol_run_id, project_id)
+            return project_id
+        cached = self._projects.get(protocol_run_id)
+        if cached is not _MISSING:
+            return cast(Optional[int], cached)
+        try:
+            resolved = self.db_provider().get_protocol_run(protocol_run_id).project_id
+        except Exception:
+            resolved = None
+        self._projects.put(protocol_run_id, resolved)
+        return resolved
+
+    def submit(self, row: Dict[str, Any]) -> None:
+        # Bind the target DB now so a later provider switch cannot redirect the event.
+        item = (self.db_provider(), row)
+        self._ensure_thread()
+        with self._cond:
+            self._enqueued += 1
+            if len(self._buffer) < self.max_queue_size:
+                self._buffer.append(item)
+                if len(self._buffer) == 1 or len(self._buffer) >= self.batch_size:
+                    self._cond.notify_all()
+                return
+        # Backpressure: never drop events, write this one inline.
+        self._write([item])
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Block until every event submitted so far is written. Returns False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            target = self._enqueued
+            while self._written < target:
+                self._flush_wanted = True
+                self._cond.notify_all()
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    @property
+    def pending(self) -> int:
+        with self._cond:
+            return self._enqueued - self._written
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Flush pending events and stop the writer thread."""
+        self.flush(timeout)
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+
+    # ------------------------------------------------------------------
+    # Writer thread
+    # ------------------------------------------------------------------
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._cond:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopped = False
+            self._thread = threading.Thread(target=self._run, name="devgodzilla-event-writer", daemon=True)
+            self._thread.start()
+
+    def _next_batch(self) -> Optional[List[tuple[_EventDB, Dict[str, Any]]]]:
+        with self._cond:
+            while not self._buffer and not self._stopped:
+                self._cond.wait()
+            if not self._buffer:
+                return None
+            deadline = time.monotonic() + self.flush_interval_seconds
+            while len(self._buffer) < self.batch_size and not (self._flush_wanted or self._stopped):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            count = min(len(self._buffer), self.batch_size)
+            batch = [self._buffer.popleft() for _ in range(count)]
+            if not self._buffer:
+                self._flush_wanted = False
+            return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            self._write(batch)
+
+    def _write(self, batch: List[tuple[_EventDB, Dict[str, Any]]]) -> None:
+        groups: Dict[int, tuple[_EventDB, List[Dict[str, Any]]]] = {}
+        for db, row in batch:
+            groups.setdefault(id(db), (db, []))[1].append(row)
+        try:
+            for db, rows in groups.values():
+                try:
+                    db.append_events(rows)
+                except Exception as exc:
+                    logger.warning(
+                        "event_persist_failed",
+                        extra={"count": len(rows), "error": str(exc)},
+                    )
+            notify_event_broker()
+        finally:
+            with self._cond:
+                self._written += len(batch)
+                self._cond.notify_all()
+
+
+_event_writer: Optional[EventWriter] = None
+
+
+def get_event_writer() -> Optional[EventWriter]:
+    """Return the background writer if the sink runs in `async`/`barrier` mode."""
+    return _event_writer
+
+
+def flush_db_event_sink(timeout: Optional[float] = 5.0) -> bool:
+    """Wait until queued events are persisted (no-op in `sync` mode)."""
+    writer = _event_writer
+    if writer is None:
+        return True
+    return writer.flush(timeout)
+
+
+def _event_row(event: BusEvent, protocol_run_id: Optional[int], project_id: Optional[int]) -> Dict[str, Any]:
+    payload = _json_safe(event)
+    return {
+        "protocol_run_id": protocol_run_id,
+        "project_id": project_id,
+        "step_run_id": cast(Optional[int], getattr(event, "step_run_id", None)),
+        "event_type": normalize_event_type(event.event_type),
+        "message": _default_message(event),
+        "metadata": cast(Dict[str, Any], payload) if isinstance(payload, dict) else {"event": payload},
+    }
+
+
 def install_db_event_sink(
     *,
     db_provider: Callable[[], _EventDB],
+    mode: str = "sync",
+    batch_size: int = 200,
+    flush_interval_seconds: float = 0.05,
+    max_queue_size: int = 10000,
 ) -> None:
     """
     Install a global EventBus handler that persists events into the DB.
 
     Idempotent: calling multiple times installs the sink only once per process.
+    `mode` selects the durability mode (see module docstring).
     """
+    global _event_writer
     bus = get_event_bus()
 
     if getattr(bus, "_db_sink_installed", False):
         return
 
+    mode = (mode or "sync").strip().lower()
+    if mode not in EVENT_PERSISTENCE_MODES:
+        raise ValueError(f"Unknown event persistence mode: {mode}")
+
+    writer: Optional[EventWriter] = None
+    if mode != "sync":
+        writer = EventWriter(
+            db_provider,
+            mode=mode,
+            batch_size=batch_size,
+            flush_interval_seconds=flush_interval_seconds,
+            max_queue_size=max_queue_size,
+        )
+        _event_writer = writer
+        atexit.register(writer.stop)
+
     def _persist(event: BusEvent) -> None:
         protocol_run_id = cast(Optional[int], getattr(event, "protocol_run_id", None))
         project_id = cast(Optional[int], getattr(event, "project_id", None))
@@ -75,21 +329,16 @@ def install_db_event_sink(
         # Require at least one of protocol_run_id or project_id
         if not protocol_run_id and not project_id:
             return
-            
-        step_run_id = cast(Optional[int], getattr(event, "step_run_id", None))
 
         try:
+            if writer is not None:
+                project_id = writer.resolve_project_id(protocol_run_id or None, project_id)
+                writer.submit(_event_row(event, protocol_run_id or None, project_id))
+                return
             db = db_provider()
-            payload = _json_safe(event)
-            normalized_type = normalize_event_type(event.event_type)
-            db.append_event(
-                protocol_run_id=protocol_run_id,
-                step_run_id=step_run_id,
-                project_id=project_id,
-                event_type=normalized_type,
-                message=_default_message(event),
-                metadata=cast(Dict[str, Any], payload) if isinstance(payload, dict) else {"event": payload},
-            )
+            row = _event_row(event, protocol_run_id, project_id)
+            db.append_event(**row)
+            notify_event_broker()
         except Exception as exc:  # pragma: no cover
             logger.warning(
                 "event_persist_failed",
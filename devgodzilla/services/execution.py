@@ -5,9 +5,10 @@ Service for executing protocol steps via AI coding engines.
 Coordinates repository setup, engine invocation, and QA triggering.
 """
 
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from devgodzilla.logging import get_logger
 from devgodzilla.models.domain import (
@@ -25,11 +26,22 @@ from devgodzilla.engines import (
     get_registry,
 )
 from devgodzilla.engines.artifacts import ArtifactWriter
+from devgodzilla.errors import GitCommandError
+from devgodzilla.prompt_cache import MISSING, AssembledPrompt, get_prompt_cache
+from devgodzilla.qa.changeset import (
+    CHANGED_FILES_ARTIFACT,
+    CHANGES_MANIFEST_ARTIFACT,
+    CHANGES_STATE_KEY,
+    MAX_MANIFEST_FILES,
+    capture_workspace_changes,
+    manifest_status,
+)
 from devgodzilla.spec import get_step_spec as get_step_spec_from_template, resolve_spec_path
 from devgodzilla.services.base import Service, ServiceContext
 from devgodzilla.services.agent_config import AgentConfigService
 from devgodzilla.services.events import get_event_bus, StepStarted, StepCompleted, StepFailed
 from devgodzilla.services.clarifier import ClarifierService
+from devgodzilla.services.git import GitService
 from devgodzilla.services.policy import PolicyService
 from devgodzilla.services.quality import QualityService
 
@@ -99,6 +111,11 @@ class StepResolution:
     step_name: Optional[str] = None
     spec_hash: Optional[str] = None
 
+    # Hash of prompt_text and cache key of its inputs (see prompt_cache)
+    prompt_hash: Optional[str] = None
+    prompt_key: Optional[str] = None
+    prompt_cached: bool = False
+
 
 class ExecutionService(Service):
     """
@@ -141,6 +158,7 @@ class ExecutionService(Service):
         job_id: Optional[str] = None,
         engine_id: Optional[str] = None,
         model: Optional[str] = None,
+        isolated: bool = False,
     ) -> ExecutionResult:
         """
         Execute a step.
@@ -150,6 +168,8 @@ class ExecutionService(Service):
             job_id: Optional job ID for tracking
             engine_id: Override engine ID
             model: Override model
+            isolated: Run a writing step in its own worktree (other steps of
+                the protocol may be writing to its workspace concurrently)
             
         Returns:
             ExecutionResult with execution details
@@ -236,6 +256,7 @@ class ExecutionService(Service):
         try:
             # Resolve execution context
             resolution = self._resolve_step(step, run, project, engine_id, model)
+            self._record_prompt(step_run_id, resolution)
             
             # Get engine
             registry = get_registry()
@@ -254,7 +275,7 @@ class ExecutionService(Service):
 
             availability_error = None
             try:
-                available = engine.check_availability()
+                available = registry.is_available(engine)
             except Exception as exc:
                 available = False
                 availability_error = str(exc)
@@ -277,22 +298,25 @@ class ExecutionService(Service):
             if resolution.model is None:
                 resolution.model = engine.metadata.default_model
             
-            # Build request
-            request = EngineRequest(
-                project_id=project.id,
-                protocol_run_id=run.id,
-                step_run_id=step_run_id,
-                model=resolution.model,
-                prompt_text=resolution.prompt_text,
-                prompt_files=[str(resolution.prompt_path)] if resolution.prompt_path else [],
-                working_dir=str(resolution.workdir),
-                sandbox=resolution.sandbox,
-                timeout=resolution.timeout or self.default_timeout,
-                extra={"job_id": job_id},
-            )
-            
-            # Execute
-            engine_result = engine.execute(request)
+            with self._step_workspace(step, run, resolution, isolated=isolated):
+                # Build request
+                request = EngineRequest(
+                    project_id=project.id,
+                    protocol_run_id=run.id,
+                    step_run_id=step_run_id,
+                    model=resolution.model,
+                    prompt_text=resolution.prompt_text,
+                    prompt_files=[str(resolution.prompt_path)] if resolution.prompt_path else [],
+                    working_dir=str(resolution.workdir),
+                    sandbox=resolution.sandbox,
+                    timeout=resolution.timeout or self.default_timeout,
+                    stdout_path=str(self._artifacts_dir(resolution, step_run_id) / "stdout.log"),
+                    stderr_path=str(self._artifacts_dir(resolution, step_run_id) / "stderr.log"),
+                    extra={"job_id": job_id},
+                )
+
+                engine_result = engine.execute(request)
+                outputs_written = self._capture_outputs(step, run, engine, engine_result, resolution)
             
             # Handle result
             result = self._handle_result(
@@ -301,6 +325,7 @@ class ExecutionService(Service):
                 engine,
                 engine_result,
                 resolution,
+                outputs_written,
             )
             
             return result
@@ -418,7 +443,7 @@ class ExecutionService(Service):
             step_prompt_path = protocol_root / f"{step.step_name}.md"
 
         # Build prompt
-        prompt_text = self._build_prompt(
+        prompt = self._build_prompt(
             step,
             protocol_root,
             workspace_root,
@@ -427,23 +452,29 @@ class ExecutionService(Service):
         )
         prompt_path = step_prompt_path
         
-        # Determine timeout
+        # Determine timeout and sandbox
         timeout = None
+        sandbox = SandboxMode.WORKSPACE_WRITE
         if step_spec:
             timeout = step_spec.get("timeout_seconds")
+            if step_spec.get("sandbox"):
+                sandbox = SandboxMode(step_spec["sandbox"])
         
         return StepResolution(
             engine_id=resolved_engine,
             model=resolved_model,
-            prompt_text=prompt_text,
+            prompt_text=prompt.text,
             prompt_path=prompt_path if prompt_path.exists() else None,
             prompt_version=None,
             workdir=workspace_root,
             protocol_root=protocol_root,
             workspace_root=workspace_root,
-            sandbox=SandboxMode.WORKSPACE_WRITE,
+            sandbox=sandbox,
             timeout=timeout,
             step_name=step.step_name,
+            prompt_hash=prompt.prompt_hash[:16],
+            prompt_key=prompt.key,
+            prompt_cached=prompt.cached,
         )
 
     def _get_step_spec(
@@ -466,27 +497,61 @@ class ExecutionService(Service):
         *,
         step_prompt_path: Optional[Path] = None,
         prompt_template_path: Optional[Path] = None,
-    ) -> str:
-        """Build execution prompt for step."""
-        parts = []
-        
-        # Include prompt template if assigned
-        if prompt_template_path and prompt_template_path.exists():
-            parts.append(prompt_template_path.read_text(encoding="utf-8"))
-
-        # Include plan if available
-        plan_path = protocol_root / "plan.md"
-        if plan_path.exists():
-            parts.append(f"# Plan\n\n{plan_path.read_text(encoding='utf-8')}")
-        
-        # Include step file if available
+    ) -> AssembledPrompt:
+        """
+        Build execution prompt for step.
+
+        Served from the prompt cache while the template, plan and step file
+        contents are unchanged (e.g. on retries).
+        """
+        cache = get_prompt_cache()
         step_path = step_prompt_path or (protocol_root / f"{step.step_name}.md")
-        if step_path.exists():
-            parts.append(f"# Task\n\n{step_path.read_text(encoding='utf-8')}")
-        elif step.summary:
-            parts.append(f"# Task\n\n{step.summary}")
-        
-        return "\n\n---\n\n".join(parts) if parts else f"Execute step: {step.step_name}"
+        files = {
+            "template": prompt_template_path,
+            "plan": protocol_root / "plan.md",
+            "step": step_path,
+        }
+        values: Dict[str, Any] = {"step_name": step.step_name}
+        # The summary only stands in for a missing step file.
+        if cache.fingerprint(step_path) == MISSING:
+            values["summary"] = step.summary or None
+
+        def render(texts: Dict[str, Optional[str]]) -> str:
+            parts = []
+
+            # Include prompt template if assigned
+            if texts["template"] is not None:
+                parts.append(texts["template"])
+
+            # Include plan if available
+            if texts["plan"] is not None:
+                parts.append(f"# Plan\n\n{texts['plan']}")
+
+            # Include step file if available
+            if texts["step"] is not None:
+                parts.append(f"# Task\n\n{texts['step']}")
+            elif values.get("summary"):
+                parts.append(f"# Task\n\n{values['summary']}")
+
+            return "\n\n---\n\n".join(parts) if parts else f"Execute step: {step.step_name}"
+
+        return cache.assemble("exec", files, render, values=values)
+
+    def _record_prompt(self, step_run_id: int, resolution: StepResolution) -> None:
+        """Store the prompt hash on the step run so identical invocations can be matched."""
+        try:
+            runtime_state = dict(self.db.get_step_run(step_run_id).runtime_state or {})
+            runtime_state["prompt"] = {
+                "hash": resolution.prompt_hash,
+                "key": resolution.prompt_key,
+                "cached": resolution.prompt_cached,
+            }
+            self.db.update_step_run(step_run_id, runtime_state=runtime_state)
+        except Exception as exc:
+            self.logger.warning(
+                "prompt_hash_record_failed",
+                extra=self.log_extra(step_run_id=step_run_id, error=str(exc)),
+            )
 
     def _fail_step_pre_execution(
         self,
@@ -516,20 +581,66 @@ class ExecutionService(Service):
             error=error,
         )
 
-    def _handle_result(
+    @contextmanager
+    def _step_workspace(
+        self,
+        step: StepRun,
+        run: ProtocolRun,
+        resolution: StepResolution,
+        *,
+        isolated: bool,
+    ) -> Iterator[None]:
+        """
+        Point an isolated writing step at its own worktree for the duration of the block.
+
+        The step runs and its changes are captured in the step worktree, so its
+        manifest lists only its own edits; the changes are then applied to the
+        protocol workspace. When they no longer apply, the step fails and its
+        worktree is kept for inspection.
+        """
+        workspace_root, workdir = resolution.workspace_root, resolution.workdir
+        if (
+            not isolated
+            or resolution.sandbox == SandboxMode.READ_ONLY
+            or not (workspace_root / ".git").exists()
+        ):
+            yield
+            return
+
+        git = GitService(self.context)
+        step_worktree = git.create_step_worktree(workspace_root, step.id, run.base_branch)
+        top = step_worktree.workspace.resolve()
+        resolution.workspace_root = step_worktree.path / workspace_root.resolve().relative_to(top)
+        resolution.workdir = step_worktree.path / workdir.resolve().relative_to(top)
+        try:
+            yield
+        except BaseException:
+            git.release_worktree(step_worktree.repo_root, step_worktree.path, run.base_branch)
+            raise
+        finally:
+            resolution.workspace_root, resolution.workdir = workspace_root, workdir
+        try:
+            git.merge_step_worktree(step_worktree)
+        except GitCommandError:
+            self.logger.warning(
+                "step_worktree_kept",
+                extra=self.log_extra(step_run_id=step.id, worktree_path=str(step_worktree.path)),
+            )
+            raise
+        git.release_worktree(step_worktree.repo_root, step_worktree.path, run.base_branch)
+
+    def _capture_outputs(
         self,
         step: StepRun,
         run: ProtocolRun,
         engine: Engine,
         engine_result: EngineResult,
         resolution: StepResolution,
-    ) -> ExecutionResult:
-        """Handle engine execution result."""
-        outputs_written: Dict[str, Path] = {}
-
+    ) -> Dict[str, Path]:
+        """Write execution artifacts and the step's change manifest."""
         # Always write artifacts so the API and E2E checks can validate real outputs.
         try:
-            outputs_written = self._write_execution_artifacts(
+            return self._write_execution_artifacts(
                 step=step,
                 run=run,
                 engine=engine,
@@ -542,7 +653,18 @@ class ExecutionService(Service):
                 "execution_artifacts_write_failed",
                 extra=self.log_extra(step_run_id=step.id, protocol_run_id=run.id, error=str(e)),
             )
+            return {}
 
+    def _handle_result(
+        self,
+        step: StepRun,
+        run: ProtocolRun,
+        engine: Engine,
+        engine_result: EngineResult,
+        resolution: StepResolution,
+        outputs_written: Dict[str, Path],
+    ) -> ExecutionResult:
+        """Handle engine execution result."""
         if engine_result.success:
             # Mark as needs QA (or completed if QA skipped)
             self.db.update_step_status(
@@ -648,7 +770,11 @@ class ExecutionService(Service):
         """Check if an engine is available."""
         registry = get_registry()
         engine = registry.get_or_default(engine_id)
-        return engine.check_availability()
+        return registry.is_available(engine)
+
+    @staticmethod
+    def _artifacts_dir(resolution: StepResolution, step_run_id: int) -> Path:
+        return resolution.protocol_root / ".devgodzilla" / "steps" / str(step_run_id) / "artifacts"
 
     def _write_execution_artifacts(
         self,
@@ -660,7 +786,7 @@ class ExecutionService(Service):
         resolution: StepResolution,
     ) -> Dict[str, Path]:
         protocol_root = resolution.protocol_root
-        artifacts_dir = protocol_root / ".devgodzilla" / "steps" / str(step.id) / "artifacts"
+        artifacts_dir = self._artifacts_dir(resolution, step.id)
         writer = ArtifactWriter(artifacts_dir=artifacts_dir, step_run_id=step.id)
 
         outputs: Dict[str, Path] = {}
@@ -671,63 +797,56 @@ class ExecutionService(Service):
             "protocol_run_id": run.id,
             "step_run_id": step.id,
             "step_name": step.step_name,
+            "prompt_hash": resolution.prompt_hash,
             "workspace_root": str(resolution.workspace_root),
             "protocol_root": str(protocol_root),
         }
         outputs["execution_meta"] = writer.write_json("execution", meta, kind="meta").path
 
-        if engine_result.stdout:
-            outputs["stdout"] = writer.write_text("stdout", engine_result.stdout, kind="log", extension=".log").path
-        if engine_result.stderr:
-            outputs["stderr"] = writer.write_text("stderr", engine_result.stderr, kind="log", extension=".log").path
+        # Engines that stream output already wrote the full logs; only the
+        # in-memory fallback is written here.
+        for name, streamed, text in (
+            ("stdout", engine_result.stdout_path, engine_result.stdout),
+            ("stderr", engine_result.stderr_path, engine_result.stderr),
+        ):
+            path = Path(streamed) if streamed else None
+            if path is not None and path.exists():
+                if path.stat().st_size:
+                    outputs[name] = path
+                else:
+                    path.unlink()
+            elif text:
+                outputs[name] = writer.write_text(name, text, kind="log", extension=".log").path
         if engine_result.error:
             outputs["error"] = writer.write_text("error", engine_result.error, kind="log", extension=".txt").path
 
-        # Capture best-effort git status/diff if the workspace is a git repo.
+        # Capture best-effort git status/diffs if the workspace is a git repo.
         repo_root = resolution.workspace_root
         if (repo_root / ".git").exists():
-            import subprocess
-
-            status = subprocess.run(  # noqa: S603
-                ["git", "status", "--porcelain=v1"],
-                cwd=repo_root,
-                capture_output=True,
-                text=True,
-                check=False,
-            )
-            outputs["git_status"] = writer.write_text(
-                "git-status",
-                (status.stdout or "").strip() + ("\n" if (status.stdout or "").strip() else ""),
-                kind="diff",
-                extension=".txt",
-            ).path
-
-            diff = subprocess.run(  # noqa: S603
-                ["git", "diff"],
-                cwd=repo_root,
-                capture_output=True,
-                text=True,
-                check=False,
-            )
-            outputs["git_diff"] = writer.write_text(
-                "changes",
-                diff.stdout or "",
-                kind="diff",
-                extension=".diff",
-            ).path
-
-            diff_cached = subprocess.run(  # noqa: S603
-                ["git", "diff", "--cached"],
-                cwd=repo_root,
-                capture_output=True,
-                text=True,
-                check=False,
-            )
-            outputs["git_diff_cached"] = writer.write_text(
-                "changes_cached",
-                diff_cached.stdout or "",
-                kind="diff",
-                extension=".diff",
-            ).path
+            changes = capture_workspace_changes(repo_root, artifacts_dir, base_branch=run.base_branch)
+            if changes is not None:
+                status_text = manifest_status(changes.manifest())
+                outputs["git_status"] = writer.write_text(
+                    "git-status",
+                    status_text + ("\n" if status_text else ""),
+                    kind="diff",
+                    extension=".txt",
+                ).path
+                for name, key in (("unstaged", "git_diff"), ("staged", "git_diff_cached")):
+                    if name in changes.patches:
+                        outputs[key] = Path(changes.patches[name]["path"])
+                outputs["changes_manifest"] = writer.write_json(
+                    CHANGES_MANIFEST_ARTIFACT, changes.manifest(), kind="diff"
+                ).path
+                # Changed-file set vs the protocol base branch, for incremental QA.
+                if changes.changed_files is not None:
+                    outputs["changed_files"] = writer.write_json(
+                        CHANGED_FILES_ARTIFACT,
+                        {"base_branch": run.base_branch, "files": changes.changed_files},
+                        kind="diff",
+                    ).path
+                runtime_state = dict(self.db.get_step_run(step.id).runtime_state or {})
+                runtime_state[CHANGES_STATE_KEY] = changes.manifest(max_files=MAX_MANIFEST_FILES)
+                self.db.update_step_run(step.id, runtime_state=runtime_state)
 
         return outputs
@@ -8,10 +8,12 @@ branch operations, PR/MR creation, and CI triggering.
 import os
 import shutil
 import subprocess
+import tempfile
+import threading
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable, Optional, TypeVar
+from typing import Any, Callable, Dict, Optional, TypeVar
 
 import httpx
 
@@ -168,6 +170,41 @@ def _cleanup_stale_lock(repo_root: Path) -> bool:
         return False
 
 
+# Identity for the internal snapshot commits step worktrees start from; they
+# are never on a branch, so the repository's own identity is not required.
+_SNAPSHOT_IDENTITY = {
+    "GIT_AUTHOR_NAME": "DevGodzilla",
+    "GIT_AUTHOR_EMAIL": "devgodzilla@localhost",
+    "GIT_COMMITTER_NAME": "DevGodzilla",
+    "GIT_COMMITTER_EMAIL": "devgodzilla@localhost",
+}
+
+_workspace_merge_locks: Dict[str, threading.Lock] = {}
+_workspace_merge_locks_guard = threading.Lock()
+
+
+def _workspace_merge_lock(workspace: Path) -> threading.Lock:
+    """Lock held while a workspace is snapshotted for a step or a step's changes are applied to it."""
+    key = str(workspace.resolve())
+    with _workspace_merge_locks_guard:
+        lock = _workspace_merge_locks.get(key)
+        if lock is None:
+            lock = _workspace_merge_locks[key] = threading.Lock()
+        return lock
+
+
+@dataclass
+class StepWorktree:
+    """A detached worktree one step runs in while other steps write to the same workspace."""
+
+    path: Path
+    repo_root: Path
+    # Top level of the workspace the step's changes are applied back to.
+    workspace: Path
+    # Snapshot of `workspace` the worktree was checked out at.
+    base_commit: str
+
+
 class GitService(Service):
     """
     Service for handling all git and worktree operations.
@@ -265,6 +302,22 @@ class GitService(Service):
 
         worktree.parent.mkdir(parents=True, exist_ok=True)
 
+        # A pooled worktree only fits a new branch; an existing one would fail
+        # the checkout and cost the pool an entry.
+        if not self.local_branch_exists(repo_root, branch_name) and self._claim_pooled_worktree(
+            repo_root, worktree, branch_name, base_branch
+        ):
+            self.logger.info(
+                "spec_worktree_claimed_from_pool",
+                extra=self.log_extra(
+                    spec_run_id=spec_run_id,
+                    project_id=project_id,
+                    branch=branch_name,
+                    base_branch=base_branch,
+                ),
+            )
+            return worktree
+
         self.logger.info(
             "creating_spec_worktree",
             extra=self.log_extra(
@@ -300,6 +353,7 @@ class GitService(Service):
             retry_delay=config.git_lock_retry_delay,
             repo_root=repo_root,
         )
+        self._invalidate_refs(repo_root)
 
         return worktree
 
@@ -320,6 +374,7 @@ class GitService(Service):
             args.append("--force")
         args.append(str(worktree_path))
         run_process(args, cwd=repo_root, check=False)
+        self._invalidate_refs(repo_root)
         self.logger.info(
             "worktree_removed",
             extra=self.log_extra(
@@ -329,9 +384,249 @@ class GitService(Service):
             ),
         )
 
+    def release_worktree(
+        self,
+        repo_root: Path,
+        worktree_path: Path,
+        base_branch: Optional[str],
+        *,
+        spec_run_id: Optional[int] = None,
+        project_id: Optional[int] = None,
+    ) -> None:
+        """Clean up a spec worktree: recycle it into its pool when there is one with room, else remove it."""
+        if not self.recycle_worktree(
+            repo_root, worktree_path, base_branch, spec_run_id=spec_run_id, project_id=project_id
+        ):
+            self.remove_worktree(repo_root, worktree_path, spec_run_id=spec_run_id, project_id=project_id)
+
+    def recycle_worktree(
+        self,
+        repo_root: Path,
+        worktree_path: Path,
+        base_branch: Optional[str],
+        *,
+        spec_run_id: Optional[int] = None,
+        project_id: Optional[int] = None,
+        protocol_run_id: Optional[int] = None,
+    ) -> bool:
+        """Return a finished worktree to its pool (reset + clean); False (untouched) without a pool with room."""
+        from devgodzilla.services.worktree_pool import get_worktree_pool
+
+        pool = get_worktree_pool(repo_root, base_branch) if base_branch and worktree_path.exists() else None
+        if pool is None or not pool.recycle(worktree_path):
+            return False
+        self.logger.info(
+            "worktree_recycled",
+            extra=self.log_extra(
+                spec_run_id=spec_run_id,
+                protocol_run_id=protocol_run_id,
+                project_id=project_id,
+                worktree_path=str(worktree_path),
+            ),
+        )
+        self._invalidate_refs(repo_root)
+        return True
+
+    def release_protocol_worktree(
+        self,
+        worktree_path: Path,
+        base_branch: Optional[str],
+        *,
+        preserve: Optional[Dict[Path, Path]] = None,
+        protocol_run_id: Optional[int] = None,
+        project_id: Optional[int] = None,
+    ) -> bool:
+        """
+        Recycle a finished protocol's worktree into its pool (see `recycle_worktree`).
+
+        Without a worktree pool (or with a full one) the worktree is kept as
+        is; it is never removed. The protocol branch and its commits are kept.
+        Skipped (False) for the main checkout and for worktrees with
+        uncommitted or untracked files, which a recycle would discard.
+        `preserve` maps directories inside the worktree (e.g. ignored step
+        artifacts) to destinations outside it; they are ignored by that check
+        and moved out before the worktree is cleaned, and moved back if the
+        recycle fails.
+        """
+        from devgodzilla.services.worktree_pool import get_worktree_pool
+
+        if not worktree_path.exists():
+            return False
+        repo_root = self.resolve_repo_root(worktree_path)
+        if repo_root.resolve() == worktree_path.resolve():
+            return False
+        pool = get_worktree_pool(repo_root, base_branch) if base_branch else None
+        if pool is None or len(pool.idle()) >= pool.size:
+            return False
+        preserve = {
+            src: dst for src, dst in (preserve or {}).items() if src.exists() and src.is_relative_to(worktree_path)
+        }
+        excludes = [f":(exclude){src.relative_to(worktree_path).as_posix()}" for src in preserve]
+        status = run_process(
+            ["git", "status", "--porcelain", "--", ".", *excludes], cwd=worktree_path, check=False
+        )
+        if status.returncode != 0 or status.stdout.strip():
+            self.logger.info(
+                "protocol_worktree_kept",
+                extra=self.log_extra(
+                    protocol_run_id=protocol_run_id,
+                    project_id=project_id,
+                    worktree_path=str(worktree_path),
+                    reason="uncommitted_changes" if status.returncode == 0 else "status_failed",
+                ),
+            )
+            return False
+        for src, dst in preserve.items():
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            shutil.move(str(src), str(dst))
+        if self.recycle_worktree(
+            repo_root, worktree_path, base_branch, protocol_run_id=protocol_run_id, project_id=project_id
+        ):
+            return True
+        for src, dst in preserve.items():
+            shutil.move(str(dst), str(src))
+        return False
+
+    def create_step_worktree(
+        self,
+        workspace: Path,
+        step_run_id: int,
+        base_branch: Optional[str],
+    ) -> StepWorktree:
+        """
+        Give a step its own worktree so it can write while other steps of the protocol do.
+
+        The worktree is detached at a snapshot commit of `workspace` as it is
+        now, uncommitted and untracked files included (ignored files are not);
+        the snapshot is built in a scratch index, so the workspace's index and
+        HEAD are untouched. An idle pooled worktree is claimed when there is one.
+        """
+        from devgodzilla.services.worktree_pool import get_worktree_pool
+
+        try:
+            top = Path(run_process(["git", "rev-parse", "--show-toplevel"], cwd=workspace).stdout.strip())
+            repo_root = self.resolve_repo_root(top)
+            # Step worktrees of the main checkout live inside it; keep them out of its snapshot.
+            excludes = [":(exclude)worktrees"] if top.resolve() == repo_root.resolve() else []
+            with _workspace_merge_lock(top):
+                base_commit = self._snapshot_commit(top, f"devgodzilla step {step_run_id} base", excludes)
+        except subprocess.CalledProcessError as exc:
+            raise GitCommandError(f"Failed to snapshot {workspace} for step {step_run_id}: {exc.stderr}") from exc
+
+        path = repo_root / "worktrees" / ".steps" / f"step-{step_run_id}"
+        if path.exists():
+            # Left behind by an earlier attempt of this step.
+            self.remove_worktree(repo_root, path)
+            shutil.rmtree(path, ignore_errors=True)
+
+        pool = get_worktree_pool(repo_root, base_branch) if base_branch else None
+        claimed = pool.claim(path, None, start_point=base_commit) if pool is not None else None
+        if pool is not None:
+            pool.refill_async()
+        if claimed is None:
+            config = get_config()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                with_git_lock_retry(
+                    lambda: run_process(
+                        ["git", "worktree", "add", "--quiet", "--detach", str(path), base_commit],
+                        cwd=repo_root,
+                    ),
+                    max_retries=config.git_lock_max_retries,
+                    retry_delay=config.git_lock_retry_delay,
+                    repo_root=repo_root,
+                )
+            except subprocess.CalledProcessError as exc:
+                raise GitCommandError(f"Failed to create step worktree {path}: {exc.stderr}") from exc
+        self._invalidate_refs(repo_root)
+        self.logger.info(
+            "step_worktree_created",
+            extra=self.log_extra(
+                step_run_id=step_run_id,
+                worktree_path=str(path),
+                base_commit=base_commit,
+                pooled=claimed is not None,
+            ),
+        )
+        return StepWorktree(path=path, repo_root=repo_root, workspace=top, base_commit=base_commit)
+
+    def merge_step_worktree(self, step_worktree: StepWorktree) -> bool:
+        """
+        Apply the changes a step made in its worktree to the workspace it was created from.
+
+        The changes land uncommitted, as if the step had run in the workspace.
+        Returns False when there were none. Raises `GitCommandError` when they
+        no longer apply, e.g. because another step changed the same lines.
+        """
+        try:
+            run_process(["git", "add", "-A"], cwd=step_worktree.path)
+            patch = run_process(
+                ["git", "diff", "--cached", "--binary", step_worktree.base_commit],
+                cwd=step_worktree.path,
+                text=False,
+            ).stdout
+        except subprocess.CalledProcessError as exc:
+            raise GitCommandError(f"Failed to collect changes in {step_worktree.path}: {exc.stderr}") from exc
+        if not patch.strip():
+            return False
+        with _workspace_merge_lock(step_worktree.workspace):
+            result = run_process(
+                ["git", "apply", "--binary", "--whitespace=nowarn", "-"],
+                cwd=step_worktree.workspace,
+                input=patch,
+                text=False,
+                check=False,
+            )
+        if result.returncode != 0:
+            raise GitCommandError(
+                f"Changes in {step_worktree.path} do not apply to {step_worktree.workspace}: "
+                f"{result.stderr.decode(errors='replace').strip()}"
+            )
+        return True
+
+    @staticmethod
+    def _snapshot_commit(top: Path, message: str, excludes: list) -> str:
+        """Commit the working tree of `top` (not on any branch) via a copy of its index."""
+        index = Path(run_process(["git", "rev-parse", "--git-path", "index"], cwd=top).stdout.strip())
+        if not index.is_absolute():
+            index = top / index
+        with tempfile.TemporaryDirectory(prefix="devgodzilla-index-") as tmp:
+            scratch = Path(tmp) / "index"
+            # Starting from the real index keeps its stat cache, so only changed files are hashed.
+            if index.exists():
+                shutil.copyfile(index, scratch)
+            env = {**os.environ, **_SNAPSHOT_IDENTITY, "GIT_INDEX_FILE": str(scratch)}
+            run_process(["git", "add", "-A", "--", ".", *excludes], cwd=top, env=env)
+            tree = run_process(["git", "write-tree"], cwd=top, env=env).stdout.strip()
+        head = run_process(["git", "rev-parse", "--verify", "--quiet", "HEAD"], cwd=top, check=False).stdout.strip()
+        parents = ["-p", head] if head else []
+        return run_process(["git", "commit-tree", tree, *parents, "-m", message], cwd=top, env=env).stdout.strip()
+
+    @staticmethod
+    def _invalidate_refs(path: Path) -> None:
+        """Drop cached branch/worktree metadata after we change refs under `path`."""
+        from devgodzilla.services.repo_refs import invalidate_repo_refs
+
+        invalidate_repo_refs(path)
+
+    def _claim_pooled_worktree(self, repo_root: Path, worktree: Path, branch: str, base_branch: str) -> bool:
+        """Claim a pre-created worktree for a new branch and top the pool up in the background."""
+        from devgodzilla.services.worktree_pool import get_worktree_pool
+
+        pool = get_worktree_pool(repo_root, base_branch)
+        if pool is None:
+            return False
+        claimed = pool.claim(worktree, branch)
+        pool.refill_async()
+        if claimed is None:
+            return False
+        self._invalidate_refs(repo_root)
+        return True
+
     def delete_local_branch(self, repo_root: Path, branch: str) -> None:
         """Delete a local branch (best-effort)."""
         run_process(["git", "branch", "-D", branch], cwd=repo_root, check=False)
+        self._invalidate_refs(repo_root)
 
     def resolve_repo_root(self, worktree_path: Path) -> Path:
         """Resolve the main repo root for a worktree path."""
@@ -355,6 +650,7 @@ class GitService(Service):
         *,
         project_id: Optional[int] = None,
         clone_if_missing: bool = False,
+        clone_strategy: Optional[str] = None,
     ) -> Path:
         """
         Resolve a local repo path for a project.
@@ -367,6 +663,7 @@ class GitService(Service):
             local_path: Optional pre-configured local path
             project_id: Optional project ID for directory naming
             clone_if_missing: Whether to clone if not present
+            clone_strategy: full, reference, partial or shallow (default from config)
             
         Returns:
             Path to the local repository
@@ -440,19 +737,20 @@ class GitService(Service):
         # Clone the repository
         default_path.parent.mkdir(parents=True, exist_ok=True)
         clone_start = time.perf_counter()
+        from devgodzilla.services.repo_mirror import normalize_clone_strategy
+
+        strategy = normalize_clone_strategy(clone_strategy, self.config.git_clone_strategy)
         self.logger.info(
             "repo_clone_start",
             extra=self.log_extra(
                 project_id=project_id,
                 repo_path=str(default_path),
                 repo_parent=str(default_path.parent),
+                clone_strategy=strategy,
             ),
         )
         try:
-            run_process(
-                ["git", "clone", git_url, default_path.name],
-                cwd=default_path.parent,
-            )
+            self.clone_repo(git_url, default_path, strategy=strategy, project_id=project_id)
         except Exception as exc:
             self.logger.error(
                 "repo_clone_failed",
@@ -475,6 +773,36 @@ class GitService(Service):
 
         return default_path
 
+    def clone_repo(
+        self,
+        git_url: str,
+        target: Path,
+        *,
+        strategy: str = "full",
+        project_id: Optional[int] = None,
+    ) -> None:
+        """
+        Clone `git_url` into `target`, going through the shared mirror cache when enabled.
+
+        With DEVGODZILLA_GIT_MIRROR_ROOT set, the upstream is first mirrored (or
+        fetched incrementally into the existing mirror); `full` clones then copy
+        from the mirror with hardlinks and `reference` clones borrow its objects.
+        """
+        from devgodzilla.services.repo_mirror import clone_command, ensure_mirror
+
+        mirror: Optional[Path] = None
+        if self.config.git_mirror_root and strategy in ("full", "reference"):
+            try:
+                mirror = ensure_mirror(self.config.git_mirror_root, git_url)
+            except GitCommandError as exc:
+                self.logger.warning(
+                    "repo_mirror_unavailable",
+                    extra=self.log_extra(project_id=project_id, error=str(exc)),
+                )
+        run_process(clone_command(git_url, target, strategy, mirror))
+        if mirror is not None and strategy == "full":
+            run_process(["git", "remote", "set-url", "origin", git_url], cwd=target)
+
     def ensure_worktree(
         self,
         repo_root: Path,
@@ -517,6 +845,20 @@ class GitService(Service):
         if worktree.exists():
             return worktree
 
+        if not self.local_branch_exists(repo_root, branch_name) and self._claim_pooled_worktree(
+            repo_root, worktree, branch_name, base_branch
+        ):
+            self.logger.info(
+                "worktree_claimed_from_pool",
+                extra=self.log_extra(
+                    protocol_run_id=protocol_run_id,
+                    project_id=project_id,
+                    branch=branch_name,
+                    base_branch=base_branch,
+                ),
+            )
+            return worktree
+
         self.logger.info(
             "creating_worktree",
             extra=self.log_extra(
@@ -558,6 +900,7 @@ class GitService(Service):
             retry_delay=config.git_lock_retry_delay,
             repo_root=repo_root,
         )
+        self._invalidate_refs(repo_root)
         
         return worktree
 
@@ -613,6 +956,7 @@ class GitService(Service):
                 ["git", "push", "--set-upstream", "origin", branch_name],
                 cwd=worktree,
             )
+            self._invalidate_refs(worktree)
 
         try:
             with_git_lock_retry(
@@ -678,6 +1022,7 @@ class GitService(Service):
             )
         except Exception as exc:
             raise GitCommandError(f"Failed to delete remote branch {branch}") from exc
+        self._invalidate_refs(repo_root)
 
     def trigger_ci(
         self,
@@ -0,0 +1,276 @@
+"""
+DevGodzilla Windmill Job Reconciler
+
+Keeps `job_runs` in step with Windmill without per-job polling. Each sweep
+lists every non-terminal Windmill-backed run, pages through `jobs/list` once
+for all of them, and writes the changed rows (plus a `job_run_status_changed`
+event per transition) in one transaction per batch. This catches jobs whose
+completion webhook was missed. When the page cap cuts the listing short,
+runs not reached yet are looked up one by one (`jobs_u/get`), oldest first
+and at most `max_lookups` per sweep.
+
+Runs Windmill no longer knows (purged, or never created) are marked failed:
+at once when a lookup returns 404, or after `max_missed_sweeps` consecutive
+sweeps whose complete listing or lookup did not return them. Otherwise they
+would pin the listing cutoff and repeat the same lookups forever.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from devgodzilla.db.database import Database
+from devgodzilla.models.domain import JobRun, JobRunStatus
+from devgodzilla.services.base import Service, ServiceContext
+from devgodzilla.services.event_broker import notify_event_broker
+from devgodzilla.windmill.client import JobInfo, JobStatus, WindmillClient, job_info_from_payload
+
+JOB_RUN_STATUS_BY_WINDMILL = {
+    JobStatus.QUEUED: JobRunStatus.QUEUED,
+    JobStatus.RUNNING: JobRunStatus.RUNNING,
+    JobStatus.COMPLETED: JobRunStatus.SUCCEEDED,
+    JobStatus.FAILED: JobRunStatus.FAILED,
+    JobStatus.CANCELED: JobRunStatus.CANCELLED,
+}
+
+# Windmill and API clocks are not synchronized, and the job is created in
+# Windmill before its job_runs row; widen the listing window by this much.
+_LISTING_SKEW = timedelta(minutes=5)
+
+LOST_JOB_ERROR = "Job not found in Windmill"
+
+
+def job_run_updates(run: JobRun, job: JobInfo) -> Dict[str, Any]:
+    """Column changes that bring `run` in line with the Windmill job state."""
+    updates: Dict[str, Any] = {}
+    status = JOB_RUN_STATUS_BY_WINDMILL.get(job.status, run.status)
+    if status != run.status:
+        updates["status"] = status
+    # Timestamps are normalized on read, so only fill them in once.
+    if job.started_at and not run.started_at:
+        updates["started_at"] = job.started_at
+    if job.completed_at and not run.finished_at:
+        updates["finished_at"] = job.completed_at
+    if job.result is not None and job.result != run.result:
+        updates["result"] = job.result
+    if job.error and job.error != run.error:
+        updates["error"] = job.error
+    return updates
+
+
+def _listing_cutoff(runs: List[JobRun]) -> Optional[str]:
+    oldest: Optional[datetime] = None
+    for run in runs:
+        value = run.created_at
+        if not isinstance(value, datetime):
+            try:
+                value = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+            except ValueError:
+                return None
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        oldest = value if oldest is None else min(oldest, value)
+    return (oldest - _LISTING_SKEW).isoformat() if oldest else None
+
+
+def _is_not_found(exc: Exception) -> bool:
+    # httpx.HTTPStatusError, without importing the optional dependency.
+    return getattr(getattr(exc, "response", None), "status_code", None) == 404
+
+
+@dataclass
+class ReconcileResult:
+    checked: int = 0
+    updated: int = 0
+    missing: int = 0
+    pages: int = 0
+    lookups: int = 0
+    lost: int = 0
+
+
+class WindmillJobReconciler(Service):
+    """
+    Bulk-sync non-terminal job runs from Windmill.
+
+    Example:
+        reconciler = WindmillJobReconciler(ctx, db, windmill)
+        result = reconciler.reconcile_once()
+        reconciler.start(interval_seconds=30)
+    """
+
+    def __init__(
+        self,
+        context: ServiceContext,
+        db: Database,
+        windmill: WindmillClient,
+        *,
+        per_page: int = 200,
+        max_pages: int = 20,
+        batch_size: int = 200,
+        max_runs: int = 1000,
+        max_lookups: int = 50,
+        max_missed_sweeps: int = 3,
+        client_factory: Optional[Callable[[], WindmillClient]] = None,
+    ) -> None:
+        super().__init__(context)
+        self.db = db
+        self.windmill = windmill
+        # Re-resolved before each sweep so a config reload's new client is used.
+        self.client_factory = client_factory
+        self.per_page = per_page
+        self.max_pages = max_pages
+        self.batch_size = batch_size
+        self.max_runs = max_runs
+        self.max_lookups = max_lookups
+        self.max_missed_sweeps = max(1, max_missed_sweeps)
+        # run_id -> consecutive sweeps that should have seen the job but did not.
+        self._misses: Dict[str, int] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def reconcile_once(self) -> ReconcileResult:
+        """Run one sweep; returns counts of checked, updated and unseen runs."""
+        runs = self.db.list_active_windmill_job_runs(limit=self.max_runs)
+        result = ReconcileResult(checked=len(runs))
+        active = {run.run_id for run in runs}
+        self._misses = {run_id: n for run_id, n in self._misses.items() if run_id in active}
+        if not runs:
+            return result
+        if self.client_factory is not None:
+            self.windmill = self.client_factory()
+
+        pending = {str(run.windmill_job_id): run for run in runs}
+        cutoff = _listing_cutoff(runs)
+        changes: List[tuple[JobRun, Dict[str, Any]]] = []
+        listing_complete = False
+        while pending and result.pages < self.max_pages:
+            result.pages += 1
+            jobs = self.windmill.list_jobs(
+                per_page=self.per_page,
+                page=result.pages,
+                created_or_started_after=cutoff,
+            )
+            for data in jobs:
+                run = pending.pop(str(data.get("id")), None)
+                if run is None:
+                    continue
+                self._misses.pop(run.run_id, None)
+                updates = job_run_updates(run, job_info_from_payload(run.windmill_job_id, data))
+                if updates:
+                    changes.append((run, updates))
+            if len(jobs) < self.per_page:
+                listing_complete = True
+                break
+
+        lost: List[JobRun] = []
+        if listing_complete:
+            # The listing covered every active run; these are gone from Windmill.
+            lost.extend(run for run in pending.values() if self._missed(run))
+        elif pending:
+            # Listing is newest first, so the page cap leaves the oldest runs.
+            oldest = sorted(pending.values(), key=lambda r: str(r.created_at))
+            for run in oldest[:self.max_lookups]:
+                result.lookups += 1
+                try:
+                    job = self.windmill.get_job(str(run.windmill_job_id))
+                except Exception as exc:
+                    self.logger.debug(
+                        "windmill_job_lookup_failed",
+                        extra=self.log_extra(run_id=run.run_id, error=str(exc)),
+                    )
+                    if _is_not_found(exc) or self._missed(run):
+                        lost.append(run)
+                    continue
+                pending.pop(str(run.windmill_job_id), None)
+                self._misses.pop(run.run_id, None)
+                updates = job_run_updates(run, job)
+                if updates:
+                    changes.append((run, updates))
+
+        finished_at = datetime.now(timezone.utc).isoformat()
+        for run in lost:
+            pending.pop(str(run.windmill_job_id), None)
+            self._misses.pop(run.run_id, None)
+            changes.append((run, {"status": JobRunStatus.FAILED, "error": LOST_JOB_ERROR, "finished_at": finished_at}))
+        result.lost = len(lost)
+
+        result.missing = len(pending)
+        for start in range(0, len(changes), self.batch_size):
+            batch = changes[start:start + self.batch_size]
+            events = [
+                self._transition_event(run, updates)
+                for run, updates in batch
+                if "status" in updates and (run.project_id is not None or run.protocol_run_id is not None)
+            ]
+            self.db.update_job_runs({run.run_id: updates for run, updates in batch}, events=events)
+            result.updated += len(batch)
+        if changes:
+            notify_event_broker()
+
+        self.logger.info(
+            "windmill_jobs_reconciled",
+            extra=self.log_extra(
+                checked=result.checked,
+                updated=result.updated,
+                missing=result.missing,
+                pages=result.pages,
+                lookups=result.lookups,
+                lost=result.lost,
+            ),
+        )
+        return result
+
+    def _missed(self, run: JobRun) -> bool:
+        """Count a sweep that did not find `run`; True once it is considered lost."""
+        misses = self._misses.get(run.run_id, 0) + 1
+        self._misses[run.run_id] = misses
+        return misses >= self.max_missed_sweeps
+
+    @staticmethod
+    def _transition_event(run: JobRun, updates: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "protocol_run_id": run.protocol_run_id,
+            "project_id": run.project_id,
+            "step_run_id": run.step_run_id,
+            "event_type": "job_run_status_changed",
+            "message": f"{run.job_type} job {run.status} -> {updates['status']}",
+            "metadata": {
+                "run_id": run.run_id,
+                "windmill_job_id": run.windmill_job_id,
+                "from_status": run.status,
+                "to_status": updates["status"],
+                "source": "reconciler",
+            },
+        }
+
+    def start(self, interval_seconds: float) -> None:
+        """Sweep every `interval_seconds` on a daemon thread until `stop()`."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(interval_seconds,),
+            name="devgodzilla-job-reconciler",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self, interval_seconds: float) -> None:
+        while not self._stop.wait(interval_seconds):
+            try:
+                self.reconcile_once()
+            except Exception as exc:
+                self.logger.warning(
+                    "windmill_job_reconcile_failed",
+                    extra=self.log_extra(error=str(exc)),
+                )
@@ -0,0 +1,231 @@
+"""
+DevGodzilla Local Step Scheduler
+
+Runs a protocol's step DAG in-process (local mode, no Windmill) on a bounded
+worker pool. Every step whose `depends_on` steps are COMPLETED is dispatched
+at once, subject to:
+
+- `max_workers`: total steps in flight for the protocol.
+- per-engine limits: steps in flight per engine (`assigned_agent`, then
+  `engine_id`, then the configured exec/default engine).
+- `parallel_group`: members of a group are released together once every
+  pending member is ready, mirroring the Windmill branchall per group.
+
+Dependency tracking is event driven: the scheduler keeps an in-degree count
+per pending step and a ready queue, so a completion only touches that step's
+dependents instead of rescanning the protocol. All steps run in the protocol's
+own worktree, so protocols stay isolated from each other exactly as in
+Windmill mode. When more than one step may be in flight, each step that may
+write runs in a step worktree of its own (`GitService.create_step_worktree`),
+so its captured changes are its own; they are applied back to the protocol's
+worktree when the step finishes. Steps with a `read-only` sandbox run in the
+protocol's worktree directly.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional, Set
+
+from devgodzilla.models.domain import ProtocolStatus, StepRun, StepStatus
+from devgodzilla.services.base import Service, ServiceContext
+
+# Step outcomes that stop further dispatching (the protocol needs attention).
+_FAILED_STATUSES = {StepStatus.FAILED, StepStatus.TIMEOUT, StepStatus.BLOCKED, StepStatus.CANCELLED}
+# Protocol states in which no new steps may start.
+_HALTED_PROTOCOL_STATUSES = {
+    ProtocolStatus.PAUSED,
+    ProtocolStatus.CANCELLED,
+    ProtocolStatus.BLOCKED,
+    ProtocolStatus.FAILED,
+}
+
+
+@dataclass
+class LocalRunResult:
+    """Outcome of one local scheduling pass over a protocol."""
+    protocol_run_id: int
+    completed: List[int] = field(default_factory=list)
+    failed: List[int] = field(default_factory=list)
+    unfinished: List[int] = field(default_factory=list)
+    not_started: List[int] = field(default_factory=list)
+    max_in_flight: int = 0
+    stopped_reason: Optional[str] = None
+
+    @property
+    def success(self) -> bool:
+        return not self.failed and self.stopped_reason is None
+
+
+class LocalStepScheduler(Service):
+    """
+    Ready-queue scheduler for local-mode protocol execution.
+
+    Example:
+        scheduler = LocalStepScheduler(context, db, orchestrator.run_step)
+        result = scheduler.run(protocol_run_id)
+    """
+
+    def __init__(
+        self,
+        context: ServiceContext,
+        db,
+        run_step: Callable[[int], Any],
+        *,
+        max_workers: Optional[int] = None,
+        engine_limits: Optional[Dict[str, int]] = None,
+    ) -> None:
+        super().__init__(context)
+        self.db = db
+        self.run_step = run_step
+        configured = max_workers if max_workers is not None else getattr(self.config, "local_max_parallel_steps", 4)
+        self.max_workers = max(1, int(configured))
+        limits = engine_limits if engine_limits is not None else getattr(self.config, "local_engine_concurrency", {})
+        self.engine_limits = {k: max(1, int(v)) for k, v in (limits or {}).items()}
+        self.default_engine_id = (
+            getattr(self.config, "exec_engine_id", None)
+            or getattr(self.config, "default_engine_id", None)
+            or "default"
+        )
+
+    def engine_key(self, step: StepRun) -> str:
+        return step.assigned_agent or step.engine_id or self.default_engine_id
+
+    def run(self, protocol_run_id: int) -> LocalRunResult:
+        """Run every runnable step of a protocol, returning when nothing more can start."""
+        result = LocalRunResult(protocol_run_id=protocol_run_id)
+        steps = {s.id: s for s in self.db.list_step_runs(protocol_run_id)}
+        completed: Set[int] = {sid for sid, s in steps.items() if s.status == StepStatus.COMPLETED}
+        pending = sorted(
+            (s for s in steps.values() if s.status == StepStatus.PENDING),
+            key=lambda s: (s.step_index, s.id),
+        )
+
+        waiting: Dict[int, Set[int]] = {}
+        dependents: Dict[int, List[int]] = defaultdict(list)
+        for step in pending:
+            # Unknown dependency ids are never satisfied, as in `_find_runnable_step`.
+            deps = {dep for dep in (step.depends_on or []) if dep not in completed}
+            waiting[step.id] = deps
+            for dep in deps:
+                dependents[dep].append(step.id)
+
+        groups: Dict[str, Set[int]] = defaultdict(set)
+        for step in pending:
+            if step.parallel_group:
+                groups[step.parallel_group].add(step.id)
+        # A group whose members depend on each other cannot be released as a
+        # unit; its members are scheduled individually instead.
+        gang_groups = {
+            name for name, members in groups.items()
+            if not any(waiting[m] & members for m in members)
+        }
+        staged: Dict[str, Set[int]] = defaultdict(set)
+        ready: Deque[int] = deque()
+
+        def _release(step_id: int) -> None:
+            group = steps[step_id].parallel_group
+            if group in gang_groups:
+                staged[group].add(step_id)
+                if staged[group] == groups[group]:
+                    ready.extend(sorted(staged[group], key=lambda sid: (steps[sid].step_index, sid)))
+            else:
+                ready.append(step_id)
+
+        for step in pending:
+            if not waiting[step.id]:
+                _release(step.id)
+
+        in_flight: Dict[Future, int] = {}
+        engine_load: Dict[str, int] = defaultdict(int)
+        started: Set[int] = set()
+
+        def _next_dispatchable() -> Optional[int]:
+            for idx, step_id in enumerate(ready):
+                key = self.engine_key(steps[step_id])
+                limit = self.engine_limits.get(key)
+                if limit is None or engine_load[key] < limit:
+                    del ready[idx]
+                    return step_id
+            return None
+
+        self.logger.info(
+            "local_schedule_started",
+            extra=self.log_extra(
+                protocol_run_id=protocol_run_id,
+                pending=len(pending),
+                ready=len(ready),
+                max_workers=self.max_workers,
+            ),
+        )
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="devgodzilla-step") as pool:
+            while True:
+                while result.stopped_reason is None and len(in_flight) < self.max_workers:
+                    step_id = _next_dispatchable()
+                    if step_id is None:
+                        break
+                    engine_load[self.engine_key(steps[step_id])] += 1
+                    started.add(step_id)
+                    in_flight[pool.submit(self.run_step, step_id)] = step_id
+                    result.max_in_flight = max(result.max_in_flight, len(in_flight))
+
+                if not in_flight:
+                    break
+
+                done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+                for future in done:
+                    step_id = in_flight.pop(future)
+                    engine_load[self.engine_key(steps[step_id])] -= 1
+                    status = self._finished_status(future, step_id)
+
+                    if status == StepStatus.COMPLETED:
+                        result.completed.append(step_id)
+                        for dependent in dependents.get(step_id, ()):
+                            remaining = waiting[dependent]
+                            remaining.discard(step_id)
+                            if not remaining:
+                                _release(dependent)
+                    elif status in _FAILED_STATUSES:
+                        result.failed.append(step_id)
+                        if result.stopped_reason is None:
+                            result.stopped_reason = f"step {step_id} {status}"
+                    else:
+                        # e.g. NEEDS_QA: dependents stay blocked until QA completes it.
+                        result.unfinished.append(step_id)
+
+                if result.stopped_reason is None:
+                    protocol_status = self.db.get_protocol_run(protocol_run_id).status
+                    if protocol_status in _HALTED_PROTOCOL_STATUSES:
+                        result.stopped_reason = f"protocol {protocol_status}"
+
+        result.not_started = [s.id for s in pending if s.id not in started]
+        self.logger.info(
+            "local_schedule_finished",
+            extra=self.log_extra(
+                protocol_run_id=protocol_run_id,
+                completed=len(result.completed),
+                failed=len(result.failed),
+                not_started=len(result.not_started),
+                max_in_flight=result.max_in_flight,
+                stopped_reason=result.stopped_reason,
+            ),
+        )
+        return result
+
+    def _finished_status(self, future: Future, step_id: int) -> str:
+        try:
+            future.result()
+        except Exception as exc:
+            self.logger.error(
+                "local_step_crashed",
+                extra=self.log_extra(step_run_id=step_id, error=str(exc)),
+            )
+            try:
+                self.db.update_step_status(step_id, StepStatus.FAILED, summary=f"Step crashed: {exc}")
+            except Exception:
+                pass
+            return StepStatus.FAILED
+        return self.db.get_step_run(step_id).status
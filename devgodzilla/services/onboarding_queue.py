@@ -8,7 +8,7 @@ from uuid import uuid4
 from devgodzilla.db.database import Database
 from devgodzilla.logging import get_logger, log_extra
 from devgodzilla.services.base import ServiceContext
-from devgodzilla.windmill.client import WindmillClient, WindmillConfig
+from devgodzilla.windmill.client import WindmillClient, get_shared_windmill_client, windmill_config_from_settings
 
 logger = get_logger(__name__)
 
@@ -24,13 +24,7 @@ def _build_windmill_client(ctx: ServiceContext) -> WindmillClient:
     config = ctx.config
     if not getattr(config, "windmill_enabled", False):
         raise RuntimeError("Windmill integration not configured")
-
-    wm_config = WindmillConfig(
-        base_url=config.windmill_url or "http://localhost:8000",
-        token=config.windmill_token or "",
-        workspace=getattr(config, "windmill_workspace", "devgodzilla"),
-    )
-    return WindmillClient(wm_config)
+    return get_shared_windmill_client(windmill_config_from_settings(config))
 
 
 def enqueue_project_onboarding(
@@ -60,32 +54,29 @@ def enqueue_project_onboarding(
         payload["discovery_model"] = discovery_model
 
     client = _build_windmill_client(ctx)
+    logger.debug(
+        "onboarding_enqueue_request",
+        extra=log_extra(
+            project_id=project_id,
+            script_path=script_path,
+            payload=payload,
+            workspace=ctx.config.windmill_workspace,
+        ),
+    )
+    enqueue_start = time.perf_counter()
     try:
-        logger.debug(
-            "onboarding_enqueue_request",
+        job_id = client.run_script(script_path, payload)
+    except Exception as exc:
+        logger.error(
+            "onboarding_enqueue_failed",
             extra=log_extra(
                 project_id=project_id,
                 script_path=script_path,
-                payload=payload,
-                workspace=ctx.config.windmill_workspace,
+                error=str(exc),
             ),
         )
-        enqueue_start = time.perf_counter()
-        try:
-            job_id = client.run_script(script_path, payload)
-        except Exception as exc:
-            logger.error(
-                "onboarding_enqueue_failed",
-                extra=log_extra(
-                    project_id=project_id,
-                    script_path=script_path,
-                    error=str(exc),
-                ),
-            )
-            raise
-        enqueue_duration_ms = int((time.perf_counter() - enqueue_start) * 1000)
-    finally:
-        client.close()
+        raise
+    enqueue_duration_ms = int((time.perf_counter() - enqueue_start) * 1000)
     logger.info(
         "onboarding_enqueue_response",
         extra=log_extra(
@@ -6,9 +6,10 @@ Manages lifecycle of protocol runs and coordinates with Windmill for execution.
 """
 
 import uuid
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 from enum import Enum
+from functools import partial
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -349,12 +350,14 @@ class OrchestratorService(Service):
         return OrchestratorResult(success=True, job_id=job_id, flow_id=run.windmill_flow_id)
 
     # Step Operations
-    def run_step(self, step_run_id: int) -> OrchestratorResult:
+    def run_step(self, step_run_id: int, *, isolated: bool = False) -> OrchestratorResult:
         """
         Execute a single step.
         
         Args:
             step_run_id: Step run ID
+            isolated: In local mode, run the step in its own worktree
+                (see `ExecutionService.execute_step`)
             
         Returns:
             OrchestratorResult with job_id
@@ -407,10 +410,10 @@ class OrchestratorService(Service):
             return OrchestratorResult(success=True, job_id=job_id)
         elif self.execution_service:
             # Local mode
-            result = self.execution_service.execute_step(step_run_id)
+            result = self.execution_service.execute_step(step_run_id, isolated=isolated)
             return OrchestratorResult(
-                success=result.get("success", False),
-                error=result.get("error"),
+                success=result.success,
+                error=result.error,
             )
         
         return OrchestratorResult(success=True)
@@ -472,6 +475,8 @@ class OrchestratorService(Service):
         Find and run the next available step.
         
         Selects a step with status PENDING whose dependencies are satisfied.
+        In local mode with an execution service, all ready steps are run
+        concurrently via `run_protocol_locally` instead.
         
         Args:
             protocol_run_id: Protocol run ID
@@ -479,6 +484,9 @@ class OrchestratorService(Service):
         Returns:
             OrchestratorResult with step details
         """
+        if self.mode == OrchestratorMode.LOCAL and self.execution_service:
+            return self.run_protocol_locally(protocol_run_id)
+
         steps = self.db.list_step_runs(protocol_run_id)
         completed_ids = {s.id for s in steps if s.status == StepStatus.COMPLETED}
         
@@ -503,6 +511,59 @@ class OrchestratorService(Service):
             error="No runnable steps found",
         )
 
+    def run_protocol_locally(
+        self,
+        protocol_run_id: int,
+        *,
+        max_workers: Optional[int] = None,
+        engine_limits: Optional[Dict[str, int]] = None,
+    ) -> OrchestratorResult:
+        """
+        Run every ready step of a protocol in-process on a bounded worker pool.
+
+        Steps are dispatched as soon as their dependencies complete (see
+        `LocalStepScheduler`), then the protocol is completed if all steps
+        reached a terminal state.
+
+        Args:
+            protocol_run_id: Protocol run ID
+            max_workers: Override DEVGODZILLA_LOCAL_MAX_PARALLEL_STEPS
+            engine_limits: Override DEVGODZILLA_LOCAL_ENGINE_CONCURRENCY
+
+        Returns:
+            OrchestratorResult with per-step outcome lists in `data`
+        """
+        from devgodzilla.services.local_scheduler import LocalStepScheduler
+
+        scheduler = LocalStepScheduler(
+            self.context,
+            self.db,
+            self.run_step,
+            max_workers=max_workers,
+            engine_limits=engine_limits,
+        )
+        if scheduler.max_workers > 1:
+            # Steps may overlap: give each writing step a worktree of its own.
+            scheduler.run_step = partial(self.run_step, isolated=True)
+        outcome = scheduler.run(protocol_run_id)
+        data = asdict(outcome)
+
+        run = self.db.get_protocol_run(protocol_run_id)
+        if run.status in (ProtocolStatus.COMPLETED, ProtocolStatus.FAILED):
+            data["completed"] = run.status == ProtocolStatus.COMPLETED
+        elif self.check_and_complete_protocol(protocol_run_id):
+            data["completed"] = self.db.get_protocol_run(protocol_run_id).status == ProtocolStatus.COMPLETED
+
+        if not outcome.success:
+            return OrchestratorResult(success=False, error=outcome.stopped_reason, data=data)
+        if not (outcome.completed or outcome.unfinished or data.get("completed")):
+            return OrchestratorResult(success=False, error="No runnable steps found", data=data)
+        return OrchestratorResult(
+            success=True,
+            message=f"Ran {len(outcome.completed) + len(outcome.unfinished)} step(s)",
+            data=data,
+        )
+
     def retry_step(self, step_run_id: int) -> OrchestratorResult:
         """
         Retry a failed, blocked, or timed out step.
@@ -589,6 +650,7 @@ class OrchestratorService(Service):
                 self.db.update_step_status(step.id, StepStatus.CANCELLED)
         
         self.db.update_protocol_status(protocol_run_id, ProtocolStatus.CANCELLED)
+        self._release_worktree(run)
         
         # Emit event - cancellation is not a failure, just a completion
         event_bus = get_event_bus()
@@ -625,6 +687,9 @@ class OrchestratorService(Service):
         
         new_status = ProtocolStatus.FAILED if any_failed else ProtocolStatus.COMPLETED
         self.db.update_protocol_status(protocol_run_id, new_status)
+        if not any_failed:
+            # Failed runs keep their worktree for inspection and retries.
+            self._release_worktree(self.db.get_protocol_run(protocol_run_id))
         
         # Emit appropriate event
         event_bus = get_event_bus()
@@ -649,6 +714,48 @@ class OrchestratorService(Service):
 
         return True
 
+    def _release_worktree(self, run: ProtocolRun) -> None:
+        """
+        Hand a finished protocol's clean worktree back to the pool (best-effort).
+
+        Step artifacts (`<protocol_root>/.devgodzilla`) are moved out first, to
+        `<project>/.devgodzilla/protocols/<run id>`, which becomes the run's
+        protocol_root; the run's worktree_path is cleared.
+        """
+        if not run.worktree_path:
+            return
+        from devgodzilla.services.git import GitService
+
+        git_service = self.git_service or GitService(self.context)
+        try:
+            project = self.db.get_project(run.project_id)
+            archive_root = (
+                Path(project.local_path).expanduser() / ".devgodzilla" / "protocols" / str(run.id)
+                if project.local_path
+                else None
+            )
+            preserve = {}
+            if archive_root is not None and run.protocol_root:
+                preserve[Path(run.protocol_root).expanduser() / ".devgodzilla"] = archive_root / ".devgodzilla"
+            released = git_service.release_protocol_worktree(
+                Path(run.worktree_path).expanduser(),
+                run.base_branch,
+                preserve=preserve,
+                protocol_run_id=run.id,
+                project_id=run.project_id,
+            )
+            if released:
+                self.db.update_protocol_paths(
+                    run.id,
+                    worktree_path=None,
+                    protocol_root=str(archive_root) if archive_root is not None else None,
+                )
+        except Exception as exc:
+            self.logger.warning(
+                "protocol_worktree_release_failed",
+                extra=self.log_extra(protocol_run_id=run.id, error=str(exc)),
+            )
+
     def _find_runnable_step(self, steps: List[StepRun]) -> Optional[StepRun]:
         completed_ids = {s.id for s in steps if s.status == StepStatus.COMPLETED}
         for step in steps:
@@ -674,7 +781,7 @@ class OrchestratorService(Service):
         - optionally enqueue the next runnable step
         """
         recovered: List[Dict[str, Any]] = []
-        runs = self.db.list_all_protocol_runs(limit=limit)
+        runs = self.db.list_all_protocol_runs(limit=limit, status=ProtocolStatus.RUNNING)
         for run in runs:
             if run.status != ProtocolStatus.RUNNING:
                 continue
@@ -777,6 +884,7 @@ class OrchestratorService(Service):
         run = self.db.get_protocol_run(protocol_run_id)
         project = self.db.get_project(run.project_id)
 
+        # A released worktree is cleared from the run; its branch remains.
         worktree_path = run.worktree_path or project.local_path
         if not worktree_path:
             return OrchestratorResult(success=False, error="Project has no local_path/worktree_path configured")
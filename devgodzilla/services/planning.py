@@ -298,6 +298,11 @@ class PlanningService(Service):
                         engine_id=engine_id,
                         model=model,
                         prompt_path=prompt_path,
+                        repo_snapshot=self.build_repo_snapshot(
+                            project,
+                            workspace,
+                            query=f"{run.protocol_name} {run.description or ''}",
+                        ),
                         timeout_seconds=int(os.environ.get("DEVGODZILLA_PROTOCOL_GENERATE_TIMEOUT_SECONDS", "900")),
                         strict_outputs=True,
                     )
@@ -514,18 +519,40 @@ class PlanningService(Service):
         self,
         project: Project,
         workspace: Path,
+        *,
+        query: str = "",
+        token_budget: Optional[int] = None,
     ) -> str:
         """
         Build a repository snapshot for prompt injection.
+
+        Git repositories get a map rendered from the per-commit repository
+        index (see `services/repo_index.py`), ranked by relevance to `query`;
+        other workspaces fall back to a directory listing.
         
         Args:
             project: Project object
             workspace: Workspace path
+            query: Text to rank files by (e.g. protocol name and description)
+            token_budget: Approximate size limit (default: repo_map_token_budget)
             
         Returns:
             Markdown-formatted snapshot
         """
-        return _build_repo_snapshot(workspace)
+        from devgodzilla.services.repo_index import load_repo_index, render_repo_map
+
+        budget = token_budget or getattr(self.context.config, "repo_map_token_budget", 2000)
+        try:
+            index = load_repo_index(workspace)
+        except Exception as exc:
+            self.logger.warning(
+                "repo_index_failed",
+                extra=self.log_extra(project_id=project.id, error=str(exc)),
+            )
+            index = None
+        if index is None or not index.files:
+            return _build_repo_snapshot(workspace)
+        return render_repo_map(index, query=query, token_budget=budget)
 
     def decompose_step(
         self,
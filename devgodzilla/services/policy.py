@@ -3,17 +3,27 @@ DevGodzilla Policy Service
 
 Manages policy packs, policy resolution, and policy evaluation.
 Policies define governance rules for projects, protocols, and steps.
+
+Resolved policies and step findings are memoized per database (see
+`PolicyCache`); writers of packs or project policy fields call
+`invalidate_policy_cache`.
 """
 
+import copy
 import hashlib
 import json
 import re
+import threading
+import time
+import weakref
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from devgodzilla.logging import get_logger
 from devgodzilla.services.base import Service, ServiceContext
+from devgodzilla.spec import get_step_spec, protocol_spec_hash
 
 logger = get_logger(__name__)
 
@@ -89,6 +99,21 @@ def _stable_hash(payload: Dict[str, Any]) -> str:
     return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()[:16]
 
 
+def _repo_local_policy_signature(repo_root: Path) -> Tuple[Tuple[str, int, str], ...]:
+    """(path, mtime, content hash) of each file `_load_repo_local_policy` may read."""
+    signature = []
+    for policy_dir in (".devgodzilla", ".tasksgodzilla"):
+        for name in ("policy.json", "policy.yaml", "policy.yml"):
+            path = repo_root / policy_dir / name
+            try:
+                mtime = path.stat().st_mtime_ns
+                digest = hashlib.sha256(path.read_bytes()).hexdigest()
+            except OSError:
+                continue
+            signature.append((str(path), mtime, digest))
+    return tuple(signature)
+
+
 def _load_repo_local_policy(repo_root: Path) -> Optional[Dict[str, Any]]:
     """
     Best-effort loader for repo-local override policy.
@@ -150,6 +175,125 @@ def _policy_block_codes(policy: Dict[str, Any]) -> set:
     return _DEFAULT_BLOCK_CODES
 
 
+_PolicyKey = Tuple[Any, ...]
+
+
+class PolicyCache:
+    """
+    Memoized effective policies and step findings for one database.
+
+    Policies are keyed by project id, project `updated_at`, pack key/version
+    and the repo-local policy file signature; step findings by the effective
+    policy hash and the step spec hash. Entries also expire after
+    `ttl_seconds`, which bounds staleness for pack edits made by other
+    processes. Writers in this process call `invalidate_policy_cache`.
+
+    Example:
+        cache = get_policy_cache(db)
+        cache.invalidate(project_id=project.id)
+    """
+
+    def __init__(self, *, ttl_seconds: float = 60.0, max_entries: int = 256) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._policies: "OrderedDict[_PolicyKey, Tuple[float, EffectivePolicy]]" = OrderedDict()
+        self._findings: "OrderedDict[_PolicyKey, Tuple[float, List[Finding]]]" = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.max_entries > 0
+
+    def _get(self, entries: "OrderedDict[_PolicyKey, Tuple[float, Any]]", key: _PolicyKey) -> Any:
+        with self._lock:
+            entry = entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] >= self.ttl_seconds:
+                del entries[key]
+                return None
+            entries.move_to_end(key)
+            return entry[1]
+
+    def _put(self, entries: "OrderedDict[_PolicyKey, Tuple[float, Any]]", key: _PolicyKey, value: Any) -> None:
+        with self._lock:
+            entries[key] = (time.monotonic(), value)
+            entries.move_to_end(key)
+            while len(entries) > self.max_entries:
+                entries.popitem(last=False)
+
+    def get_policy(self, key: _PolicyKey) -> Optional[EffectivePolicy]:
+        effective = self._get(self._policies, key)
+        return _copy_effective(effective) if effective is not None else None
+
+    def put_policy(self, key: _PolicyKey, effective: EffectivePolicy) -> None:
+        self._put(self._policies, key, _copy_effective(effective))
+
+    def get_findings(self, key: _PolicyKey) -> Optional[List[Finding]]:
+        findings = self._get(self._findings, key)
+        return copy.deepcopy(findings) if findings is not None else None
+
+    def put_findings(self, key: _PolicyKey, findings: List[Finding]) -> None:
+        self._put(self._findings, key, copy.deepcopy(findings))
+
+    def invalidate(self, *, project_id: Optional[int] = None, pack_key: Optional[str] = None) -> None:
+        """Drop entries of a project and/or a policy pack; no arguments drops everything."""
+        with self._lock:
+            for entries in (self._policies, self._findings):
+                if project_id is None and pack_key is None:
+                    entries.clear()
+                    continue
+                for key in list(entries):
+                    # Keys start with (project_id, pack_key, ...).
+                    if (project_id is not None and key[0] == project_id) or (
+                        pack_key is not None and key[1] == pack_key
+                    ):
+                        del entries[key]
+
+
+def _copy_effective(effective: EffectivePolicy) -> EffectivePolicy:
+    # Callers may mutate the returned policy dict; never hand out the cached one.
+    return EffectivePolicy(
+        policy=copy.deepcopy(effective.policy),
+        effective_hash=effective.effective_hash,
+        pack_key=effective.pack_key,
+        pack_version=effective.pack_version,
+        sources=copy.deepcopy(effective.sources),
+    )
+
+
+# One cache per Database instance; entries disappear with their Database.
+_policy_caches: "weakref.WeakKeyDictionary[Any, PolicyCache]" = weakref.WeakKeyDictionary()
+_policy_caches_lock = threading.Lock()
+
+
+def get_policy_cache(db: Any) -> PolicyCache:
+    """Get or create the shared `PolicyCache` for `db`."""
+    with _policy_caches_lock:
+        try:
+            cache = _policy_caches.get(db)
+            if cache is None:
+                cache = PolicyCache()
+                _policy_caches[db] = cache
+        except TypeError:
+            # Not weak-referenceable; cache for this caller only.
+            cache = PolicyCache()
+        return cache
+
+
+def invalidate_policy_cache(
+    db: Any,
+    *,
+    project_id: Optional[int] = None,
+    pack_key: Optional[str] = None,
+) -> None:
+    """Forget resolved policies after a policy pack or project policy update."""
+    with _policy_caches_lock:
+        cache = _policy_caches.get(db)
+    if cache is not None:
+        cache.invalidate(project_id=project_id, pack_key=pack_key)
+
+
 class PolicyService(Service):
     """
     Service for policy management and evaluation.
@@ -180,6 +324,10 @@ class PolicyService(Service):
     def __init__(self, context: ServiceContext, db) -> None:
         super().__init__(context)
         self.db = db
+        self.cache = get_policy_cache(db)
+        ttl = getattr(context.config, "policy_cache_ttl_seconds", None)
+        if isinstance(ttl, (int, float)) and not isinstance(ttl, bool):
+            self.cache.ttl_seconds = float(ttl)
 
     def resolve_effective_policy(
         self,
@@ -209,6 +357,20 @@ class PolicyService(Service):
         # Load base policy pack
         pack_key = project.policy_pack_key or "default"
         pack_version = project.policy_pack_version or "1.0"
+
+        use_repo_local = bool(include_repo_local and project.policy_repo_local_enabled and repo_root)
+        cache_key: Optional[_PolicyKey] = None
+        if self.cache.enabled:
+            cache_key = (
+                project_id,
+                pack_key,
+                pack_version,
+                str(project.updated_at),
+                _repo_local_policy_signature(Path(repo_root)) if use_repo_local else None,
+            )
+            cached = self.cache.get_policy(cache_key)
+            if cached is not None:
+                return cached
         
         try:
             pack = self.db.get_policy_pack(key=pack_key, version=pack_version)
@@ -227,7 +389,7 @@ class PolicyService(Service):
             sources["project_overrides"] = True
         
         # Apply repo-local overrides
-        if include_repo_local and project.policy_repo_local_enabled and repo_root:
+        if use_repo_local:
             repo_local = _load_repo_local_policy(repo_root)
             if repo_local:
                 sanitized = _sanitize_policy_override(repo_local)
@@ -236,13 +398,16 @@ class PolicyService(Service):
         
         effective_hash = _stable_hash(merged)
         
-        return EffectivePolicy(
+        effective = EffectivePolicy(
             policy=merged,
             effective_hash=effective_hash,
             pack_key=pack_key,
             pack_version=pack_version,
             sources=sources,
         )
+        if cache_key is not None:
+            self.cache.put_policy(cache_key, effective)
+        return effective
 
     def evaluate_project(self, project_id: int) -> List[Finding]:
         """
@@ -369,6 +534,15 @@ class PolicyService(Service):
             repo_root=repo_root,
         )
         policy = effective.policy
+
+        findings_key: Optional[_PolicyKey] = None
+        if self.cache.enabled:
+            spec_hash = self._step_spec_hash(step, run)
+            if spec_hash is not None:
+                findings_key = (run.project_id, effective.pack_key, effective.effective_hash, spec_hash)
+                cached = self.cache.get_findings(findings_key)
+                if cached is not None:
+                    return cached
         
         # Check required step sections
         requirements = policy.get("requirements", {})
@@ -377,8 +551,19 @@ class PolicyService(Service):
         # Would check step markdown for required sections here
         # For now, return empty (implementation depends on step file format)
         
+        if findings_key is not None:
+            self.cache.put_findings(findings_key, findings)
         return findings
 
+    @staticmethod
+    def _step_spec_hash(step, run) -> Optional[str]:
+        """Hash of the step's spec in the protocol template, or None if it cannot be read."""
+        try:
+            spec = get_step_spec(run.template_config, step.step_name)
+            return protocol_spec_hash({"step_name": step.step_name, "spec": spec or {}})
+        except Exception:
+            return None
+
     def build_policy_guidelines(self, effective: EffectivePolicy) -> str:
         """
         Build a policy guidelines string for inclusion in prompts.
@@ -32,11 +32,19 @@ class ProtocolGenerationResult:
     error: Optional[str] = None
 
 
-def _render_prompt(template: str, *, protocol_name: str, description: str, step_count: int) -> str:
+def _render_prompt(
+    template: str,
+    *,
+    protocol_name: str,
+    description: str,
+    step_count: int,
+    repo_snapshot: str = "",
+) -> str:
     return (
         template.replace("{{PROTOCOL_NAME}}", protocol_name)
         .replace("{{PROTOCOL_DESCRIPTION}}", description)
         .replace("{{STEP_COUNT}}", str(step_count))
+        .replace("{{REPO_SNAPSHOT}}", repo_snapshot or "(not available; inspect the worktree)")
     )
 
 
@@ -54,6 +62,7 @@ class ProtocolGenerationService(Service):
         engine_id: str = "opencode",
         model: Optional[str] = None,
         prompt_path: Optional[Path] = None,
+        repo_snapshot: str = "",
         timeout_seconds: int = 900,
         strict_outputs: bool = True,
     ) -> ProtocolGenerationResult:
@@ -93,7 +102,7 @@ class ProtocolGenerationService(Service):
                 error=f"Engine not registered: {e}",
             )
 
-        if not engine.check_availability():
+        if not registry.is_available(engine):
             return ProtocolGenerationResult(
                 success=False,
                 engine_id=engine_id,
@@ -113,6 +122,7 @@ class ProtocolGenerationService(Service):
             protocol_name=protocol_name,
             description=description,
             step_count=max(1, int(step_count)),
+            repo_snapshot=repo_snapshot,
         )
 
         req = EngineRequest(
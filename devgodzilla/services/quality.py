@@ -11,6 +11,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from devgodzilla.logging import get_logger
+from devgodzilla.prompt_cache import get_prompt_cache
 from devgodzilla.models.domain import (
     ProtocolRun,
     ProtocolStatus,
@@ -32,6 +33,16 @@ from devgodzilla.qa.gates import (
     SpecKitChecklistGate,
     ConstitutionalGate,
     PromptQAGate,
+    GateRunner,
+)
+from devgodzilla.qa.gates.cache import GateResultCache
+from devgodzilla.qa.changeset import (
+    CHANGES_STATE_KEY,
+    changed_files_from_manifest,
+    compute_changed_files,
+    load_changed_files,
+    load_changes_manifest,
+    workspace_status,
 )
 from devgodzilla.services.base import Service, ServiceContext
 from devgodzilla.services.constitution import ConstitutionService
@@ -83,6 +94,13 @@ def _gate_ids_from_required_checks(checks: List[str]) -> List[str]:
     return list(dict.fromkeys(gate_ids))
 
 
+def _config_value(config: Any, name: str, default: Any, kinds: tuple) -> Any:
+    value = getattr(config, name, None)
+    if isinstance(value, bool) and bool not in kinds:
+        return default
+    return value if isinstance(value, kinds) else default
+
+
 class QAVerdict(str, Enum):
     """Overall QA verdict."""
     PASS = "pass"
@@ -147,10 +165,86 @@ class QualityService(Service):
         db,
         *,
         default_gates: Optional[List[Gate]] = None,
+        max_parallel_gates: Optional[int] = None,
+        qa_deadline_seconds: Optional[float] = None,
+        short_circuit: Optional[bool] = None,
     ) -> None:
         super().__init__(context)
         self.db = db
         self.default_gates = default_gates or []
+        self.max_parallel_gates = max_parallel_gates
+        self.qa_deadline_seconds = qa_deadline_seconds
+        self.short_circuit = short_circuit
+
+    def _gate_cache(self, project_id: Optional[int], use_cache: Optional[bool]) -> Optional[GateResultCache]:
+        config = self.context.config
+        if use_cache is None:
+            use_cache = _config_value(config, "qa_gate_cache_enabled", True, (bool,))
+        if not use_cache:
+            return None
+        ttl = _config_value(config, "qa_gate_cache_ttl_seconds", 24 * 60 * 60, (int, float))
+        return GateResultCache(self.db, project_id=project_id, ttl_seconds=ttl)
+
+    @staticmethod
+    def _step_artifacts_dir(step: StepRun, protocol_root: Path) -> Path:
+        return protocol_root / ".devgodzilla" / "steps" / str(step.id) / "artifacts"
+
+    def _recorded_changes(self, step: StepRun, protocol_root: Path) -> Optional[Dict[str, Any]]:
+        """The change manifest ExecutionService recorded for the step, if any."""
+        manifest = (step.runtime_state or {}).get(CHANGES_STATE_KEY)
+        if isinstance(manifest, dict):
+            return manifest
+        return load_changes_manifest(self._step_artifacts_dir(step, protocol_root))
+
+    def _changed_files(
+        self,
+        step: StepRun,
+        run: ProtocolRun,
+        workspace_root: Path,
+        protocol_root: Path,
+    ) -> Optional[List[str]]:
+        """
+        Files changed by the step for an incremental scan (None: full scan).
+
+        Reuses the change manifest ExecutionService recorded (runtime_state,
+        else the `changes-manifest` artifact) while HEAD is unchanged, and a
+        bare `changed-files` artifact as is; both plus anything changed in the
+        working tree since (e.g. manual fixes), from one `git status`. Only
+        re-diffs against the base branch when nothing usable was recorded or
+        HEAD has moved.
+        """
+        manifest = self._recorded_changes(step, protocol_root)
+        reused = changed_files_from_manifest(manifest, workspace_root)
+        if reused is not None:
+            return reused
+        recorded = load_changed_files(self._step_artifacts_dir(step, protocol_root))
+        if recorded is not None and manifest is None:
+            # No recorded HEAD to compare against: trust the artifact.
+            status = workspace_status(workspace_root)
+            if status is not None:
+                return sorted(set(recorded) | set(status.paths))
+        current = compute_changed_files(workspace_root, run.base_branch)
+        if current is None:
+            return recorded
+        return sorted(set(current) | set(recorded or []))
+
+    def _gate_runner(self, cache: Optional[GateResultCache] = None) -> GateRunner:
+        config = self.context.config
+        max_workers = self.max_parallel_gates
+        if max_workers is None:
+            max_workers = _config_value(config, "qa_max_parallel_gates", 4, (int,))
+        deadline = self.qa_deadline_seconds
+        if deadline is None:
+            deadline = _config_value(config, "qa_deadline_seconds", None, (int, float))
+        short_circuit = self.short_circuit
+        if short_circuit is None:
+            short_circuit = _config_value(config, "qa_short_circuit", True, (bool,))
+        return GateRunner(
+            max_workers=max_workers,
+            deadline_seconds=deadline,
+            short_circuit=short_circuit,
+            cache=cache,
+        )
 
     def _qa_prompt_path(self) -> Path:
         repo_root = Path(__file__).resolve().parents[2]
@@ -197,7 +291,7 @@ class QualityService(Service):
             else:
                 raise RuntimeError(f"QA engine not registered: {engine_id}")
         try:
-            available = engine.check_availability()
+            available = registry.is_available(engine)
         except Exception as exc:
             available = False
             availability_error = str(exc)
@@ -226,6 +320,7 @@ class QualityService(Service):
             engine=engine,
             prompt_path=prompt_path or self._qa_prompt_path(),
             model=model,
+            prompt_cache=get_prompt_cache(),
         )
 
     @staticmethod
@@ -266,6 +361,7 @@ class QualityService(Service):
         job_id: Optional[str] = None,
         gates: Optional[List[Gate]] = None,
         skip_gates: Optional[List[str]] = None,
+        use_cache: Optional[bool] = None,
     ) -> QAResult:
         """
         Run QA for a step.
@@ -275,6 +371,8 @@ class QualityService(Service):
             job_id: Optional job ID for tracking
             gates: Override gates to run (defaults to default_gates)
             skip_gates: Gate IDs to skip
+            use_cache: Reuse cached gate results for an unchanged tree
+                (defaults to DEVGODZILLA_QA_GATE_CACHE); False forces a re-run
             
         Returns:
             QAResult with verdict and findings
@@ -318,9 +416,14 @@ class QualityService(Service):
             protocol_run_id=run.id,
             project_id=project.id,
         )
+        # Prompt QA reads git status and the last commit from the manifest.
+        changes = self._recorded_changes(step, protocol_root_path)
+        if changes is not None:
+            context.metadata["changes"] = changes
 
         policy_service = PolicyService(self.context, self.db)
         qa_policy = "full"
+        scan_mode = _config_value(self.context.config, "qa_scan_mode", "incremental", (str,))
         required_checks: List[str] = []
         try:
             effective = policy_service.resolve_effective_policy(
@@ -331,6 +434,8 @@ class QualityService(Service):
             defaults = effective.policy.get("defaults", {}) if isinstance(effective.policy, dict) else {}
             qa_defaults = defaults.get("qa", {}) if isinstance(defaults, dict) else {}
             qa_policy = _normalize_qa_policy(qa_defaults.get("policy"))
+            if qa_defaults.get("scan"):
+                scan_mode = str(qa_defaults["scan"])
             required_checks = _policy_required_checks(effective.policy)
         except Exception:
             qa_policy = "full"
@@ -338,6 +443,11 @@ class QualityService(Service):
         if qa_policy == "skip":
             qa_policy = "full"
 
+        # Incremental scans lint/type/format/security-check only what the step changed.
+        if scan_mode.strip().lower() == "incremental":
+            context.changed_files = self._changed_files(step, run, workspace_root, protocol_root_path)
+        context.metadata["scan_mode"] = "full" if context.changed_files is None else "incremental"
+
         # Run gates
         skip_ids = set(skip_gates or [])
         prompt_gate = None
@@ -444,19 +554,12 @@ class QualityService(Service):
                     error=prompt_gate_error,
                 )
             )
-        for gate in gates_to_run:
-            if gate.gate_id in skip_ids:
-                continue
-            
-            if not gate.enabled:
-                gate_results.append(gate.skip("Gate disabled"))
-                continue
-            
-            try:
-                result = gate.run(context)
-                gate_results.append(result)
-            except Exception as e:
-                gate_results.append(gate.error(str(e)))
+        gate_results.extend(
+            self._gate_runner(self._gate_cache(project.id, use_cache)).run(
+                [g for g in gates_to_run if g.gate_id not in skip_ids],
+                context,
+            )
+        )
         
         # Aggregate verdict
         verdict = self._aggregate_verdict(gate_results)
@@ -467,6 +570,10 @@ class QualityService(Service):
             verdict=verdict,
             gate_results=gate_results,
             duration_seconds=duration,
+            metadata={
+                "scan_mode": context.metadata["scan_mode"],
+                "changed_files": len(context.changed_files) if context.changed_files is not None else None,
+            },
         )
 
         try:
@@ -664,14 +771,7 @@ class QualityService(Service):
         )
         
         gates_to_run = gates or self.default_gates
-        gate_results = []
-        
-        for gate in gates_to_run:
-            try:
-                result = gate.run(context)
-                gate_results.append(result)
-            except Exception as e:
-                gate_results.append(gate.error(str(e)))
+        gate_results = self._gate_runner().run(list(gates_to_run), context)
         
         verdict = self._aggregate_verdict(gate_results)
         
@@ -0,0 +1,363 @@
+"""
+DevGodzilla Repository Index
+
+A per-commit index of the files in a repository (size, language and
+top-level symbols) used to render the repository map injected into planning
+prompts. Indexes are built from `git ls-tree` and blob contents read through
+one `git cat-file --batch` process, stored next to the repository's git
+objects, and updated incrementally: a new commit re-reads only the files
+`git diff --name-status` reports against the closest stored index.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import subprocess
+import threading
+from collections import Counter, OrderedDict
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from devgodzilla.logging import get_logger, log_extra
+
+logger = get_logger(__name__)
+
+INDEX_VERSION = 1
+INDEX_DIR_NAME = "devgodzilla-index"
+# Stored indexes kept per repository (newest first by mtime).
+MAX_STORED_INDEXES = 8
+# Larger blobs are listed but not parsed for symbols.
+MAX_SYMBOL_SOURCE_BYTES = 256 * 1024
+MAX_SYMBOLS_PER_FILE = 20
+
+LANGUAGES = {
+    ".py": "python", ".pyi": "python",
+    ".js": "javascript", ".jsx": "javascript", ".mjs": "javascript", ".cjs": "javascript",
+    ".ts": "typescript", ".tsx": "typescript",
+    ".go": "go", ".rs": "rust", ".java": "java", ".kt": "kotlin", ".rb": "ruby",
+    ".c": "c", ".h": "c", ".cc": "cpp", ".cpp": "cpp", ".hpp": "cpp", ".cs": "csharp",
+    ".php": "php", ".swift": "swift", ".scala": "scala", ".sh": "shell", ".sql": "sql",
+    ".md": "markdown", ".rst": "text", ".txt": "text",
+    ".json": "json", ".yaml": "yaml", ".yml": "yaml", ".toml": "toml",
+    ".html": "html", ".css": "css", ".scss": "css",
+}
+
+_SYMBOL_PATTERNS = {
+    "python": re.compile(r"^(?:async\s+)?(?:def|class)\s+([A-Za-z_]\w*)", re.MULTILINE),
+    "javascript": re.compile(
+        r"^export\s+(?:default\s+)?(?:async\s+)?(?:function\*?|class|const|let)\s+([A-Za-z_$][\w$]*)", re.MULTILINE
+    ),
+    "typescript": re.compile(
+        r"^export\s+(?:default\s+)?(?:declare\s+)?(?:abstract\s+)?(?:async\s+)?"
+        r"(?:function\*?|class|const|let|interface|type|enum)\s+([A-Za-z_$][\w$]*)",
+        re.MULTILINE,
+    ),
+    "go": re.compile(r"^(?:func\s+(?:\([^)]*\)\s*)?|type\s+)([A-Za-z_]\w*)", re.MULTILINE),
+    "rust": re.compile(r"^pub\s+(?:async\s+)?(?:fn|struct|enum|trait|mod|type)\s+([A-Za-z_]\w*)", re.MULTILINE),
+    "java": re.compile(r"^public\s+(?:abstract\s+|final\s+)*(?:class|interface|enum|record)\s+([A-Za-z_]\w*)", re.MULTILINE),
+    "kotlin": re.compile(r"^(?:data\s+|sealed\s+|open\s+)*(?:class|interface|object|fun)\s+([A-Za-z_]\w*)", re.MULTILINE),
+    "ruby": re.compile(r"^(?:class|module|def)\s+([A-Za-z_][\w:.]*)", re.MULTILINE),
+}
+
+# Files worth showing regardless of the query.
+_KEY_FILES = {
+    "readme.md", "readme.rst", "readme", "pyproject.toml", "setup.py", "package.json", "makefile",
+    "cargo.toml", "go.mod", "dockerfile", "docker-compose.yml", "requirements.txt", "agents.md",
+}
+_WORD_RE = re.compile(r"[a-z0-9]+")
+_STOP_WORDS = {"the", "and", "for", "with", "add", "use", "from", "into", "this", "that", "new", "step"}
+
+
+@dataclass
+class IndexedFile:
+    path: str
+    size: int
+    language: Optional[str] = None
+    symbols: List[str] = field(default_factory=list)
+
+
+@dataclass
+class RepoIndex:
+    commit: str
+    files: Dict[str, IndexedFile] = field(default_factory=dict)
+    # How the index was obtained: "memory", "stored", "incremental" or "full".
+    source: str = "full"
+
+    def to_json(self) -> Dict:
+        return {
+            "version": INDEX_VERSION,
+            "commit": self.commit,
+            "files": [asdict(f) for f in self.files.values()],
+        }
+
+    @classmethod
+    def from_json(cls, payload: Dict) -> Optional["RepoIndex"]:
+        if not isinstance(payload, dict) or payload.get("version") != INDEX_VERSION:
+            return None
+        files = {item["path"]: IndexedFile(**item) for item in payload.get("files", [])}
+        return cls(commit=str(payload.get("commit")), files=files, source="stored")
+
+
+def _git(repo_root: Path, *args: str) -> Optional[str]:
+    try:
+        proc = subprocess.run(["git", *args], cwd=repo_root, capture_output=True, text=True, timeout=60)
+    except Exception:
+        return None
+    return proc.stdout if proc.returncode == 0 else None
+
+
+def language_for(path: str) -> Optional[str]:
+    name = path.rsplit("/", 1)[-1].lower()
+    if name in ("makefile", "dockerfile"):
+        return name
+    return LANGUAGES.get(os.path.splitext(name)[1])
+
+
+def extract_symbols(language: Optional[str], source: str) -> List[str]:
+    """Top-level definitions in `source` (first MAX_SYMBOLS_PER_FILE, in order)."""
+    pattern = _SYMBOL_PATTERNS.get(language or "")
+    if pattern is None:
+        return []
+    seen: Dict[str, None] = {}
+    for match in pattern.finditer(source):
+        seen.setdefault(match.group(1), None)
+        if len(seen) >= MAX_SYMBOLS_PER_FILE:
+            break
+    return list(seen)
+
+
+def _ls_tree(repo_root: Path, commit: str, paths: Optional[List[str]] = None) -> Optional[List[Tuple[str, str, int]]]:
+    """(path, blob sha, size) of regular files in `commit`, optionally limited to `paths`."""
+    args = ["ls-tree", "-r", "-l", "-z", "--full-tree", commit]
+    if paths is not None:
+        args += ["--", *paths]
+    out = _git(repo_root, *args)
+    if out is None:
+        return None
+    entries = []
+    for record in out.split("\0"):
+        if not record:
+            continue
+        meta, _, path = record.partition("\t")
+        parts = meta.split()
+        if len(parts) != 4 or parts[1] != "blob":
+            continue  # submodules
+        entries.append((path, parts[2], int(parts[3]) if parts[3].isdigit() else 0))
+    return entries
+
+
+def _read_blobs(repo_root: Path, shas: Iterable[str]) -> Dict[str, bytes]:
+    """Blob contents through one `git cat-file --batch` process."""
+    shas = list(dict.fromkeys(shas))
+    if not shas:
+        return {}
+    proc = subprocess.Popen(
+        ["git", "cat-file", "--batch"],
+        cwd=repo_root,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+    assert proc.stdin is not None and proc.stdout is not None
+
+    def feed() -> None:
+        try:
+            for sha in shas:
+                proc.stdin.write(f"{sha}\n".encode("ascii"))
+            proc.stdin.close()
+        except (BrokenPipeError, OSError):
+            pass
+
+    # Feed from a thread so large batches cannot deadlock on full pipes.
+    writer = threading.Thread(target=feed, daemon=True)
+    writer.start()
+    blobs: Dict[str, bytes] = {}
+    for sha in shas:
+        header = proc.stdout.readline().split()
+        if len(header) != 3:
+            continue
+        data = proc.stdout.read(int(header[2]))
+        proc.stdout.read(1)
+        blobs[sha] = data
+    writer.join()
+    proc.stdout.close()
+    proc.wait()
+    return blobs
+
+
+def _index_entries(repo_root: Path, entries: List[Tuple[str, str, int]]) -> Dict[str, IndexedFile]:
+    files = {path: IndexedFile(path=path, size=size, language=language_for(path)) for path, _, size in entries}
+    parse: Dict[str, List[str]] = {}
+    for path, sha, size in entries:
+        if size <= MAX_SYMBOL_SOURCE_BYTES and files[path].language in _SYMBOL_PATTERNS:
+            parse.setdefault(sha, []).append(path)
+    for sha, data in _read_blobs(repo_root, parse).items():
+        text = data.decode("utf-8", errors="ignore")
+        for path in parse[sha]:
+            files[path].symbols = extract_symbols(files[path].language, text)
+    return files
+
+
+def _store_dir(repo_root: Path) -> Optional[Path]:
+    common = _git(repo_root, "rev-parse", "--git-common-dir")
+    if common is None:
+        return None
+    path = Path(common.strip())
+    if not path.is_absolute():
+        path = (repo_root / path).resolve()
+    return path / INDEX_DIR_NAME
+
+
+def _load_stored(store: Path, commit: str) -> Optional[RepoIndex]:
+    try:
+        return RepoIndex.from_json(json.loads((store / f"{commit}.json").read_text(encoding="utf-8")))
+    except (OSError, ValueError, TypeError, KeyError):
+        return None
+
+
+def _save(store: Path, index: RepoIndex) -> None:
+    try:
+        store.mkdir(parents=True, exist_ok=True)
+        tmp = store / f".{index.commit}.{os.getpid()}.tmp"
+        tmp.write_text(json.dumps(index.to_json(), separators=(",", ":")), encoding="utf-8")
+        tmp.replace(store / f"{index.commit}.json")
+        stored = sorted(store.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True)
+        for old in stored[MAX_STORED_INDEXES:]:
+            old.unlink(missing_ok=True)
+    except OSError as exc:
+        logger.warning("repo_index_save_failed", extra=log_extra(store=str(store), error=str(exc)))
+
+
+def _apply_diff(repo_root: Path, base: RepoIndex, commit: str) -> Optional[RepoIndex]:
+    """Update `base` to `commit` by re-indexing the files changed between them."""
+    out = _git(repo_root, "diff", "--name-status", "--no-renames", "-z", base.commit, commit)
+    if out is None:
+        return None
+    fields = [f for f in out.split("\0") if f]
+    files = dict(base.files)
+    changed: List[str] = []
+    for status, path in zip(fields[::2], fields[1::2]):
+        files.pop(path, None)
+        if not status.startswith("D"):
+            changed.append(path)
+    entries: List[Tuple[str, str, int]] = []
+    for start in range(0, len(changed), 500):
+        chunk = _ls_tree(repo_root, commit, changed[start:start + 500])
+        if chunk is None:
+            return None
+        entries.extend(chunk)
+    files.update(_index_entries(repo_root, entries))
+    return RepoIndex(commit=commit, files=files, source="incremental")
+
+
+_memory: "OrderedDict[Tuple[str, str], RepoIndex]" = OrderedDict()
+_memory_lock = threading.Lock()
+_MEMORY_SIZE = 16
+
+
+def load_repo_index(repo_root: Path, commit: str = "HEAD") -> Optional[RepoIndex]:
+    """
+    Index of `commit` in the repository at `repo_root` (None if not a git repo).
+
+    Served from memory or the on-disk store when present; otherwise derived
+    from the most recent stored index via `git diff`, or built from scratch.
+    """
+    repo_root = Path(repo_root)
+    resolved = _git(repo_root, "rev-parse", "--verify", "--quiet", f"{commit}^{{commit}}")
+    store = _store_dir(repo_root)
+    if not resolved or store is None:
+        return None
+    sha = resolved.strip()
+    key = (str(store), sha)
+    with _memory_lock:
+        if key in _memory:
+            _memory.move_to_end(key)
+            return RepoIndex(commit=sha, files=_memory[key].files, source="memory")
+
+    index = _load_stored(store, sha)
+    if index is None:
+        for candidate in sorted(store.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True) if store.is_dir() else []:
+            base = _load_stored(store, candidate.stem)
+            index = _apply_diff(repo_root, base, sha) if base is not None else None
+            if index is not None:
+                break
+        if index is None:
+            entries = _ls_tree(repo_root, sha)
+            if entries is None:
+                return None
+            index = RepoIndex(commit=sha, files=_index_entries(repo_root, entries), source="full")
+        _save(store, index)
+        logger.info(
+            "repo_index_built",
+            extra=log_extra(repo_root=str(repo_root), commit=sha, source=index.source, files=len(index.files)),
+        )
+
+    with _memory_lock:
+        _memory[key] = index
+        _memory.move_to_end(key)
+        while len(_memory) > _MEMORY_SIZE:
+            _memory.popitem(last=False)
+    return index
+
+
+def _terms(text: str) -> set:
+    return {w for w in _WORD_RE.findall(text.lower()) if len(w) > 2 and w not in _STOP_WORDS}
+
+
+def _relevance(item: IndexedFile, terms: set) -> float:
+    parts = item.path.lower().split("/")
+    score = 0.0
+    if parts[-1] in _KEY_FILES:
+        score += 5.0
+    path_terms = _terms(item.path.replace("_", " ").replace("-", " "))
+    score += 3.0 * len(terms & path_terms)
+    if item.symbols:
+        symbol_terms = _terms(" ".join(re.sub(r"([a-z])([A-Z])", r"\1 \2", s).replace("_", " ") for s in item.symbols))
+        score += 1.0 * len(terms & symbol_terms)
+    if item.language in _SYMBOL_PATTERNS:
+        score += 0.5
+    if "test" in parts[0] or "/tests/" in f"/{item.path.lower()}":
+        score -= 0.5
+    return score - 0.2 * (len(parts) - 1)
+
+
+def render_repo_map(index: RepoIndex, *, query: str = "", token_budget: int = 2000) -> str:
+    """
+    Markdown repository map within roughly `token_budget` tokens (4 chars/token).
+
+    Starts with per-directory file counts and languages, then lists files
+    (with their top-level symbols) in order of relevance to `query`.
+    """
+    budget = max(200, int(token_budget)) * 4
+    lines = ["# Repository Map", "", f"Commit `{index.commit[:12]}`, {len(index.files)} files.", ""]
+
+    top: Dict[str, Counter] = {}
+    for item in index.files.values():
+        head = item.path.split("/", 1)[0] if "/" in item.path else "(root)"
+        top.setdefault(head, Counter())[item.language or "other"] += 1
+    lines.append("## Layout")
+    for head, counts in sorted(top.items(), key=lambda kv: -sum(kv[1].values()))[:30]:
+        langs = ", ".join(f"{lang} {n}" for lang, n in counts.most_common(3))
+        label = head if head == "(root)" else f"{head}/"
+        lines.append(f"- {label} ({sum(counts.values())} files: {langs})")
+    lines.extend(["", "## Files"])
+
+    used = sum(len(line) + 1 for line in lines)
+    terms = _terms(query)
+    ranked = sorted(index.files.values(), key=lambda f: (-_relevance(f, terms), f.path))
+    shown = 0
+    for item in ranked:
+        line = f"- {item.path}"
+        if item.symbols:
+            line += f": {', '.join(item.symbols[:8])}"
+        if used + len(line) + 1 > budget:
+            break
+        lines.append(line)
+        used += len(line) + 1
+        shown += 1
+    if shown < len(ranked):
+        lines.append(f"- ... {len(ranked) - shown} more files")
+    return "\n".join(lines)
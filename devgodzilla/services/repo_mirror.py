@@ -0,0 +1,125 @@
+"""
+DevGodzilla Repository Mirror Cache
+
+Bare `--mirror` clones keyed by upstream URL (credentials removed), shared by
+every project that points at the same repository URL. Mirrors are created once and
+then kept current with incremental fetches; project checkouts are cloned
+from them (hardlinked objects) or borrow their objects via `--reference`,
+so onboarding the same upstream twice does not download or store its
+history twice.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import shutil
+import threading
+import uuid
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit, urlunsplit
+
+from devgodzilla.errors import GitCommandError
+from devgodzilla.logging import get_logger, log_extra
+from devgodzilla.services.git import run_process
+
+logger = get_logger(__name__)
+
+# How project checkouts are created; `defaults.git.clone` in a project's policy
+# overrides DEVGODZILLA_GIT_CLONE_STRATEGY.
+CLONE_STRATEGIES = ("full", "reference", "partial", "shallow")
+
+_mirror_locks: Dict[str, threading.Lock] = {}
+_mirror_locks_guard = threading.Lock()
+
+
+def normalize_clone_strategy(value: Optional[str], default: str = "full") -> str:
+    strategy = (value or "").strip().lower()
+    return strategy if strategy in CLONE_STRATEGIES else default
+
+
+def mirror_key(git_url: str) -> str:
+    """
+    Identity of the upstream a mirror is cloned from.
+
+    Unlike the webhook routing key (`normalize_repo_url`), nothing but
+    credentials is dropped: case, port, scheme and `.git` are kept, so two
+    distinct upstreams never share a mirror.
+    """
+    text = git_url.strip().rstrip("/")
+    if "://" in text:
+        parts = urlsplit(text)
+        netloc = parts.netloc.rsplit("@", 1)[-1]
+        text = urlunsplit((parts.scheme.lower(), netloc, parts.path, parts.query, ""))
+    return text
+
+
+def mirror_path(mirror_root: Path, git_url: str) -> Path:
+    """Location of the mirror for `git_url` (readable name plus a hash of `mirror_key`)."""
+    key = mirror_key(git_url) or "repo"
+    name = re.sub(r"[^A-Za-z0-9._-]+", "_", re.split(r"[/:]", key)[-1]) or "repo"
+    if name.endswith(".git"):
+        name = name[:-4] or "repo"
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:12]
+    return Path(mirror_root).expanduser() / f"{name}-{digest}.git"
+
+
+def _mirror_lock(path: Path) -> threading.Lock:
+    with _mirror_locks_guard:
+        return _mirror_locks.setdefault(str(path), threading.Lock())
+
+
+def ensure_mirror(mirror_root: Path, git_url: str) -> Path:
+    """
+    Create or incrementally update the mirror of `git_url`; returns its path.
+
+    New mirrors are cloned into a temporary directory and renamed into
+    place, so a concurrent process never sees a partial mirror. Raises
+    GitCommandError when the mirror cannot be created.
+    """
+    path = mirror_path(mirror_root, git_url)
+    with _mirror_lock(path):
+        if (path / "HEAD").exists():
+            result = run_process(
+                ["git", "--git-dir", str(path), "fetch", "--prune", "--quiet", "origin"],
+                check=False,
+            )
+            if result.returncode != 0:
+                # A stale mirror still saves most of the transfer; the checkout fetches the rest.
+                logger.warning(
+                    "repo_mirror_fetch_failed",
+                    extra=log_extra(mirror=str(path), error=(result.stderr or "").strip()[-500:]),
+                )
+            return path
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        staging = path.parent / f".{path.name}.{uuid.uuid4().hex[:8]}.tmp"
+        try:
+            run_process(["git", "clone", "--mirror", "--quiet", git_url, str(staging)])
+            # Checkouts may borrow objects through alternates; never prune them away.
+            run_process(["git", "--git-dir", str(staging), "config", "gc.pruneExpire", "never"])
+            staging.rename(path)
+        except Exception as exc:
+            shutil.rmtree(staging, ignore_errors=True)
+            if (path / "HEAD").exists():
+                return path
+            raise GitCommandError(f"Failed to mirror {git_url}: {exc}") from exc
+        logger.info("repo_mirror_created", extra=log_extra(mirror=str(path)))
+        return path
+
+
+def clone_command(git_url: str, target: Path, strategy: str, mirror: Optional[Path] = None) -> List[str]:
+    """`git clone` arguments for a project checkout of `git_url` using `strategy`."""
+    cmd = ["git", "clone", "--quiet"]
+    if strategy == "partial":
+        cmd += ["--filter=blob:none"]
+    elif strategy == "shallow":
+        cmd += ["--depth", "1", "--no-single-branch"]
+    if mirror is not None:
+        if strategy == "full":
+            # Local clone from the mirror hardlinks its objects; origin is reset afterwards.
+            return [*cmd, str(mirror), str(target)]
+        if strategy == "reference":
+            cmd += ["--reference-if-able", str(mirror)]
+    return [*cmd, git_url, str(target)]
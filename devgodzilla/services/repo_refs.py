@@ -0,0 +1,264 @@
+"""
+DevGodzilla Repository Ref Cache
+
+In-memory cache of per-repository git metadata (branches, remote heads,
+recent commits, worktrees, pull requests) for the project API. Entries are
+served until their TTL expires; after that the stale value is returned
+immediately (flagged `stale`) while one background thread reloads it.
+Concurrent misses for the same entry share a single load, and our own
+branch, worktree and push operations drop a repository's entries.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from devgodzilla.config import get_config
+from devgodzilla.logging import get_logger, log_extra
+from devgodzilla.services.git import run_process
+
+logger = get_logger(__name__)
+
+# Kinds that need the network; they use the remote TTL.
+REMOTE_KINDS = frozenset({"remote_heads", "pulls", "pr_urls"})
+
+
+@dataclass
+class CachedRefs:
+    value: Any
+    fetched_at: float
+    stale: bool = False
+
+
+_Key = Tuple[str, str, Any]
+
+
+def _repo_key(repo_path: Path) -> str:
+    return str(Path(repo_path).expanduser().resolve())
+
+
+class RepoRefCache:
+    """
+    TTL cache with stale-while-revalidate and single-flight loads.
+
+    Example:
+        cache = get_repo_ref_cache()
+        entry = cache.get(repo_path, "local_heads", load_local_heads)
+        entry.value, entry.fetched_at, entry.stale
+    """
+
+    def __init__(self, *, ttl_seconds: float = 10.0, remote_ttl_seconds: float = 60.0) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.remote_ttl_seconds = remote_ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: Dict[_Key, CachedRefs] = {}
+        self._inflight: Dict[_Key, Tuple[Future, int]] = {}
+        # Bumped on invalidation so loads started before it are not stored.
+        self._generation: Dict[str, int] = {}
+
+    def _ttl(self, kind: str) -> float:
+        return self.remote_ttl_seconds if kind in REMOTE_KINDS else self.ttl_seconds
+
+    def get(
+        self,
+        repo_path: Path,
+        kind: str,
+        loader: Callable[[Path], Any],
+        *,
+        arg: Any = None,
+        refresh: bool = False,
+    ) -> CachedRefs:
+        """
+        Cached `loader(repo_path)` for `kind` (and `arg`, e.g. a limit).
+
+        `refresh=True` waits for a fresh load. Loader errors propagate to
+        the callers waiting on that load and are not cached.
+        """
+        key: _Key = (_repo_key(repo_path), kind, arg)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and not refresh:
+                if time.time() - entry.fetched_at < self._ttl(kind):
+                    return entry
+                future, generation, owner = self._claim(key)
+                if owner:
+                    threading.Thread(
+                        target=self._load,
+                        args=(key, loader, future, generation),
+                        name="devgodzilla-repo-refs",
+                        daemon=True,
+                    ).start()
+                return CachedRefs(entry.value, entry.fetched_at, stale=True)
+            future, generation, owner = self._claim(key)
+        if owner:
+            self._load(key, loader, future, generation)
+        return future.result()
+
+    def _claim(self, key: _Key) -> Tuple[Future, int, bool]:
+        # Caller holds self._lock. Returns the in-flight load and whether the caller must run it.
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return inflight[0], inflight[1], False
+        future: Future = Future()
+        generation = self._generation.get(key[0], 0)
+        self._inflight[key] = (future, generation)
+        return future, generation, True
+
+    def _load(self, key: _Key, loader: Callable[[Path], Any], future: Future, generation: int) -> None:
+        try:
+            entry = CachedRefs(loader(Path(key[0])), time.time())
+        except Exception as exc:
+            logger.warning(
+                "repo_refs_load_failed",
+                extra=log_extra(repo_path=key[0], kind=key[1], error=str(exc)),
+            )
+            with self._lock:
+                self._inflight.pop(key, None)
+            future.set_exception(exc)
+            return
+        with self._lock:
+            if self._generation.get(key[0], 0) == generation:
+                self._entries[key] = entry
+            self._inflight.pop(key, None)
+        future.set_result(entry)
+
+    def invalidate(self, path: Path) -> None:
+        """Drop entries of the repository at `path`, or containing `path` (e.g. its worktrees)."""
+        target = _repo_key(path)
+        with self._lock:
+            repos = {
+                repo for repo, _, _ in self._entries
+                if target == repo or target.startswith(repo.rstrip("/") + "/")
+            }
+            repos.add(target)
+            for repo in repos:
+                self._generation[repo] = self._generation.get(repo, 0) + 1
+            self._entries = {k: v for k, v in self._entries.items() if k[0] not in repos}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._generation.clear()
+
+
+_cache: Optional[RepoRefCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_repo_ref_cache() -> RepoRefCache:
+    """Process-wide cache; TTLs follow the current config."""
+    global _cache
+    config = get_config()
+    with _cache_lock:
+        if _cache is None:
+            _cache = RepoRefCache()
+        _cache.ttl_seconds = config.repo_refs_ttl_seconds
+        _cache.remote_ttl_seconds = config.repo_remote_refs_ttl_seconds
+        return _cache
+
+
+def invalidate_repo_refs(path: Path) -> None:
+    """Forget cached refs after a push, branch or worktree change under `path`."""
+    if _cache is not None:
+        _cache.invalidate(path)
+
+
+# Loaders. Each returns plain data and treats git/gh failures as "nothing found".
+
+
+def load_local_heads(repo_path: Path) -> List[Dict[str, str]]:
+    """Local branches with their tip commit."""
+    result = run_process(
+        [
+            "git", "for-each-ref",
+            "--format=%(refname:short)%00%(objectname)%00%(contents:subject)%00%(committerdate:relative)",
+            "refs/heads/",
+        ],
+        cwd=repo_path,
+        check=False,
+    )
+    heads = []
+    for line in result.stdout.splitlines() if result.returncode == 0 else []:
+        parts = line.split("\x00")
+        if len(parts) == 4 and parts[0]:
+            heads.append({"name": parts[0], "sha": parts[1], "subject": parts[2], "date": parts[3]})
+    return heads
+
+
+def load_remote_heads(repo_path: Path) -> List[Dict[str, str]]:
+    """Branches on `origin` (network round-trip)."""
+    result = run_process(["git", "ls-remote", "--heads", "origin"], cwd=repo_path, check=False)
+    heads = []
+    for line in result.stdout.splitlines() if result.returncode == 0 else []:
+        parts = line.split()
+        if len(parts) >= 2 and parts[1].startswith("refs/heads/"):
+            heads.append({"name": parts[1][len("refs/heads/"):], "sha": parts[0]})
+    return heads
+
+
+def load_commits(repo_path: Path, limit: int) -> List[Dict[str, str]]:
+    result = run_process(
+        ["git", "log", f"-{limit}", "--format=%H|%s|%an|%ar"],
+        cwd=repo_path,
+        check=False,
+    )
+    commits = []
+    for line in result.stdout.strip().splitlines() if result.returncode == 0 else []:
+        parts = line.split("|", 3)
+        if len(parts) >= 4:
+            commits.append({"sha": parts[0], "message": parts[1], "author": parts[2], "date": parts[3]})
+    return commits
+
+
+def load_worktrees(repo_path: Path) -> Dict[str, str]:
+    """Branch name -> worktree path from `git worktree list`."""
+    result = run_process(["git", "worktree", "list", "--porcelain"], cwd=repo_path, check=False)
+    worktrees: Dict[str, str] = {}
+    current: Optional[str] = None
+    for line in result.stdout.splitlines() if result.returncode == 0 else []:
+        if line.startswith("worktree "):
+            current = line.split(" ", 1)[1]
+        elif line.startswith("branch refs/heads/") and current:
+            worktrees[line[len("branch refs/heads/"):]] = current
+            current = None
+    return worktrees
+
+
+def load_pulls(repo_path: Path) -> List[Dict[str, Any]]:
+    """Open pull requests via the GitHub CLI (empty when gh is unavailable)."""
+    try:
+        result = run_process(
+            ["gh", "pr", "list", "--json", "number,title,headRefName,state,author,url,createdAt,statusCheckRollup"],
+            cwd=repo_path,
+            check=False,
+        )
+    except OSError:
+        return []
+    if result.returncode != 0 or not result.stdout.strip():
+        return []
+    return json.loads(result.stdout)
+
+
+def load_pr_urls(repo_path: Path) -> Dict[str, str]:
+    """Head branch -> URL of its most recent pull request, any state."""
+    try:
+        result = run_process(
+            ["gh", "pr", "list", "--state", "all", "--limit", "500", "--json", "headRefName,url"],
+            cwd=repo_path,
+            check=False,
+        )
+    except OSError:
+        return {}
+    if result.returncode != 0 or not result.stdout.strip():
+        return {}
+    urls: Dict[str, str] = {}
+    for pr in json.loads(result.stdout):
+        # gh lists newest first.
+        urls.setdefault(pr.get("headRefName", ""), pr.get("url"))
+    return urls
@@ -1369,9 +1369,10 @@ class SpecificationService(Service):
         repo_root = git_service.resolve_repo_root(worktree_path)
 
         try:
-            git_service.remove_worktree(
+            git_service.release_worktree(
                 repo_root,
                 worktree_path,
+                spec_run.base_branch,
                 spec_run_id=spec_run_id,
                 project_id=spec_run.project_id,
             )
@@ -1749,7 +1750,7 @@ Legend:
             raise RuntimeError(f"SpecKit engine not registered: {resolved_engine_id}") from exc
 
         try:
-            available = engine.check_availability()
+            available = registry.is_available(engine)
         except Exception as exc:
             available = False
             availability_error = str(exc)
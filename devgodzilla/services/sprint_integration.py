@@ -8,6 +8,7 @@ Links protocol steps to sprint tasks and synchronizes status updates.
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 
+from devgodzilla.db.async_database import get_async_database
 from devgodzilla.db.database import Database
 from devgodzilla.logging import get_logger
 from devgodzilla.models.domain import AgileTask, ProtocolRun, Sprint, StepRun
@@ -107,7 +108,8 @@ class SprintIntegrationService:
         Raises:
             KeyError: If protocol run or sprint not found
         """
-        protocol_run = self.db.get_protocol_run(protocol_run_id)
+        adb = get_async_database(self.db)
+        protocol_run = await adb.get_protocol_run(protocol_run_id)
         sprint = self.db.get_sprint(sprint_id)
 
         if protocol_run.project_id != sprint.project_id:
@@ -116,7 +118,7 @@ class SprintIntegrationService:
                 f"sprint project {sprint.project_id}"
             )
 
-        step_runs = self.db.list_step_runs(protocol_run_id)
+        step_runs = await adb.list_step_runs(protocol_run_id)
 
         tasks: List[AgileTask] = []
 
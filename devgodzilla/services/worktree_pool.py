@@ -0,0 +1,225 @@
+"""
+DevGodzilla Worktree Pool
+
+Keeps a few clean, detached worktrees per repository and base branch so a
+protocol or spec run can claim one (`git worktree move` plus a branch
+checkout) instead of paying for `git worktree add` and a full checkout at
+start. Released worktrees are reset, cleaned and returned to the pool.
+
+Pooled worktrees live under `<repo>/worktrees/.pool/<base_branch>/`. A claim
+is a rename, so concurrent processes sharing a repository never hand out
+the same worktree: the loser of a race just tries the next one.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+import uuid
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from devgodzilla.config import get_config
+from devgodzilla.logging import get_logger, log_extra
+from devgodzilla.services.git import run_process, with_git_lock_retry
+
+logger = get_logger(__name__)
+
+POOL_DIR_NAME = ".pool"
+_ENTRY_PREFIX = "wt-"
+
+
+def _slug(branch: str) -> str:
+    return re.sub(r"[^A-Za-z0-9._-]+", "_", branch).strip("._") or "default"
+
+
+class WorktreePool:
+    """
+    Pre-created worktrees for one repository and base branch.
+
+    Example:
+        pool = WorktreePool(repo_root, "main", size=2)
+        pool.fill()
+        worktree = pool.claim(repo_root / "worktrees" / "feature-x", "feature-x")
+        ...
+        pool.recycle(worktree)
+    """
+
+    def __init__(self, repo_root: Path, base_branch: str, size: int) -> None:
+        self.repo_root = Path(repo_root)
+        self.base_branch = base_branch
+        self.size = max(0, int(size))
+        self.pool_dir = self.repo_root / "worktrees" / POOL_DIR_NAME / _slug(base_branch)
+        self._lock = threading.Lock()
+        self._filling = False
+
+    def base_rev(self) -> Optional[str]:
+        """Commit new runs start from: `origin/<base>`, else `<base>`, else HEAD."""
+        for ref in (f"origin/{self.base_branch}", self.base_branch, "HEAD"):
+            result = run_process(
+                ["git", "rev-parse", "--verify", "--quiet", f"{ref}^{{commit}}"],
+                cwd=self.repo_root,
+                check=False,
+            )
+            if result.returncode == 0 and result.stdout.strip():
+                return result.stdout.strip()
+        return None
+
+    def idle(self) -> List[Path]:
+        """Pooled worktrees ready to be claimed."""
+        if not self.pool_dir.is_dir():
+            return []
+        return sorted(
+            p for p in self.pool_dir.iterdir()
+            if p.name.startswith(_ENTRY_PREFIX) and (p / ".git").exists()
+        )
+
+    def _git(self, *args: str, cwd: Optional[Path] = None) -> None:
+        config = get_config()
+        with_git_lock_retry(
+            lambda: run_process(["git", *args], cwd=cwd or self.repo_root),
+            max_retries=config.git_lock_max_retries,
+            retry_delay=config.git_lock_retry_delay,
+            repo_root=self.repo_root,
+        )
+
+    def _park(self, worktree: Path) -> Path:
+        """Move a clean worktree into the pool under a fresh entry name."""
+        self.pool_dir.mkdir(parents=True, exist_ok=True)
+        target = self.pool_dir / f"{_ENTRY_PREFIX}{uuid.uuid4().hex[:12]}"
+        self._git("worktree", "move", str(worktree), str(target))
+        return target
+
+    def fill(self) -> int:
+        """Create worktrees until the pool holds `size`; returns how many were added."""
+        missing = self.size - len(self.idle())
+        rev = self.base_rev() if missing > 0 else None
+        if rev is None:
+            return 0
+        self.pool_dir.mkdir(parents=True, exist_ok=True)
+        added = 0
+        for _ in range(missing):
+            # Build under a name `idle()` ignores so a half-checked-out tree is never claimed.
+            staging = self.pool_dir / f".staging-{uuid.uuid4().hex[:12]}"
+            try:
+                self._git("worktree", "add", "--detach", "--checkout", str(staging), rev)
+                self._park(staging)
+            except Exception as exc:
+                logger.warning(
+                    "worktree_pool_fill_failed",
+                    extra=log_extra(repo_root=str(self.repo_root), base_branch=self.base_branch, error=str(exc)),
+                )
+                run_process(["git", "worktree", "remove", "--force", str(staging)], cwd=self.repo_root, check=False)
+                break
+            added += 1
+        return added
+
+    def refresh(self) -> None:
+        """Move idle worktrees to the current base commit, then top the pool up."""
+        rev = self.base_rev()
+        if rev is None:
+            return
+        for worktree in self.idle():
+            with self._lock:
+                try:
+                    self._git("checkout", "--quiet", "--detach", "--force", rev, cwd=worktree)
+                except Exception:
+                    # Claimed by another process meanwhile, or broken; claims check out anyway.
+                    continue
+        self.fill()
+
+    def claim(self, target: Path, branch: Optional[str], *, start_point: Optional[str] = None) -> Optional[Path]:
+        """
+        Move an idle worktree to `target` and create `branch` there at the base commit.
+
+        With `start_point` the worktree is checked out at that commit instead,
+        detached when `branch` is None. Returns None when the pool is empty or
+        every candidate was lost to a concurrent claim; callers then create the
+        worktree as usual.
+        """
+        rev = start_point or self.base_rev()
+        if rev is None:
+            return None
+        checkout = ["-b", branch, rev] if branch else ["--detach", rev]
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            for worktree in self.idle():
+                try:
+                    self._git("worktree", "move", str(worktree), str(target))
+                except Exception:
+                    continue
+                try:
+                    self._git("checkout", "--quiet", "--force", *checkout, cwd=target)
+                except Exception:
+                    run_process(["git", "worktree", "remove", "--force", str(target)], cwd=self.repo_root, check=False)
+                    return None
+                return target
+        return None
+
+    def recycle(self, worktree: Path) -> bool:
+        """Reset and clean a released worktree back into the pool; False if the pool is full."""
+        if self.size <= 0 or len(self.idle()) >= self.size:
+            return False
+        rev = self.base_rev()
+        if rev is None:
+            return False
+        try:
+            self._git("reset", "--quiet", "--hard", cwd=worktree)
+            self._git("clean", "-qffdx", cwd=worktree)
+            self._git("checkout", "--quiet", "--detach", rev, cwd=worktree)
+            self._park(worktree)
+        except Exception as exc:
+            logger.warning(
+                "worktree_pool_recycle_failed",
+                extra=log_extra(worktree_path=str(worktree), error=str(exc)),
+            )
+            return False
+        return True
+
+    def refill_async(self, *, refresh: bool = False) -> None:
+        """Run `fill()` (or `refresh()`) on a daemon thread unless one is already running."""
+        with self._lock:
+            if self._filling:
+                return
+            self._filling = True
+
+        def run() -> None:
+            try:
+                self.refresh() if refresh else self.fill()
+            except Exception as exc:
+                logger.warning(
+                    "worktree_pool_refill_failed",
+                    extra=log_extra(repo_root=str(self.repo_root), base_branch=self.base_branch, error=str(exc)),
+                )
+            finally:
+                with self._lock:
+                    self._filling = False
+
+        threading.Thread(target=run, name="devgodzilla-worktree-pool", daemon=True).start()
+
+
+_pools: Dict[Tuple[str, str], WorktreePool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_worktree_pool(repo_root: Path, base_branch: str, size: Optional[int] = None) -> Optional[WorktreePool]:
+    """Process-wide pool for a repository/base branch; None when pooling is disabled."""
+    size = get_config().worktree_pool_size if size is None else size
+    if size <= 0:
+        return None
+    key = (str(Path(repo_root).resolve()), base_branch)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = WorktreePool(Path(repo_root), base_branch, size)
+        pool.size = size
+        return pool
+
+
+def refresh_worktree_pools(repo_root: Path) -> None:
+    """Refresh every pool of `repo_root` in the background, e.g. after a fetch."""
+    root = str(Path(repo_root).resolve())
+    with _pools_lock:
+        pools = [pool for (path, _), pool in _pools.items() if path == root]
+    for pool in pools:
+        pool.refill_async(refresh=True)
@@ -5,9 +5,13 @@ Industrial-grade workflow orchestration via Windmill.
 """
 
 from devgodzilla.windmill.client import (
+    AsyncWindmillClient,
     WindmillClient,
     WindmillConfig,
+    get_shared_async_windmill_client,
+    get_shared_windmill_client,
     get_windmill_config,
+    windmill_config_from_settings,
     JobStatus,
     JobInfo,
     FlowInfo,
@@ -21,9 +25,13 @@ from devgodzilla.windmill.flow_generator import (
 
 __all__ = [
     # Client
+    "AsyncWindmillClient",
     "WindmillClient",
     "WindmillConfig",
+    "get_shared_async_windmill_client",
+    "get_shared_windmill_client",
     "get_windmill_config",
+    "windmill_config_from_settings",
     "JobStatus",
     "JobInfo",
     "FlowInfo",
@@ -5,11 +5,14 @@ HTTP client wrapper for Windmill API.
 Handles job submission, flow management, and status queries.
 """
 
+import asyncio
+import importlib.util
 import os
+import threading
 import time
-from dataclasses import dataclass, field
+from dataclasses import astuple, dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from devgodzilla.logging import get_logger
 
@@ -65,6 +68,10 @@ class WindmillConfig:
     max_retries: int = 3
     backoff_base_seconds: float = 0.5
     backoff_max_seconds: float = 5.0
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 30.0
+    http2: bool = True
 
 
 def get_windmill_config() -> WindmillConfig:
@@ -77,10 +84,123 @@ def get_windmill_config() -> WindmillConfig:
         max_retries=int(os.environ.get("DEVGODZILLA_WINDMILL_MAX_RETRIES", "3")),
         backoff_base_seconds=float(os.environ.get("DEVGODZILLA_WINDMILL_BACKOFF_BASE_SECONDS", "0.5")),
         backoff_max_seconds=float(os.environ.get("DEVGODZILLA_WINDMILL_BACKOFF_MAX_SECONDS", "5.0")),
+        max_connections=int(os.environ.get("DEVGODZILLA_WINDMILL_MAX_CONNECTIONS", "20")),
+        max_keepalive_connections=int(os.environ.get("DEVGODZILLA_WINDMILL_MAX_KEEPALIVE", "10")),
+        http2=os.environ.get("DEVGODZILLA_WINDMILL_HTTP2", "true").lower() in ("1", "true", "yes", "on"),
     )
 
 
-class WindmillClient:
+def windmill_config_from_settings(config: Any) -> WindmillConfig:
+    """Build a WindmillConfig from the application `Config` snapshot."""
+    return WindmillConfig(
+        base_url=config.windmill_url or "http://localhost:8000",
+        token=config.windmill_token or "",
+        workspace=getattr(config, "windmill_workspace", "devgodzilla"),
+        max_connections=getattr(config, "windmill_max_connections", 20),
+        max_keepalive_connections=getattr(config, "windmill_max_keepalive_connections", 10),
+        http2=getattr(config, "windmill_http2", True),
+    )
+
+
+def _http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+_RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+def _job_status_from(data: Dict[str, Any]) -> JobStatus:
+    """Map Windmill job type/success to a stable status enum."""
+    job_type = str(data.get("type") or "").lower()
+    if data.get("canceled"):
+        return JobStatus.CANCELED
+    if "running" in job_type:
+        return JobStatus.RUNNING
+    if "queued" in job_type:
+        return JobStatus.RUNNING if data.get("running") else JobStatus.QUEUED
+    if "canceled" in job_type or "cancelled" in job_type:
+        return JobStatus.CANCELED
+    if "failed" in job_type:
+        return JobStatus.FAILED
+    if "completed" in job_type:
+        return JobStatus.COMPLETED if bool(data.get("success", True)) else JobStatus.FAILED
+    return JobStatus.QUEUED
+
+
+def job_info_from_payload(job_id: str, data: Dict[str, Any]) -> JobInfo:
+    """Build a JobInfo from a `jobs_u/get` or `jobs/list` job payload."""
+    return JobInfo(
+        id=job_id,
+        status=_job_status_from(data),
+        created_at=data.get("created_at"),
+        started_at=data.get("started_at"),
+        completed_at=data.get("completed_at"),
+        result=data.get("result"),
+        error=data.get("error") or data.get("err"),
+    )
+
+
+def _jobs_list_params(
+    per_page: int,
+    page: int,
+    job_kinds: Optional[str],
+    script_path_exact: Optional[str],
+    created_or_started_after: Optional[str] = None,
+) -> Dict[str, Any]:
+    params: Dict[str, Any] = {
+        "per_page": max(1, min(int(per_page), 200)),
+        "page": max(1, int(page)),
+    }
+    if job_kinds:
+        params["job_kinds"] = job_kinds
+    if script_path_exact:
+        params["script_path_exact"] = script_path_exact
+    if created_or_started_after:
+        params["created_or_started_after"] = created_or_started_after
+    return params
+
+
+class _WindmillClientBase:
+    """Connection settings and retry policy shared by the sync and async clients."""
+
+    def __init__(self, config: Optional[WindmillConfig] = None) -> None:
+        self.config = config or get_windmill_config()
+        if not HTTPX_AVAILABLE:
+            raise ImportError(f"httpx is required for {type(self).__name__}. Install: pip install httpx")
+
+    def _client_kwargs(self) -> Dict[str, Any]:
+        return {
+            "base_url": self.config.base_url,
+            "timeout": self.config.timeout,
+            "headers": {
+                "Authorization": f"Bearer {self.config.token}",
+                "Content-Type": "application/json",
+            },
+            "limits": httpx.Limits(
+                max_connections=self.config.max_connections,
+                max_keepalive_connections=self.config.max_keepalive_connections,
+                keepalive_expiry=self.config.keepalive_expiry,
+            ),
+            "http2": bool(self.config.http2) and _http2_available(),
+        }
+
+    def _url(self, path: str) -> str:
+        """Build API URL."""
+        return f"/api/w/{self.config.workspace}{path}"
+
+    def _retry_delay(self, attempt: int, exc: Exception) -> Optional[float]:
+        """Backoff before retrying `exc`, or None if it should be raised."""
+        if attempt >= max(0, int(self.config.max_retries)):
+            return None
+        if isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code not in _RETRYABLE_STATUS:
+            return None
+        return min(
+            self.config.backoff_base_seconds * (2 ** attempt),
+            self.config.backoff_max_seconds,
+        )
+
+
+class WindmillClient(_WindmillClientBase):
     """
     HTTP client for Windmill API.
     
@@ -105,57 +225,42 @@ class WindmillClient:
     """
 
     def __init__(self, config: Optional[WindmillConfig] = None) -> None:
-        self.config = config or get_windmill_config()
-        if not HTTPX_AVAILABLE:
-            raise ImportError("httpx is required for WindmillClient. Install: pip install httpx")
+        super().__init__(config)
         self._client: Optional[httpx.Client] = None
+        self._client_lock = threading.Lock()
+        self._in_flight = 0
+        self._retired = False
 
     def _get_client(self) -> "httpx.Client":
-        """Get or create HTTP client."""
+        """Get or create the pooled HTTP client."""
         if self._client is None:
-            self._client = httpx.Client(
-                base_url=self.config.base_url,
-                timeout=self.config.timeout,
-                headers={
-                    "Authorization": f"Bearer {self.config.token}",
-                    "Content-Type": "application/json",
-                },
-            )
+            with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.Client(**self._client_kwargs())
         return self._client
 
-    def _url(self, path: str) -> str:
-        """Build API URL."""
-        return f"/api/w/{self.config.workspace}{path}"
-
     def _request(self, method: str, path: str, **kwargs: Any) -> "httpx.Response":
         """Issue a Windmill API request with retry/backoff."""
-        retryable = {429, 500, 502, 503, 504}
-        max_retries = max(0, int(self.config.max_retries))
-        for attempt in range(max_retries + 1):
-            try:
-                resp = self._get_client().request(method, self._url(path), **kwargs)
+        with self._client_lock:
+            self._in_flight += 1
+        try:
+            attempt = 0
+            while True:
                 try:
+                    resp = self._get_client().request(method, self._url(path), **kwargs)
                     resp.raise_for_status()
-                except httpx.HTTPStatusError as exc:
-                    status = exc.response.status_code
-                    if status in retryable and attempt < max_retries:
-                        delay = min(
-                            self.config.backoff_base_seconds * (2 ** attempt),
-                            self.config.backoff_max_seconds,
-                        )
-                        time.sleep(delay)
-                        continue
-                    raise
-                return resp
-            except httpx.RequestError:
-                if attempt >= max_retries:
-                    raise
-                delay = min(
-                    self.config.backoff_base_seconds * (2 ** attempt),
-                    self.config.backoff_max_seconds,
-                )
-                time.sleep(delay)
-        raise RuntimeError("Windmill request retries exhausted")
+                    return resp
+                except (httpx.HTTPStatusError, httpx.RequestError) as exc:
+                    delay = self._retry_delay(attempt, exc)
+                    if delay is None:
+                        raise
+                    time.sleep(delay)
+                    attempt += 1
+        finally:
+            with self._client_lock:
+                self._in_flight -= 1
+            if self._retired:
+                self._close_if_idle()
 
     def close(self) -> None:
         """Close HTTP client."""
@@ -163,6 +268,19 @@ class WindmillClient:
             self._client.close()
             self._client = None
 
+    def retire(self) -> None:
+        """Close the HTTP client once in-flight requests finish (replaced in the shared pool)."""
+        self._retired = True
+        self._close_if_idle()
+
+    def _close_if_idle(self) -> None:
+        with self._client_lock:
+            if self._in_flight:
+                return
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
     # Flow Management
     def create_flow(
         self,
@@ -253,21 +371,14 @@ class WindmillClient:
         page: int = 1,
         job_kinds: Optional[str] = None,
         script_path_exact: Optional[str] = None,
+        created_or_started_after: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """
         List jobs in Windmill.
 
         Uses `/api/w/{workspace}/jobs/list`.
         """
-        params: Dict[str, Any] = {
-            "per_page": max(1, min(int(per_page), 200)),
-            "page": max(1, int(page)),
-        }
-        if job_kinds:
-            params["job_kinds"] = job_kinds
-        if script_path_exact:
-            params["script_path_exact"] = script_path_exact
-
+        params = _jobs_list_params(per_page, page, job_kinds, script_path_exact, created_or_started_after)
         resp = self._request("get", "/jobs/list", params=params)
         data = resp.json()
         return data if isinstance(data, list) else []
@@ -355,31 +466,7 @@ class WindmillClient:
         """Get job status and details."""
         # Windmill exposes job details under jobs_u/*.
         resp = self._request("get", f"/jobs_u/get/{job_id}")
-        data = resp.json()
-        
-        # Map Windmill job type/success to a stable status enum.
-        job_type = str(data.get("type") or "").lower()
-        status = JobStatus.QUEUED
-        if "running" in job_type:
-            status = JobStatus.RUNNING
-        elif "queued" in job_type:
-            status = JobStatus.QUEUED
-        elif "canceled" in job_type or "cancelled" in job_type:
-            status = JobStatus.CANCELED
-        elif "failed" in job_type:
-            status = JobStatus.FAILED
-        elif "completed" in job_type:
-            status = JobStatus.COMPLETED if bool(data.get("success", True)) else JobStatus.FAILED
-        
-        return JobInfo(
-            id=job_id,
-            status=status,
-            created_at=data.get("created_at"),
-            started_at=data.get("started_at"),
-            completed_at=data.get("completed_at"),
-            result=data.get("result"),
-            error=data.get("error") or data.get("err"),
-        )
+        return job_info_from_payload(job_id, resp.json())
 
     def get_job_logs(self, job_id: str) -> str:
         """Get job logs."""
@@ -450,3 +537,273 @@ class WindmillClient:
             return resp.text.strip()
         except Exception:
             return None
+
+
+class AsyncWindmillClient(_WindmillClientBase):
+    """
+    Non-blocking Windmill client for async routes and streams.
+
+    Mirrors the `WindmillClient` API with coroutine methods, backed by a
+    pooled `httpx.AsyncClient`; retry backoff uses `asyncio.sleep`.
+    """
+
+    def __init__(self, config: Optional[WindmillConfig] = None) -> None:
+        super().__init__(config)
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> "httpx.AsyncClient":
+        """Get or create the pooled HTTP client."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(**self._client_kwargs())
+        return self._client
+
+    async def _request(self, method: str, path: str, **kwargs: Any) -> "httpx.Response":
+        """Issue a Windmill API request with retry/backoff."""
+        attempt = 0
+        while True:
+            try:
+                resp = await self._get_client().request(method, self._url(path), **kwargs)
+                resp.raise_for_status()
+                return resp
+            except (httpx.HTTPStatusError, httpx.RequestError) as exc:
+                delay = self._retry_delay(attempt, exc)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    async def aclose(self) -> None:
+        """Close HTTP client."""
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+
+    # Flow Management
+    async def create_flow(
+        self,
+        path: str,
+        definition: Dict[str, Any],
+        *,
+        summary: Optional[str] = None,
+        description: Optional[str] = None,
+    ) -> FlowInfo:
+        """Create a new flow in Windmill."""
+        payload = {
+            "path": path,
+            "value": definition,
+            "summary": summary or path.split("/")[-1],
+            "description": description or "",
+        }
+        await self._request("post", "/flows/create", json=payload)
+        logger.info("flow_created", extra={"path": path})
+        return FlowInfo(path=path, name=summary or path.split("/")[-1])
+
+    async def update_flow(
+        self,
+        path: str,
+        definition: Dict[str, Any],
+        *,
+        summary: Optional[str] = None,
+    ) -> FlowInfo:
+        """Update an existing flow."""
+        await self._request("post", f"/flows/update/{path}", json={"value": definition, "summary": summary})
+        logger.info("flow_updated", extra={"path": path})
+        return FlowInfo(path=path, name=summary or path.split("/")[-1])
+
+    async def delete_flow(self, path: str) -> None:
+        """Delete a flow."""
+        await self._request("delete", f"/flows/delete/{path}")
+        logger.info("flow_deleted", extra={"path": path})
+
+    async def get_flow(self, path: str) -> FlowInfo:
+        """Get flow details."""
+        data = (await self._request("get", f"/flows/get/{path}")).json()
+        return FlowInfo(
+            path=path,
+            name=data.get("summary", path.split("/")[-1]),
+            summary=data.get("summary"),
+            schema=data.get("schema"),
+        )
+
+    async def list_flows(self, prefix: Optional[str] = None) -> List[FlowInfo]:
+        """List flows, optionally filtered by path prefix."""
+        params = {"path_start": prefix} if prefix else {}
+        resp = await self._request("get", "/flows/list", params=params)
+        return [FlowInfo(path=item.get("path", ""), name=item.get("summary", "")) for item in resp.json()]
+
+    async def list_jobs(
+        self,
+        *,
+        per_page: int = 50,
+        page: int = 1,
+        job_kinds: Optional[str] = None,
+        script_path_exact: Optional[str] = None,
+        created_or_started_after: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """List jobs in Windmill."""
+        params = _jobs_list_params(per_page, page, job_kinds, script_path_exact, created_or_started_after)
+        data = (await self._request("get", "/jobs/list", params=params)).json()
+        return data if isinstance(data, list) else []
+
+    async def list_flow_runs(
+        self,
+        flow_path: str,
+        *,
+        per_page: int = 50,
+        page: int = 1,
+    ) -> List[Dict[str, Any]]:
+        """List job runs for a specific flow."""
+        return await self.list_jobs(
+            per_page=per_page,
+            page=page,
+            job_kinds="flow",
+            script_path_exact=flow_path,
+        )
+
+    # Job Management
+    async def run_flow(
+        self,
+        path: str,
+        args: Optional[Dict[str, Any]] = None,
+        *,
+        scheduled_for: Optional[str] = None,
+        invisible_to_owner: bool = False,
+    ) -> str:
+        """Run a flow and return the job ID."""
+        params = {"invisible_to_owner": str(invisible_to_owner).lower()}
+        if scheduled_for:
+            params["scheduled_for"] = scheduled_for
+        resp = await self._request("post", f"/jobs/run/f/{path}", json=args or {}, params=params)
+        job_id = resp.text.strip('"')
+        logger.info("flow_job_started", extra={"path": path, "job_id": job_id})
+        return job_id
+
+    async def run_script(
+        self,
+        path: str,
+        args: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """Run a script and return the job ID."""
+        resp = await self._request("post", f"/jobs/run/p/{path}", json=args or {})
+        job_id = resp.text.strip('"')
+        logger.info("script_job_started", extra={"path": path, "job_id": job_id})
+        return job_id
+
+    async def get_job(self, job_id: str) -> JobInfo:
+        """Get job status and details."""
+        resp = await self._request("get", f"/jobs_u/get/{job_id}")
+        return job_info_from_payload(job_id, resp.json())
+
+    async def get_job_logs(self, job_id: str) -> str:
+        """Get job logs."""
+        return (await self._request("get", f"/jobs_u/get_logs/{job_id}")).text
+
+    async def cancel_job(self, job_id: str) -> None:
+        """Cancel a running job."""
+        await self._request("post", f"/jobs_u/queue/cancel/{job_id}")
+        logger.info("job_canceled", extra={"job_id": job_id})
+
+    async def wait_for_job(
+        self,
+        job_id: str,
+        *,
+        timeout: float = 300,
+        poll_interval: float = 1.0,
+    ) -> JobInfo:
+        """Wait for a job to complete; raises TimeoutError after `timeout` seconds."""
+        start = time.monotonic()
+        while True:
+            job = await self.get_job(job_id)
+            if job.status in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELED):
+                if job.status == JobStatus.COMPLETED and job.result is None:
+                    try:
+                        r = await self._request("get", f"/jobs_u/completed/get_result_maybe/{job_id}")
+                        if r.status_code == 200:
+                            job.result = r.json()
+                    except Exception:
+                        pass
+                return job
+            if time.monotonic() - start > timeout:
+                raise TimeoutError(f"Job {job_id} did not complete within {timeout}s")
+            await asyncio.sleep(poll_interval)
+
+    # Health Check
+    async def health_check(self) -> bool:
+        """Check if Windmill is reachable."""
+        try:
+            resp = await self._get_client().get("/api/version")
+            return resp.status_code == 200
+        except Exception:
+            return False
+
+    async def get_version(self) -> Optional[str]:
+        """Get Windmill version."""
+        try:
+            resp = await self._get_client().get("/api/version")
+            resp.raise_for_status()
+            return resp.text.strip()
+        except Exception:
+            return None
+
+
+# Process-wide pooled clients, keyed by connection settings. Async clients are
+# also keyed by event loop since an httpx.AsyncClient is bound to one loop.
+_shared_clients: Dict[Tuple[Any, ...], WindmillClient] = {}
+_shared_async_clients: Dict[Tuple[Any, ...], AsyncWindmillClient] = {}
+_shared_lock = threading.Lock()
+# Replaced clients that may still be finishing requests (closed at shutdown).
+_retired_clients: List[WindmillClient] = []
+
+
+def get_shared_windmill_client(config: WindmillConfig) -> WindmillClient:
+    """
+    Return the process-wide pooled client for `config`.
+
+    Callers must not `close()` it; `close_shared_windmill_clients()` does that
+    at shutdown. A client for changed credentials (config reload) replaces the
+    previous one, which is retired: closed as soon as its in-flight requests
+    finish, or at shutdown.
+    """
+    key = astuple(config)
+    replaced: List[WindmillClient] = []
+    with _shared_lock:
+        client = _shared_clients.get(key)
+        if client is None:
+            for stale in [k for k in _shared_clients if k[0] == config.base_url and k[2] == config.workspace]:
+                replaced.append(_shared_clients.pop(stale))
+            client = _shared_clients[key] = WindmillClient(config)
+            _retired_clients[:] = [c for c in _retired_clients if c._client is not None] + replaced
+    for stale_client in replaced:
+        stale_client.retire()
+    return client
+
+
+def get_shared_async_windmill_client(config: WindmillConfig) -> AsyncWindmillClient:
+    """Return the pooled async client for `config` on the running event loop."""
+    loop = asyncio.get_running_loop()
+    key = (*astuple(config), id(loop))
+    with _shared_lock:
+        client = _shared_async_clients.get(key)
+        if client is None:
+            client = _shared_async_clients[key] = AsyncWindmillClient(config)
+        return client
+
+
+def close_shared_windmill_clients() -> None:
+    """Close pooled sync clients (application shutdown)."""
+    with _shared_lock:
+        clients = [*_shared_clients.values(), *_retired_clients]
+        _shared_clients.clear()
+        _retired_clients.clear()
+    for client in clients:
+        client.close()
+
+
+async def aclose_shared_windmill_clients() -> None:
+    """Close pooled async clients bound to the running event loop."""
+    loop_id = id(asyncio.get_running_loop())
+    with _shared_lock:
+        keys = [k for k in _shared_async_clients if k[-1] == loop_id]
+        clients = [_shared_async_clients.pop(k) for k in keys]
+    for client in clients:
+        await client.aclose()
@@ -207,6 +207,7 @@ def open_pr(protocol_run_id: int) -> Dict[str, Any]:
     Returns:
         Dict with PR details
     """
+    from devgodzilla.qa.changeset import CHANGES_STATE_KEY, describe_changes
     from devgodzilla.services.git import GitService
     
     context = get_context()
@@ -226,18 +227,26 @@ def open_pr(protocol_run_id: int) -> Dict[str, Any]:
     )
     
     try:
+        # A released worktree is cleared from the run; its branch remains.
         worktree_path = run.worktree_path or project.local_path
         if not worktree_path:
             return {"success": False, "protocol_run_id": protocol_run_id, "error": "Project has no local_path/worktree_path"}
 
         head_branch = git.get_branch_name(run.protocol_name)
+        description = run.description or "Automated changes from DevGodzilla"
+        # The steps' recorded change manifests describe the diff; no re-diff.
+        changes = describe_changes(
+            (step.runtime_state or {}).get(CHANGES_STATE_KEY) for step in db.list_step_runs(protocol_run_id)
+        )
+        if changes:
+            description = f"{description}\n\n{changes}"
         pr_info = git.open_pr(
             Path(worktree_path).expanduser(),
             run.protocol_name,
             run.base_branch or project.base_branch or "main",
             head_branch=head_branch,
             title=f"[DevGodzilla] {run.protocol_name}",
-            description=run.description or "Automated changes from DevGodzilla",
+            description=description,
         )
         
         return {
@@ -142,7 +142,7 @@ export default function MetricsPage() {
               </div>
               <div>
                 <div className="flex items-center justify-between mb-1">
-                  <span className="text-sm">Job Runs</span>
+                  <span className="text-sm">Job Runs (all time)</span>
                   <span className="text-sm text-muted-foreground">{metrics?.total_job_runs ?? 0}</span>
                 </div>
                 <div className="h-2 bg-secondary rounded-full overflow-hidden">
@@ -238,6 +238,8 @@ export interface ArtifactContent {
   type: string
   content: string
   truncated: boolean
+  offset?: number
+  size?: number | null
 }
 
 export interface DiffHunk {
@@ -414,6 +416,7 @@ export interface MetricsSummary {
   success_rate: number
   job_type_metrics: JobTypeMetric[]
   recent_events_count: number
+  recent_job_runs_count: number
 }
 
 // =============================================================================
@@ -684,6 +687,8 @@ export interface AgentHealth {
   version?: string | null
   error?: string | null
   response_time_ms?: number | null
+  checked_at?: string | null
+  stale?: boolean
 }
 
 export interface AgentMetrics {
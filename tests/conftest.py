@@ -1,7 +1,136 @@
+import json
+import re
 import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
+from typing import Any, Dict, List
+from urllib.parse import parse_qs, urlparse
+
+import pytest
 
 # Ensure repository root is on sys.path so in-tree packages and demo modules import cleanly.
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+
+
+@pytest.fixture(autouse=True)
+def _fresh_config_snapshot(monkeypatch):
+    """
+    Drop the frozen config snapshot whenever a test sets or deletes a
+    DEVGODZILLA_* variable, as `reload_config()` would in production.
+    """
+    from devgodzilla import config as config_module
+
+    def _resetting(method):
+        def wrapper(self, name, *args, **kwargs):
+            result = method(self, name, *args, **kwargs)
+            if str(name).startswith("DEVGODZILLA_"):
+                config_module._reset_config_for_tests()
+            return result
+
+        return wrapper
+
+    monkeypatch.setattr(pytest.MonkeyPatch, "setenv", _resetting(pytest.MonkeyPatch.setenv))
+    monkeypatch.setattr(pytest.MonkeyPatch, "delenv", _resetting(pytest.MonkeyPatch.delenv))
+    config_module._reset_config_for_tests()
+    yield
+    config_module._reset_config_for_tests()
+
+
+class FakeWindmillServer:
+    """
+    In-process HTTP server speaking the subset of the Windmill API used by
+    `WindmillClient`: version, jobs/list (paginated, newest first), jobs_u/get,
+    jobs_u/get_logs and jobs/run. `requests` records every path served.
+    """
+
+    def __init__(self, workspace: str = "devgodzilla") -> None:
+        self.workspace = workspace
+        self.jobs: Dict[str, Dict[str, Any]] = {}
+        self.requests: List[str] = []
+        self._lock = threading.Lock()
+        self._counter = 0
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def set_job(self, job_id: str, **fields: Any) -> Dict[str, Any]:
+        """Create or update a job; e.g. `set_job("j1", type="CompletedJob", success=True)`."""
+        with self._lock:
+            job = self.jobs.setdefault(job_id, {"id": job_id, "type": "QueuedJob", "running": False})
+            job.update(fields)
+            return job
+
+    def _route(self, method: str, path: str, query: Dict[str, List[str]], body: Any) -> tuple[int, Any]:
+        if path == "/api/version":
+            return 200, "fake-1.0"
+        prefix = f"/api/w/{self.workspace}"
+        if not path.startswith(prefix):
+            return 404, {"error": "unknown workspace"}
+        path = path[len(prefix):]
+        with self._lock:
+            if path == "/jobs/list":
+                per_page = int(query.get("per_page", ["50"])[0])
+                page = int(query.get("page", ["1"])[0])
+                jobs = list(reversed(list(self.jobs.values())))
+                return 200, jobs[(page - 1) * per_page:page * per_page]
+            if match := re.fullmatch(r"/jobs_u/get/(.+)", path):
+                job = self.jobs.get(match.group(1))
+                return (200, job) if job else (404, {"error": "not found"})
+            if match := re.fullmatch(r"/jobs_u/get_logs/(.+)", path):
+                return 200, f"logs for {match.group(1)}"
+            if method == "POST" and re.fullmatch(r"/jobs/run/[fp]/.+", path):
+                self._counter += 1
+                job_id = f"job-{self._counter}"
+                self.jobs[job_id] = {"id": job_id, "type": "QueuedJob", "running": False, "args": body}
+                return 201, job_id
+        return 404, {"error": "not found"}
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _respond(self, method: str) -> None:
+                parsed = urlparse(self.path)
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length) if length else b""
+                server.requests.append(parsed.path)
+                status, payload = server._route(method, parsed.path, parse_qs(parsed.query), json.loads(raw) if raw else None)
+                data = json.dumps(payload).encode() if not isinstance(payload, str) or method == "POST" else payload.encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self) -> None:
+                self._respond("GET")
+
+            def do_POST(self) -> None:
+                self._respond("POST")
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        return Handler
+
+    def __enter__(self) -> "FakeWindmillServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def fake_windmill():
+    """A running `FakeWindmillServer`; point a `WindmillConfig` at `fake_windmill.url`."""
+    with FakeWindmillServer() as server:
+        yield server
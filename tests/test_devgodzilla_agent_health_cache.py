@@ -0,0 +1,93 @@
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from devgodzilla.config import load_config
+from devgodzilla.engines.dummy import DummyEngine
+from devgodzilla.engines.registry import EngineRegistry
+from devgodzilla.services import agent_config as agent_config_module
+from devgodzilla.services.agent_config import AgentConfigService, HealthCheckResult
+from devgodzilla.services.base import ServiceContext
+
+
+@pytest.fixture(autouse=True)
+def empty_health_cache():
+    agent_config_module.clear_health_cache()
+    yield
+    agent_config_module.clear_health_cache()
+
+
+def _service(tmp_path: Path, **config) -> AgentConfigService:
+    path = tmp_path / "agents.yaml"
+    lines = ["agents:"]
+    for name in ("a1", "a2", "a3", "a4"):
+        lines += [f"  {name}:", "    kind: cli", f"    command: {name}-cli"]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    ctx = ServiceContext(config=load_config().model_copy(update=config))
+    return AgentConfigService(ctx, config_path=str(path))
+
+
+def test_health_probes_run_concurrently_and_are_cached(tmp_path: Path, monkeypatch) -> None:
+    calls = []
+    lock = threading.Lock()
+
+    def probe(self, agent):
+        with lock:
+            calls.append(agent.id)
+        time.sleep(0.2)
+        return HealthCheckResult(agent_id=agent.id, available=agent.id != "a4", error=None if agent.id != "a4" else "missing")
+
+    monkeypatch.setattr(AgentConfigService, "_check_cli_health", probe)
+    svc = _service(tmp_path, agent_health_ttl_seconds=60.0, agent_health_negative_ttl_seconds=0.2)
+
+    start = time.monotonic()
+    results = svc.check_all_health()
+    assert time.monotonic() - start < 0.6
+    assert [r.agent_id for r in results] == ["a1", "a2", "a3", "a4"]
+    assert all(r.checked_at is not None and not r.stale for r in results)
+
+    calls.clear()
+    assert [r.available for r in svc.check_all_health()] == [True, True, True, False]
+    assert calls == []
+
+    # The negative result expires first: served stale, re-probed in the background.
+    time.sleep(0.25)
+    stale = {r.agent_id: r.stale for r in svc.check_all_health()}
+    assert stale == {"a1": False, "a2": False, "a3": False, "a4": True}
+    deadline = time.monotonic() + 2
+    while time.monotonic() < deadline and not calls:
+        time.sleep(0.02)
+    assert calls == ["a4"]
+
+    calls.clear()
+    svc.check_all_health(refresh=True)
+    assert sorted(calls) == ["a1", "a2", "a3", "a4"]
+
+
+def test_registry_caches_engine_availability() -> None:
+    probes = []
+
+    class Probed(DummyEngine):
+        def check_availability(self) -> bool:
+            probes.append(1)
+            return False
+
+    registry = EngineRegistry(availability_ttl_seconds=60.0, availability_negative_ttl_seconds=60.0)
+    engine = Probed()
+    registry.register(engine)
+    assert registry.is_available(engine) is False
+    assert registry.is_available(engine) is False
+    assert len(probes) == 1
+
+    replacement = Probed()
+    registry.register(replacement, replace=True)
+    registry.is_available(replacement)
+    assert len(probes) == 2
+
+    registry.availability_negative_ttl_seconds = 0
+    registry.invalidate_availability()
+    registry.is_available(replacement)
+    registry.is_available(replacement)
+    assert len(probes) == 4
@@ -1,3 +1,4 @@
+import asyncio
 import os
 import subprocess
 import tempfile
@@ -34,6 +35,8 @@ def _init_repo(path: Path) -> None:
 
 @pytest.mark.skipif(TestClient is None, reason="fastapi not installed")
 def test_step_artifacts_list_and_content(monkeypatch: pytest.MonkeyPatch) -> None:
+    from devgodzilla.api.routes.steps import stream_step_artifact
+    from devgodzilla.db.async_database import get_async_database
     from devgodzilla.db.database import SQLiteDatabase
 
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -92,6 +95,35 @@ def test_step_artifacts_list_and_content(monkeypatch: pytest.MonkeyPatch) -> Non
             assert "hello from log" in data["content"]
             assert data["truncated"] is False
 
+            tail = client.get(f"/steps/{step.id}/artifacts/execution.log/content", params={"tail": True, "max_bytes": 4})
+            assert tail.json()["content"] == "log\n"
+            assert tail.json()["offset"] == 11 and tail.json()["truncated"] is True
+
+            ranged = client.get(f"/steps/{step.id}/artifacts/execution.log/content", headers={"Range": "bytes=0-4"})
+            assert ranged.status_code == 206
+            assert ranged.headers["content-range"] == "bytes 0-4/15"
+            assert ranged.json()["content"] == "hello"
+            unsatisfiable = client.get(f"/steps/{step.id}/artifacts/execution.log/content", headers={"Range": "bytes=99-"})
+            assert unsatisfiable.status_code == 416
+
             download = client.get(f"/steps/{step.id}/artifacts/execution.log/download")
             assert download.status_code == 200
             assert b"hello from log" in download.content
+
+            # The SSE route resolves the step through the async DB facade.
+            assert client.get("/steps/999999/artifacts/execution.log/stream").status_code == 404
+
+        response = asyncio.run(
+            stream_step_artifact(
+                step.id,
+                "execution.log",
+                since_bytes=0,
+                tail_bytes=None,
+                last_event_id=None,
+                poll_interval_seconds=0.5,
+                max_chunk_bytes=65536,
+                adb=get_async_database(db),
+            )
+        )
+        assert response.media_type == "text/event-stream"
+        assert get_async_database(db).stats()["get_project"]["calls"] == 1
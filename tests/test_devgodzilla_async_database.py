@@ -0,0 +1,98 @@
+import asyncio
+import threading
+import time
+from pathlib import Path
+
+from devgodzilla.db.async_database import AsyncDatabase
+from devgodzilla.db.database import SQLiteDatabase
+
+
+def _make_db(tmp_path: Path) -> SQLiteDatabase:
+    db = SQLiteDatabase(tmp_path / "devgodzilla.sqlite")
+    db.init_schema()
+    return db
+
+
+def test_async_database_runs_hot_reads_off_the_event_loop(tmp_path: Path) -> None:
+    db = _make_db(tmp_path)
+    project = db.create_project(name="demo", git_url="https://example.com/demo.git", base_branch="main")
+    run = db.create_protocol_run(project_id=project.id, protocol_name="p", status="running", base_branch="main")
+    step = db.create_step_run(protocol_run_id=run.id, step_index=0, step_name="s1", step_type="execute", status="pending")
+    db.append_event(run.id, "step_started", "hello")
+
+    async def scenario() -> None:
+        adb = AsyncDatabase(db, max_workers=2)
+        loop_thread = threading.get_ident()
+        seen_threads = []
+        original = db.get_step_run
+
+        def _tracking(step_run_id: int):
+            seen_threads.append(threading.get_ident())
+            return original(step_run_id)
+
+        db.get_step_run = _tracking  # type: ignore[method-assign]
+
+        fetched = await adb.get_protocol_run(run.id)
+        fetched_step = await adb.get_step_run(step.id)
+        listed = await adb.list_step_runs(run.id)
+        recent = await adb.list_recent_events(limit=5)
+        since = await adb.list_events_since_id(since_id=0, protocol_run_id=run.id)
+
+        assert fetched.id == run.id
+        assert fetched_step.step_name == "s1"
+        assert [s.id for s in listed] == [step.id]
+        assert [e.message for e in recent] == ["hello"]
+        assert [e.message for e in since] == ["hello"]
+        assert seen_threads and loop_thread not in seen_threads
+
+        stats = adb.stats()
+        assert stats["get_protocol_run"]["calls"] == 1
+        assert stats["list_events_since_id"]["errors"] == 0
+        adb.close()
+
+    asyncio.run(scenario())
+    db.close()
+
+
+def test_async_database_does_not_stall_concurrent_coroutines() -> None:
+    class _SlowDB:
+        def list_recent_events(self, **_kwargs):
+            time.sleep(0.3)
+            return []
+
+    async def scenario() -> None:
+        slow_db = _SlowDB()
+        adb = AsyncDatabase(slow_db, max_workers=1)
+        ticks = 0
+
+        async def _ticker() -> None:
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker = asyncio.create_task(_ticker())
+        await adb.list_recent_events(limit=1)
+        ticker.cancel()
+        adb.close()
+        # The loop kept running while the query blocked a worker thread.
+        assert ticks >= 10
+        assert adb.stats()["list_recent_events"]["max_ms"] >= 250
+
+    asyncio.run(scenario())
+
+
+def test_sprint_sync_lists_steps_through_async_database(tmp_path: Path) -> None:
+    from devgodzilla.db.async_database import get_async_database
+    from devgodzilla.services.sprint_integration import SprintIntegrationService
+
+    db = _make_db(tmp_path)
+    project = db.create_project(name="demo", git_url="https://example.com/demo.git", base_branch="main")
+    run = db.create_protocol_run(project_id=project.id, protocol_name="p", status="running", base_branch="main")
+    sprint = db.create_sprint(project_id=project.id, name="Sprint 1")
+
+    tasks = asyncio.run(SprintIntegrationService(db).sync_protocol_to_sprint(run.id, sprint.id))
+
+    assert tasks == []
+    assert get_async_database(db).stats()["list_step_runs"]["calls"] == 1
+    db.close()
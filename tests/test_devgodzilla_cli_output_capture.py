@@ -0,0 +1,73 @@
+import sys
+import time
+from pathlib import Path
+
+from devgodzilla.engines.cli_adapter import OutputCapture, run_cli_command
+
+
+def test_streamed_output_goes_to_disk_with_bounded_tail(tmp_path: Path) -> None:
+    script = (
+        "import sys\n"
+        "for i in range(5000):\n"
+        "    print(f'line {i:05d} ' + 'x' * 80)\n"
+        "sys.stdout.write('y' * 200000 + '\\n')\n"
+        "print('done')\n"
+        "print('warn', file=sys.stderr)\n"
+    )
+    seen = []
+    result = run_cli_command(
+        [sys.executable, "-c", script],
+        cwd=tmp_path,
+        timeout=60,
+        on_output=lambda source, text: seen.append(source),
+        stdout_path=tmp_path / "out" / "stdout.log",
+        stderr_path=tmp_path / "out" / "stderr.log",
+        tail_chars=1000,
+    )
+
+    assert result.success is True
+    full = Path(result.stdout_path).read_text(encoding="utf-8")
+    assert full.startswith("line 00000 ") and full.endswith("done\n")
+    assert len(full) > 600_000
+    assert result.stdout.endswith("done\n") and len(result.stdout) == 1000
+    assert result.metadata["stdout_truncated"] is True
+    assert result.metadata["stdout_chars"] == len(full)
+    assert result.stderr == "warn\n" and result.metadata["stderr_truncated"] is False
+    assert Path(result.stderr_path).read_text(encoding="utf-8") == "warn\n"
+    assert seen.count("stderr") == 1
+
+
+def test_capture_without_path_keeps_everything() -> None:
+    capture = OutputCapture(tail_chars=4)
+    for chunk in ("abc\n", "def\n", "ghi\n"):
+        capture.write(chunk)
+    assert capture.text() == "abc\ndef\nghi\n"
+    assert capture.truncated is False
+
+
+def test_output_read_after_exit_is_not_dropped(tmp_path: Path) -> None:
+    # A slow consumer leaves output in the pipe after the process has exited.
+    result = run_cli_command(
+        [sys.executable, "-c", "print('first', flush=True); print('last', flush=True)"],
+        cwd=tmp_path,
+        timeout=60,
+        on_output=lambda source, text: time.sleep(0.3),
+        stdout_path=tmp_path / "stdout.log",
+    )
+
+    assert Path(result.stdout_path).read_text(encoding="utf-8") == "first\nlast\n"
+    assert result.stdout == "first\nlast\n"
+
+
+def test_descendant_holding_pipes_does_not_block_exit(tmp_path: Path) -> None:
+    started = time.monotonic()
+    result = run_cli_command(
+        ["sh", "-c", "sleep 8 & echo hi"],
+        cwd=tmp_path,
+        timeout=60,
+        stdout_path=tmp_path / "stdout.log",
+    )
+
+    assert time.monotonic() - started < 5
+    assert result.success is True
+    assert Path(result.stdout_path).read_text(encoding="utf-8") == "hi\n"
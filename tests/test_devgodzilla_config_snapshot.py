@@ -0,0 +1,68 @@
+import os
+import signal
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from devgodzilla import config as config_module
+from devgodzilla.config import get_config, install_reload_signal_handler, reload_config
+
+
+@pytest.fixture(autouse=True)
+def fresh_snapshot(monkeypatch, tmp_path: Path):
+    monkeypatch.chdir(tmp_path)
+    for key in ("DEVGODZILLA_WINDMILL_URL", "DEVGODZILLA_WINDMILL_TOKEN", "DEVGODZILLA_WINDMILL_WORKSPACE"):
+        monkeypatch.delenv(key, raising=False)
+    config_module._reset_config_for_tests()
+    yield
+    with config_module._config_lock:
+        config_module._forget_injected_env()
+    config_module._reset_config_for_tests()
+
+
+def test_snapshot_is_frozen_and_shared_until_reload(monkeypatch) -> None:
+    # setitem: the conftest hook on setenv would drop the snapshot itself.
+    monkeypatch.setitem(os.environ, "DEVGODZILLA_API_TOKEN", "one")
+    first = get_config()
+    assert get_config() is first
+    with pytest.raises(ValidationError):
+        first.api_token = "changed"
+
+    monkeypatch.setitem(os.environ, "DEVGODZILLA_API_TOKEN", "two")
+    assert get_config() is first
+    second = reload_config()
+    assert second.api_token == "two"
+    assert get_config() is second
+
+
+def test_env_file_edits_invalidate_snapshot(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(config_module, "ENV_FILE_CHECK_INTERVAL_SECONDS", 0.0)
+    env_file = tmp_path / "windmill.env"
+    env_file.write_text("WINDMILL_URL=http://one:8000/api\nWINDMILL_TOKEN=t\n", encoding="utf-8")
+    monkeypatch.setenv("DEVGODZILLA_WINDMILL_ENV_FILE", str(env_file))
+
+    first = get_config()
+    assert first.windmill_url == "http://one:8000"
+    assert get_config() is first
+
+    env_file.write_text("WINDMILL_URL=http://two:8000\nWINDMILL_TOKEN=t\n", encoding="utf-8")
+    stat = env_file.stat()
+    os.utime(env_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert get_config().windmill_url == "http://two:8000"
+
+
+def test_explicit_and_signal_reload(monkeypatch) -> None:
+    first = get_config()
+    assert reload_config() is not first
+
+    if not hasattr(signal, "SIGHUP"):
+        pytest.skip("SIGHUP not available")
+    previous = signal.getsignal(signal.SIGHUP)
+    try:
+        assert install_reload_signal_handler()
+        current = get_config()
+        os.kill(os.getpid(), signal.SIGHUP)
+        assert get_config() is not current
+    finally:
+        signal.signal(signal.SIGHUP, previous)
@@ -0,0 +1,48 @@
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from devgodzilla.db.database import SQLiteDatabase
+
+
+def test_aggregate_queries(tmp_path: Path) -> None:
+    db = SQLiteDatabase(tmp_path / "devgodzilla.sqlite")
+    db.init_schema()
+    project = db.create_project(name="demo", git_url="https://example.com/demo.git", base_branch="main")
+    other = db.create_project(name="other", git_url="https://example.com/other.git", base_branch="main")
+    run = db.create_protocol_run(project_id=project.id, protocol_name="a", status="completed", base_branch="main")
+    db.create_protocol_run(project_id=project.id, protocol_name="b", status="failed", base_branch="main")
+    other_run = db.create_protocol_run(project_id=other.id, protocol_name="c", status="completed", base_branch="main")
+
+    step = db.create_step_run(run.id, 0, "s0", "execute", "pending")
+    db.update_step_status(step.id, "completed", engine_id="codex")
+    db.create_step_run(run.id, 1, "s1", "execute", "running", assigned_agent="codex")
+    db.create_step_run(run.id, 2, "s2", "execute", "pending")
+    step = db.create_step_run(other_run.id, 0, "s0", "execute", "pending")
+    db.update_step_status(step.id, "failed", engine_id="opencode")
+
+    start = datetime.now(timezone.utc)
+    for i, job_type in enumerate(["plan", "plan", "execute"]):
+        job = db.create_job_run(run_id=f"job-{i}", job_type=job_type, status="succeeded")
+        db.update_job_run(
+            job.run_id,
+            started_at=start.isoformat(),
+            finished_at=(start + timedelta(seconds=10 * (i + 1))).isoformat(),
+        )
+    db.append_event(run.id, "protocol_started", "started")
+
+    assert db.count_protocol_runs_by_status() == {"completed": 2, "failed": 1}
+    assert db.count_protocol_runs_by_status(project_id=other.id) == {"completed": 1}
+    assert sum(db.count_step_runs_by_status().values()) == 4
+    assert db.count_step_runs_by_status(project_id=project.id) == {"completed": 1, "running": 1, "pending": 1}
+
+    by_engine = {(r["engine_id"], r["status"]): r["count"] for r in db.step_run_stats_by_engine()}
+    assert by_engine == {("codex", "completed"): 1, ("codex", "running"): 1, ("opencode", "failed"): 1}
+    assert {r["engine_id"] for r in db.step_run_stats_by_engine(project_id=other.id)} == {"opencode"}
+
+    stats = db.job_run_stats_by_type(since=start - timedelta(hours=1))
+    assert [(s["job_type"], s["count"]) for s in stats] == [("plan", 2), ("execute", 1)]
+    assert abs(stats[0]["avg_duration_seconds"] - 15.0) < 0.01
+    assert db.job_run_stats_by_type(since=start + timedelta(hours=1)) == []
+
+    assert db.count_events() == 1
+    assert db.count_events(since=start + timedelta(hours=1)) == 0
@@ -0,0 +1,98 @@
+from pathlib import Path
+from typing import Any, List, Tuple
+
+import pytest
+
+from devgodzilla.db.database import SQLiteDatabase
+
+
+@pytest.fixture
+def db(tmp_path: Path) -> SQLiteDatabase:
+    db = SQLiteDatabase(tmp_path / "devgodzilla.sqlite")
+    db.init_schema()
+    project = db.create_project(name="demo", git_url="https://example.com/demo.git", base_branch="main")
+    run = db.create_protocol_run(project_id=project.id, protocol_name="p", status="running", base_branch="main")
+    db.create_step_run(run.id, 0, "s0", "execute", "pending")
+    db.append_event(run.id, "step_started", "started")
+    return db
+
+
+def _capture(db: SQLiteDatabase, monkeypatch, call) -> List[Tuple[str, Tuple[Any, ...]]]:
+    queries: List[Tuple[str, Tuple[Any, ...]]] = []
+    original = db._fetchall
+
+    def recording(query, params=()):
+        queries.append((query, tuple(params)))
+        return original(query, params)
+
+    monkeypatch.setattr(db, "_fetchall", recording)
+    call()
+    monkeypatch.setattr(db, "_fetchall", original)
+    return queries
+
+
+def _plan(db: SQLiteDatabase, query: str, params: Tuple[Any, ...]) -> str:
+    rows = db._fetchall("EXPLAIN QUERY PLAN " + query, params)
+    return "\n".join(row["detail"] for row in rows)
+
+
+@pytest.mark.parametrize(
+    "call, table, index",
+    [
+        (lambda db: db.list_step_runs(1), "step_runs", "idx_step_runs_protocol"),
+        (lambda db: db.list_protocol_runs(1), "protocol_runs", "idx_protocol_runs_project"),
+        (lambda db: db.list_all_protocol_runs(status="running"), "protocol_runs", "idx_protocol_runs_status"),
+        (lambda db: db.list_all_protocol_runs(), "protocol_runs", "idx_protocol_runs_created"),
+        (lambda db: db.list_events_since_id(since_id=0, project_id=1), "e", "idx_events_project_id"),
+        (lambda db: db.list_events_since_id(since_id=0, protocol_run_id=1), "e", "idx_events_protocol_id"),
+        (lambda db: db.list_recent_events(project_id=1), "e", "idx_events_project_id"),
+    ],
+)
+def test_hot_queries_use_indexes(db: SQLiteDatabase, monkeypatch, call, table, index) -> None:
+    queries = _capture(db, monkeypatch, lambda: call(db))
+    assert queries
+    plan = _plan(db, *queries[0])
+    assert index in plan, plan
+    assert f"SCAN {table}\n" not in plan + "\n", plan
+
+
+def test_events_project_id_is_backfilled(db: SQLiteDatabase) -> None:
+    with db._transaction() as conn:
+        conn.execute("UPDATE events SET project_id = NULL")
+    db.append_events([{"protocol_run_id": 1, "event_type": "step_completed", "message": "done"}])
+    assert [e.project_id for e in db.list_events_since_id(since_id=0, project_id=1)] == [1, 1]
+
+
+def test_webhook_lookups_are_single_indexed_queries(db: SQLiteDatabase, monkeypatch) -> None:
+    db.update_protocol_windmill(1, windmill_flow_id="f/devgodzilla/demo")
+    queries: List[Tuple[str, Tuple[Any, ...]]] = []
+    original = db._fetchone
+
+    def recording(query, params=()):
+        queries.append((query, tuple(params)))
+        return original(query, params)
+
+    monkeypatch.setattr(db, "_fetchone", recording)
+    project = db.get_project_by_repo_urls(["git@example.com:Demo.git", "https://other.example/x"])
+    run = db.get_protocol_run_by_windmill_flow_id("f/devgodzilla/demo")
+    monkeypatch.setattr(db, "_fetchone", original)
+
+    assert project is not None and project.id == 1
+    assert run is not None and run.id == 1
+    assert db.get_project_by_repo_urls(["https://example.com/missing.git"]) is None
+    assert len(queries) == 2
+    assert "idx_projects_repo_key" in _plan(db, *queries[0])
+    assert "idx_protocol_runs_windmill_flow" in _plan(db, *queries[1])
+
+
+def test_repo_key_is_added_to_existing_databases(tmp_path: Path) -> None:
+    db = SQLiteDatabase(tmp_path / "legacy.sqlite")
+    db.init_schema()
+    db.create_project(name="old", git_url="https://GitHub.com/org/old.git", base_branch="main")
+    with db._transaction() as conn:
+        conn.execute("DROP INDEX idx_projects_repo_key")
+        conn.execute("ALTER TABLE projects DROP COLUMN repo_key")
+
+    db.init_schema()
+    project = db.get_project_by_repo_urls(["git@github.com:org/old.git"])
+    assert project is not None and project.name == "old"
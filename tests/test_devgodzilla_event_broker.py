@@ -0,0 +1,136 @@
+import asyncio
+from pathlib import Path
+from typing import Any, List
+
+from devgodzilla.db.database import SQLiteDatabase
+from devgodzilla.services.event_broker import EventBroker
+
+
+class _CountingDB:
+    def __init__(self, db: SQLiteDatabase) -> None:
+        self.db = db
+        self.since_calls: List[dict] = []
+
+    def list_events_since_id(self, **kwargs: Any):
+        self.since_calls.append(kwargs)
+        return self.db.list_events_since_id(**kwargs)
+
+    def list_recent_events(self, **kwargs: Any):
+        return self.db.list_recent_events(**kwargs)
+
+
+def _setup(tmp_path: Path):
+    db = SQLiteDatabase(tmp_path / "devgodzilla.sqlite")
+    db.init_schema()
+    project = db.create_project(name="demo", git_url="https://example.com/demo.git", base_branch="main")
+    run_a = db.create_protocol_run(project_id=project.id, protocol_name="a", status="running", base_branch="main")
+    run_b = db.create_protocol_run(project_id=project.id, protocol_name="b", status="running", base_branch="main")
+    return db, project, run_a, run_b
+
+
+async def _collect(stream, count: int, timeout: float = 5.0) -> list:
+    out = []
+
+    async def _run() -> None:
+        async for event in stream:
+            if event is None:
+                continue
+            out.append(event)
+            if len(out) >= count:
+                return
+
+    await asyncio.wait_for(_run(), timeout=timeout)
+    await stream.aclose()
+    return out
+
+
+def test_broker_replays_history_and_fans_out_live_events(tmp_path: Path) -> None:
+    db, _project, run_a, run_b = _setup(tmp_path)
+    db.append_event(run_a.id, "step_started", "a-1")
+    db.append_event(run_b.id, "step_started", "b-1")
+
+    async def scenario() -> None:
+        broker = EventBroker(db, poll_interval_seconds=0.05)
+        stream_a = broker.stream(since_id=0, protocol_run_id=run_a.id, idle_timeout_seconds=0.05)
+        stream_all = broker.stream(since_id=0, idle_timeout_seconds=0.05)
+        task_a = asyncio.create_task(_collect(stream_a, 2))
+        task_all = asyncio.create_task(_collect(stream_all, 4))
+        await asyncio.sleep(0.1)
+        db.append_event(run_a.id, "step_completed", "a-2")
+        db.append_event(run_b.id, "step_completed", "b-2")
+        broker.notify()
+        events_a = await task_a
+        events_all = await task_all
+        await broker.close()
+
+        assert [e.message for e in events_a] == ["a-1", "a-2"]
+        assert [e.message for e in events_all] == ["a-1", "b-1", "a-2", "b-2"]
+
+    asyncio.run(scenario())
+
+
+def test_broker_polls_db_once_for_many_subscribers(tmp_path: Path) -> None:
+    db, _project, run_a, _run_b = _setup(tmp_path)
+    counting = _CountingDB(db)
+
+    async def scenario() -> None:
+        broker = EventBroker(counting, poll_interval_seconds=0.05)
+        streams = [broker.stream(since_id=0, idle_timeout_seconds=0.05) for _ in range(20)]
+        tasks = [asyncio.create_task(_collect(s, 1)) for s in streams]
+        await asyncio.sleep(0.3)
+        counting.since_calls.clear()
+        db.append_event(run_a.id, "step_started", "live")
+        broker.notify()
+        results = await asyncio.gather(*tasks)
+        await broker.close()
+
+        assert all(r[0].message == "live" for r in results)
+        # One shared tail query per tick rather than one per subscriber.
+        assert len(counting.since_calls) < 20
+
+    asyncio.run(scenario())
+
+
+def test_broker_falls_back_to_db_when_since_id_is_older_than_window(tmp_path: Path) -> None:
+    db, project, run_a, _run_b = _setup(tmp_path)
+    first = db.append_event(run_a.id, "step_started", "old")
+
+    async def scenario() -> None:
+        broker = EventBroker(db, window_size=2, poll_interval_seconds=0.05)
+        warmup = broker.stream(since_id=first.id, idle_timeout_seconds=0.05)
+        warm_task = asyncio.create_task(_collect(warmup, 6))
+        await asyncio.sleep(0.1)
+        for i in range(6):
+            db.append_event(run_a.id, "step_started", f"new-{i}")
+        broker.notify()
+        await warm_task
+        assert broker._window.floor_id > first.id
+
+        replay = broker.stream(since_id=0, project_id=project.id, idle_timeout_seconds=0.05)
+        events = await _collect(replay, 7)
+        await broker.close()
+        assert [e.message for e in events] == ["old"] + [f"new-{i}" for i in range(6)]
+
+    asyncio.run(scenario())
+
+
+def test_broker_replay_is_paged_and_capped(monkeypatch, tmp_path: Path) -> None:
+    from devgodzilla.services import event_broker
+
+    db, _project, run_a, _run_b = _setup(tmp_path)
+    for i in range(12):
+        db.append_event(run_a.id, "step_started", f"e-{i}")
+    counting = _CountingDB(db)
+    monkeypatch.setattr(event_broker, "_PAGE_SIZE", 3)
+
+    async def scenario() -> None:
+        broker = EventBroker(counting, poll_interval_seconds=0.05, max_replay_events=7)
+        events = await _collect(broker.stream(since_id=0, idle_timeout_seconds=0.05), 7)
+        await broker.close()
+        # Only the newest max_replay_events ids are replayed, three rows per query.
+        assert [e.message for e in events] == [f"e-{i}" for i in range(5, 12)]
+        replay_calls = [c for c in counting.since_calls if c.get("protocol_run_id", 0) is None]
+        assert replay_calls[0]["since_id"] == events[0].id - 1
+        assert all(c["limit"] == 3 for c in replay_calls)
+
+    asyncio.run(scenario())
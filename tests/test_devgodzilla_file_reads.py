@@ -0,0 +1,47 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+from fastapi import HTTPException
+
+from devgodzilla.api.file_reads import follow_file, parse_range_header, read_file_window
+
+
+def test_windows_read_only_the_requested_bytes(tmp_path: Path) -> None:
+    path = tmp_path / "big.log"
+    path.write_bytes(b"".join(f"{i:04d}\n".encode() for i in range(1000)))
+
+    head = read_file_window(path, max_bytes=10)
+    assert (head.data, head.offset, head.size, head.truncated) == (b"0000\n0001\n", 0, 5000, True)
+    tail = read_file_window(path, max_bytes=10, tail=True)
+    assert (tail.data, tail.offset) == (b"0998\n0999\n", 4990)
+    assert read_file_window(path, max_bytes=5, offset=50).data == b"0010\n"
+    assert read_file_window(path, max_bytes=100, range_header="bytes=5-9").data == b"0001\n"
+    assert read_file_window(path, max_bytes=100, range_header="bytes=-5").data == b"0999\n"
+
+    assert parse_range_header("bytes=4990-", 5000) == (4990, 5000)
+    for bad in ("bytes=5000-", "items=0-1", "bytes=0-1,4-5", "bytes=x-"):
+        with pytest.raises(HTTPException) as exc:
+            parse_range_header(bad, 5000)
+        assert exc.value.status_code == 416
+
+
+def test_follow_streams_appended_bytes_from_offset(tmp_path: Path) -> None:
+    path = tmp_path / "run.log"
+    path.write_text("old line\n", encoding="utf-8")
+
+    async def scenario() -> list:
+        events = []
+        stream = follow_file(path, tail_bytes=5, poll_interval_seconds=0.1)
+        events.append(await stream.__anext__())
+        events.append(await stream.__anext__())
+        with path.open("a", encoding="utf-8") as handle:
+            handle.write("new line\n")
+        events.append(await asyncio.wait_for(stream.__anext__(), timeout=2))
+        await stream.aclose()
+        return events
+
+    connected, first, second = asyncio.run(scenario())
+    assert connected.startswith("event: connected")
+    assert first.startswith("id: 9\n") and '"chunk": "line\\n"' in first
+    assert second.startswith("id: 18\n") and '"chunk": "new line\\n"' in second
@@ -0,0 +1,121 @@
+from pathlib import Path
+
+from devgodzilla.config import load_config
+from devgodzilla.db.database import SQLiteDatabase
+from devgodzilla.services.base import ServiceContext
+from devgodzilla.services.job_reconciler import WindmillJobReconciler
+from devgodzilla.windmill.client import WindmillClient, WindmillConfig
+
+
+def test_reconciler_bulk_syncs_active_runs(tmp_path: Path, fake_windmill) -> None:
+    db = SQLiteDatabase(tmp_path / "devgodzilla.sqlite")
+    db.init_schema()
+    project = db.create_project(name="demo", git_url="https://example.com/demo.git", base_branch="main")
+    for i in range(7):
+        fake_windmill.set_job(f"wm-{i}")
+        db.create_job_run(
+            run_id=f"run-{i}",
+            job_type="execute_step",
+            status="queued",
+            project_id=project.id,
+            windmill_job_id=f"wm-{i}",
+        )
+    db.create_job_run(run_id="done", job_type="plan", status="succeeded", windmill_job_id="wm-done")
+    fake_windmill.set_job("wm-0", type="CompletedJob", success=True, started_at="2024-01-01T00:00:00Z")
+    fake_windmill.set_job("wm-1", type="CompletedJob", success=False, error="boom")
+    fake_windmill.set_job("wm-2", running=True)
+    fake_windmill.set_job("wm-3", type="CompletedJob", success=False, canceled=True)
+    del fake_windmill.jobs["wm-6"]
+
+    windmill = WindmillClient(WindmillConfig(base_url=fake_windmill.url, token="t", workspace="devgodzilla"))
+    reconciler = WindmillJobReconciler(ServiceContext(config=load_config()), db, windmill, per_page=2, batch_size=2)
+    result = reconciler.reconcile_once()
+
+    assert (result.checked, result.updated, result.missing) == (7, 4, 1)
+    assert fake_windmill.requests.count("/api/w/devgodzilla/jobs/list") == result.pages == 4
+    assert not any("/jobs_u/get/" in path for path in fake_windmill.requests)
+
+    statuses = {run.run_id: run.status for run in db.list_job_runs()}
+    assert statuses == {
+        "run-0": "succeeded",
+        "run-1": "failed",
+        "run-2": "running",
+        "run-3": "cancelled",
+        "run-4": "queued",
+        "run-5": "queued",
+        "run-6": "queued",
+        "done": "succeeded",
+    }
+    assert db.get_job_run("run-0").started_at.startswith("2024-01-01T00:00:00")
+    assert db.get_job_run("run-1").error == "boom"
+
+    events = [e for e in db.list_recent_events(project_id=project.id) if e.event_type == "job_run_status_changed"]
+    assert sorted(e.metadata["to_status"] for e in events) == ["cancelled", "failed", "running", "succeeded"]
+
+    fake_windmill.requests.clear()
+    assert reconciler.reconcile_once().updated == 0
+
+
+def test_reconciler_looks_up_runs_beyond_the_page_cap(tmp_path: Path, fake_windmill) -> None:
+    db = SQLiteDatabase(tmp_path / "devgodzilla.sqlite")
+    db.init_schema()
+    for i in range(5):
+        fake_windmill.set_job(f"wm-{i}")
+        db.create_job_run(run_id=f"run-{i}", job_type="execute_step", status="queued", windmill_job_id=f"wm-{i}")
+    # The oldest job finished, but only the two newest fit in the listing.
+    fake_windmill.set_job("wm-0", type="CompletedJob", success=True)
+
+    windmill = WindmillClient(WindmillConfig(base_url=fake_windmill.url, token="t", workspace="devgodzilla"))
+    reconciler = WindmillJobReconciler(
+        ServiceContext(config=load_config()), db, windmill, per_page=2, max_pages=1, max_lookups=2
+    )
+    result = reconciler.reconcile_once()
+
+    assert (result.pages, result.lookups, result.updated, result.missing) == (1, 2, 1, 1)
+    assert db.get_job_run("run-0").status == "succeeded"
+    lookups = [p for p in fake_windmill.requests if "/jobs_u/get/" in p]
+    assert lookups == ["/api/w/devgodzilla/jobs_u/get/wm-0", "/api/w/devgodzilla/jobs_u/get/wm-1"]
+
+
+def test_reconciler_fails_runs_windmill_no_longer_has(tmp_path: Path, fake_windmill) -> None:
+    db = SQLiteDatabase(tmp_path / "devgodzilla.sqlite")
+    db.init_schema()
+    for i in range(3):
+        fake_windmill.set_job(f"wm-{i}")
+        db.create_job_run(run_id=f"run-{i}", job_type="execute_step", status="queued", windmill_job_id=f"wm-{i}")
+    windmill = WindmillClient(WindmillConfig(base_url=fake_windmill.url, token="t", workspace="devgodzilla"))
+    ctx = ServiceContext(config=load_config())
+
+    # Beyond the page cap, a 404 lookup fails the run at once.
+    del fake_windmill.jobs["wm-0"]
+    capped = WindmillJobReconciler(ctx, db, windmill, per_page=1, max_pages=1)
+    result = capped.reconcile_once()
+    assert (result.lookups, result.lost) == (2, 1)
+    assert db.get_job_run("run-0").status == "failed"
+    assert db.get_job_run("run-0").error == "Job not found in Windmill"
+
+    # A run missing from complete listings is failed after max_missed_sweeps.
+    del fake_windmill.jobs["wm-1"]
+    reconciler = WindmillJobReconciler(ctx, db, windmill, max_missed_sweeps=2)
+    assert reconciler.reconcile_once().lost == 0
+    assert db.get_job_run("run-1").status == "queued"
+    assert reconciler.reconcile_once().lost == 1
+    assert db.get_job_run("run-1").status == "failed"
+    assert db.get_job_run("run-2").status == "queued"
+    assert reconciler.reconcile_once().checked == 1
+
+
+def test_reconciler_resolves_its_client_each_sweep(tmp_path: Path, fake_windmill) -> None:
+    db = SQLiteDatabase(tmp_path / "devgodzilla.sqlite")
+    db.init_schema()
+    fake_windmill.set_job("wm-0", type="CompletedJob", success=True)
+    db.create_job_run(run_id="run-0", job_type="execute_step", status="queued", windmill_job_id="wm-0")
+    stale = WindmillClient(WindmillConfig(base_url="http://127.0.0.1:9", token="old", workspace="devgodzilla"))
+    current = WindmillClient(WindmillConfig(base_url=fake_windmill.url, token="t", workspace="devgodzilla"))
+
+    reconciler = WindmillJobReconciler(
+        ServiceContext(config=load_config()), db, stale, client_factory=lambda: current
+    )
+    assert reconciler.reconcile_once().updated == 1
+    assert reconciler.windmill is current
+    assert db.get_job_run("run-0").status == "succeeded"
@@ -0,0 +1,189 @@
+import subprocess
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from devgodzilla.config import load_config
+from devgodzilla.db.database import SQLiteDatabase
+from devgodzilla.models.domain import StepStatus
+from devgodzilla.services.base import ServiceContext
+from devgodzilla.services.local_scheduler import LocalStepScheduler
+
+
+def _make_run(tmp_path: Path):
+    db = SQLiteDatabase(tmp_path / "devgodzilla.sqlite")
+    db.init_schema()
+    project = db.create_project(name="demo", git_url="https://example.com/demo.git", base_branch="main")
+    run = db.create_protocol_run(project_id=project.id, protocol_name="p", status="running", base_branch="main")
+    return db, run
+
+
+class _FakeRunner:
+    """Marks steps completed after a short sleep and records concurrency."""
+
+    def __init__(self, db, *, fail=(), delay=0.1):
+        self.db = db
+        self.fail = set(fail)
+        self.delay = delay
+        self.order = []
+        self.active = {}
+        self.peak = {}
+        self.lock = threading.Lock()
+
+    def __call__(self, step_run_id: int) -> None:
+        step = self.db.get_step_run(step_run_id)
+        key = step.assigned_agent or "default"
+        with self.lock:
+            self.order.append(step.step_name)
+            self.active[key] = self.active.get(key, 0) + 1
+            self.peak[key] = max(self.peak.get(key, 0), self.active[key])
+        time.sleep(self.delay)
+        with self.lock:
+            self.active[key] -= 1
+        status = StepStatus.FAILED if step.step_name in self.fail else StepStatus.COMPLETED
+        self.db.update_step_status(step_run_id, status)
+
+
+def test_local_scheduler_runs_fan_out_concurrently_in_dependency_order(tmp_path: Path) -> None:
+    db, run = _make_run(tmp_path)
+    root = db.create_step_run(run.id, 0, "root", "execute", "pending")
+    leaves = [
+        db.create_step_run(run.id, i + 1, f"leaf{i}", "execute", "pending", depends_on=[root.id])
+        for i in range(6)
+    ]
+    db.create_step_run(run.id, 7, "join", "execute", "pending", depends_on=[s.id for s in leaves])
+
+    runner = _FakeRunner(db)
+    scheduler = LocalStepScheduler(ServiceContext(config=load_config()), db, runner, max_workers=6)
+    started = time.monotonic()
+    result = scheduler.run(run.id)
+    elapsed = time.monotonic() - started
+
+    assert result.success
+    assert len(result.completed) == 8
+    assert runner.order[0] == "root"
+    assert runner.order[-1] == "join"
+    assert result.max_in_flight == 6
+    # root + one parallel wave + join, not 8 serial steps.
+    assert elapsed < 0.6
+
+
+def test_local_scheduler_applies_engine_limits_and_parallel_groups(tmp_path: Path) -> None:
+    db, run = _make_run(tmp_path)
+    for i in range(4):
+        db.create_step_run(run.id, i, f"codex{i}", "execute", "pending", assigned_agent="codex")
+    gate = db.create_step_run(run.id, 4, "gate", "execute", "pending", assigned_agent="opencode")
+    db.create_step_run(run.id, 5, "g-early", "execute", "pending", parallel_group="g", assigned_agent="opencode")
+    db.create_step_run(
+        run.id, 6, "g-late", "execute", "pending",
+        depends_on=[gate.id], parallel_group="g", assigned_agent="opencode",
+    )
+
+    runner = _FakeRunner(db, delay=0.05)
+    scheduler = LocalStepScheduler(
+        ServiceContext(config=load_config()),
+        db,
+        runner,
+        max_workers=8,
+        engine_limits={"codex": 2},
+    )
+    result = scheduler.run(run.id)
+
+    assert result.success
+    assert runner.peak["codex"] == 2
+    # The group is released as a unit only after its late member is ready.
+    assert runner.order.index("g-early") > runner.order.index("gate")
+
+
+def test_local_scheduler_stops_dispatching_after_failure(tmp_path: Path) -> None:
+    db, run = _make_run(tmp_path)
+    first = db.create_step_run(run.id, 0, "first", "execute", "pending")
+    db.create_step_run(run.id, 1, "second", "execute", "pending", depends_on=[first.id])
+    db.create_step_run(run.id, 2, "other", "execute", "pending", depends_on=[first.id])
+
+    runner = _FakeRunner(db, fail={"first"}, delay=0.01)
+    scheduler = LocalStepScheduler(ServiceContext(config=load_config()), db, runner, max_workers=4)
+    result = scheduler.run(run.id)
+
+    assert not result.success
+    assert result.failed == [first.id]
+    assert len(result.not_started) == 2
+    assert runner.order == ["first"]
+
+
+def test_run_route_runs_writing_steps_concurrently_in_step_worktrees(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    from fastapi.testclient import TestClient
+
+    from devgodzilla.api.app import app
+    from devgodzilla.engines import registry
+    from devgodzilla.engines.dummy import DummyEngine
+    from devgodzilla.engines.interface import EngineMetadata
+    from devgodzilla.services.execution import QualityService
+
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    subprocess.run(["git", "init", "-q"], cwd=repo, check=True)
+
+    class _WritingEngine(DummyEngine):
+        """Writes one file per step, then lingers so concurrent steps overlap."""
+
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        @property
+        def metadata(self) -> EngineMetadata:
+            return EngineMetadata(id="writer", display_name="Writer", kind=DummyEngine().metadata.kind)
+
+        def execute(self, req):
+            with self.lock:
+                type(self).active += 1
+                type(self).peak = max(type(self).peak, type(self).active)
+            (Path(req.working_dir) / f"step-{req.step_run_id}.txt").write_text("x", encoding="utf-8")
+            time.sleep(0.2)
+            with self.lock:
+                type(self).active -= 1
+            return super().execute(req)
+
+    engines = registry.EngineRegistry()
+    engines.register(_WritingEngine())
+    monkeypatch.setattr(registry, "_registry", engines)
+    monkeypatch.setattr(QualityService, "run_qa", lambda self, step_id: (_ for _ in ()).throw(RuntimeError("no qa")))
+    monkeypatch.setenv("DEVGODZILLA_DB_PATH", str(tmp_path / "devgodzilla.sqlite"))
+    monkeypatch.delenv("DEVGODZILLA_API_TOKEN", raising=False)
+    monkeypatch.delenv("DEVGODZILLA_WINDMILL_URL", raising=False)
+
+    db = SQLiteDatabase(tmp_path / "devgodzilla.sqlite")
+    db.init_schema()
+    project = db.create_project(name="demo", git_url=str(repo), base_branch="main", local_path=str(repo))
+    run = db.create_protocol_run(project_id=project.id, protocol_name="p", status="planned", base_branch="main")
+    steps = [
+        db.create_step_run(run.id, i, f"s{i}", "execute", "pending", assigned_agent="writer")
+        for i in range(2)
+    ]
+
+    with TestClient(app) as client:  # type: ignore[arg-type]
+        response = client.post(f"/protocols/{run.id}/actions/run")
+        assert response.status_code == 200
+        assert response.json()["status"] == "running"
+        assert client.post("/protocols/999/actions/run").status_code == 404
+
+    # The background task ran both independent steps through ExecutionService.
+    finished = [db.get_step_run(s.id) for s in steps]
+    assert [s.status for s in finished] == [StepStatus.NEEDS_QA, StepStatus.NEEDS_QA]
+    assert _WritingEngine.peak == 2
+
+    # Each writer ran in its own step worktree: its manifest has only its own
+    # file, and both files were applied back to the protocol workspace.
+    for step in finished:
+        files = {f["path"] for f in step.runtime_state["changes"]["files"] if f["path"].startswith("step-")}
+        assert files == {f"step-{step.id}.txt"}
+        assert (repo / f"step-{step.id}.txt").read_text(encoding="utf-8") == "x"
+    assert not list((repo / "worktrees" / ".steps").glob("step-*"))
+    status_files = sorted(repo.rglob("git-status.txt"))
+    assert len(status_files) == 2
+    assert all(path.read_text().count("?? step-") == 1 for path in status_files)
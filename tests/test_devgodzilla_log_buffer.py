@@ -0,0 +1,48 @@
+import asyncio
+import logging
+import threading
+
+from devgodzilla.logging import RingBufferHandler
+
+
+def _logger(handler: RingBufferHandler, name: str) -> logging.Logger:
+    logger = logging.getLogger(name)
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    logger.handlers = [handler]
+    return logger
+
+
+def test_ring_buffer_indexes_survive_wraparound() -> None:
+    handler = RingBufferHandler(capacity=20)
+    api = _logger(handler, "devgodzilla.test.api")
+    worker = _logger(handler, "devgodzilla.test.worker")
+    for i in range(55):
+        (api.error if i % 5 == 0 else worker.info)(f"m{i}")
+
+    assert handler.get_last_id() == 55
+    assert [e["id"] for e in handler.get_logs_since(0)] == list(range(36, 56))
+    assert [e["id"] for e in handler.get_logs_since(50)] == list(range(51, 56))
+    assert [e["message"] for e in handler.get_logs_since(0, level="error")] == ["m35", "m40", "m45", "m50"]
+    assert [e["message"] for e in handler.get_logs_since(40, source="test.api")] == ["m40", "m45", "m50"]
+    assert [e["message"] for e in handler.get_recent(2, level="error")] == ["m45", "m50"]
+    assert [e["message"] for e in handler.get_recent(2, source="devgodzilla.test")] == ["m53", "m54"]
+    assert handler.get_recent(5, source="missing") == []
+
+
+def test_subscription_wakes_on_matching_entries_only() -> None:
+    handler = RingBufferHandler(capacity=100)
+    logger = _logger(handler, "devgodzilla.test.sub")
+
+    async def scenario() -> None:
+        subscription = handler.subscribe(level="error")
+        try:
+            logger.info("ignored")
+            assert not await subscription.wait(timeout=0.05)
+            threading.Thread(target=logger.error, args=("from thread",)).start()
+            assert await subscription.wait(timeout=1.0)
+            assert handler.get_logs_since(0, level="error")[0]["message"] == "from thread"
+        finally:
+            handler.unsubscribe(subscription)
+
+    asyncio.run(scenario())
@@ -0,0 +1,89 @@
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from devgodzilla.db.database import SQLiteDatabase
+from devgodzilla.services.base import ServiceContext
+from devgodzilla.services.policy import PolicyService, invalidate_policy_cache
+
+
+def _db_with_project(tmp_path: Path):
+    repo = tmp_path / "repo"
+    (repo / ".devgodzilla").mkdir(parents=True)
+    db = SQLiteDatabase(tmp_path / "devgodzilla.sqlite")
+    db.init_schema()
+    db.upsert_policy_pack(key="team", version="1.0", name="Team", pack={"defaults": {"qa": {"policy": "full"}}})
+    project = db.create_project(
+        name="demo",
+        git_url=str(repo),
+        base_branch="main",
+        local_path=str(repo),
+        policy_pack_key="team",
+        policy_pack_version="1.0",
+    )
+    db.update_project_policy(project.id, policy_repo_local_enabled=True)
+    return db, project, repo
+
+
+def test_effective_policy_is_memoized_and_invalidated(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    db, project, repo = _db_with_project(tmp_path)
+    service = PolicyService(ServiceContext(config=SimpleNamespace(policy_cache_ttl_seconds=600)), db)
+
+    pack_loads = []
+    real_get_pack = db.get_policy_pack
+    monkeypatch.setattr(db, "get_policy_pack", lambda **kw: pack_loads.append(kw) or real_get_pack(**kw))
+
+    first = service.resolve_effective_policy(project.id, repo_root=repo)
+    first.policy["defaults"]["qa"]["policy"] = "mutated by caller"
+    again = service.resolve_effective_policy(project.id, repo_root=repo)
+    assert len(pack_loads) == 1
+    assert again.policy == {"defaults": {"qa": {"policy": "full"}}}
+    assert again.effective_hash == first.effective_hash
+
+    # Repo-local policy files are part of the key.
+    (repo / ".devgodzilla" / "policy.json").write_text(json.dumps({"defaults": {"qa": {"policy": "light"}}}))
+    local = service.resolve_effective_policy(project.id, repo_root=repo)
+    assert local.policy["defaults"]["qa"]["policy"] == "light" and local.sources["repo_local"] is True
+    assert len(pack_loads) == 2
+
+    # Pack edits are picked up once the writer invalidates.
+    service.resolve_effective_policy(project.id)
+    db.upsert_policy_pack(key="team", version="1.0", name="Team", pack={"defaults": {"ci": {"required_checks": ["lint"]}}})
+    assert "ci" not in service.resolve_effective_policy(project.id).policy["defaults"]
+    invalidate_policy_cache(db, pack_key="team")
+    assert service.resolve_effective_policy(project.id).policy["defaults"]["ci"] == {"required_checks": ["lint"]}
+
+
+def test_step_findings_are_cached_per_spec_hash(tmp_path: Path) -> None:
+    db, project, repo = _db_with_project(tmp_path)
+    service = PolicyService(ServiceContext(config=SimpleNamespace(policy_cache_ttl_seconds=600)), db)
+    run = db.create_protocol_run(project.id, "demo", "running", "main", worktree_path=str(repo))
+    step = db.create_step_run(run.id, 0, "step-01", "work", "pending")
+
+    assert service.evaluate_step(step.id, repo_root=repo) == []
+    effective = service.resolve_effective_policy(project.id, repo_root=repo)
+    key = (project.id, "team", effective.effective_hash, service._step_spec_hash(step, run))
+    assert service.cache.get_findings(key) == []
+
+    invalidate_policy_cache(db, project_id=project.id)
+    assert service.cache.get_findings(key) is None
+
+
+def test_policy_route_update_is_visible_immediately(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    from fastapi.testclient import TestClient
+
+    from devgodzilla.api.app import app
+
+    db, project, _ = _db_with_project(tmp_path)
+    monkeypatch.setenv("DEVGODZILLA_DB_PATH", str(tmp_path / "devgodzilla.sqlite"))
+    monkeypatch.delenv("DEVGODZILLA_API_TOKEN", raising=False)
+
+    with TestClient(app) as client:  # type: ignore[arg-type]
+        before = client.get(f"/projects/{project.id}/policy/effective").json()
+        assert before["policy"] == {"defaults": {"qa": {"policy": "full"}}}
+        overrides = {"defaults": {"qa": {"policy": "light"}}}
+        assert client.put(f"/projects/{project.id}/policy", json={"policy_overrides": overrides}).status_code == 200
+        after = client.get(f"/projects/{project.id}/policy/effective").json()
+        assert after["policy"] == overrides and after["hash"] != before["hash"]
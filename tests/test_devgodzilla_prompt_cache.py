@@ -0,0 +1,115 @@
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from devgodzilla import prompt_cache
+from devgodzilla.engines.dummy import DummyEngine
+from devgodzilla.prompt_cache import PromptCache
+from devgodzilla.qa.gates.interface import GateContext
+from devgodzilla.qa.gates.prompt import PromptQAGate
+from devgodzilla.services.base import ServiceContext
+from devgodzilla.services.execution import ExecutionService
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(prompt_cache, "_cache", None)
+
+
+def test_exec_prompt_is_reused_until_inputs_change(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    protocol_root = tmp_path / "repo" / ".protocols" / "demo"
+    protocol_root.mkdir(parents=True)
+    (protocol_root / "plan.md").write_text("Plan v1", encoding="utf-8")
+    (protocol_root / "step-01.md").write_text("Step content", encoding="utf-8")
+
+    reads = []
+    real_fingerprint = prompt_cache.fingerprint_file
+    monkeypatch.setattr(prompt_cache, "fingerprint_file", lambda path, **kw: reads.append(path) or real_fingerprint(path, **kw))
+
+    service = ExecutionService(
+        context=ServiceContext(config=SimpleNamespace(agent_config_path=tmp_path / "none.yaml", engine_defaults={})),
+        db=Mock(),
+    )
+    step = Mock(step_name="step-01", summary=None, model=None, assigned_agent=None)
+    run = Mock(protocol_name="demo", worktree_path=None, protocol_root=None, template_config=None)
+    project = Mock(id=1, local_path=str(tmp_path / "repo"))
+
+    first = service._resolve_step(step, run, project, engine_id=None, model=None)
+    assert "# Plan\n\nPlan v1" in first.prompt_text and not first.prompt_cached
+    reads.clear()
+
+    again = service._resolve_step(step, run, project, engine_id=None, model=None)
+    assert again.prompt_cached and again.prompt_hash == first.prompt_hash
+    assert reads == []
+
+    (protocol_root / "plan.md").write_text("Plan v2", encoding="utf-8")
+    changed = service._resolve_step(step, run, project, engine_id=None, model=None)
+    assert not changed.prompt_cached and "Plan v2" in changed.prompt_text
+    assert changed.prompt_hash != first.prompt_hash
+
+    (protocol_root / "plan.md").write_text("Plan v1", encoding="utf-8")
+    reverted = service._resolve_step(step, run, project, engine_id=None, model=None)
+    assert reverted.prompt_cached and reverted.prompt_key == first.prompt_key
+
+    service.db.get_step_run.return_value = Mock(runtime_state={"changes": {}})
+    service._record_prompt(7, reverted)
+    service.db.update_step_run.assert_called_once_with(
+        7,
+        runtime_state={"changes": {}, "prompt": {"hash": first.prompt_hash, "key": first.prompt_key, "cached": True}},
+    )
+
+
+def test_qa_prompt_keys_on_git_state(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    header = tmp_path / "qa.prompt.md"
+    header.write_text("QA HEADER", encoding="utf-8")
+    protocol_root = tmp_path / ".protocols" / "demo"
+    protocol_root.mkdir(parents=True)
+    (protocol_root / "step-01.md").write_text("Do the thing", encoding="utf-8")
+
+    status = {"value": " M app.py"}
+    monkeypatch.setattr(
+        PromptQAGate,
+        "_git_cmd",
+        staticmethod(lambda cmd, cwd: status["value"] if "status" in cmd else "last"),
+    )
+    gate = PromptQAGate(engine=DummyEngine(), prompt_path=header, prompt_cache=PromptCache(max_entries=8))
+    context = GateContext(workspace_root=str(tmp_path), protocol_root=str(protocol_root), step_name="step-01")
+
+    first = gate._build_prompt(context)
+    assert "QA HEADER" in first.text and "## plan.md\nMISSING" in first.text
+    assert gate._build_prompt(context).cached
+
+    status["value"] = " M app.py\n?? new.py"
+    changed = gate._build_prompt(context)
+    assert not changed.cached and "?? new.py" in changed.text
+
+
+def test_qa_prompt_reads_git_state_from_change_manifest(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    header = tmp_path / "qa.prompt.md"
+    header.write_text("QA HEADER", encoding="utf-8")
+    monkeypatch.setattr(PromptQAGate, "_git_cmd", staticmethod(Mock(side_effect=AssertionError("git was run"))))
+
+    manifest = {
+        "head": "abc",
+        "files": [{"path": "app.py", "status": " M"}, {"path": "new.py", "status": "??"}],
+        "last_commit": "feat: add app",
+    }
+    gate = PromptQAGate(engine=DummyEngine(), prompt_path=header)
+    context = GateContext(workspace_root=str(tmp_path), metadata={"changes": manifest})
+    prompt = gate._build_prompt(context)
+    assert "## git status\n M app.py\n?? new.py" in prompt.text
+    assert "## last commit\nfeat: add app" in prompt.text
+
+
+def test_undecodable_protocol_file_does_not_break_qa_prompt(tmp_path: Path) -> None:
+    header = tmp_path / "qa.prompt.md"
+    header.write_text("QA HEADER", encoding="utf-8")
+    protocol_root = tmp_path / ".protocols" / "demo"
+    protocol_root.mkdir(parents=True)
+    (protocol_root / "log.md").write_bytes(b"ran tests \xff\xfe done")
+
+    gate = PromptQAGate(engine=DummyEngine(), prompt_path=header, prompt_cache=PromptCache(max_entries=8))
+    prompt = gate._build_prompt(GateContext(workspace_root=str(tmp_path), protocol_root=str(protocol_root)))
+    assert "## log.md\nran tests \ufffd\ufffd done" in prompt.text
@@ -0,0 +1,160 @@
+import subprocess
+from pathlib import Path
+
+from devgodzilla.qa.changeset import compute_changed_files, python_import_closure
+from devgodzilla.qa.gates import FormatGate, LintGate, TypeGate
+from devgodzilla.qa.gates.security import SecurityGate
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+def _make_repo(tmp_path: Path) -> Path:
+    repo = tmp_path / "repo"
+    (repo / "pkg").mkdir(parents=True)
+    (repo / "pyproject.toml").write_text("[project]\nname = 'demo'\n")
+    (repo / "pkg" / "__init__.py").write_text("")
+    (repo / "pkg" / "core.py").write_text("def f() -> int:\n    return 1\n")
+    (repo / "pkg" / "api.py").write_text("from pkg.core import f\n")
+    (repo / "pkg" / "cli.py").write_text("from . import api\n")
+    (repo / "pkg" / "other.py").write_text("import os\n")
+    _git(repo, "init", "-b", "main")
+    _git(repo, "-c", "user.email=t@example.com", "-c", "user.name=t", "add", "-A")
+    _git(repo, "-c", "user.email=t@example.com", "-c", "user.name=t", "commit", "-m", "init")
+    _git(repo, "checkout", "-b", "feature")
+    return repo
+
+
+def test_changed_files_and_import_closure(tmp_path: Path) -> None:
+    repo = _make_repo(tmp_path)
+    (repo / "pkg" / "core.py").write_text("def f() -> str:\n    return '1'\n")
+    (repo / "pkg" / "new.py").write_text("x = 1\n")
+
+    changed = compute_changed_files(repo, "main")
+    assert changed == ["pkg/core.py", "pkg/new.py"]
+    assert compute_changed_files(repo, "missing-branch") is None
+
+    closure = python_import_closure(repo, ["pkg/core.py"])
+    assert closure == ["pkg/api.py", "pkg/cli.py", "pkg/core.py"]
+
+
+def test_gates_scope_commands_to_changed_files(tmp_path: Path) -> None:
+    repo = _make_repo(tmp_path)
+    changed = ["pkg/core.py", "README.md", "pkg/deleted.py"]
+
+    lint_cmd = LintGate().resolve_command(repo, changed)
+    assert lint_cmd == ["ruff", "check", "--force-exclude", "pkg/core.py"]
+    assert LintGate().resolve_command(repo, ["README.md"]) == []
+    assert LintGate().resolve_command(repo, None)[-1] == "."
+
+    type_cmd = TypeGate().resolve_command(repo, changed)
+    assert type_cmd == ["mypy", "pkg/api.py", "pkg/cli.py", "pkg/core.py"]
+
+    format_cmd = FormatGate().resolve_command(repo, changed)
+    assert format_cmd[-1] == "pkg/core.py"
+
+    gate = SecurityGate(exclude_dirs=["vendor"])
+    assert gate._python_paths(repo, changed) == ["pkg/core.py"]
+    assert gate._python_paths(repo, None) is None
+
+
+def test_capture_workspace_changes_manifest_and_reuse(tmp_path: Path) -> None:
+    import gzip
+
+    from devgodzilla.qa.changeset import capture_workspace_changes, changed_files_from_manifest
+
+    repo = _make_repo(tmp_path)
+    (repo / "pkg" / "core.py").write_text("def f() -> str:\n    return '1'\n\n\nX = 2\n")
+    (repo / "pkg" / "other.py").write_text("import sys\n")
+    _git(repo, "add", "pkg/other.py")
+    (repo / "pkg" / "new.py").write_text("x = 1\n")
+
+    artifacts = tmp_path / "artifacts"
+    changes = capture_workspace_changes(repo, artifacts, base_branch="main")
+    assert changes is not None
+    manifest = changes.manifest()
+    by_path = {f["path"]: f for f in manifest["files"]}
+    assert by_path["pkg/core.py"]["status"] == " M"
+    assert (by_path["pkg/core.py"]["additions"], by_path["pkg/core.py"]["deletions"]) == (5, 2)
+    assert by_path["pkg/other.py"]["status"] == "M "
+    assert by_path["pkg/new.py"]["status"] == "??"
+    assert manifest["changed_files"] == ["pkg/core.py", "pkg/new.py", "pkg/other.py"]
+    assert manifest["patches"]["unstaged"]["truncated"] is False
+    assert manifest["last_commit"] == "init"
+    unstaged = gzip.decompress((artifacts / "changes.diff.gz").read_bytes()).decode()
+    assert unstaged.startswith("diff --git a/pkg/core.py")
+    assert "import sys" in gzip.decompress((artifacts / "changes_cached.diff.gz").read_bytes()).decode()
+
+    (repo / "pkg" / "api.py").write_text("from pkg.core import f as g\n")
+    assert changed_files_from_manifest(manifest, repo) == [
+        "pkg/api.py", "pkg/core.py", "pkg/new.py", "pkg/other.py",
+    ]
+    _git(repo, "-c", "user.email=t@example.com", "-c", "user.name=t", "commit", "-am", "next")
+    assert changed_files_from_manifest(manifest, repo) is None
+
+    (repo / "pkg" / "core.py").write_text("y = 1\n" * 200)
+    capped = capture_workspace_changes(repo, artifacts, max_patch_bytes=64)
+    assert capped is not None and capped.patches["unstaged"]["truncated"] is True
+    assert "patch truncated after 64 bytes" in gzip.decompress((artifacts / "changes.diff.gz").read_bytes()).decode()
+
+
+def test_quality_changed_files_reads_recorded_artifacts_before_git(monkeypatch, tmp_path: Path) -> None:
+    import json
+    from types import SimpleNamespace
+    from unittest.mock import Mock
+
+    from devgodzilla.services import quality
+    from devgodzilla.services.base import ServiceContext
+
+    repo = _make_repo(tmp_path)
+    (repo / "pkg" / "api.py").write_text("from pkg.core import f as g\n")
+    protocol_root = tmp_path / "protocol"
+    artifacts = protocol_root / ".devgodzilla" / "steps" / "7" / "artifacts"
+    artifacts.mkdir(parents=True)
+    (artifacts / "changed-files.json").write_text(json.dumps({"base_branch": "main", "files": ["pkg/core.py"]}))
+
+    diffs = []
+    monkeypatch.setattr(quality, "compute_changed_files", lambda *a: diffs.append(a) or [])
+    service = quality.QualityService(ServiceContext(config=SimpleNamespace()), db=Mock())
+    step = SimpleNamespace(id=7, runtime_state={})
+    run = SimpleNamespace(base_branch="main")
+
+    # Only the artifact: reused plus the working tree's own changes.
+    assert service._changed_files(step, run, repo, protocol_root) == ["pkg/api.py", "pkg/core.py"]
+    assert diffs == []
+
+    # A recorded manifest whose HEAD still matches is reused as well.
+    head = subprocess.run(["git", "rev-parse", "HEAD"], cwd=repo, capture_output=True, text=True).stdout.strip()
+    (artifacts / "changes-manifest.json").write_text(json.dumps({"head": head, "changed_files": ["pkg/cli.py"]}))
+    assert "pkg/cli.py" in service._changed_files(step, run, repo, protocol_root)
+    assert diffs == []
+
+    # HEAD moved since the capture: fall back to git.
+    (artifacts / "changes-manifest.json").write_text(json.dumps({"head": "0" * 40, "changed_files": ["pkg/cli.py"]}))
+    service._changed_files(step, run, repo, protocol_root)
+    assert len(diffs) == 1
+
+
+def test_describe_changes_and_write_patch(tmp_path: Path) -> None:
+    import gzip
+
+    from devgodzilla.qa.changeset import describe_changes, write_patch
+
+    assert describe_changes([None, {}]) is not None
+    assert describe_changes([None]) is None
+    summary = describe_changes(
+        [
+            {"files": [{"path": "a.py", "additions": 1, "deletions": 0}], "changed_files": ["a.py"]},
+            {"files": [{"path": "a.py", "additions": 3, "deletions": 1}], "changed_files": ["a.py", "b.py"]},
+        ],
+        max_files=1,
+    )
+    assert summary == "### Changes\n2 files changed (+3 -1)\n\n- `a.py` (+3 -1)\n- ...and 1 more"
+
+    repo = _make_repo(tmp_path)
+    target = tmp_path / "changes.diff.gz"
+    assert write_patch(repo, target) is None and not target.exists()
+    (repo / "pkg" / "other.py").write_text("import sys\n")
+    assert write_patch(repo, target)["truncated"] is False
+    assert "+import sys" in gzip.decompress(target.read_bytes()).decode()
@@ -0,0 +1,97 @@
+import subprocess
+from pathlib import Path
+
+from devgodzilla.db.database import SQLiteDatabase
+from devgodzilla.qa.gates.cache import GateResultCache, git_tree_hash
+from devgodzilla.qa.gates.interface import Finding, Gate, GateContext, GateResult, GateVerdict
+from devgodzilla.qa.gates.runner import GateRunner
+
+
+class _CountingGate(Gate):
+    def __init__(self, verdict=GateVerdict.FAIL):
+        self.calls = 0
+        self.verdict = verdict
+
+    @property
+    def gate_id(self):
+        return "counting"
+
+    @property
+    def gate_name(self):
+        return "Counting Gate"
+
+    def cache_fingerprint(self, context):
+        return {"command": ["count"], "tool_version": "1.0"}
+
+    def run(self, context):
+        self.calls += 1
+        return GateResult(
+            gate_id=self.gate_id,
+            gate_name=self.gate_name,
+            verdict=self.verdict,
+            findings=[Finding(gate_id=self.gate_id, severity="error", message="boom", line_number=3)],
+        )
+
+
+def _git_repo(path: Path) -> Path:
+    path.mkdir()
+    subprocess.run(["git", "init", "-q"], cwd=path, check=True)
+    (path / "app.py").write_text("print('hi')\n")
+    return path
+
+
+def test_gate_results_are_reused_until_the_tree_changes(tmp_path: Path) -> None:
+    db = SQLiteDatabase(tmp_path / "devgodzilla.sqlite")
+    db.init_schema()
+    repo = _git_repo(tmp_path / "repo")
+    context = GateContext(workspace_root=str(repo))
+    gate = _CountingGate()
+
+    first = GateRunner(cache=GateResultCache(db)).run([gate], context)
+    second = GateRunner(cache=GateResultCache(db)).run([gate], context)
+
+    assert gate.calls == 1
+    assert second[0].verdict == GateVerdict.FAIL
+    assert second[0].metadata["cache_hit"] is True
+    assert second[0].findings[0].line_number == 3
+    assert "cache_hit" not in first[0].metadata
+
+    (repo / "app.py").write_text("print('changed')\n")
+    GateRunner(cache=GateResultCache(db)).run([gate], context)
+    assert gate.calls == 2
+
+    # No cache (bypass) always re-runs.
+    GateRunner().run([gate], context)
+    assert gate.calls == 3
+    assert db.delete_qa_gate_cache() == 2
+
+
+def test_git_tree_hash_tracks_working_tree_without_touching_index(tmp_path: Path) -> None:
+    repo = _git_repo(tmp_path / "repo")
+    before = git_tree_hash(repo)
+    assert before
+    assert git_tree_hash(repo) == before
+
+    (repo / "new.txt").write_text("untracked\n")
+    assert git_tree_hash(repo) != before
+    status = subprocess.run(["git", "status", "--porcelain"], cwd=repo, capture_output=True, text=True)
+    assert "??" in status.stdout  # nothing was staged in the real index
+
+    objects = sorted(p.name for p in (repo / ".git" / "objects").rglob("*") if p.is_file())
+    git_tree_hash(repo)
+    assert sorted(p.name for p in (repo / ".git" / "objects").rglob("*") if p.is_file()) == objects
+
+
+def test_expired_cache_rows_are_purged_on_store(tmp_path: Path) -> None:
+    db = SQLiteDatabase(tmp_path / "devgodzilla.sqlite")
+    db.init_schema()
+    repo = _git_repo(tmp_path / "repo")
+    context = GateContext(workspace_root=str(repo))
+    db.upsert_qa_gate_cache(cache_key="stale", gate_id="counting", tree_hash="old", result={})
+    with db._transaction() as conn:
+        conn.execute("UPDATE qa_gate_cache SET created_at = '2000-01-01 00:00:00'")
+
+    GateRunner(cache=GateResultCache(db, ttl_seconds=3600)).run([_CountingGate()], context)
+
+    assert db.get_qa_gate_cache("stale") is None
+    assert db.delete_qa_gate_cache() == 1
@@ -194,7 +194,7 @@ class TestTestGateImplementation:
         """Test running when pytest is not found."""
         gate = TestGate()
         
-        with patch("subprocess.run") as mock_run:
+        with patch("devgodzilla.qa.gates.common.run_command") as mock_run:
             mock_run.side_effect = FileNotFoundError()
             result = gate.run(gate_context)
             
@@ -213,7 +213,7 @@ class TestFormatGateImplementation:
         mock_proc.stdout = "Formatting needed"
         mock_proc.stderr = ""
 
-        with patch("shutil.which") as mock_which, patch("subprocess.run") as mock_run:
+        with patch("shutil.which") as mock_which, patch("devgodzilla.qa.gates.common.run_command") as mock_run:
             mock_which.return_value = "/usr/bin/ruff"
             mock_run.return_value = mock_proc
 
@@ -255,7 +255,7 @@ class TestCoverageGateImplementation:
         """Test running with passing tests."""
         gate = TestGate()
         
-        with patch("subprocess.run") as mock_run:
+        with patch("devgodzilla.qa.gates.common.run_command") as mock_run:
             mock_run.return_value = MagicMock(
                 returncode=0,
                 stdout="1 passed",
@@ -270,7 +270,7 @@ class TestCoverageGateImplementation:
         """Test running with failing tests."""
         gate = TestGate()
         
-        with patch("subprocess.run") as mock_run:
+        with patch("devgodzilla.qa.gates.common.run_command") as mock_run:
             mock_run.return_value = MagicMock(
                 returncode=1,
                 stdout="1 failed",
@@ -285,7 +285,7 @@ class TestCoverageGateImplementation:
         """Test using custom test command."""
         gate = TestGate(test_command=["npm", "test"])
         
-        with patch("subprocess.run") as mock_run:
+        with patch("devgodzilla.qa.gates.common.run_command") as mock_run:
             mock_run.return_value = MagicMock(
                 returncode=0,
                 stdout="All tests passed",
@@ -324,7 +324,7 @@ class TestLintGateImplementation:
         """Test running on code with no lint issues."""
         gate = LintGate()
         
-        with patch("subprocess.run") as mock_run:
+        with patch("devgodzilla.qa.gates.common.run_command") as mock_run:
             mock_run.return_value = MagicMock(
                 returncode=0,
                 stdout="",
@@ -338,7 +338,7 @@ class TestLintGateImplementation:
         """Test running on code with lint warnings."""
         gate = LintGate()
         
-        with patch("subprocess.run") as mock_run:
+        with patch("devgodzilla.qa.gates.common.run_command") as mock_run:
             mock_run.return_value = MagicMock(
                 returncode=1,
                 stdout="src/main.py:1:1: W291 trailing whitespace",
@@ -376,7 +376,7 @@ class TestTypeGateImplementation:
         """Test running on well-typed code."""
         gate = TypeGate()
         
-        with patch("subprocess.run") as mock_run:
+        with patch("devgodzilla.qa.gates.common.run_command") as mock_run:
             mock_run.return_value = MagicMock(
                 returncode=0,
                 stdout="Success: no issues found",
@@ -549,3 +549,168 @@ class TestGateBaseMethods:
         
         assert result.verdict == GateVerdict.ERROR
         assert result.error == "Something broke"
+
+
+# =============================================================================
+# Test GateRunner
+# =============================================================================
+
+class _SleepGate(Gate):
+    """Gate that sleeps, then returns a fixed verdict and logs its start."""
+
+    def __init__(self, gate_id, *, delay=0.2, verdict=GateVerdict.PASS, fast=False, depends_on=None, timeout=None, log=None):
+        self._gate_id = gate_id
+        self.delay = delay
+        self.verdict = verdict
+        self._fast = fast
+        self._depends_on = depends_on or []
+        self.timeout = timeout
+        self.log = log if log is not None else []
+
+    @property
+    def gate_id(self):
+        return self._gate_id
+
+    @property
+    def gate_name(self):
+        return self._gate_id.title()
+
+    @property
+    def fast(self):
+        return self._fast
+
+    @property
+    def depends_on(self):
+        return self._depends_on
+
+    def run(self, context):
+        import time
+
+        self.log.append(self._gate_id)
+        time.sleep(self.delay)
+        return GateResult(gate_id=self.gate_id, gate_name=self.gate_name, verdict=self.verdict)
+
+
+class TestGateRunner:
+    """Test concurrent gate execution."""
+
+    def test_runs_independent_gates_concurrently(self, workspace):
+        import time
+        from devgodzilla.qa.gates.runner import GateRunner
+
+        gates = [_SleepGate(f"g{i}") for i in range(4)]
+        start = time.monotonic()
+        results = GateRunner(max_workers=4).run(gates, GateContext(workspace_root=str(workspace)))
+
+        assert time.monotonic() - start < 0.6
+        assert [r.gate_id for r in results] == ["g0", "g1", "g2", "g3"]
+        assert all(r.metadata["wall_seconds"] >= 0.2 for r in results)
+        assert all("cpu_seconds" in r.metadata for r in results)
+
+    def test_dependencies_order_and_skip_on_failure(self, workspace):
+        from devgodzilla.qa.gates.runner import GateRunner
+
+        log = []
+        gates = [
+            _SleepGate("coverage", delay=0.0, depends_on=["test"], log=log),
+            _SleepGate("test", delay=0.05, verdict=GateVerdict.FAIL, log=log),
+        ]
+        results = GateRunner().run(gates, GateContext(workspace_root=str(workspace)))
+
+        assert log == ["test"]
+        assert results[0].verdict == GateVerdict.SKIP
+        assert results[1].verdict == GateVerdict.FAIL
+
+    def test_failing_fast_gate_short_circuits_slow_gates(self, workspace):
+        from devgodzilla.qa.gates.runner import GateRunner
+
+        log = []
+        gates = [
+            _SleepGate("slow", delay=0.0, log=log),
+            _SleepGate("lint", delay=0.0, fast=True, verdict=GateVerdict.FAIL, log=log),
+        ]
+        results = GateRunner().run(gates, GateContext(workspace_root=str(workspace)))
+
+        assert log == ["lint"]
+        assert results[0].verdict == GateVerdict.SKIP
+        assert "lint" in results[0].metadata["skip_reason"]
+
+    def test_gate_timeout_and_global_deadline(self, workspace):
+        from devgodzilla.qa.gates.runner import GateRunner
+
+        gates = [
+            _SleepGate("hung", delay=1.0, timeout=0.05),
+            _SleepGate("quick", delay=0.0),
+        ]
+        results = GateRunner(timeout_grace_seconds=0.0).run(gates, GateContext(workspace_root=str(workspace)))
+        assert results[0].verdict == GateVerdict.ERROR
+        assert "timed out" in results[0].error
+        assert results[1].verdict == GateVerdict.PASS
+
+        results = GateRunner(max_workers=1, deadline_seconds=0.1).run(
+            [_SleepGate("a", delay=1.0), _SleepGate("b", delay=0.0)],
+            GateContext(workspace_root=str(workspace)),
+        )
+        assert results[0].verdict == GateVerdict.ERROR
+        assert results[1].verdict == GateVerdict.SKIP
+
+
+class _CommandGate(Gate):
+    """Gate that runs a Python snippet through the gate process helper."""
+
+    def __init__(self, gate_id, code, *, timeout=None):
+        self._gate_id = gate_id
+        self.code = code
+        self.timeout = timeout
+
+    @property
+    def gate_id(self):
+        return self._gate_id
+
+    @property
+    def gate_name(self):
+        return self._gate_id.title()
+
+    def run(self, context):
+        import sys
+        from devgodzilla.qa.gates.process import run_command
+
+        proc = run_command([sys.executable, "-c", self.code], cwd=context.workspace_root, timeout=60)
+        verdict = GateVerdict.PASS if proc.returncode == 0 else GateVerdict.FAIL
+        return GateResult(gate_id=self.gate_id, gate_name=self.gate_name, verdict=verdict)
+
+
+class TestGateRunnerProcesses:
+    """Tool CPU accounting and cleanup of overdue tools."""
+
+    def test_cpu_seconds_counts_the_gate_tool(self, workspace):
+        from devgodzilla.qa.gates.runner import GateRunner
+
+        busy = "import time\nend = time.process_time() + 0.3\nwhile time.process_time() < end: pass"
+        results = GateRunner().run([_CommandGate("busy", busy)], GateContext(workspace_root=str(workspace)))
+
+        assert results[0].verdict == GateVerdict.PASS
+        assert results[0].metadata["cpu_seconds"] >= 0.25
+
+    def test_overdue_gate_tool_is_killed(self, workspace):
+        import os
+        import time
+        from devgodzilla.qa.gates.runner import GateRunner
+
+        pid_file = workspace / "tool.pid"
+        code = f"import os, time\nopen({str(pid_file)!r}, 'w').write(str(os.getpid()))\ntime.sleep(30)"
+        results = GateRunner(timeout_grace_seconds=0.0).run(
+            [_CommandGate("hung", code, timeout=0.5)],
+            GateContext(workspace_root=str(workspace)),
+        )
+        assert results[0].verdict == GateVerdict.ERROR
+
+        pid = int(pid_file.read_text())
+        for _ in range(50):
+            try:
+                os.kill(pid, 0)
+            except ProcessLookupError:
+                break
+            time.sleep(0.1)
+        else:
+            raise AssertionError("gate tool still running after its gate timed out")
@@ -0,0 +1,71 @@
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from devgodzilla.services import repo_index
+from devgodzilla.services.repo_index import load_repo_index, render_repo_map
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+def _commit(repo: Path, message: str) -> None:
+    _git(repo, "add", "-A")
+    _git(repo, "-c", "user.email=t@example.com", "-c", "user.name=t", "commit", "-m", message)
+
+
+@pytest.fixture(autouse=True)
+def empty_memory(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(repo_index, "_memory", type(repo_index._memory)())
+
+
+def test_index_is_stored_and_updated_incrementally(tmp_path: Path) -> None:
+    repo = tmp_path / "repo"
+    (repo / "src" / "billing").mkdir(parents=True)
+    (repo / "web").mkdir()
+    (repo / "README.md").write_text("# demo\n")
+    (repo / "src" / "billing" / "invoices.py").write_text("class InvoiceService:\n    pass\n\ndef render_invoice():\n    pass\n")
+    (repo / "src" / "auth.py").write_text("def login():\n    pass\n")
+    (repo / "web" / "app.ts").write_text("export function mountApp() {}\nexport interface AppProps {}\n")
+    _git(repo, "init", "-b", "main")
+    _commit(repo, "init")
+
+    first = load_repo_index(repo)
+    assert first is not None and first.source == "full"
+    invoices = first.files["src/billing/invoices.py"]
+    assert invoices.language == "python"
+    assert invoices.symbols == ["InvoiceService", "render_invoice"]
+    assert first.files["web/app.ts"].symbols == ["mountApp", "AppProps"]
+    assert (repo / ".git" / "devgodzilla-index" / f"{first.commit}.json").exists()
+    assert load_repo_index(repo).source == "memory"
+
+    (repo / "src" / "auth.py").unlink()
+    (repo / "src" / "billing" / "taxes.py").write_text("def tax_rate():\n    pass\n")
+    _commit(repo, "taxes")
+    repo_index._memory.clear()
+    second = load_repo_index(repo)
+    assert second.source == "incremental"
+    assert "src/auth.py" not in second.files
+    assert second.files["src/billing/taxes.py"].symbols == ["tax_rate"]
+
+    repo_index._memory.clear()
+    assert load_repo_index(repo).source == "stored"
+    assert load_repo_index(tmp_path) is None
+
+
+def test_render_ranks_by_query_within_budget(tmp_path: Path) -> None:
+    repo = tmp_path / "repo"
+    (repo / "pkg").mkdir(parents=True)
+    for i in range(300):
+        (repo / "pkg" / f"module_{i:03}.py").write_text(f"def fn_{i}():\n    pass\n")
+    (repo / "pkg" / "invoices.py").write_text("def render_invoice():\n    pass\n")
+    _git(repo, "init", "-b", "main")
+    _commit(repo, "init")
+
+    text = render_repo_map(load_repo_index(repo), query="Fix invoice rendering", token_budget=300)
+    assert len(text) <= 300 * 4 + 100
+    files = text.split("## Files\n", 1)[1].splitlines()
+    assert files[0] == "- pkg/invoices.py: render_invoice"
+    assert text.splitlines()[-1].endswith("more files")
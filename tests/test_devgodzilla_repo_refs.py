@@ -0,0 +1,91 @@
+import subprocess
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from devgodzilla.services import repo_refs
+from devgodzilla.services.repo_refs import RepoRefCache
+
+
+def test_concurrent_misses_share_one_load_and_stale_entries_reload(tmp_path: Path) -> None:
+    cache = RepoRefCache(ttl_seconds=0.05)
+    calls = []
+    release = threading.Event()
+
+    def loader(path: Path) -> int:
+        calls.append(path)
+        release.wait(1.0)
+        return len(calls)
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get(tmp_path, "heads", loader).value)) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert results == [1] * 5
+    assert len(calls) == 1
+
+    time.sleep(0.06)
+    stale = cache.get(tmp_path, "heads", loader)
+    assert stale.stale and stale.value == 1
+    deadline = time.time() + 1.0
+    while cache.get(tmp_path, "heads", loader).value != 2 and time.time() < deadline:
+        time.sleep(0.01)
+    assert cache.get(tmp_path, "heads", loader).value == 2
+
+    cache.invalidate(tmp_path / "worktrees" / "feature")
+    assert cache.get(tmp_path, "heads", loader).value == 3
+
+
+def test_branches_endpoint_is_cached_and_invalidated_by_branch_create(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    from fastapi.testclient import TestClient
+
+    from devgodzilla.api.app import app
+    from devgodzilla.db.database import SQLiteDatabase
+
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    subprocess.run(["git", "init", "-b", "main"], cwd=repo, check=True, capture_output=True)
+    (repo / "README.md").write_text("# repo\n")
+    subprocess.run(["git", "add", "."], cwd=repo, check=True, capture_output=True)
+    subprocess.run(
+        ["git", "-c", "user.email=t@example.com", "-c", "user.name=t", "commit", "-m", "init"],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+    db_path = tmp_path / "devgodzilla.sqlite"
+    db = SQLiteDatabase(db_path)
+    db.init_schema()
+    project = db.create_project(name="demo", git_url=str(repo), base_branch="main", local_path=str(repo))
+
+    monkeypatch.setenv("DEVGODZILLA_DB_PATH", str(db_path))
+    monkeypatch.delenv("DEVGODZILLA_API_TOKEN", raising=False)
+    monkeypatch.setenv("DEVGODZILLA_REPO_REFS_TTL_SECONDS", "3600")
+    monkeypatch.setattr(repo_refs, "_cache", None)
+
+    with TestClient(app) as client:  # type: ignore[arg-type]
+        first = client.get(f"/projects/{project.id}/branches")
+        assert first.status_code == 200
+        assert first.headers["X-DevGodzilla-Refs-Stale"] == "false"
+        assert [b["name"] for b in first.json()] == ["main"]
+
+        # Out-of-band changes are served from cache until refresh...
+        subprocess.run(["git", "branch", "side"], cwd=repo, check=True, capture_output=True)
+        assert [b["name"] for b in client.get(f"/projects/{project.id}/branches").json()] == ["main"]
+        assert {b["name"] for b in client.get(f"/projects/{project.id}/branches?refresh=true").json()} == {"main", "side"}
+
+        # ...while our own branch operations invalidate immediately.
+        assert client.post(f"/projects/{project.id}/branches", json={"name": "feature/x"}).status_code == 200
+        names = {b["name"] for b in client.get(f"/projects/{project.id}/branches").json()}
+        assert names == {"main", "side", "feature/x"}
+
+        commits = client.get(f"/projects/{project.id}/commits?limit=5")
+        assert [c["message"] for c in commits.json()] == ["init"]
+        assert "X-DevGodzilla-Refs-Fetched-At" in commits.headers
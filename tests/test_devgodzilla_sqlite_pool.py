@@ -0,0 +1,92 @@
+import sqlite3
+import threading
+from pathlib import Path
+
+import pytest
+
+from devgodzilla.db.database import SQLiteDatabase
+
+
+def _make_db(tmp_path: Path) -> SQLiteDatabase:
+    db = SQLiteDatabase(tmp_path / "devgodzilla.sqlite", pool_size=4)
+    db.init_schema()
+    return db
+
+
+def test_sqlite_pool_enables_wal_and_reuses_connections(tmp_path: Path) -> None:
+    db = _make_db(tmp_path)
+
+    row = db._fetchone("PRAGMA journal_mode")
+    assert str(row[0]).lower() == "wal"
+
+    with db.pool.reader() as first:
+        pass
+    with db.pool.reader() as second:
+        pass
+    assert first is second
+
+    with db._transaction() as w1:
+        pass
+    with db._transaction() as w2:
+        pass
+    assert w1 is w2
+    db.close()
+
+
+def test_sqlite_pool_readers_are_read_only(tmp_path: Path) -> None:
+    db = _make_db(tmp_path)
+    with pytest.raises(sqlite3.OperationalError):
+        db._fetchall("INSERT INTO projects (name, git_url, base_branch) VALUES ('x', 'y', 'main')")
+    db.close()
+
+
+def test_sqlite_pool_concurrent_writers_and_readers(tmp_path: Path) -> None:
+    db = _make_db(tmp_path)
+    project = db.create_project(name="demo", git_url="https://example.com/demo.git", base_branch="main")
+    run = db.create_protocol_run(
+        project_id=project.id,
+        protocol_name="demo-proto",
+        status="pending",
+        base_branch="main",
+    )
+    errors: list[BaseException] = []
+
+    def writer() -> None:
+        try:
+            for i in range(25):
+                db.append_event(run.id, "step_started", f"event {i}")
+        except BaseException as exc:  # pragma: no cover - surfaced by assertion
+            errors.append(exc)
+
+    def reader() -> None:
+        try:
+            for _ in range(25):
+                db.list_recent_events(limit=10, protocol_run_id=run.id)
+        except BaseException as exc:  # pragma: no cover - surfaced by assertion
+            errors.append(exc)
+
+    threads = [threading.Thread(target=writer) for _ in range(4)]
+    threads += [threading.Thread(target=reader) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert not errors
+    assert len(db.list_events(run.id)) == 100
+    db.close()
+
+
+def test_sqlite_pool_rolls_back_failed_transaction(tmp_path: Path) -> None:
+    db = _make_db(tmp_path)
+    try:
+        with db._transaction() as conn:
+            conn.execute(
+                "INSERT INTO projects (name, git_url, base_branch) VALUES (?, ?, ?)",
+                ("rolled-back", "https://example.com/x.git", "main"),
+            )
+            raise RuntimeError("boom")
+    except RuntimeError:
+        pass
+    assert db.list_projects() == []
+    db.close()
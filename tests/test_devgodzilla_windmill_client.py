@@ -0,0 +1,87 @@
+import asyncio
+
+import httpx
+import pytest
+
+from devgodzilla.windmill import client as client_module
+from devgodzilla.windmill.client import (
+    AsyncWindmillClient,
+    JobStatus,
+    WindmillClient,
+    WindmillConfig,
+    get_shared_windmill_client,
+)
+
+
+def _config(**overrides) -> WindmillConfig:
+    values = dict(base_url="http://windmill.test", token="t", workspace="ws", backoff_base_seconds=0.0)
+    values.update(overrides)
+    return WindmillConfig(**values)
+
+
+def _handler(calls: list):
+    def handle(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        if request.url.path.endswith("/jobs_u/get/flaky") and calls.count(request.url.path) == 1:
+            return httpx.Response(503)
+        if "/jobs_u/get/" in request.url.path:
+            return httpx.Response(200, json={"type": "CompletedJob", "success": False, "result": {"ok": False}})
+        if "/jobs/run/f/" in request.url.path:
+            return httpx.Response(200, text='"job-1"')
+        return httpx.Response(404)
+
+    return handle
+
+
+def test_shared_client_is_reused_and_replaced_on_new_credentials(monkeypatch) -> None:
+    monkeypatch.setattr(client_module, "_shared_clients", {})
+    monkeypatch.setattr(client_module, "_retired_clients", [])
+    first = get_shared_windmill_client(_config())
+    assert get_shared_windmill_client(_config()) is first
+    pooled = first._client = httpx.Client(
+        base_url="http://windmill.test", transport=httpx.MockTransport(_handler([]))
+    )
+    first._in_flight = 1  # a request still running on the old credentials
+    rotated = get_shared_windmill_client(_config(token="t2"))
+    assert rotated is not first
+    assert list(client_module._shared_clients.values()) == [rotated]
+    assert not pooled.is_closed
+
+    # The replaced client is closed once its last request finishes.
+    first._in_flight = 0
+    assert first.get_job("done").status == JobStatus.FAILED
+    assert first._client is None and pooled.is_closed
+
+    kwargs = rotated._client_kwargs()
+    assert kwargs["limits"].max_connections == 20
+    assert kwargs["limits"].max_keepalive_connections == 10
+    assert kwargs["http2"] == client_module._http2_available()
+
+
+def test_sync_client_retries_transient_errors() -> None:
+    calls: list = []
+    wm = WindmillClient(_config())
+    wm._client = httpx.Client(base_url="http://windmill.test", transport=httpx.MockTransport(_handler(calls)))
+    job = wm.get_job("flaky")
+    assert job.status == JobStatus.FAILED
+    assert calls == ["/api/w/ws/jobs_u/get/flaky"] * 2
+
+
+def test_async_client_mirrors_sync_api() -> None:
+    calls: list = []
+
+    async def scenario() -> None:
+        wm = AsyncWindmillClient(_config())
+        wm._client = httpx.AsyncClient(base_url="http://windmill.test", transport=httpx.MockTransport(_handler(calls)))
+        try:
+            assert await wm.run_flow("f/ws/demo", {"x": 1}) == "job-1"
+            job = await wm.get_job("flaky")
+            assert job.status == JobStatus.FAILED
+            assert job.result == {"ok": False}
+            with pytest.raises(httpx.HTTPStatusError):
+                await wm.get_flow("missing")
+        finally:
+            await wm.aclose()
+
+    asyncio.run(scenario())
+    assert calls.count("/api/w/ws/jobs_u/get/flaky") == 2
@@ -0,0 +1,172 @@
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from devgodzilla.config import load_config
+from devgodzilla.services import worktree_pool as pool_module
+from devgodzilla.services.base import ServiceContext
+from devgodzilla.services.git import GitService
+from devgodzilla.services.worktree_pool import WorktreePool
+
+
+def _git(repo: Path, *args: str) -> str:
+    return subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True, text=True).stdout.strip()
+
+
+def _make_repo(tmp_path: Path) -> Path:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    (repo / "README.md").write_text("hello\n")
+    _git(repo, "init", "-b", "main")
+    _git(repo, "add", "-A")
+    _git(repo, "-c", "user.email=t@example.com", "-c", "user.name=t", "commit", "-m", "init")
+    return repo
+
+
+def test_pool_claim_and_recycle(tmp_path: Path) -> None:
+    repo = _make_repo(tmp_path)
+    pool = WorktreePool(repo, "main", size=2)
+    assert pool.fill() == 2
+    assert len(pool.idle()) == 2
+
+    (repo / "CHANGELOG.md").write_text("new\n")
+    _git(repo, "add", "-A")
+    _git(repo, "-c", "user.email=t@example.com", "-c", "user.name=t", "commit", "-m", "next")
+
+    target = repo / "worktrees" / "feature-x"
+    assert pool.claim(target, "feature-x") == target
+    assert len(pool.idle()) == 1
+    assert _git(target, "rev-parse", "--abbrev-ref", "HEAD") == "feature-x"
+    assert (target / "CHANGELOG.md").exists()
+
+    (target / "scratch.txt").write_text("tmp\n")
+    (target / "README.md").write_text("edited\n")
+    assert pool.recycle(target)
+    assert not target.exists()
+    idle = pool.idle()
+    assert len(idle) == 2
+    assert all(_git(p, "status", "--porcelain") == "" for p in idle)
+
+    assert not pool.recycle(idle[0])  # pool already full
+
+
+def test_git_service_claims_from_pool(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    repo = _make_repo(tmp_path)
+    monkeypatch.setattr(pool_module, "_pools", {})
+    monkeypatch.setenv("DEVGODZILLA_WORKTREE_POOL_SIZE", "1")
+    pool = pool_module.get_worktree_pool(repo, "main")
+    assert pool is not None and pool.fill() == 1
+
+    git = GitService(ServiceContext(config=load_config()))
+    worktree = git.ensure_worktree(repo, "proto-1", "main")
+    assert worktree == repo / "worktrees" / "proto-1"
+    assert _git(worktree, "rev-parse", "--abbrev-ref", "HEAD") == "proto-1"
+
+    monkeypatch.setenv("DEVGODZILLA_WORKTREE_POOL_SIZE", "0")
+    assert pool_module.get_worktree_pool(repo, "main") is None
+    spec = git.create_spec_worktree(repo, "spec-1", "main")
+    assert _git(spec, "rev-parse", "--abbrev-ref", "HEAD") == "spec-1"
+
+
+def test_spec_worktree_for_existing_branch_skips_the_pool(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    repo = _make_repo(tmp_path)
+    monkeypatch.setattr(pool_module, "_pools", {})
+    monkeypatch.setenv("DEVGODZILLA_WORKTREE_POOL_SIZE", "1")
+    pool = pool_module.get_worktree_pool(repo, "main")
+    assert pool is not None and pool.fill() == 1
+    _git(repo, "branch", "spec-1")
+
+    git = GitService(ServiceContext(config=load_config()))
+    monkeypatch.setattr(pool, "claim", lambda *a: pytest.fail("claimed for an existing branch"))
+    with pytest.raises(Exception):
+        git.create_spec_worktree(repo, "spec-1", "main")
+    assert len(pool.idle()) == 1
+
+
+def test_completed_protocol_returns_clean_worktree_to_pool(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    from devgodzilla.db.database import SQLiteDatabase
+    from devgodzilla.services.orchestrator import OrchestratorService
+
+    repo = _make_repo(tmp_path)
+    monkeypatch.setattr(pool_module, "_pools", {})
+    monkeypatch.setenv("DEVGODZILLA_WORKTREE_POOL_SIZE", "1")
+    monkeypatch.setattr(WorktreePool, "refill_async", lambda self, **kwargs: None)  # keep room in the pool
+    context = ServiceContext(config=load_config())
+    git = GitService(context)
+    db = SQLiteDatabase(tmp_path / "devgodzilla.sqlite")
+    db.init_schema()
+    project = db.create_project(name="demo", git_url=str(repo), base_branch="main", local_path=str(repo))
+    orchestrator = OrchestratorService(context, db, git_service=git)
+
+    def _finished_run(name: str):
+        worktree = git.ensure_worktree(repo, name, "main")
+        protocol_root = worktree / ".protocols" / name
+        run = db.create_protocol_run(
+            project.id, name, "running", "main", worktree_path=str(worktree), protocol_root=str(protocol_root)
+        )
+        step = db.create_step_run(run.id, 0, "step-01", "work", "pending")
+        db.update_step_status(step.id, "completed")
+        artifacts = protocol_root / ".devgodzilla" / "steps" / str(step.id) / "artifacts"
+        artifacts.mkdir(parents=True)
+        (artifacts / "stdout.log").write_text("done\n")
+        return run, worktree
+
+    dirty_run, dirty = _finished_run("proto-dirty")
+    (dirty / "notes.txt").write_text("uncommitted\n")
+    assert orchestrator.check_and_complete_protocol(dirty_run.id)
+    assert dirty.exists()
+    assert db.get_protocol_run(dirty_run.id).worktree_path == str(dirty)
+
+    run, worktree = _finished_run("proto-clean")
+    assert orchestrator.check_and_complete_protocol(run.id)
+    assert not worktree.exists()
+    assert git.local_branch_exists(repo, "proto-clean")
+
+    # Artifacts moved out of the recycled tree and the run points at them.
+    released = db.get_protocol_run(run.id)
+    assert released.worktree_path is None
+    assert released.protocol_root == str(repo / ".devgodzilla" / "protocols" / str(run.id))
+    assert list(Path(released.protocol_root).rglob("stdout.log"))
+
+    # Without a pool a finished worktree is kept, never removed.
+    monkeypatch.setenv("DEVGODZILLA_WORKTREE_POOL_SIZE", "0")
+    kept_run, kept = _finished_run("proto-kept")
+    assert orchestrator.check_and_complete_protocol(kept_run.id)
+    assert kept.exists()
+    assert db.get_protocol_run(kept_run.id).worktree_path == str(kept)
+
+
+def test_step_worktrees_start_from_the_workspace_and_merge_back(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    from devgodzilla.errors import GitCommandError
+
+    repo = _make_repo(tmp_path)
+    monkeypatch.setattr(pool_module, "_pools", {})
+    monkeypatch.setattr(WorktreePool, "refill_async", lambda self, **kwargs: None)
+    monkeypatch.setenv("DEVGODZILLA_WORKTREE_POOL_SIZE", "1")
+    pool = pool_module.get_worktree_pool(repo, "main")
+    assert pool is not None and pool.fill() == 1
+    (repo / "README.md").write_text("uncommitted\n")
+
+    git = GitService(ServiceContext(config=load_config()))
+    first = git.create_step_worktree(repo, 1, "main")
+    second = git.create_step_worktree(repo, 2, "main")
+    assert first.path == repo / "worktrees" / ".steps" / "step-1"
+    assert pool.idle() == []  # the first step claimed the pooled worktree
+    assert (second.path / "README.md").read_text() == "uncommitted\n"
+    assert _git(repo, "status", "--porcelain", "-uno") == "M README.md"  # index and HEAD untouched
+
+    (first.path / "README.md").write_text("first\n")
+    (first.path / "new.txt").write_text("new\n")
+    (second.path / "README.md").write_text("second\n")
+    assert git.merge_step_worktree(first)
+    assert (repo / "README.md").read_text() == "first\n"
+    assert (repo / "new.txt").read_text() == "new\n"
+    with pytest.raises(GitCommandError):
+        git.merge_step_worktree(second)
+
+    git.release_worktree(first.repo_root, first.path, "main")
+    assert not first.path.exists()
+    assert len(pool.idle()) == 1
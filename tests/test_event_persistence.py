@@ -42,3 +42,89 @@ def test_event_persistence_sink_writes_db() -> None:
         assert events
         assert any(e.event_type == "protocol_started" for e in events)
         assert any(e.protocol_run_id == run.id for e in events)
+
+
+def _make_run(tmp: Path):
+    from devgodzilla.db.database import SQLiteDatabase
+
+    db = SQLiteDatabase(tmp / "devgodzilla.sqlite")
+    db.init_schema()
+    project = db.create_project(name="demo", git_url="https://example.com/demo.git", base_branch="main")
+    run = db.create_protocol_run(
+        project_id=project.id,
+        protocol_name="demo-proto",
+        status="running",
+        base_branch="main",
+    )
+    return db, project, run
+
+
+def test_append_events_inserts_batch_in_order(tmp_path: Path) -> None:
+    db, project, run = _make_run(tmp_path)
+
+    count = db.append_events(
+        [
+            {"protocol_run_id": run.id, "project_id": project.id, "event_type": "StepStarted", "message": f"m{i}"}
+            for i in range(3)
+        ]
+    )
+
+    assert count == 3
+    events = db.list_events_since_id(since_id=0, project_id=project.id)
+    assert [e.message for e in events] == ["m0", "m1", "m2"]
+    assert all(e.event_type == "step_started" for e in events)
+
+
+def test_event_writer_batches_and_caches_project_lookup(tmp_path: Path) -> None:
+    from devgodzilla.services.event_persistence import EventWriter
+
+    db, project, run = _make_run(tmp_path)
+    calls = {"get_protocol_run": 0, "append_events": 0}
+
+    class _CountingDB:
+        def get_protocol_run(self, run_id: int):
+            calls["get_protocol_run"] += 1
+            return db.get_protocol_run(run_id)
+
+        def append_events(self, rows):
+            calls["append_events"] += 1
+            return db.append_events(rows)
+
+    counting = _CountingDB()
+    writer = EventWriter(lambda: counting, batch_size=50, flush_interval_seconds=5.0)
+    for i in range(10):
+        project_id = writer.resolve_project_id(run.id, None)
+        writer.submit({"protocol_run_id": run.id, "project_id": project_id, "event_type": "qa_passed", "message": f"q{i}"})
+
+    assert writer.flush(timeout=5.0)
+    writer.stop()
+
+    events = db.list_events_since_id(since_id=0, protocol_run_id=run.id)
+    assert [e.message for e in events] == [f"q{i}" for i in range(10)]
+    assert all(e.project_id == project.id for e in events)
+    assert calls["get_protocol_run"] == 1
+    assert calls["append_events"] == 1
+
+
+def test_event_persistence_mode_defaults_per_process(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    import importlib
+
+    from devgodzilla.api import app as api_app
+    from devgodzilla.config import load_config
+    from devgodzilla.services import event_persistence
+
+    monkeypatch.delenv("DEVGODZILLA_EVENT_PERSISTENCE_MODE", raising=False)
+    monkeypatch.setenv("DEVGODZILLA_DB_PATH", str(tmp_path / "devgodzilla.sqlite"))
+    assert load_config().event_persistence_mode is None
+
+    cli_main = importlib.import_module("devgodzilla.cli.main")
+    modes = []
+    monkeypatch.setattr(event_persistence, "install_db_event_sink", lambda **kw: modes.append(kw["mode"]))
+    monkeypatch.setattr(cli_main, "_DB", None, raising=False)
+    cli_main.get_db()
+    api_app.bootstrap_database()
+    # CLI/worker processes persist synchronously; the API batches behind its flush barrier.
+    assert modes[0] == "sync" and modes[1] == "barrier"
+
+    monkeypatch.setenv("DEVGODZILLA_EVENT_PERSISTENCE_MODE", "async")
+    assert load_config().event_persistence_mode == "async"
@@ -117,6 +117,7 @@ def test_metrics_summary_counts(monkeypatch: pytest.MonkeyPatch) -> None:
         assert payload["total_protocol_runs"] == 2
         assert payload["total_step_runs"] == 3
         assert payload["total_job_runs"] == 2
+        assert payload["recent_job_runs_count"] == 2
         assert payload["success_rate"] == 50.0
         assert payload["recent_events_count"] == 1
 
@@ -127,3 +127,49 @@ def test_github_workflow_failure_blocks_protocol(monkeypatch: pytest.MonkeyPatch
 
         updated = db.get_protocol_run(run.id)
         assert updated.status == "blocked"
+
+
+@pytest.mark.skipif(TestClient is None, reason="fastapi not installed")
+def test_github_ci_success_advances_protocol_off_the_event_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    import asyncio
+
+    from devgodzilla.api.routes import webhooks
+
+    calls = []
+
+    def _advance(db, *, protocol_run_id):
+        try:
+            asyncio.get_running_loop()
+            calls.append(("event_loop", protocol_run_id))
+        except RuntimeError:
+            calls.append(("threadpool", protocol_run_id))
+
+    monkeypatch.setattr(webhooks, "_maybe_advance_protocol_on_ci", _advance)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        _db, project, run, db_path = _setup_db(Path(tmpdir))
+        monkeypatch.setenv("DEVGODZILLA_DB_PATH", str(db_path))
+        monkeypatch.setenv("DEVGODZILLA_WEBHOOK_TOKEN", "secret")
+        monkeypatch.setenv("DEVGODZILLA_AUTO_QA_ON_CI", "true")
+        monkeypatch.delenv("DEVGODZILLA_DB_URL", raising=False)
+
+        payload = {
+            "action": "completed",
+            "workflow_run": {"conclusion": "success", "name": "CI", "id": 7},
+            "repository": {"full_name": "demo/repo"},
+            "sender": {},
+        }
+        body = json.dumps(payload).encode("utf-8")
+        with TestClient(app) as client:  # type: ignore[arg-type]
+            resp = client.post(
+                f"/webhooks/github?project_id={project.id}&protocol_run_id={run.id}",
+                data=body,
+                headers={
+                    "Content-Type": "application/json",
+                    "X-Github-Event": "workflow_run",
+                    "X-Hub-Signature-256": _sign_github("secret", body),
+                },
+            )
+            assert resp.status_code == 200
+
+    assert calls == [("threadpool", run.id)]
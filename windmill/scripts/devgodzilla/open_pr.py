@@ -33,6 +33,7 @@ except ImportError:
 # Import DevGodzilla services if available
 try:
     from devgodzilla.db import get_database
+    from devgodzilla.qa.changeset import CHANGES_STATE_KEY, describe_changes
     DEVGODZILLA_AVAILABLE = True
 except ImportError:
     DEVGODZILLA_AVAILABLE = False
@@ -53,7 +54,9 @@ def main(
     if not protocol_info:
         return {"error": f"Protocol {protocol_run_id} not found"}
     
-    project_path = Path(protocol_info.get("worktree_path") or protocol_info["local_path"])
+    # A released worktree is cleared from the run; its branch remains.
+    worktree_path = protocol_info.get("worktree_path")
+    project_path = Path(worktree_path or protocol_info["local_path"])
     branch_name = protocol_info["branch_name"]
     base_branch = protocol_info.get("base_branch", "main")
     git_url = protocol_info["git_url"]
@@ -65,8 +68,10 @@ def main(
     if not description:
         description = _generate_description(protocol_run_id, protocol_info, project_path)
     
-    # Step 1: Ensure all changes are committed
-    commit_result = _commit_changes(project_path, f"DevGodzilla: Complete protocol {protocol_run_id}")
+    # Step 1: Ensure all changes are committed (a released worktree was clean;
+    # the project checkout's own changes are not the protocol's)
+    if worktree_path:
+        _commit_changes(project_path, f"DevGodzilla: Complete protocol {protocol_run_id}")
     
     # Step 2: Push branch
     push_result = _push_branch(project_path, branch_name)
@@ -107,6 +112,10 @@ def _get_protocol_info(protocol_run_id: int) -> dict | None:
                 "local_path": project.local_path,
                 "worktree_path": protocol.worktree_path,
                 "git_url": project.git_url,
+                "step_changes": [
+                    (step.runtime_state or {}).get(CHANGES_STATE_KEY)
+                    for step in db.list_step_runs(protocol_run_id)
+                ],
             }
         except:
             pass
@@ -149,6 +158,12 @@ This PR was generated by DevGodzilla AI development protocol.
         description += "### Feature Specification\n"
         description += "\n".join(lines[:5]) + "\n\n"
     
+    # Changed files from the steps' recorded change manifests
+    if DEVGODZILLA_AVAILABLE:
+        changes = describe_changes(protocol_info.get("step_changes") or [])
+        if changes:
+            description += changes + "\n\n"
+    
     # Add QA status placeholder
     description += """### QA Status
 - [ ] Constitutional gates passed
@@ -173,18 +188,7 @@ def _commit_changes(project_path: Path, message: str) -> dict:
             capture_output=True,
         )
         
-        # Check if there are changes to commit
-        status = subprocess.run(
-            ["git", "status", "--porcelain"],
-            cwd=str(project_path),
-            capture_output=True,
-            text=True,
-        )
-        
-        if not status.stdout.strip():
-            return {"success": True, "message": "No changes to commit"}
-        
-        # Commit
+        # Commit; a clean tree is reported by git itself, no status re-check
         result = subprocess.run(
             ["git", "commit", "-m", message],
             cwd=str(project_path),
@@ -192,6 +196,9 @@ def _commit_changes(project_path: Path, message: str) -> dict:
             text=True,
         )
         
+        if result.returncode != 0 and "nothing to commit" in (result.stdout + result.stderr):
+            return {"success": True, "message": "No changes to commit"}
+        
         return {
             "success": result.returncode == 0,
             "message": result.stdout if result.returncode == 0 else result.stderr,